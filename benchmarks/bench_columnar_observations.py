@@ -0,0 +1,85 @@
+"""
+Benchmark time-range Observation queries of the columnar example engine (example/sta/engine/columnar_observation.py).
+
+Compares answering a phenomenon time range query ordered by phenomenon time with $top against scanning, sorting and
+slicing Observation dictionaries, as the other example engines do. Requires numpy.
+
+Usage:
+    python benchmarks/bench_columnar_observations.py [--observations N] [--top N] [--repeat N]
+"""
+
+import sys
+import argparse
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+from django.conf import settings
+
+settings.configure()
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'example'))
+
+from odata_query.grammar import ODataParser, ODataLexer  # noqa: E402
+from sta.engine import columnar_observation  # noqa: E402
+
+
+def build_observations(observation_count):
+    start_time = datetime(2020, 1, 1)
+
+    return {
+        i: {
+            'id': i,
+            'phenomenon_time': (start_time + timedelta(minutes=15 * i)).isoformat() + '+00:00',
+            'result': float(i % 100),
+            'datastream_id': 1
+        } for i in range(1, observation_count + 1)
+    }
+
+
+def scan(observations, start_time, top):
+    return [
+        observation['id'] for observation in sorted(
+            (observation for observation in observations.values() if observation['phenomenon_time'] >= start_time),
+            key=lambda observation: observation['phenomenon_time']
+        )[:top]
+    ]
+
+
+def columnar(engine, filters, top):
+    response, _ = engine.get_observations(
+        datastream_ids=[1],
+        filters=filters,
+        ordering=[{'field': 'phenomenonTime', 'direction': 'asc'}],
+        pagination={'skip': 0, 'top': top, 'count': False}
+    )
+
+    return list(response)
+
+
+def run(observation_count, top, repeat):
+    print(f'{observation_count} observations, $top={top}, best of {repeat}')
+
+    observations = build_observations(observation_count)
+    observation_store = columnar_observation.ColumnarObservationStore()
+    observation_store.insert([dict(observation) for observation in observations.values()])
+    columnar_observation.get_observation_store = lambda: observation_store
+
+    engine = columnar_observation.ColumnarObservationEngine()
+    start_time = observations[observation_count // 2]['phenomenon_time']
+    filters = ODataParser().parse(ODataLexer().tokenize(f'phenomenonTime ge {start_time[:19]}Z'))
+
+    assert scan(observations, start_time, top) == columnar(engine, filters, top)
+
+    scanned = min(timeit.repeat(lambda: scan(observations, start_time, top), number=1, repeat=repeat))
+    searched = min(timeit.repeat(lambda: columnar(engine, filters, top), number=1, repeat=repeat))
+    print(f'  scan: {scanned * 1000:10.2f} ms   columnar: {searched * 1000:8.2f} ms   '
+          f'speedup: {scanned / searched:8.1f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--observations', type=int, default=200000)
+    parser.add_argument('--top', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.observations, args.top, args.repeat)
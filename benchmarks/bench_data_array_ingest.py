@@ -0,0 +1,66 @@
+"""
+Benchmark converting a CreateObservations payload into the arguments passed to the engine.
+
+Compares DataArrayBaseEngine.convert_from_data_array, which builds an ObservationPostBody for every row, against
+DataArrayBaseEngine.convert_from_data_array_columnar, which validates each component as a column. Both start from
+the already parsed request body.
+
+Usage:
+    python benchmarks/bench_data_array_ingest.py [--rows N] [--datastreams N] [--repeat N]
+"""
+
+import argparse
+import timeit
+from datetime import datetime, timedelta, timezone
+from django.conf import settings
+
+settings.configure()
+
+from sensorthings.extensions.dataarray.engine import DataArrayBaseEngine  # noqa: E402
+from sensorthings.extensions.dataarray.schemas import ObservationDataArrayPostBody  # noqa: E402
+
+
+def build_payload(row_count, datastream_count):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    return [
+        ObservationDataArrayPostBody(
+            datastream={'@iot.id': str(datastream_id)},
+            components=['phenomenonTime', 'result', 'resultQuality'],
+            data_array=[
+                [(start + timedelta(minutes=i)).isoformat(), float(i), {'quality_code': 'ok'}]
+                for i in range(row_count // datastream_count)
+            ]
+        ) for datastream_id in range(datastream_count)
+    ]
+
+
+def run(row_count, datastream_count, repeat):
+    payload = build_payload(row_count, datastream_count)
+
+    rows = DataArrayBaseEngine.convert_from_data_array(payload)
+    columns = DataArrayBaseEngine.convert_from_data_array_columnar(payload)
+    assert all(
+        [observation.phenomenon_time for observation in rows[datastream_id]] == column['phenomenon_time'] and
+        [observation.result for observation in rows[datastream_id]] == column['result']
+        for datastream_id, column in columns.items()
+    )
+
+    print(f'{row_count} Observation rows in {datastream_count} data arrays, best of {repeat}')
+
+    for name, function in [
+        ('per-row models', DataArrayBaseEngine.convert_from_data_array),
+        ('columnar', DataArrayBaseEngine.convert_from_data_array_columnar),
+    ]:
+        elapsed = min(timeit.repeat(lambda: function(payload), number=1, repeat=repeat))
+        print(f'  {name:16} {elapsed * 1000:8.2f} ms   {elapsed * 1e6 / row_count:6.2f} us/row')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--datastreams', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    run(args.rows, args.datastreams, args.repeat)
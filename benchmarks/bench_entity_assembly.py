@@ -0,0 +1,127 @@
+"""
+Benchmark the per-row cost of building Observation response entities in SensorThingsBaseEngine.fetch_entities.
+
+Compares the single-pass SensorThingsBaseEngine.assemble_entities against the previous pipeline, which rebuilt every
+entity dict once for the self link, once per navigation link and once more to remove unselected fields. Reports wall
+time and the peak memory allocated per row while building a page.
+
+Usage:
+    python benchmarks/bench_entity_assembly.py [--rows N] [--repeat N]
+"""
+
+import argparse
+import timeit
+import tracemalloc
+from types import SimpleNamespace
+from django.conf import settings
+
+settings.configure()
+
+from sensorthings.engine import SensorThingsBaseEngine  # noqa: E402
+from sensorthings.components.field_schemas import Observation  # noqa: E402
+from sensorthings.components.observations.schemas import ObservationGetResponse  # noqa: E402
+
+
+class BenchmarkEngine(SensorThingsBaseEngine):
+    rows = {}
+
+    def get_observations(self, **kwargs):
+        return self.rows, None
+
+
+BenchmarkEngine.__abstractmethods__ = frozenset()
+
+
+def build_rows(row_count):
+    return {
+        i: {
+            'id': i,
+            'phenomenon_time': '2024-01-01T00:00:00Z',
+            'result_time': '2024-01-01T00:00:00Z',
+            'result': float(i),
+            'result_quality': {'quality_code': 'ok'},
+            'parameters': {'code': 'OBSERVATION'},
+            'datastream_id': i % 10,
+            'feature_of_interest_id': i % 10
+        } for i in range(row_count)
+    }
+
+
+def previous_pipeline(engine, query_params):
+    """
+    The entity assembly steps used by fetch_entities before single-pass assembly.
+    """
+
+    entities, _ = engine.get_observations()
+    query_plan = engine.compile_query(component=Observation, query_params=query_params)
+
+    entities = {
+        entity_id: {'self_link': engine.build_ref_link(Observation, entity_id), **entity}
+        for entity_id, entity in entities.items()
+    }
+    for related_component_name, related_component_field in Observation.get_related_components().items():
+        entities = {
+            entity_id: {
+                f'{related_component_name}_link': f'{entity["self_link"]}/{related_component_field.alias}',
+                **entity
+            } for entity_id, entity in entities.items()
+        }
+    entities = {
+        entity_id: {
+            field_name: field_value for field_name, field_value in entity.items()
+            if field_name not in query_plan.unselected_fields
+        } for entity_id, entity in entities.items()
+    }
+
+    return entities
+
+
+def single_pass(engine, query_params):
+    return engine.fetch_entities(component=Observation, query_params=query_params)[0]
+
+
+def measure_peak(function, *args):
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    function(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak - baseline
+
+
+def run(row_count, repeat):
+    engine = BenchmarkEngine(
+        request=SimpleNamespace(
+            sensorthings_url='http://127.0.0.1:8000/sensorthings/v1.1',
+            nested_path=[],
+            ref_response=False,
+            value_response=False
+        ),
+        get_response_schemas={'ObservationGetResponse': ObservationGetResponse}
+    )
+    BenchmarkEngine.rows = build_rows(row_count)
+
+    print(f'{row_count} Observation rows, best of {repeat}')
+
+    for label, query_params in [
+        ('no $select', {}),
+        ('$select=result,phenomenonTime', {'select': 'result,phenomenonTime'}),
+    ]:
+        assert previous_pipeline(engine, query_params) == single_pass(engine, query_params)
+
+        for name, function in [('previous', previous_pipeline), ('single-pass', single_pass)]:
+            elapsed = min(timeit.repeat(lambda: function(engine, query_params), number=1, repeat=repeat))
+            peak = measure_peak(function, engine, query_params)
+            print(f'  {label:32} {name:12} {elapsed * 1000:8.2f} ms   '
+                  f'{elapsed * 1e6 / row_count:6.2f} us/row   {peak / row_count:8.1f} peak bytes/row')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.rows, args.repeat)
@@ -0,0 +1,136 @@
+"""
+Benchmark the latency of sibling $expand branches fetched sequentially and concurrently.
+
+Every engine get method sleeps for a fixed latency to simulate a backend round trip. The request
+Datastreams?$expand=Thing,Sensor,ObservedProperty,Observations($top=1) makes one root and four sibling branch round
+trips. Fetched one after another the latency is their sum, and with ST_EXPAND_CONCURRENCY workers it approaches the
+root plus the slowest branch.
+
+Usage:
+    python benchmarks/bench_expand_fanout.py [--latency-ms N] [--repeat N]
+"""
+
+import time
+import asyncio
+import argparse
+from types import SimpleNamespace
+from django.conf import settings
+
+settings.configure()
+
+from sensorthings import settings as sensorthings_settings  # noqa: E402
+from sensorthings.engine import SensorThingsBaseEngine, SensorThingsBaseAsyncEngine  # noqa: E402
+from sensorthings.components.field_schemas import Datastream  # noqa: E402
+from sensorthings.components.things.schemas import ThingGetResponse  # noqa: E402
+from sensorthings.components.sensors.schemas import SensorGetResponse  # noqa: E402
+from sensorthings.components.observedproperties.schemas import ObservedPropertyGetResponse  # noqa: E402
+from sensorthings.components.observations.schemas import ObservationGetResponse  # noqa: E402
+from sensorthings.components.datastreams.schemas import DatastreamGetResponse  # noqa: E402
+
+
+LATENCY = 0.02
+
+DATASTREAM = {
+    'id': '1', 'name': 'DATASTREAM', 'description': 'Datastream', 'observation_type': 'https://example.com/measurement',
+    'unit_of_measurement': {'name': 'Unit', 'symbol': 'U', 'definition': 'https://example.com/unit'},
+    'thing_id': '1', 'sensor_id': '1', 'observed_property_id': '1'
+}
+ROWS = {
+    'datastreams': {'1': DATASTREAM},
+    'things': {'1': {'id': '1', 'name': 'THING', 'description': 'Thing'}},
+    'sensors': {'1': {'id': '1', 'name': 'SENSOR', 'description': 'Sensor', 'encoding_type': 'text/html'}},
+    'observed_properties': {'1': {'id': '1', 'name': 'PROPERTY', 'definition': 'https://example.com/property',
+                                    'description': 'Property'}},
+    'observations': {'1': {'id': '1', 'phenomenon_time': '2024-01-01T00:00:00Z', 'result': 1.0, 'datastream_id': '1'}}
+}
+GET_RESPONSE_SCHEMAS = {
+    schema.__name__: schema for schema in [
+        DatastreamGetResponse, ThingGetResponse, SensorGetResponse, ObservedPropertyGetResponse,
+        ObservationGetResponse
+    ]
+}
+QUERY_PARAMS = {'expand': 'Thing,Sensor,ObservedProperty,Observations($top=1)'}
+
+
+def make_getter(name):
+    def getter(self, **kwargs):
+        time.sleep(LATENCY)
+        return ROWS[name], None
+    return getter
+
+
+def make_async_getter(name):
+    async def getter(self, **kwargs):
+        await asyncio.sleep(LATENCY)
+        return ROWS[name], None
+    return getter
+
+
+class BenchmarkEngine(SensorThingsBaseEngine):
+    get_datastreams = make_getter('datastreams')
+    get_things = make_getter('things')
+    get_sensors = make_getter('sensors')
+    get_observed_properties = make_getter('observed_properties')
+    get_observations = make_getter('observations')
+
+
+class BenchmarkAsyncEngine(SensorThingsBaseAsyncEngine):
+    get_datastreams = make_async_getter('datastreams')
+    get_things = make_async_getter('things')
+    get_sensors = make_async_getter('sensors')
+    get_observed_properties = make_async_getter('observed_properties')
+    get_observations = make_async_getter('observations')
+
+
+BenchmarkEngine.__abstractmethods__ = frozenset()
+BenchmarkAsyncEngine.__abstractmethods__ = frozenset()
+
+
+def build_engine(engine_class):
+    return engine_class(
+        request=SimpleNamespace(
+            sensorthings_url='http://127.0.0.1:8000/sensorthings/v1.1',
+            nested_path=[],
+            ref_response=False,
+            value_response=False
+        ),
+        get_response_schemas=GET_RESPONSE_SCHEMAS
+    )
+
+
+def measure(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(repeat):
+    print(f'{LATENCY * 1000:.0f} ms per engine round trip, best of {repeat}')
+
+    for concurrency in [1, 4]:
+        sensorthings_settings.ST_EXPAND_CONCURRENCY = concurrency
+        engine = build_engine(BenchmarkEngine)
+        async_engine = build_engine(BenchmarkAsyncEngine)
+
+        sync_time = measure(
+            lambda: engine.fetch_entities(component=Datastream, query_params=dict(QUERY_PARAMS)), repeat
+        )
+        async_time = measure(
+            lambda: asyncio.run(async_engine.fetch_entities(component=Datastream, query_params=dict(QUERY_PARAMS))),
+            repeat
+        )
+        print(f'  ST_EXPAND_CONCURRENCY={concurrency}   sync: {sync_time * 1000:7.1f} ms   '
+              f'async: {async_time * 1000:7.1f} ms')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--latency-ms', type=float, default=20)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    LATENCY = args.latency_ms / 1000
+    run(args.repeat)
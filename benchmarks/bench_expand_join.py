@@ -0,0 +1,97 @@
+"""
+Benchmark the $expand join used by SensorThingsBaseEngine.insert_related_entities.
+
+Compares the back-reference index built by SensorThingsBaseEngine.build_back_ref_index against the previous
+approach of scanning every related entity for every parent entity.
+
+Usage:
+    python benchmarks/bench_expand_join.py [--parents N] [--children-per-parent N] [--repeat N]
+"""
+
+import argparse
+import timeit
+from django.conf import settings
+
+settings.configure()
+
+from sensorthings.engine import SensorThingsBaseEngine  # noqa: E402
+
+
+def build_one_to_many(parent_count, children_per_parent):
+    parents = {i: {'id': i} for i in range(parent_count)}
+    children = {
+        i: {'id': i, 'datastream_id': i % parent_count}
+        for i in range(parent_count * children_per_parent)
+    }
+
+    return parents, children
+
+
+def build_many_to_many(parent_count, children_per_parent):
+    parents = {i: {'id': i} for i in range(parent_count)}
+    children = {
+        i: {'id': i, 'thing_ids': [i % parent_count, (i + 1) % parent_count]}
+        for i in range(parent_count * children_per_parent)
+    }
+
+    return parents, children
+
+
+def quadratic_one_to_many(parents, children):
+    return {
+        parent_id: [child for child in children.values() if child['datastream_id'] == parent_id]
+        for parent_id in parents
+    }
+
+
+def quadratic_many_to_many(parents, children):
+    return {
+        parent_id: [child for child in children.values() if parent_id in child['thing_ids']]
+        for parent_id in parents
+    }
+
+
+def indexed(parents, children, back_ref, relationship):
+    index = SensorThingsBaseEngine.build_back_ref_index(
+        related_entities=children,
+        back_ref=back_ref,
+        relationship=relationship
+    )
+
+    return {
+        parent_id: [children[child_id] for child_id in index.get(parent_id, [])]
+        for parent_id in parents
+    }
+
+
+def run(parent_count, children_per_parent, repeat):
+    print(f'{parent_count} parents x {children_per_parent} children per parent, best of {repeat}')
+
+    parents, children = build_one_to_many(parent_count, children_per_parent)
+    assert quadratic_one_to_many(parents, children) == indexed(parents, children, 'datastream_id', 'one_to_many')
+    quadratic = min(timeit.repeat(lambda: quadratic_one_to_many(parents, children), number=1, repeat=repeat))
+    hashed = min(timeit.repeat(
+        lambda: indexed(parents, children, 'datastream_id', 'one_to_many'), number=1, repeat=repeat
+    ))
+    print(f'  one_to_many   quadratic: {quadratic * 1000:10.2f} ms   indexed: {hashed * 1000:8.2f} ms   '
+          f'speedup: {quadratic / hashed:8.1f}x')
+
+    parents, children = build_many_to_many(parent_count, children_per_parent)
+    assert quadratic_many_to_many(parents, children) == indexed(parents, children, 'thing_id', 'many_to_many')
+    quadratic = min(timeit.repeat(lambda: quadratic_many_to_many(parents, children), number=1, repeat=repeat))
+    hashed = min(timeit.repeat(
+        lambda: indexed(parents, children, 'thing_id', 'many_to_many'), number=1, repeat=repeat
+    ))
+    print(f'  many_to_many  quadratic: {quadratic * 1000:10.2f} ms   indexed: {hashed * 1000:8.2f} ms   '
+          f'speedup: {quadratic / hashed:8.1f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--parents', type=int, default=1000)
+    parser.add_argument('--children-per-parent', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    for parent_count in sorted({10, 100, args.parents}):
+        run(parent_count, args.children_per_parent, args.repeat)
@@ -0,0 +1,55 @@
+"""
+Benchmark ISO 8601 time and interval validation.
+
+Compares sensorthings.types.iso_string.validate_iso_time, which parses the common fixed-width forms directly, against
+parse_iso_time, the dateutil based validator it falls back to for other inputs. Also times validate_iso_interval.
+Checks that both validators produce identical output for the benchmark inputs.
+
+Usage:
+    python benchmarks/bench_iso_validation.py [--values N] [--repeat N]
+"""
+
+import argparse
+import timeit
+from datetime import datetime, timedelta, timezone
+from django.conf import settings
+
+settings.configure()
+
+from sensorthings.types.iso_string import validate_iso_time, validate_iso_interval, parse_iso_time  # noqa: E402
+
+
+def build_values(value_count):
+    start = datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=-7)))
+
+    return [
+        (start + timedelta(minutes=15 * i)).isoformat(timespec='seconds').replace('+00:00', 'Z')
+        if i % 2 else (start + timedelta(minutes=15 * i)).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+        for i in range(value_count)
+    ]
+
+
+def run(value_count, repeat):
+    values = build_values(value_count)
+    intervals = [f'{values[i]}/{values[i + 1]}' for i in range(0, value_count - 1, 2)]
+
+    assert [validate_iso_time(value) for value in values] == [parse_iso_time(value) for value in values]
+
+    print(f'{value_count} timestamps, best of {repeat}')
+
+    for name, function, inputs in [
+        ('dateutil', parse_iso_time, values),
+        ('fast path', validate_iso_time, values),
+        ('interval', validate_iso_interval, intervals),
+    ]:
+        elapsed = min(timeit.repeat(lambda: [function(value) for value in inputs], number=1, repeat=repeat))
+        print(f'  {name:12} {elapsed * 1000:8.2f} ms   {elapsed * 1e6 / len(inputs):6.2f} us/value')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--values', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.values, args.repeat)
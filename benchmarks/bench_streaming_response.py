@@ -0,0 +1,99 @@
+"""
+Benchmark the peak memory of buffered and streamed Observation list responses.
+
+Buffered responses build the whole page of response entities, validate it against ObservationListResponse and encode
+it with a single orjson.dumps call. Streamed responses (SensorThingsBaseEngine.stream_entities) assemble, validate and
+encode ST_STREAMING_BATCH_SIZE rows at a time from an engine whose get_observations yields its rows.
+
+Usage:
+    python benchmarks/bench_streaming_response.py [--rows N] [--batch-size N]
+"""
+
+import argparse
+import tracemalloc
+from types import SimpleNamespace
+from django.conf import settings
+
+settings.configure()
+
+import orjson  # noqa: E402
+from sensorthings import settings as sensorthings_settings  # noqa: E402
+from sensorthings.engine import SensorThingsBaseEngine  # noqa: E402
+from sensorthings.components.field_schemas import Observation  # noqa: E402
+from sensorthings.components.observations.schemas import (ObservationGetResponse,  # noqa: E402
+                                                          ObservationListResponse)
+
+
+class BenchmarkEngine(SensorThingsBaseEngine):
+    row_count = 0
+
+    def get_observations(self, pagination=None, **kwargs):
+        rows = (
+            {
+                'id': str(i),
+                'phenomenon_time': '2024-01-01T00:00:00Z',
+                'result_time': '2024-01-01T00:00:00Z',
+                'result': float(i),
+                'result_quality': {'quality_code': 'ok'},
+                'parameters': {'code': 'OBSERVATION'},
+                'datastream_id': i % 10,
+                'feature_of_interest_id': i % 10
+            } for i in range(self.row_count)
+        )
+        return rows, None
+
+
+BenchmarkEngine.__abstractmethods__ = frozenset()
+
+
+def buffered(engine, query_params):
+    response = engine.list_entities(component=Observation, query_params=dict(query_params))
+    return len(orjson.dumps(ObservationListResponse(**response).dict(by_alias=True, exclude_unset=True)))
+
+
+def streamed(engine, query_params):
+    response = engine.list_entities(component=Observation, query_params=dict(query_params))
+    return sum(len(chunk) for chunk in response.streaming_content)
+
+
+def measure_peak(function, *args):
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    size = function(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return size, peak - baseline
+
+
+def run(row_count, batch_size):
+    sensorthings_settings.ST_STREAMING_BATCH_SIZE = batch_size
+    BenchmarkEngine.row_count = row_count
+    query_params = {'top': row_count, 'skip': 0}
+
+    print(f'{row_count} Observation rows, streaming batch size {batch_size}')
+
+    for name, function, stream_response in [('buffered', buffered, False), ('streamed', streamed, True)]:
+        engine = BenchmarkEngine(
+            request=SimpleNamespace(
+                sensorthings_url='http://127.0.0.1:8000/sensorthings/v1.1',
+                sensorthings_path='Observations',
+                nested_path=[],
+                ref_response=False,
+                value_response=False,
+                stream_response=stream_response
+            ),
+            get_response_schemas={'ObservationGetResponse': ObservationGetResponse}
+        )
+        size, peak = measure_peak(function, engine, query_params)
+        print(f'  {name:10} {size / 1e6:8.2f} MB body   {peak / 1e6:8.2f} MB peak')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    run(args.rows, args.batch_size)
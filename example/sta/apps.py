@@ -2,4 +2,5 @@ from django.apps import AppConfig
 
 
 class StaConfig(AppConfig):
+    default_auto_field = 'django.db.models.AutoField'
     name = 'sta'
@@ -9,6 +9,8 @@ from .quality_control import QualityControlEngine
 from .sensor import SensorEngine
 from .thing import ThingEngine
 from .data_array import DataArrayEngine
+from .columnar_observation import ColumnarObservationEngine
+from .async_engine import TestAsyncSensorThingsEngine  # noqa: F401
 
 
 class TestSensorThingsEngine(
@@ -53,3 +55,17 @@ class TestQualityControlSensorThingsEngine(
     QualityControlEngine
 ):
     pass
+
+
+class TestColumnarSensorThingsEngine(
+    DatastreamEngine,
+    FeatureOfInterestEngine,
+    HistoricalLocationEngine,
+    LocationEngine,
+    ColumnarObservationEngine,
+    ObservedPropertyEngine,
+    SensorEngine,
+    ThingEngine,
+    SensorThingsBaseEngine
+):
+    pass
@@ -0,0 +1,73 @@
+import functools
+from sensorthings import SensorThingsBaseAsyncEngine
+from sensorthings.extensions.dataarray.engine import DataArrayBaseEngine
+from sensorthings.extensions.qualitycontrol.engine import QualityControlBaseEngine
+from .datastream import DatastreamEngine
+from .feature_of_interest import FeatureOfInterestEngine
+from .historical_location import HistoricalLocationEngine
+from .location import LocationEngine
+from .observation import ObservationEngine
+from .observed_property import ObservedPropertyEngine
+from .quality_control import QualityControlEngine
+from .sensor import SensorEngine
+from .thing import ThingEngine
+from .data_array import DataArrayEngine
+from .utils import SensorThingsUtils
+
+
+def run_async(method):
+    @functools.wraps(method)
+    async def async_method(self, *args, **kwargs):
+        return method(self, *args, **kwargs)
+    return async_method
+
+
+class TestAsyncSensorThingsEngine(
+    SensorThingsBaseAsyncEngine,
+    DataArrayBaseEngine,
+    QualityControlBaseEngine,
+    SensorThingsUtils
+):
+    get_datastreams = run_async(DatastreamEngine.get_datastreams)
+    create_datastream = run_async(DatastreamEngine.create_datastream)
+    update_datastream = run_async(DatastreamEngine.update_datastream)
+    delete_datastream = run_async(DatastreamEngine.delete_datastream)
+
+    get_features_of_interest = run_async(FeatureOfInterestEngine.get_features_of_interest)
+    create_feature_of_interest = run_async(FeatureOfInterestEngine.create_feature_of_interest)
+    update_feature_of_interest = run_async(FeatureOfInterestEngine.update_feature_of_interest)
+    delete_feature_of_interest = run_async(FeatureOfInterestEngine.delete_feature_of_interest)
+
+    get_historical_locations = run_async(HistoricalLocationEngine.get_historical_locations)
+    create_historical_location = run_async(HistoricalLocationEngine.create_historical_location)
+    update_historical_location = run_async(HistoricalLocationEngine.update_historical_location)
+    delete_historical_location = run_async(HistoricalLocationEngine.delete_historical_location)
+
+    get_locations = run_async(LocationEngine.get_locations)
+    create_location = run_async(LocationEngine.create_location)
+    update_location = run_async(LocationEngine.update_location)
+    delete_location = run_async(LocationEngine.delete_location)
+
+    get_observations = run_async(ObservationEngine.get_observations)
+    create_observation = run_async(ObservationEngine.create_observation)
+    update_observation = run_async(ObservationEngine.update_observation)
+    delete_observation = run_async(ObservationEngine.delete_observation)
+    get_datastream_time_bounds = run_async(ObservationEngine.get_datastream_time_bounds)
+
+    get_observed_properties = run_async(ObservedPropertyEngine.get_observed_properties)
+    create_observed_property = run_async(ObservedPropertyEngine.create_observed_property)
+    update_observed_property = run_async(ObservedPropertyEngine.update_observed_property)
+    delete_observed_property = run_async(ObservedPropertyEngine.delete_observed_property)
+
+    get_sensors = run_async(SensorEngine.get_sensors)
+    create_sensor = run_async(SensorEngine.create_sensor)
+    update_sensor = run_async(SensorEngine.update_sensor)
+    delete_sensor = run_async(SensorEngine.delete_sensor)
+
+    get_things = run_async(ThingEngine.get_things)
+    create_thing = run_async(ThingEngine.create_thing)
+    update_thing = run_async(ThingEngine.update_thing)
+    delete_thing = run_async(ThingEngine.delete_thing)
+
+    create_observations = run_async(DataArrayEngine.create_observations)
+    delete_observations = run_async(QualityControlEngine.delete_observations)
@@ -0,0 +1,474 @@
+import operator
+import threading
+from collections.abc import Mapping
+from datetime import timezone
+from functools import lru_cache
+from ninja.errors import HttpError
+from odata_query import ast
+from sensorthings.components.observations.engine import ObservationBaseEngine
+from sensorthings.components.observations.schemas import ObservationPostBody, ObservationPatchBody
+from sensorthings.extensions.dataarray.engine import DataArrayBaseEngine
+from sensorthings.types.iso_string import validate_iso_time
+from .utils import SensorThingsUtils
+from ..data import observations
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+column_names = {
+    'id': 'id', '@iot.id': 'id', 'phenomenonTime': 'phenomenon_time', 'result': 'result', 'resultTime': 'result_time',
+    'FeatureOfInterest/id': 'feature_of_interest_id', 'Datastream/id': 'datastream_id'
+}
+
+comparators = {
+    ast.Eq: operator.eq, ast.NotEq: operator.ne, ast.Gt: operator.gt, ast.GtE: operator.ge, ast.Lt: operator.lt,
+    ast.LtE: operator.le
+}
+
+extra_fields = ['result_quality', 'valid_time', 'parameters']
+
+
+class ColumnarObservationStore:
+    """
+    Keeps the Observations of each Datastream in numpy arrays sorted by phenomenon time.
+
+    Arrays are replaced rather than modified on writes, so readers can use the arrays of a Datastream without holding
+    the write lock.
+    """
+
+    def __init__(self):
+        if np is None:
+            raise ImportError('The columnar Observation engine requires numpy.')
+
+        self.datastreams = {}
+        self.extras = {}
+        self.next_id = 1
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def parse_times(values):
+        return np.array([
+            validate_iso_time(value)[:19] if value is not None else 'NaT' for value in values
+        ], dtype='datetime64[s]')
+
+    @staticmethod
+    def format_times(values):
+        return [
+            None if value == 'NaT' else f'{value}+00:00' for value in np.datetime_as_string(values, unit='s').tolist()
+        ]
+
+    def build_columns(self, rows):
+        phenomenon_times = [(row.get('phenomenon_time') or '').partition('/') for row in rows]
+
+        return {
+            'id': np.array([row['id'] for row in rows], dtype=np.int64),
+            'phenomenon_time': self.parse_times([start_time for start_time, _, _ in phenomenon_times]),
+            'phenomenon_time_end': self.parse_times([end_time or None for _, _, end_time in phenomenon_times]),
+            'result': np.array([row['result'] for row in rows], dtype=np.float64),
+            'result_time': self.parse_times([row.get('result_time') for row in rows]),
+            'feature_of_interest_id': np.array([
+                row.get('feature_of_interest_id') or -1 for row in rows
+            ], dtype=np.int64)
+        }
+
+    @staticmethod
+    def sort_columns(columns):
+        order = np.argsort(columns['phenomenon_time'], kind='stable')
+        return {name: column[order] for name, column in columns.items()}
+
+    def insert(self, rows):
+        """
+        Adds Observation rows to the store, assigning IDs to rows without one, and returns their IDs.
+        """
+
+        with self.lock:
+            for row in rows:
+                if row.get('id') is None:
+                    row['id'] = self.next_id
+                self.next_id = max(self.next_id, row['id'] + 1)
+                extras = {field: row[field] for field in extra_fields if row.get(field) is not None}
+                if extras:
+                    self.extras[row['id']] = extras
+
+            datastream_rows = {}
+            for row in rows:
+                datastream_rows.setdefault(row['datastream_id'], []).append(row)
+
+            for datastream_id, new_rows in datastream_rows.items():
+                new_columns = self.sort_columns(self.build_columns(new_rows))
+                columns = self.datastreams.get(datastream_id)
+
+                if columns is not None and len(columns['id']):
+                    is_appended = new_columns['phenomenon_time'][0] >= columns['phenomenon_time'][-1]
+                    new_columns = {
+                        name: np.concatenate([column, new_columns[name]]) for name, column in columns.items()
+                    }
+                    if not is_appended:
+                        new_columns = self.sort_columns(new_columns)
+
+                self.datastreams[datastream_id] = new_columns
+
+        return [row['id'] for row in rows]
+
+    def remove(self, observation_id):
+        """
+        Removes an Observation from the store and returns its row, or None if it does not exist.
+        """
+
+        with self.lock:
+            for datastream_id, columns in self.datastreams.items():
+                index = np.flatnonzero(columns['id'] == observation_id)
+                if len(index):
+                    row = self.get_rows(datastream_id, columns, index)[0]
+                    self.datastreams[datastream_id] = {
+                        name: np.delete(column, index) for name, column in columns.items()
+                    }
+                    row.update(self.extras.pop(observation_id, {}))
+                    return row
+
+        return None
+
+    def get_rows(self, datastream_ids, columns, positions):
+        values = zip(
+            columns['id'][positions].tolist(),
+            self.format_times(columns['phenomenon_time'][positions]),
+            self.format_times(columns['phenomenon_time_end'][positions]),
+            columns['result'][positions].tolist(),
+            self.format_times(columns['result_time'][positions]),
+            np.broadcast_to(datastream_ids, columns['id'].shape)[positions].tolist(),
+            columns['feature_of_interest_id'][positions].tolist()
+        )
+
+        return [
+            {
+                'id': observation_id,
+                'phenomenon_time': f'{start_time}/{end_time}' if end_time is not None else start_time,
+                'result': result,
+                'result_time': result_time,
+                'datastream_id': datastream_id,
+                'feature_of_interest_id': feature_of_interest_id if feature_of_interest_id >= 0 else None
+            } for (
+                observation_id, start_time, end_time, result, result_time, datastream_id, feature_of_interest_id
+            ) in values
+        ]
+
+
+@lru_cache(maxsize=None)
+def get_observation_store():
+    observation_store = ColumnarObservationStore()
+    observation_store.insert([dict(observation) for observation in observations.values()])
+    return observation_store
+
+
+class ColumnarObservationEngine(ObservationBaseEngine, DataArrayBaseEngine, SensorThingsUtils):
+    def get_observations(
+            self,
+            observation_ids: list[int] = None,
+            datastream_ids: list[int] = None,
+            feature_of_interest_ids: list[int] = None,
+            pagination: dict = None,
+            ordering: dict = None,
+            filters: dict = None,
+            expanded: bool = False,
+            fields: list[str] = None,
+            limit_per_parent: dict = None,
+            get_count: bool = False
+    ) -> (list[int, dict], int):
+
+        observation_store = get_observation_store()
+        search_bounds, filters = self.split_search_bounds(filters)
+        datastream_frames = []
+
+        for datastream_id, columns in sorted(observation_store.datastreams.items()):
+            if datastream_ids is not None and datastream_id not in datastream_ids or \
+                    search_bounds.get('datastream_id', datastream_id) != datastream_id:
+                continue
+            start, end = self.search_time_bounds(columns['phenomenon_time'], search_bounds)
+            frame = {name: column[start:end] for name, column in columns.items()}
+            frame['datastream_id'] = np.broadcast_to(np.int64(datastream_id), frame['id'].shape)
+            datastream_frames.append(frame)
+
+        if not datastream_frames:
+            return {}, 0 if get_count else None
+        elif len(datastream_frames) == 1:
+            frame = datastream_frames[0]
+        else:
+            frame = {
+                name: np.concatenate([datastream_frame[name] for datastream_frame in datastream_frames])
+                for name in datastream_frames[0]
+            }
+
+        mask = self.evaluate_filters(frame, filters) if filters is not None else None
+
+        for name, ids in [('id', observation_ids), ('feature_of_interest_id', feature_of_interest_ids)]:
+            if ids is not None:
+                ids_mask = np.isin(frame[name], np.asarray(list(ids), dtype=np.int64))
+                mask = ids_mask if mask is None else mask & ids_mask
+
+        positions = self.order_positions(
+            frame, ordering, mask, is_sorted=len(datastream_frames) == 1 or (
+                limit_per_parent is not None and limit_per_parent['field'] == 'datastream_id'
+            )
+        )
+
+        if get_count:
+            count = len(positions)
+        else:
+            count = None
+
+        if limit_per_parent is not None:
+            positions = self.limit_positions_per_parent(frame, positions, limit_per_parent)
+
+        if pagination is not None:
+            positions = positions[pagination['skip']: pagination['skip'] + max(pagination['top'], 0)]
+
+        rows = observation_store.get_rows(frame['datastream_id'], frame, np.asarray(positions, dtype=np.int64))
+        response = {row['id']: {**row, **observation_store.extras.get(row['id'], {})} for row in rows}
+        response = self.apply_fields(response, fields)
+
+        return response, count
+
+    @staticmethod
+    def get_column_name(node):
+        if isinstance(node, ast.Identifier):
+            path = node.name
+        elif isinstance(node, ast.Attribute) and isinstance(node.owner, ast.Identifier):
+            path = f'{node.owner.name}/{node.attr}'
+        else:
+            path = None
+
+        if path not in column_names:
+            raise HttpError(422, 'Unsupported filter for the columnar Observation engine.')
+
+        return column_names[path]
+
+    @staticmethod
+    def get_value(node):
+        if isinstance(node, (ast.DateTime, ast.Date)):
+            return np.datetime64(validate_iso_time(node.val)[:19], 's')
+        elif isinstance(node, (ast.Integer, ast.Float)):
+            return float(node.val)
+        elif isinstance(node, ast.String):
+            try:
+                return float(node.val)
+            except ValueError:
+                pass
+
+        raise HttpError(422, 'Unsupported filter for the columnar Observation engine.')
+
+    def split_search_bounds(self, filters):
+        """
+        Separates the phenomenon time comparisons and Datastream ID condition joined to the rest of the filters with
+        'and'. These are answered with a binary search of the sorted phenomenon times of the selected Datastream
+        instead of a mask.
+        """
+
+        conditions = []
+        search_bounds = {}
+
+        def split(node):
+            if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.And):
+                split(node.left)
+                split(node.right)
+            else:
+                conditions.append(node)
+
+        if filters is not None:
+            split(filters)
+
+        residual_conditions = []
+
+        for condition in conditions:
+            if isinstance(condition, ast.Compare) and isinstance(condition.left, ast.Identifier) and \
+                    condition.left.name == 'phenomenonTime' and type(condition.comparator) in \
+                    (ast.Eq, ast.Gt, ast.GtE, ast.Lt, ast.LtE):
+                search_bounds.setdefault('conditions', []).append(
+                    (type(condition.comparator), self.get_value(condition.right))
+                )
+            elif isinstance(condition, ast.Compare) and isinstance(condition.comparator, ast.Eq) and \
+                    isinstance(condition.left, ast.Attribute) and 'datastream_id' not in search_bounds and \
+                    self.get_column_name(condition.left) == 'datastream_id':
+                search_bounds['datastream_id'] = int(self.get_value(condition.right))
+            else:
+                residual_conditions.append(condition)
+
+        residual_filters = None
+        for condition in residual_conditions:
+            residual_filters = condition if residual_filters is None else ast.BoolOp(
+                op=ast.And(), left=residual_filters, right=condition
+            )
+
+        return search_bounds, residual_filters
+
+    @staticmethod
+    def search_time_bounds(phenomenon_times, search_bounds):
+        start, end = 0, len(phenomenon_times)
+
+        for comparator, value in search_bounds.get('conditions', []):
+            if comparator in (ast.Gt, ast.GtE, ast.Eq):
+                start = max(start, np.searchsorted(
+                    phenomenon_times, value, side='right' if comparator is ast.Gt else 'left'
+                ))
+            if comparator in (ast.Lt, ast.LtE, ast.Eq):
+                end = min(end, np.searchsorted(
+                    phenomenon_times, value, side='left' if comparator is ast.Lt else 'right'
+                ))
+
+        return start, max(start, end)
+
+    def evaluate_filters(self, frame, node):
+        if isinstance(node, ast.BoolOp):
+            left, right = self.evaluate_filters(frame, node.left), self.evaluate_filters(frame, node.right)
+            return left & right if isinstance(node.op, ast.And) else left | right
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return ~self.evaluate_filters(frame, node.operand)
+        elif isinstance(node, ast.Compare) and type(node.comparator) in comparators:
+            try:
+                return comparators[type(node.comparator)](
+                    frame[self.get_column_name(node.left)], self.get_value(node.right)
+                )
+            except TypeError:
+                raise HttpError(422, 'Invalid filter value for the columnar Observation engine.')
+
+        raise HttpError(422, 'Unsupported filter for the columnar Observation engine.')
+
+    def order_positions(self, frame, ordering, mask, is_sorted):
+        """
+        Returns the positions of the selected rows of a frame in the requested order.
+
+        The rows of each Datastream are already sorted by phenomenon time, so ordering the rows of a single Datastream
+        (or of each Datastream separately) by phenomenon time returns their positions without sorting them.
+        """
+
+        ordering = [
+            {'field': column_names.get(order_field['field']), 'direction': order_field['direction']}
+            for order_field in ordering or []
+        ]
+
+        if any(order_field['field'] not in frame for order_field in ordering):
+            raise HttpError(422, 'Unsupported ordering for the columnar Observation engine.')
+
+        positions = np.flatnonzero(mask) if mask is not None else range(len(frame['id']))
+
+        if is_sorted and ordering and all(order_field['field'] == 'phenomenon_time' for order_field in ordering):
+            return positions[::-1] if ordering[0]['direction'] == 'desc' else positions
+        elif ordering:
+            positions = np.asarray(positions, dtype=np.int64)
+            sort_keys = [frame['id'][positions]]
+            for order_field in reversed(ordering):
+                sort_key = frame[order_field['field']][positions]
+                sort_key = sort_key.view(np.int64) if sort_key.dtype.kind == 'M' else sort_key
+                sort_keys.append(-sort_key if order_field['direction'] == 'desc' else sort_key)
+            positions = positions[np.lexsort(sort_keys)]
+
+        return positions
+
+    @staticmethod
+    def limit_positions_per_parent(frame, positions, limit_per_parent):
+        positions = np.asarray(positions, dtype=np.int64)
+        groups = frame[limit_per_parent['field']][positions]
+        group_order = np.argsort(groups, kind='stable')
+        sorted_groups = groups[group_order]
+        group_starts = np.flatnonzero(np.r_[True, sorted_groups[1:] != sorted_groups[:-1]])
+        ranks = np.empty(len(positions), dtype=np.int64)
+        ranks[group_order] = np.arange(len(positions)) - np.repeat(
+            group_starts, np.diff(np.r_[group_starts, len(positions)])
+        )
+
+        return positions[
+            (ranks >= limit_per_parent['skip']) & (ranks < limit_per_parent['skip'] + limit_per_parent['top'])
+        ]
+
+    def get_datastream_time_bounds(
+            self,
+            datastream_ids: list[int]
+    ) -> dict:
+
+        time_bounds = {}
+
+        for datastream_id in datastream_ids:
+            columns = get_observation_store().datastreams.get(datastream_id)
+            if columns is None or not len(columns['id']):
+                continue
+            datastream_time_bounds = time_bounds.setdefault(datastream_id, {})
+            phenomenon_time_end = np.fmax(columns['phenomenon_time'], columns['phenomenon_time_end']).max()
+            for field, start_time, end_time in [
+                ('phenomenon_time', columns['phenomenon_time'][0], phenomenon_time_end),
+                ('result_time', np.min(columns['result_time']), np.max(columns['result_time']))
+            ]:
+                if not np.isnat(start_time):
+                    datastream_time_bounds[field] = tuple(
+                        time.item().replace(tzinfo=timezone.utc) for time in (start_time, end_time)
+                    )
+
+        return time_bounds
+
+    def create_observation(
+            self,
+            observation: ObservationPostBody,
+    ) -> int:
+
+        return self.create_observations([observation])[0]
+
+    def create_observations(
+            self,
+            observations: list[ObservationPostBody] | Mapping
+    ) -> list[int]:
+
+        if isinstance(observations, Mapping):
+            observations = [
+                observation for datastream_observations in observations.values()
+                for observation in datastream_observations
+            ]
+
+        return get_observation_store().insert([
+            {
+                **observation.model_dump(include={'phenomenon_time', 'result', 'result_time', *extra_fields}),
+                'datastream_id': observation.datastream.id,
+                'feature_of_interest_id': observation.feature_of_interest.id
+                if observation.feature_of_interest is not None else None
+            } for observation in observations
+        ])
+
+    def create_observations_columnar(
+            self,
+            observations: dict[int, dict[str, list]]
+    ) -> list[int]:
+
+        return get_observation_store().insert([
+            {**dict(zip(columns, row)), 'datastream_id': datastream_id}
+            for datastream_id, columns in observations.items() for row in zip(*columns.values())
+        ])
+
+    def update_observation(
+            self,
+            observation_id: int,
+            observation: ObservationPatchBody
+    ) -> None:
+
+        observation_store = get_observation_store()
+        row = observation_store.remove(observation_id)
+
+        if row is not None:
+            row.update(observation.model_dump(
+                include={'phenomenon_time', 'result', 'result_time', *extra_fields}, exclude_unset=True
+            ))
+            if observation.datastream is not None:
+                row['datastream_id'] = observation.datastream.id
+            if observation.feature_of_interest is not None:
+                row['feature_of_interest_id'] = observation.feature_of_interest.id
+            observation_store.insert([row])
+
+        return None
+
+    def delete_observation(
+            self,
+            observation_id: int
+    ) -> None:
+
+        get_observation_store().remove(observation_id)
+
+        return None
@@ -15,10 +15,15 @@ class DatastreamEngine(DatastreamBaseEngine, SensorThingsUtils):
             ordering: dict = None,
             filters: dict = None,
             expanded: bool = False,
+            fields: list[str] = None,
             get_count: bool = False
     ) -> (list[int, dict], int):
 
         response = datastreams
+        response = self.apply_ids(response, 'id', datastream_ids)
+        response = self.apply_ids(response, 'thing_id', thing_ids)
+        response = self.apply_ids(response, 'sensor_id', sensor_ids)
+        response = self.apply_ids(response, 'observed_property_id', observed_property_ids)
         response = self.apply_filters(response, filters)
         response = self.apply_order(response, ordering)
 
@@ -30,6 +35,8 @@ class DatastreamEngine(DatastreamBaseEngine, SensorThingsUtils):
         if pagination is not None:
             response = self.apply_pagination(response, pagination)
 
+        response = self.apply_fields(response, fields)
+
         return response, count
 
     def create_datastream(
@@ -13,10 +13,12 @@ class FeatureOfInterestEngine(FeatureOfInterestBaseEngine, SensorThingsUtils):
             ordering: dict = None,
             filters: dict = None,
             expanded: bool = False,
+            fields: list[str] = None,
             get_count: bool = False
     ) -> (list[int, dict], int):
 
         response = features_of_interest
+        response = self.apply_ids(response, 'id', feature_of_interest_ids)
         response = self.apply_filters(response, filters)
         response = self.apply_order(response, ordering)
 
@@ -28,6 +30,8 @@ class FeatureOfInterestEngine(FeatureOfInterestBaseEngine, SensorThingsUtils):
         if pagination is not None:
             response = self.apply_pagination(response, pagination)
 
+        response = self.apply_fields(response, fields)
+
         return response, count
 
     def create_feature_of_interest(
@@ -15,10 +15,14 @@ class HistoricalLocationEngine(HistoricalLocationBaseEngine, SensorThingsUtils):
             ordering: dict = None,
             filters: dict = None,
             expanded: bool = False,
+            fields: list[str] = None,
             get_count: bool = False
     ) -> (list[int, dict], int):
 
         response = historical_locations
+        response = self.apply_ids(response, 'id', historical_location_ids)
+        response = self.apply_ids(response, 'thing_id', thing_ids)
+        response = self.apply_ids(response, 'location_ids', location_ids)
         response = self.apply_filters(response, filters)
         response = self.apply_order(response, ordering)
 
@@ -30,6 +34,8 @@ class HistoricalLocationEngine(HistoricalLocationBaseEngine, SensorThingsUtils):
         if pagination is not None:
             response = self.apply_pagination(response, pagination)
 
+        response = self.apply_fields(response, fields)
+
         return response, count
 
     def create_historical_location(
@@ -14,10 +14,14 @@ class LocationEngine(LocationBaseEngine, SensorThingsUtils):
             ordering: dict = None,
             filters: dict = None,
             expanded: bool = False,
+            fields: list[str] = None,
             get_count: bool = False
     ) -> (list[int, dict], int):
 
         response = locations
+        response = self.apply_ids(response, 'id', location_ids)
+        response = self.apply_ids(response, 'thing_ids', thing_ids)
+        response = self.apply_ids(response, 'historical_location_ids', historical_location_ids)
         response = self.apply_filters(response, filters)
         response = self.apply_order(response, ordering)
 
@@ -29,6 +33,8 @@ class LocationEngine(LocationBaseEngine, SensorThingsUtils):
         if pagination is not None:
             response = self.apply_pagination(response, pagination)
 
+        response = self.apply_fields(response, fields)
+
         return response, count
 
     def create_location(
@@ -1,3 +1,4 @@
+from dateutil.parser import isoparse
 from sensorthings.components.observations.engine import ObservationBaseEngine
 from sensorthings.components.observations.schemas import ObservationPostBody, ObservationPatchBody
 from .utils import SensorThingsUtils
@@ -14,10 +15,16 @@ class ObservationEngine(ObservationBaseEngine, SensorThingsUtils):
             ordering: dict = None,
             filters: dict = None,
             expanded: bool = False,
+            fields: list[str] = None,
+            seek: dict = None,
+            limit_per_parent: dict = None,
             get_count: bool = False
     ) -> (list[int, dict], int):
 
         response = observations
+        response = self.apply_ids(response, 'id', observation_ids)
+        response = self.apply_ids(response, 'datastream_id', datastream_ids)
+        response = self.apply_ids(response, 'feature_of_interest_id', feature_of_interest_ids)
         response = self.apply_filters(response, filters)
         response = self.apply_order(response, ordering)
 
@@ -26,11 +33,36 @@ class ObservationEngine(ObservationBaseEngine, SensorThingsUtils):
         else:
             count = None
 
+        response = self.apply_seek(response, seek)
+        response = self.apply_limit_per_parent(response, limit_per_parent)
+
         if pagination is not None:
             response = self.apply_pagination(response, pagination)
 
+        response = self.apply_fields(response, fields)
+
         return response, count
 
+    def get_datastream_time_bounds(
+            self,
+            datastream_ids: list[int]
+    ) -> dict:
+
+        time_bounds = {}
+
+        for observation in observations.values():
+            if observation['datastream_id'] not in datastream_ids:
+                continue
+            datastream_time_bounds = time_bounds.setdefault(observation['datastream_id'], {})
+            for field in ['phenomenon_time', 'result_time']:
+                if observation.get(field) is None:
+                    continue
+                time = isoparse(observation[field])
+                start_time, end_time = datastream_time_bounds.get(field, (time, time))
+                datastream_time_bounds[field] = (min(start_time, time), max(end_time, time))
+
+        return time_bounds
+
     def create_observation(
             self,
             observation: ObservationPostBody,
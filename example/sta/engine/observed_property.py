@@ -12,10 +12,12 @@ class ObservedPropertyEngine(ObservedPropertyBaseEngine, SensorThingsUtils):
             ordering: dict = None,
             filters: dict = None,
             expanded: bool = False,
+            fields: list[str] = None,
             get_count: bool = False
     ) -> (list[int, dict], int):
 
         response = observed_properties
+        response = self.apply_ids(response, 'id', observed_property_ids)
         response = self.apply_filters(response, filters)
         response = self.apply_order(response, ordering)
 
@@ -27,6 +29,8 @@ class ObservedPropertyEngine(ObservedPropertyBaseEngine, SensorThingsUtils):
         if pagination is not None:
             response = self.apply_pagination(response, pagination)
 
+        response = self.apply_fields(response, fields)
+
         return response, count
 
     def create_observed_property(
@@ -13,10 +13,13 @@ class ThingEngine(ThingBaseEngine, SensorThingsUtils):
             ordering: dict = None,
             filters: dict = None,
             expanded: bool = False,
+            fields: list[str] = None,
             get_count: bool = False
     ) -> (list[int, dict], int):
 
         response = things
+        response = self.apply_ids(response, 'id', thing_ids)
+        response = self.apply_ids(response, 'location_ids', location_ids)
         response = self.apply_filters(response, filters)
         response = self.apply_order(response, ordering)
 
@@ -28,6 +31,8 @@ class ThingEngine(ThingBaseEngine, SensorThingsUtils):
         if pagination is not None:
             response = self.apply_pagination(response, pagination)
 
+        response = self.apply_fields(response, fields)
+
         return response, count
 
     def create_thing(
@@ -5,6 +5,37 @@ class SensorThingsUtils:
             i['id']: i for i in list(response.values())[pagination['skip']: pagination['skip'] + pagination['top']]
         } if pagination['top'] > 0 else {}
 
+    @staticmethod
+    def apply_limit_per_parent(response, limit_per_parent):
+        if limit_per_parent is not None:
+            partitions = {}
+            for k, v in response.items():
+                partitions.setdefault(v.get(limit_per_parent['field']), []).append(k)
+            ranked_ids = {
+                k for partition in partitions.values()
+                for k in partition[limit_per_parent['skip']: limit_per_parent['skip'] + limit_per_parent['top']]
+            }
+            response = {k: v for k, v in response.items() if k in ranked_ids}
+        return response
+
+    @staticmethod
+    def apply_ids(response, field, ids):
+        if ids is not None:
+            ids = set(ids)
+            response = {
+                k: v for k, v in response.items()
+                if (ids.intersection(v.get(field) or []) if isinstance(v.get(field), list) else v.get(field) in ids)
+            }
+        return response
+
+    @staticmethod
+    def apply_fields(response, fields):
+        if fields is not None:
+            response = {
+                k: {field: value for field, value in v.items() if field in fields} for k, v in response.items()
+            }
+        return response
+
     @staticmethod
     def apply_filters(response, filters):
         if filters:
@@ -16,3 +47,22 @@ class SensorThingsUtils:
     @staticmethod
     def apply_order(response, order_by):
         return response
+
+    @staticmethod
+    def apply_seek(response, seek):
+        if seek is not None:
+            for seek_field in reversed(seek['fields']):
+                response = dict(sorted(
+                    response.items(), key=lambda item: item[1].get(seek_field['field']),
+                    reverse=seek_field['direction'] == 'desc'
+                ))
+
+            def is_after(entity):
+                for seek_field, value in zip(seek['fields'], seek['after']):
+                    if entity.get(seek_field['field']) != value:
+                        return (entity.get(seek_field['field']) > value) == (seek_field['direction'] == 'asc')
+                return False
+
+            if seek['after'] is not None:
+                response = {k: v for k, v in response.items() if is_after(v)}
+        return response
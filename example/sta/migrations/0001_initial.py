@@ -0,0 +1,114 @@
+# Generated by Django 5.0.14 on 2026-10-17 23:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeatureOfInterest',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('description', models.TextField()),
+                ('encoding_type', models.CharField(max_length=255)),
+                ('feature', models.JSONField()),
+                ('properties', models.JSONField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Location',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('description', models.TextField()),
+                ('encoding_type', models.CharField(max_length=255)),
+                ('location', models.JSONField()),
+                ('properties', models.JSONField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ObservedProperty',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('definition', models.TextField()),
+                ('description', models.TextField()),
+                ('properties', models.JSONField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Sensor',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('description', models.TextField()),
+                ('encoding_type', models.CharField(max_length=255)),
+                ('metadata', models.TextField()),
+                ('properties', models.JSONField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Thing',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('description', models.TextField()),
+                ('properties', models.JSONField(blank=True, null=True)),
+                ('locations', models.ManyToManyField(blank=True, related_name='things', to='sta.location')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='HistoricalLocation',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('time', models.DateTimeField()),
+                ('locations', models.ManyToManyField(blank=True, related_name='historical_locations', to='sta.location')),
+                ('thing', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='historical_locations', to='sta.thing')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Datastream',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('description', models.TextField()),
+                ('unit_of_measurement', models.JSONField()),
+                ('observation_type', models.CharField(max_length=255)),
+                ('observed_area', models.JSONField(blank=True, null=True)),
+                ('phenomenon_time_start', models.DateTimeField(blank=True, null=True)),
+                ('phenomenon_time_end', models.DateTimeField(blank=True, null=True)),
+                ('result_time_start', models.DateTimeField(blank=True, null=True)),
+                ('result_time_end', models.DateTimeField(blank=True, null=True)),
+                ('properties', models.JSONField(blank=True, null=True)),
+                ('observed_property', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='datastreams', to='sta.observedproperty')),
+                ('sensor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='datastreams', to='sta.sensor')),
+                ('thing', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='datastreams', to='sta.thing')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Observation',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('phenomenon_time', models.DateTimeField()),
+                ('phenomenon_time_end', models.DateTimeField(blank=True, null=True)),
+                ('result', models.FloatField()),
+                ('result_time', models.DateTimeField(blank=True, null=True)),
+                ('result_quality', models.JSONField(blank=True, null=True)),
+                ('valid_time', models.CharField(blank=True, max_length=255, null=True)),
+                ('parameters', models.JSONField(blank=True, null=True)),
+                ('datastream', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='observations', to='sta.datastream')),
+                ('feature_of_interest', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='observations', to='sta.featureofinterest')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['datastream', 'phenomenon_time'], name='sta_observa_datastr_c7e27e_idx')],
+            },
+        ),
+    ]
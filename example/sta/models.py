@@ -0,0 +1,78 @@
+from django.db import models
+
+
+class Thing(models.Model):
+    name = models.CharField(max_length=255)
+    description = models.TextField()
+    properties = models.JSONField(null=True, blank=True)
+    locations = models.ManyToManyField('Location', related_name='things', blank=True)
+
+
+class Location(models.Model):
+    name = models.CharField(max_length=255)
+    description = models.TextField()
+    encoding_type = models.CharField(max_length=255)
+    location = models.JSONField()
+    properties = models.JSONField(null=True, blank=True)
+
+
+class HistoricalLocation(models.Model):
+    thing = models.ForeignKey(Thing, on_delete=models.CASCADE, related_name='historical_locations')
+    locations = models.ManyToManyField(Location, related_name='historical_locations', blank=True)
+    time = models.DateTimeField()
+
+
+class Sensor(models.Model):
+    name = models.CharField(max_length=255)
+    description = models.TextField()
+    encoding_type = models.CharField(max_length=255)
+    metadata = models.TextField()
+    properties = models.JSONField(null=True, blank=True)
+
+
+class ObservedProperty(models.Model):
+    name = models.CharField(max_length=255)
+    definition = models.TextField()
+    description = models.TextField()
+    properties = models.JSONField(null=True, blank=True)
+
+
+class Datastream(models.Model):
+    thing = models.ForeignKey(Thing, on_delete=models.CASCADE, related_name='datastreams')
+    sensor = models.ForeignKey(Sensor, on_delete=models.CASCADE, related_name='datastreams')
+    observed_property = models.ForeignKey(ObservedProperty, on_delete=models.CASCADE, related_name='datastreams')
+    name = models.CharField(max_length=255)
+    description = models.TextField()
+    unit_of_measurement = models.JSONField()
+    observation_type = models.CharField(max_length=255)
+    observed_area = models.JSONField(null=True, blank=True)
+    phenomenon_time_start = models.DateTimeField(null=True, blank=True)
+    phenomenon_time_end = models.DateTimeField(null=True, blank=True)
+    result_time_start = models.DateTimeField(null=True, blank=True)
+    result_time_end = models.DateTimeField(null=True, blank=True)
+    properties = models.JSONField(null=True, blank=True)
+
+
+class FeatureOfInterest(models.Model):
+    name = models.CharField(max_length=255)
+    description = models.TextField()
+    encoding_type = models.CharField(max_length=255)
+    feature = models.JSONField()
+    properties = models.JSONField(null=True, blank=True)
+
+
+class Observation(models.Model):
+    datastream = models.ForeignKey(Datastream, on_delete=models.CASCADE, related_name='observations')
+    feature_of_interest = models.ForeignKey(
+        FeatureOfInterest, on_delete=models.CASCADE, related_name='observations', null=True, blank=True
+    )
+    phenomenon_time = models.DateTimeField()
+    phenomenon_time_end = models.DateTimeField(null=True, blank=True)
+    result = models.FloatField()
+    result_time = models.DateTimeField(null=True, blank=True)
+    result_quality = models.JSONField(null=True, blank=True)
+    valid_time = models.CharField(max_length=255, null=True, blank=True)
+    parameters = models.JSONField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['datastream', 'phenomenon_time'])]
@@ -0,0 +1,24 @@
+from sensorthings.extensions.dataarray.engine import DataArrayBaseEngine
+from .utils import ORMUtils
+from ..models import Observation
+
+
+class DataArrayEngine(DataArrayBaseEngine, ORMUtils):
+    def create_observations_columnar(
+            self,
+            observations: dict[int, dict[str, list]]
+    ) -> list[int]:
+
+        observation_rows = []
+
+        for datastream_id, columns in observations.items():
+            for row in zip(*columns.values()):
+                values = {field: value for field, value in zip(columns, row) if value is not None}
+                values['phenomenon_time'], values['phenomenon_time_end'] = self.parse_interval(
+                    values['phenomenon_time']
+                )
+                if 'result_time' in values:
+                    values['result_time'] = self.parse_time(values['result_time'])
+                observation_rows.append(Observation(datastream_id=datastream_id, **values))
+
+        return [observation.id for observation in Observation.objects.bulk_create(observation_rows)]
@@ -0,0 +1,118 @@
+from sensorthings.components.datastreams.engine import DatastreamBaseEngine
+from sensorthings.components.datastreams.schemas import DatastreamPostBody, DatastreamPatchBody
+from .utils import ORMUtils
+from ..models import Datastream
+
+
+datastream_columns = {
+    'name': ['name'], 'description': ['description'], 'thing_id': ['thing_id'], 'sensor_id': ['sensor_id'],
+    'observed_property_id': ['observed_property_id'], 'unit_of_measurement': ['unit_of_measurement'],
+    'observation_type': ['observation_type'], 'observed_area': ['observed_area'],
+    'phenomenon_time': ['phenomenon_time_start', 'phenomenon_time_end'],
+    'result_time': ['result_time_start', 'result_time_end'], 'properties': ['properties']
+}
+
+
+class DatastreamEngine(DatastreamBaseEngine, ORMUtils):
+    def get_datastreams(
+            self,
+            datastream_ids: list[int] = None,
+            observed_property_ids: list[int] = None,
+            sensor_ids: list[int] = None,
+            thing_ids: list[int] = None,
+            pagination: dict = None,
+            ordering: dict = None,
+            filters: dict = None,
+            expanded: bool = False,
+            fields: list[str] = None,
+            seek: dict = None,
+            limit_per_parent: dict = None,
+            get_count: bool = False
+    ) -> (list[int, dict], int):
+
+        queryset = Datastream.objects.all()
+        queryset = self.apply_ids(queryset, 'id', datastream_ids)
+        queryset = self.apply_ids(queryset, 'thing_id', thing_ids)
+        queryset = self.apply_ids(queryset, 'sensor_id', sensor_ids)
+        queryset = self.apply_ids(queryset, 'observed_property_id', observed_property_ids)
+        queryset = self.apply_filters(queryset, filters)
+
+        if get_count:
+            count = queryset.count()
+        else:
+            count = None
+
+        queryset = self.apply_seek(queryset, seek)
+        queryset = self.apply_limit_per_parent(queryset, limit_per_parent, ordering, seek)
+        queryset = self.apply_order(queryset, ordering, seek)
+
+        if pagination is not None:
+            queryset = self.apply_pagination(queryset, pagination)
+
+        response = {
+            datastream['id']: self.get_datastream(datastream)
+            for datastream in queryset.values(*self.get_columns(datastream_columns, fields))
+        }
+        response = self.apply_fields(response, fields)
+
+        return response, count
+
+    def get_datastream(self, datastream: dict) -> dict:
+        for field in ['phenomenon_time', 'result_time']:
+            if f'{field}_start' in datastream:
+                datastream[field] = self.format_interval(
+                    datastream.pop(f'{field}_start'), datastream.pop(f'{field}_end')
+                )
+        return datastream
+
+    def get_datastream_values(self, datastream: DatastreamPostBody | DatastreamPatchBody, exclude_unset=False):
+        values = self.get_model_values(Datastream, datastream, exclude_unset=exclude_unset)
+
+        for field in ['thing', 'sensor', 'observed_property']:
+            if getattr(datastream, field) is not None:
+                values[f'{field}_id'] = getattr(datastream, field).id
+
+        for field in ['phenomenon_time', 'result_time']:
+            if not exclude_unset or field in datastream.model_fields_set:
+                values[f'{field}_start'], values[f'{field}_end'] = self.parse_interval(getattr(datastream, field))
+
+        return values
+
+    def create_datastream(
+            self,
+            datastream: DatastreamPostBody,
+    ) -> int:
+
+        return self.create_datastreams([datastream])[0]
+
+    def create_datastreams(
+            self,
+            datastreams: list[DatastreamPostBody]
+    ) -> list[int]:
+
+        return [
+            datastream.id for datastream in Datastream.objects.bulk_create([
+                Datastream(**self.get_datastream_values(datastream)) for datastream in datastreams
+            ])
+        ]
+
+    def update_datastream(
+            self,
+            datastream_id: int,
+            datastream: DatastreamPatchBody
+    ) -> None:
+
+        Datastream.objects.filter(id=datastream_id).update(
+            **self.get_datastream_values(datastream, exclude_unset=True)
+        )
+
+        return None
+
+    def delete_datastream(
+            self,
+            datastream_id: int
+    ) -> None:
+
+        Datastream.objects.filter(id=datastream_id).delete()
+
+        return None
@@ -0,0 +1,96 @@
+from sensorthings.components.featuresofinterest.engine import FeatureOfInterestBaseEngine
+from sensorthings.components.featuresofinterest.schemas import FeatureOfInterestPostBody, FeatureOfInterestPatchBody
+from .utils import ORMUtils
+from ..models import FeatureOfInterest, Observation
+
+
+feature_of_interest_columns = {
+    'name': ['name'], 'description': ['description'], 'encoding_type': ['encoding_type'], 'feature': ['feature'],
+    'properties': ['properties']
+}
+
+
+class FeatureOfInterestEngine(FeatureOfInterestBaseEngine, ORMUtils):
+    def get_features_of_interest(
+            self,
+            feature_of_interest_ids: list[int] = None,
+            observation_ids: list[int] = None,
+            pagination: dict = None,
+            ordering: dict = None,
+            filters: dict = None,
+            expanded: bool = False,
+            fields: list[str] = None,
+            get_count: bool = False
+    ) -> (list[int, dict], int):
+
+        queryset = FeatureOfInterest.objects.all()
+        queryset = self.apply_ids(queryset, 'id', feature_of_interest_ids)
+        queryset = self.apply_ids(queryset, 'observations', observation_ids)
+        queryset = self.apply_filters(queryset, filters)
+
+        if get_count:
+            count = queryset.count()
+        else:
+            count = None
+
+        queryset = self.apply_order(queryset, ordering)
+
+        if pagination is not None:
+            queryset = self.apply_pagination(queryset, pagination)
+
+        response = {
+            feature_of_interest['id']: feature_of_interest
+            for feature_of_interest in queryset.values(*self.get_columns(feature_of_interest_columns, fields))
+        }
+        response = self.apply_fields(response, fields)
+
+        return response, count
+
+    def create_feature_of_interest(
+            self,
+            feature_of_interest: FeatureOfInterestPostBody,
+    ) -> int:
+
+        return self.create_features_of_interest([feature_of_interest])[0]
+
+    def create_features_of_interest(
+            self,
+            features_of_interest: list[FeatureOfInterestPostBody]
+    ) -> list[int]:
+
+        feature_of_interest_ids = [
+            feature_of_interest.id for feature_of_interest in FeatureOfInterest.objects.bulk_create([
+                FeatureOfInterest(**self.get_model_values(FeatureOfInterest, feature_of_interest))
+                for feature_of_interest in features_of_interest
+            ])
+        ]
+
+        self.set_parent_ids(
+            Observation, 'feature_of_interest_id',
+            zip(feature_of_interest_ids, [
+                feature_of_interest.observations for feature_of_interest in features_of_interest
+            ])
+        )
+
+        return feature_of_interest_ids
+
+    def update_feature_of_interest(
+            self,
+            feature_of_interest_id: int,
+            feature_of_interest: FeatureOfInterestPatchBody
+    ) -> None:
+
+        FeatureOfInterest.objects.filter(id=feature_of_interest_id).update(
+            **self.get_model_values(FeatureOfInterest, feature_of_interest, exclude_unset=True)
+        )
+
+        return None
+
+    def delete_feature_of_interest(
+            self,
+            feature_of_interest_id: int
+    ) -> None:
+
+        FeatureOfInterest.objects.filter(id=feature_of_interest_id).delete()
+
+        return None
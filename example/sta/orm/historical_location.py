@@ -0,0 +1,117 @@
+from sensorthings.components.historicallocations.engine import HistoricalLocationBaseEngine
+from sensorthings.components.historicallocations.schemas import HistoricalLocationPostBody, HistoricalLocationPatchBody
+from .utils import ORMUtils
+from ..models import HistoricalLocation
+
+
+class HistoricalLocationEngine(HistoricalLocationBaseEngine, ORMUtils):
+    def get_historical_locations(
+            self,
+            historical_location_ids: list[int] = None,
+            thing_ids: list[int] = None,
+            location_ids: list[int] = None,
+            pagination: dict = None,
+            ordering: dict = None,
+            filters: dict = None,
+            expanded: bool = False,
+            fields: list[str] = None,
+            get_count: bool = False
+    ) -> (list[int, dict], int):
+
+        queryset = HistoricalLocation.objects.all()
+        queryset = self.apply_ids(queryset, 'id', historical_location_ids)
+        queryset = self.apply_ids(queryset, 'thing_id', thing_ids)
+        queryset = self.apply_ids(queryset, 'locations', location_ids)
+        queryset = self.apply_filters(queryset, filters)
+
+        if get_count:
+            count = queryset.count()
+        else:
+            count = None
+
+        queryset = self.apply_order(queryset, ordering)
+
+        if pagination is not None:
+            queryset = self.apply_pagination(queryset, pagination)
+
+        response = {
+            historical_location['id']: {
+                **historical_location, 'time': self.format_time(historical_location.get('time'))
+            } for historical_location in queryset.values(
+                *self.get_columns({'time': ['time'], 'thing_id': ['thing_id']}, fields)
+            )
+        }
+
+        if fields is None or 'location_ids' in fields:
+            location_ids = self.get_related_ids(
+                HistoricalLocation.locations.through, 'historicallocation_id', 'location_id', list(response)
+            )
+            for historical_location_id, historical_location in response.items():
+                historical_location['location_ids'] = location_ids[historical_location_id]
+
+        response = self.apply_fields(response, fields)
+
+        return response, count
+
+    def create_historical_location(
+            self,
+            historical_location: HistoricalLocationPostBody,
+    ) -> int:
+
+        return self.create_historical_locations([historical_location])[0]
+
+    def create_historical_locations(
+            self,
+            historical_locations: list[HistoricalLocationPostBody]
+    ) -> list[int]:
+
+        historical_location_ids = [
+            historical_location.id for historical_location in HistoricalLocation.objects.bulk_create([
+                HistoricalLocation(
+                    time=self.parse_time(historical_location.time), thing_id=historical_location.thing.id
+                ) for historical_location in historical_locations
+            ])
+        ]
+
+        self.add_related_ids(
+            HistoricalLocation.locations.through, 'historicallocation_id', 'location_id',
+            zip(historical_location_ids, [
+                historical_location.locations for historical_location in historical_locations
+            ])
+        )
+
+        return historical_location_ids
+
+    def update_historical_location(
+            self,
+            historical_location_id: int,
+            historical_location: HistoricalLocationPatchBody
+    ) -> None:
+
+        values = {}
+
+        if 'time' in historical_location.model_fields_set:
+            values['time'] = self.parse_time(historical_location.time)
+
+        if historical_location.thing is not None:
+            values['thing_id'] = historical_location.thing.id
+
+        HistoricalLocation.objects.filter(id=historical_location_id).update(**values)
+
+        if historical_location.locations is not None:
+            HistoricalLocation.locations.through.objects.filter(historicallocation_id=historical_location_id).delete()
+            self.add_related_ids(
+                HistoricalLocation.locations.through, 'historicallocation_id', 'location_id',
+                [(historical_location_id, historical_location.locations)]
+            )
+
+        return None
+
+    def delete_historical_location(
+            self,
+            historical_location_id: int
+    ) -> None:
+
+        HistoricalLocation.objects.filter(id=historical_location_id).delete()
+
+        return None
@@ -0,0 +1,124 @@
+from sensorthings.components.locations.engine import LocationBaseEngine
+from sensorthings.components.locations.schemas import LocationPostBody, LocationPatchBody
+from .utils import ORMUtils
+from ..models import Thing, Location, HistoricalLocation
+
+
+location_columns = {
+    'name': ['name'], 'description': ['description'], 'encoding_type': ['encoding_type'], 'location': ['location'],
+    'properties': ['properties']
+}
+
+
+class LocationEngine(LocationBaseEngine, ORMUtils):
+    def get_locations(
+            self,
+            location_ids: list[int] = None,
+            thing_ids: list[int] = None,
+            historical_location_ids: list[int] = None,
+            pagination: dict = None,
+            ordering: dict = None,
+            filters: dict = None,
+            expanded: bool = False,
+            fields: list[str] = None,
+            get_count: bool = False
+    ) -> (list[int, dict], int):
+
+        queryset = Location.objects.all()
+        queryset = self.apply_ids(queryset, 'id', location_ids)
+        queryset = self.apply_ids(queryset, 'things', thing_ids)
+        queryset = self.apply_ids(queryset, 'historical_locations', historical_location_ids)
+        queryset = self.apply_filters(queryset, filters)
+
+        if get_count:
+            count = queryset.count()
+        else:
+            count = None
+
+        queryset = self.apply_order(queryset, ordering)
+
+        if pagination is not None:
+            queryset = self.apply_pagination(queryset, pagination)
+
+        response = {
+            location['id']: location for location in queryset.values(*self.get_columns(location_columns, fields))
+        }
+
+        if fields is None or 'thing_ids' in fields:
+            thing_ids = self.get_related_ids(Thing.locations.through, 'location_id', 'thing_id', list(response))
+            for location_id, location in response.items():
+                location['thing_ids'] = thing_ids[location_id]
+
+        if fields is None or 'historical_location_ids' in fields:
+            historical_location_ids = self.get_related_ids(
+                HistoricalLocation.locations.through, 'location_id', 'historicallocation_id', list(response)
+            )
+            for location_id, location in response.items():
+                location['historical_location_ids'] = historical_location_ids[location_id]
+
+        response = self.apply_fields(response, fields)
+
+        return response, count
+
+    def create_location(
+            self,
+            location: LocationPostBody,
+    ) -> int:
+
+        return self.create_locations([location])[0]
+
+    def create_locations(
+            self,
+            locations: list[LocationPostBody]
+    ) -> list[int]:
+
+        location_ids = [
+            location.id for location in Location.objects.bulk_create([
+                Location(**self.get_model_values(Location, location)) for location in locations
+            ])
+        ]
+
+        self.add_related_ids(
+            Thing.locations.through, 'location_id', 'thing_id',
+            zip(location_ids, [location.things for location in locations])
+        )
+        self.add_related_ids(
+            HistoricalLocation.locations.through, 'location_id', 'historicallocation_id',
+            zip(location_ids, [location.historical_locations for location in locations])
+        )
+
+        return location_ids
+
+    def update_location(
+            self,
+            location_id: int,
+            location: LocationPatchBody
+    ) -> None:
+
+        Location.objects.filter(id=location_id).update(
+            **self.get_model_values(Location, location, exclude_unset=True)
+        )
+
+        if 'things' in location.model_fields_set:
+            Thing.locations.through.objects.filter(location_id=location_id).delete()
+            self.add_related_ids(
+                Thing.locations.through, 'location_id', 'thing_id', [(location_id, location.things)]
+            )
+
+        if 'historical_locations' in location.model_fields_set:
+            HistoricalLocation.locations.through.objects.filter(location_id=location_id).delete()
+            self.add_related_ids(
+                HistoricalLocation.locations.through, 'location_id', 'historicallocation_id',
+                [(location_id, location.historical_locations)]
+            )
+
+        return None
+
+    def delete_location(
+            self,
+            location_id: int
+    ) -> None:
+
+        Location.objects.filter(id=location_id).delete()
+
+        return None
@@ -0,0 +1,149 @@
+from collections.abc import Mapping
+from django.db.models import Min, Max
+from django.db.models.functions import Coalesce
+from sensorthings.components.observations.engine import ObservationBaseEngine
+from sensorthings.components.observations.schemas import ObservationPostBody, ObservationPatchBody
+from .utils import ORMUtils
+from ..models import Observation
+
+
+observation_columns = {
+    'phenomenon_time': ['phenomenon_time', 'phenomenon_time_end'], 'result': ['result'],
+    'result_time': ['result_time'], 'result_quality': ['result_quality'], 'valid_time': ['valid_time'],
+    'parameters': ['parameters'], 'datastream_id': ['datastream_id'],
+    'feature_of_interest_id': ['feature_of_interest_id']
+}
+
+
+class ObservationEngine(ObservationBaseEngine, ORMUtils):
+    def get_observations(
+            self,
+            observation_ids: list[int] = None,
+            datastream_ids: list[int] = None,
+            feature_of_interest_ids: list[int] = None,
+            pagination: dict = None,
+            ordering: dict = None,
+            filters: dict = None,
+            expanded: bool = False,
+            fields: list[str] = None,
+            seek: dict = None,
+            limit_per_parent: dict = None,
+            get_count: bool = False
+    ) -> (list[int, dict], int):
+
+        queryset = Observation.objects.all()
+        queryset = self.apply_ids(queryset, 'id', observation_ids)
+        queryset = self.apply_ids(queryset, 'datastream_id', datastream_ids)
+        queryset = self.apply_ids(queryset, 'feature_of_interest_id', feature_of_interest_ids)
+        queryset = self.apply_filters(queryset, filters)
+
+        if get_count:
+            count = queryset.count()
+        else:
+            count = None
+
+        queryset = self.apply_seek(queryset, seek)
+        queryset = self.apply_limit_per_parent(queryset, limit_per_parent, ordering, seek)
+        queryset = self.apply_order(queryset, ordering, seek)
+
+        if pagination is not None:
+            queryset = self.apply_pagination(queryset, pagination)
+
+        response = {
+            observation['id']: self.get_observation(observation)
+            for observation in queryset.values(*self.get_columns(observation_columns, fields))
+        }
+        response = self.apply_fields(response, fields)
+
+        return response, count
+
+    def get_observation(self, observation: dict) -> dict:
+        if 'phenomenon_time' in observation:
+            observation['phenomenon_time'] = self.format_interval(
+                observation['phenomenon_time'], observation.pop('phenomenon_time_end')
+            )
+        if 'result_time' in observation:
+            observation['result_time'] = self.format_time(observation['result_time'])
+        return observation
+
+    def get_observation_values(self, observation: ObservationPostBody | ObservationPatchBody, exclude_unset=False):
+        values = self.get_model_values(Observation, observation, exclude_unset=exclude_unset)
+
+        for field in ['datastream', 'feature_of_interest']:
+            if getattr(observation, field) is not None:
+                values[f'{field}_id'] = getattr(observation, field).id
+
+        if 'phenomenon_time' in values:
+            values['phenomenon_time'], values['phenomenon_time_end'] = self.parse_interval(values['phenomenon_time'])
+
+        if 'result_time' in values:
+            values['result_time'] = self.parse_time(values['result_time'])
+
+        return values
+
+    def get_datastream_time_bounds(
+            self,
+            datastream_ids: list[int]
+    ) -> dict:
+
+        time_bounds = {}
+
+        for datastream_time_bounds in Observation.objects.filter(
+                datastream_id__in=datastream_ids
+        ).values('datastream_id').annotate(
+            phenomenon_time_start=Min('phenomenon_time'),
+            phenomenon_time_end=Max(Coalesce('phenomenon_time_end', 'phenomenon_time')),
+            result_time_start=Min('result_time'),
+            result_time_end=Max('result_time')
+        ).order_by():
+            time_bounds[datastream_time_bounds['datastream_id']] = {
+                field: (datastream_time_bounds[f'{field}_start'], datastream_time_bounds[f'{field}_end'])
+                for field in ['phenomenon_time', 'result_time'] if datastream_time_bounds[f'{field}_start'] is not None
+            }
+
+        return time_bounds
+
+    def create_observation(
+            self,
+            observation: ObservationPostBody,
+    ) -> int:
+
+        return self.create_observations([observation])[0]
+
+    def create_observations(
+            self,
+            observations: list[ObservationPostBody] | Mapping
+    ) -> list[int]:
+
+        if isinstance(observations, Mapping):
+            observations = [
+                observation for datastream_observations in observations.values()
+                for observation in datastream_observations
+            ]
+
+        return [
+            observation.id for observation in Observation.objects.bulk_create([
+                Observation(**self.get_observation_values(observation)) for observation in observations
+            ])
+        ]
+
+    def update_observation(
+            self,
+            observation_id: int,
+            observation: ObservationPatchBody
+    ) -> None:
+
+        Observation.objects.filter(id=observation_id).update(
+            **self.get_observation_values(observation, exclude_unset=True)
+        )
+
+        return None
+
+    def delete_observation(
+            self,
+            observation_id: int
+    ) -> None:
+
+        Observation.objects.filter(id=observation_id).delete()
+
+        return None
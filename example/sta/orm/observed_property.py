@@ -0,0 +1,91 @@
+from sensorthings.components.observedproperties.engine import ObservedPropertyBaseEngine
+from sensorthings.components.observedproperties.schemas import ObservedPropertyPostBody, ObservedPropertyPatchBody
+from .utils import ORMUtils
+from ..models import ObservedProperty, Datastream
+
+
+observed_property_columns = {
+    'name': ['name'], 'definition': ['definition'], 'description': ['description'], 'properties': ['properties']
+}
+
+
+class ObservedPropertyEngine(ObservedPropertyBaseEngine, ORMUtils):
+    def get_observed_properties(
+            self,
+            observed_property_ids: list[int] = None,
+            pagination: dict = None,
+            ordering: dict = None,
+            filters: dict = None,
+            expanded: bool = False,
+            fields: list[str] = None,
+            get_count: bool = False
+    ) -> (list[int, dict], int):
+
+        queryset = ObservedProperty.objects.all()
+        queryset = self.apply_ids(queryset, 'id', observed_property_ids)
+        queryset = self.apply_filters(queryset, filters)
+
+        if get_count:
+            count = queryset.count()
+        else:
+            count = None
+
+        queryset = self.apply_order(queryset, ordering)
+
+        if pagination is not None:
+            queryset = self.apply_pagination(queryset, pagination)
+
+        response = {
+            observed_property['id']: observed_property
+            for observed_property in queryset.values(*self.get_columns(observed_property_columns, fields))
+        }
+        response = self.apply_fields(response, fields)
+
+        return response, count
+
+    def create_observed_property(
+            self,
+            observed_property: ObservedPropertyPostBody,
+    ) -> int:
+
+        return self.create_observed_properties([observed_property])[0]
+
+    def create_observed_properties(
+            self,
+            observed_properties: list[ObservedPropertyPostBody]
+    ) -> list[int]:
+
+        observed_property_ids = [
+            observed_property.id for observed_property in ObservedProperty.objects.bulk_create([
+                ObservedProperty(**self.get_model_values(ObservedProperty, observed_property))
+                for observed_property in observed_properties
+            ])
+        ]
+
+        self.set_parent_ids(
+            Datastream, 'observed_property_id',
+            zip(observed_property_ids, [observed_property.datastreams for observed_property in observed_properties])
+        )
+
+        return observed_property_ids
+
+    def update_observed_property(
+            self,
+            observed_property_id: int,
+            observed_property: ObservedPropertyPatchBody
+    ) -> None:
+
+        ObservedProperty.objects.filter(id=observed_property_id).update(
+            **self.get_model_values(ObservedProperty, observed_property, exclude_unset=True)
+        )
+
+        return None
+
+    def delete_observed_property(
+            self,
+            observed_property_id: int
+    ) -> None:
+
+        ObservedProperty.objects.filter(id=observed_property_id).delete()
+
+        return None
@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Optional
+from sensorthings.extensions.qualitycontrol.engine import QualityControlBaseEngine, id_type
+from .utils import ORMUtils
+from ..models import Observation
+
+
+class QualityControlEngine(QualityControlBaseEngine, ORMUtils):
+    def delete_observations(
+            self,
+            datastream_id: id_type,
+            start_time: Optional[datetime] = None,
+            end_time: Optional[datetime] = None
+    ) -> None:
+
+        queryset = Observation.objects.filter(datastream_id=datastream_id)
+
+        if start_time is not None:
+            queryset = queryset.filter(phenomenon_time__gte=start_time)
+
+        if end_time is not None:
+            queryset = queryset.filter(phenomenon_time__lte=end_time)
+
+        queryset.delete()
+
+        return None
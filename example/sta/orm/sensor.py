@@ -0,0 +1,83 @@
+from sensorthings.components.sensors.engine import SensorBaseEngine
+from sensorthings.components.sensors.schemas import SensorPostBody, SensorPatchBody
+from .utils import ORMUtils
+from ..models import Sensor, Datastream
+
+
+sensor_columns = {
+    'name': ['name'], 'description': ['description'], 'encoding_type': ['encoding_type'], 'metadata': ['metadata'],
+    'properties': ['properties']
+}
+
+
+class SensorEngine(SensorBaseEngine, ORMUtils):
+    def get_sensors(
+            self,
+            sensor_ids: list[int] = None,
+            pagination: dict = None,
+            ordering: dict = None,
+            filters: dict = None,
+            expanded: bool = False,
+            fields: list[str] = None,
+            get_count: bool = False
+    ) -> (list[int, dict], int):
+
+        queryset = Sensor.objects.all()
+        queryset = self.apply_ids(queryset, 'id', sensor_ids)
+        queryset = self.apply_filters(queryset, filters)
+
+        if get_count:
+            count = queryset.count()
+        else:
+            count = None
+
+        queryset = self.apply_order(queryset, ordering)
+
+        if pagination is not None:
+            queryset = self.apply_pagination(queryset, pagination)
+
+        response = {sensor['id']: sensor for sensor in queryset.values(*self.get_columns(sensor_columns, fields))}
+        response = self.apply_fields(response, fields)
+
+        return response, count
+
+    def create_sensor(
+            self,
+            sensor: SensorPostBody,
+    ) -> int:
+
+        return self.create_sensors([sensor])[0]
+
+    def create_sensors(
+            self,
+            sensors: list[SensorPostBody]
+    ) -> list[int]:
+
+        sensor_ids = [
+            sensor.id for sensor in Sensor.objects.bulk_create([
+                Sensor(**self.get_model_values(Sensor, sensor)) for sensor in sensors
+            ])
+        ]
+
+        self.set_parent_ids(Datastream, 'sensor_id', zip(sensor_ids, [sensor.datastreams for sensor in sensors]))
+
+        return sensor_ids
+
+    def update_sensor(
+            self,
+            sensor_id: int,
+            sensor: SensorPatchBody
+    ) -> None:
+
+        Sensor.objects.filter(id=sensor_id).update(**self.get_model_values(Sensor, sensor, exclude_unset=True))
+
+        return None
+
+    def delete_sensor(
+            self,
+            sensor_id: int
+    ) -> None:
+
+        Sensor.objects.filter(id=sensor_id).delete()
+
+        return None
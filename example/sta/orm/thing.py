@@ -0,0 +1,98 @@
+from sensorthings.components.things.engine import ThingBaseEngine
+from sensorthings.components.things.schemas import ThingPostBody, ThingPatchBody
+from .utils import ORMUtils
+from ..models import Thing, HistoricalLocation, Datastream
+
+
+thing_columns = {'name': ['name'], 'description': ['description'], 'properties': ['properties']}
+
+
+class ThingEngine(ThingBaseEngine, ORMUtils):
+    def get_things(
+            self,
+            thing_ids: list[int] = None,
+            location_ids: list[int] = None,
+            pagination: dict = None,
+            ordering: dict = None,
+            filters: dict = None,
+            expanded: bool = False,
+            fields: list[str] = None,
+            get_count: bool = False
+    ) -> (list[int, dict], int):
+
+        queryset = Thing.objects.all()
+        queryset = self.apply_ids(queryset, 'id', thing_ids)
+        queryset = self.apply_ids(queryset, 'locations', location_ids)
+        queryset = self.apply_filters(queryset, filters)
+
+        if get_count:
+            count = queryset.count()
+        else:
+            count = None
+
+        queryset = self.apply_order(queryset, ordering)
+
+        if pagination is not None:
+            queryset = self.apply_pagination(queryset, pagination)
+
+        response = {thing['id']: thing for thing in queryset.values(*self.get_columns(thing_columns, fields))}
+
+        if fields is None or 'location_ids' in fields:
+            location_ids = self.get_related_ids(Thing.locations.through, 'thing_id', 'location_id', list(response))
+            for thing_id, thing in response.items():
+                thing['location_ids'] = location_ids[thing_id]
+
+        response = self.apply_fields(response, fields)
+
+        return response, count
+
+    def create_thing(
+            self,
+            thing: ThingPostBody
+    ) -> int:
+
+        return self.create_things([thing])[0]
+
+    def create_things(
+            self,
+            things: list[ThingPostBody]
+    ) -> list[int]:
+
+        thing_ids = [
+            thing.id for thing in Thing.objects.bulk_create([
+                Thing(**self.get_model_values(Thing, thing)) for thing in things
+            ])
+        ]
+
+        self.add_related_ids(
+            Thing.locations.through, 'thing_id', 'location_id', zip(thing_ids, [thing.locations for thing in things])
+        )
+        self.set_parent_ids(
+            HistoricalLocation, 'thing_id', zip(thing_ids, [thing.historical_locations for thing in things])
+        )
+        self.set_parent_ids(Datastream, 'thing_id', zip(thing_ids, [thing.datastreams for thing in things]))
+
+        return thing_ids
+
+    def update_thing(
+            self,
+            thing_id: int,
+            thing: ThingPatchBody
+    ) -> None:
+
+        Thing.objects.filter(id=thing_id).update(**self.get_model_values(Thing, thing, exclude_unset=True))
+
+        if 'locations' in thing.model_fields_set:
+            Thing.locations.through.objects.filter(thing_id=thing_id).delete()
+            self.add_related_ids(Thing.locations.through, 'thing_id', 'location_id', [(thing_id, thing.locations)])
+
+        return None
+
+    def delete_thing(
+            self,
+            thing_id: int
+    ) -> None:
+
+        Thing.objects.filter(id=thing_id).delete()
+
+        return None
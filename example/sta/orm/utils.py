@@ -0,0 +1,243 @@
+import re
+from datetime import datetime, timezone
+from dateutil.parser import isoparse
+from django.core.exceptions import FieldDoesNotExist, FieldError
+from django.db.models import F, Q, Window, JSONField, DateTimeField
+from django.db.models.functions import RowNumber
+from ninja.errors import HttpError
+from odata_query import ast
+from odata_query.django import AstToDjangoQVisitor
+from odata_query.exceptions import ODataException
+from odata_query.visitor import NodeTransformer
+
+
+class FilterPathResolver(NodeTransformer):
+    """
+    Rewrites the SensorThings property paths of a filter (e.g. Datastream/id) into Django lookup paths.
+    """
+
+    def __init__(self, resolve_path):
+        self.resolve_path = resolve_path
+        self.to_many = False
+
+    def visit_Identifier(self, node: ast.Identifier) -> ast.Identifier:
+        return self.resolve([node.name])
+
+    def visit_Attribute(self, node: ast.Attribute) -> ast.Identifier:
+        segments = []
+
+        while isinstance(node, ast.Attribute):
+            segments.insert(0, node.attr)
+            node = node.owner
+
+        if not isinstance(node, ast.Identifier):
+            raise HttpError(422, 'Unsupported filter property path.')
+
+        return self.resolve([node.name, *segments])
+
+    def visit_Call(self, node: ast.Call) -> ast.Call:
+        return ast.Call(node.func, [self.visit(arg) for arg in node.args])
+
+    def visit_CollectionLambda(self, node: ast.CollectionLambda):
+        raise HttpError(422, 'Lambda operators are not supported in filters.')
+
+    def resolve(self, segments: list) -> ast.Identifier:
+        lookup, to_many = self.resolve_path(segments)
+        self.to_many = self.to_many or to_many
+        return ast.Identifier(lookup)
+
+
+class ORMUtils:
+    # Model columns of SensorThings properties stored under a different name.
+    column_aliases = {
+        ('Datastream', 'phenomenon_time'): 'phenomenon_time_start',
+        ('Datastream', 'result_time'): 'result_time_start'
+    }
+
+    @staticmethod
+    def get_column_name(property_name: str) -> str:
+        return 'id' if property_name == '@iot.id' else re.sub(r'(?<!^)(?=[A-Z])', '_', property_name).lower()
+
+    def get_column(self, model, field):
+        return self.column_aliases.get((model.__name__, field), field)
+
+    def resolve_path(self, model, segments):
+        lookup = []
+        to_many = False
+
+        for index, segment in enumerate(segments):
+            column_name = self.get_column(model, self.get_column_name(segment))
+
+            try:
+                field = model._meta.get_field(column_name)
+            except FieldDoesNotExist:
+                raise HttpError(422, f'Unknown filter property: {"/".join(segments)}.')
+
+            lookup.append(field.name)
+
+            if isinstance(field, JSONField):
+                lookup.extend(segments[index + 1:])
+                break
+            elif field.is_relation:
+                to_many = to_many or field.one_to_many or field.many_to_many
+                model = field.related_model
+            elif index < len(segments) - 1:
+                raise HttpError(422, f'Unknown filter property: {"/".join(segments)}.')
+
+        return '__'.join(lookup), to_many
+
+    @staticmethod
+    def apply_ids(queryset, field, ids):
+        if ids is not None:
+            queryset = queryset.filter(**{f'{field}__in': ids})
+            if queryset.model._meta.get_field(field).is_relation and not field.endswith('_id'):
+                queryset = queryset.distinct()
+        return queryset
+
+    def apply_filters(self, queryset, filters):
+        if filters:
+            path_resolver = FilterPathResolver(lambda segments: self.resolve_path(queryset.model, segments))
+            filters = path_resolver.visit(filters)
+            visitor = AstToDjangoQVisitor(queryset.model)
+
+            try:
+                query = visitor.visit(filters)
+                queryset = queryset.annotate(**visitor.queryset_annotations).filter(query)
+            except (ODataException, FieldError, ValueError, TypeError):
+                raise HttpError(422, 'Failed to apply filter parameter.')
+
+            if path_resolver.to_many:
+                queryset = queryset.distinct()
+        return queryset
+
+    def get_order_by(self, model, ordering, seek=None):
+        if seek is not None:
+            ordering = [
+                {**seek_field, 'field': self.get_column(model, seek_field['field'])} for seek_field in seek['fields']
+            ]
+        else:
+            ordering = [
+                {**order_field, 'field': self.resolve_path(model, order_field['field'].split('/'))[0]}
+                for order_field in ordering or []
+            ]
+
+        order_by = [
+            F(order_field['field']).desc() if order_field['direction'] == 'desc' else F(order_field['field']).asc()
+            for order_field in ordering
+        ]
+
+        if 'id' not in [order_field['field'] for order_field in ordering]:
+            order_by.append(F('id').asc())
+
+        return order_by
+
+    def apply_order(self, queryset, ordering, seek=None):
+        return queryset.order_by(*self.get_order_by(queryset.model, ordering, seek))
+
+    def apply_seek(self, queryset, seek):
+        if seek is not None and seek['after'] is not None:
+            seek_fields = [
+                (
+                    self.get_column(queryset.model, seek_field['field']),
+                    seek_field['direction'], self.parse_seek_value(queryset.model, seek_field['field'], value)
+                ) for seek_field, value in zip(seek['fields'], seek['after'])
+            ]
+            seek_query = Q()
+            for index, (field, direction, value) in enumerate(seek_fields):
+                seek_query |= Q(
+                    **{previous_field: previous_value for previous_field, _, previous_value in seek_fields[:index]},
+                    **{f'{field}__{"lt" if direction == "desc" else "gt"}': value}
+                )
+            queryset = queryset.filter(seek_query)
+        return queryset
+
+    def parse_seek_value(self, model, field, value):
+        if isinstance(value, str) and isinstance(model._meta.get_field(self.get_column(model, field)), DateTimeField):
+            return isoparse(value.split('/')[0])
+        return value
+
+    def apply_limit_per_parent(self, queryset, limit_per_parent, ordering, seek=None):
+        if limit_per_parent is not None:
+            queryset = queryset.annotate(row_number=Window(
+                expression=RowNumber(),
+                partition_by=F(limit_per_parent['field']),
+                order_by=self.get_order_by(queryset.model, ordering, seek)
+            )).filter(
+                row_number__gt=limit_per_parent['skip'],
+                row_number__lte=limit_per_parent['skip'] + limit_per_parent['top']
+            )
+        return queryset
+
+    @staticmethod
+    def apply_pagination(queryset, pagination):
+        return queryset[pagination['skip']: pagination['skip'] + pagination['top']] \
+            if pagination['top'] > 0 else queryset.none()
+
+    @staticmethod
+    def get_related_ids(through, source_field, target_field, ids):
+        related_ids = {entity_id: [] for entity_id in ids}
+        for source_id, target_id in through.objects.filter(
+                **{f'{source_field}__in': ids}
+        ).order_by(target_field).values_list(source_field, target_field):
+            related_ids[source_id].append(target_id)
+        return related_ids
+
+    @staticmethod
+    def add_related_ids(through, source_field, target_field, related_ids):
+        through.objects.bulk_create([
+            through(**{source_field: source_id, target_field: target.id})
+            for source_id, targets in related_ids for target in targets or []
+        ])
+
+    @staticmethod
+    def set_parent_ids(model, parent_field, related_ids):
+        for parent_id, children in related_ids:
+            if children:
+                model.objects.filter(id__in=[child.id for child in children]).update(**{parent_field: parent_id})
+
+    @staticmethod
+    def get_model_values(model, entity_body, exclude_unset=False):
+        columns = {field.name for field in model._meta.concrete_fields if not field.is_relation}
+        return {
+            field: value for field, value in entity_body.model_dump(exclude_unset=exclude_unset).items()
+            if field in columns and field != 'id'
+        }
+
+    @staticmethod
+    def parse_time(value):
+        return isoparse(value) if isinstance(value, str) else value
+
+    @staticmethod
+    def parse_interval(value):
+        if value is None:
+            return None, None
+        start_time, _, end_time = value.partition('/')
+        return isoparse(start_time), isoparse(end_time) if end_time else None
+
+    @staticmethod
+    def format_time(value):
+        if value is None:
+            return None
+        return value.astimezone(timezone.utc).isoformat() if isinstance(value, datetime) else value
+
+    def format_interval(self, start_time, end_time):
+        if start_time is None:
+            return None
+        return f'{self.format_time(start_time)}/{self.format_time(end_time)}' if end_time is not None \
+            else self.format_time(start_time)
+
+    @staticmethod
+    def get_columns(entity_fields, fields):
+        return list(dict.fromkeys([
+            'id', *(column for field, columns in entity_fields.items() if fields is None or field in fields
+                    for column in columns)
+        ]))
+
+    @staticmethod
+    def apply_fields(response, fields):
+        if fields is not None:
+            response = {
+                k: {field: value for field, value in v.items() if field in fields or field == 'id'}
+                for k, v in response.items()
+            }
+        return response
@@ -2,7 +2,9 @@ from django.urls import path
 from sensorthings import SensorThingsAPI
 from sensorthings.extensions.dataarray import data_array_extension
 from sensorthings.extensions.qualitycontrol import quality_control_extension
-from .engine import TestSensorThingsEngine, TestDataArraySensorThingsEngine, TestQualityControlSensorThingsEngine
+from .engine import (TestSensorThingsEngine, TestDataArraySensorThingsEngine, TestQualityControlSensorThingsEngine,
+                     TestAsyncSensorThingsEngine, TestColumnarSensorThingsEngine)
+from .orm import ORMSensorThingsEngine
 
 
 sta_core = SensorThingsAPI(
@@ -31,8 +33,38 @@ sta_quality_control = SensorThingsAPI(
     extensions=[quality_control_extension]
 )
 
+sta_async = SensorThingsAPI(
+    title='Test SensorThings Async API',
+    version='1.1',
+    urls_namespace='async',
+    description='This is a test SensorThings API.',
+    engine=TestAsyncSensorThingsEngine,
+    extensions=[data_array_extension, quality_control_extension]
+)
+
+sta_orm = SensorThingsAPI(
+    title='Test SensorThings ORM API',
+    version='1.1',
+    urls_namespace='orm',
+    description='This is a test SensorThings API.',
+    engine=ORMSensorThingsEngine,
+    extensions=[data_array_extension, quality_control_extension]
+)
+
+sta_columnar = SensorThingsAPI(
+    title='Test SensorThings Columnar API',
+    version='1.1',
+    urls_namespace='columnar',
+    description='This is a test SensorThings API.',
+    engine=TestColumnarSensorThingsEngine,
+    extensions=[data_array_extension]
+)
+
 urlpatterns = [
     path('core/v1.1/', sta_core.urls),
     path('data-array/v1.1/', sta_data_array.urls),
     path('quality-control/v1.1/', sta_quality_control.urls),
+    path('async/v1.1/', sta_async.urls),
+    path('orm/v1.1/', sta_orm.urls),
+    path('columnar/v1.1/', sta_columnar.urls),
 ]
@@ -1,10 +1,11 @@
 from sensorthings.main import SensorThingsAPI, SensorThingsExtension
-from sensorthings.engine import SensorThingsBaseEngine
+from sensorthings.engine import SensorThingsBaseEngine, SensorThingsBaseAsyncEngine
 from sensorthings.http import SensorThingsHttpRequest
 
 __all__ = [
     "SensorThingsAPI",
     "SensorThingsExtension",
     "SensorThingsBaseEngine",
+    "SensorThingsBaseAsyncEngine",
     "SensorThingsHttpRequest",
 ]
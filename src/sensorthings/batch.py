@@ -0,0 +1,252 @@
+import orjson
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
+from urllib.parse import urlsplit
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.http import HttpRequest, HttpResponse, QueryDict
+from django.urls import resolve
+from django.urls.exceptions import Http404
+from sensorthings.middleware import SensorThingsMiddleware
+from sensorthings.workers import run_in_pool_thread, in_atomic_block
+from sensorthings import settings
+
+if TYPE_CHECKING:
+    from sensorthings.components.root.schemas import BatchRequest
+
+
+batch_thread_name_prefix = 'sensorthings-batch'
+batch_executor = None
+batch_executor_lock = threading.Lock()
+batch_middleware = SensorThingsMiddleware(get_response=lambda request: None)
+
+inherited_request_attributes = ['user', 'auth', 'session']
+excluded_meta_keys = ['CONTENT_LENGTH', 'CONTENT_TYPE', 'QUERY_STRING', 'PATH_INFO', 'REQUEST_METHOD']
+
+
+class BatchSubRequest(HttpRequest):
+    """
+    An HTTP request for a sub-request of a JSON batch request.
+
+    Sub-requests inherit the server, client, and authentication details of the batch request, and replace its method,
+    path, query string, headers, and body.
+
+    Attributes
+    ----------
+    batch_request : HttpRequest
+        The batch request the sub-request is part of.
+    batch_engine : SensorThingsBaseEngine
+        The engine of the batch request, shared with the sub-requests.
+    """
+
+    def __init__(self, batch_request: HttpRequest, sub_request: 'BatchRequest', base_path: str):
+        super().__init__()
+
+        url = urlsplit(sub_request.url)
+
+        self.batch_request = batch_request
+        self.batch_engine = getattr(batch_request, 'engine', None)
+        self.method = sub_request.method.upper()
+        self.path = self.path_info = url.path if url.path.startswith('/') else f'{base_path}{url.path}'
+        self.GET = QueryDict(url.query)
+        self.COOKIES = batch_request.COOKIES
+        self.META = {
+            key: value for key, value in batch_request.META.items()
+            if key not in excluded_meta_keys and not key.startswith('HTTP_IF_')
+        }
+        self.META['QUERY_STRING'] = url.query
+        self.META['REQUEST_METHOD'] = self.method
+
+        for header, value in sub_request.headers.items():
+            header = header.upper().replace('-', '_')
+            self.META[header if header in ['CONTENT_TYPE', 'CONTENT_LENGTH'] else f'HTTP_{header}'] = value
+
+        self._body = orjson.dumps(sub_request.body) if sub_request.body is not None else b''
+        self.content_type = 'application/json'
+
+        for attribute in inherited_request_attributes:
+            if hasattr(batch_request, attribute):
+                setattr(self, attribute, getattr(batch_request, attribute))
+
+    def _get_scheme(self):
+        return self.batch_request.scheme
+
+
+def execute_batch(request: HttpRequest, sub_requests: List['BatchRequest']) -> bytes:
+    """
+    Executes the sub-requests of a JSON batch request and encodes their responses.
+
+    Sub-requests are resolved and dispatched like regular requests, through the SensorThings middleware and the views
+    of the API they address, and share the engine of the batch request. Sub-requests are executed in order; runs of
+    consecutive GET sub-requests are executed concurrently if ST_BATCH_CONCURRENCY is greater than one, until a write
+    sub-request succeeds or while a database transaction is open, because pool threads use their own database
+    connections and may not see the changes of the batch. Identical GET sub-requests are only executed once, unless a
+    write sub-request is executed between them.
+
+    Parameters
+    ----------
+    request : HttpRequest
+        The batch request.
+    sub_requests : List[BatchRequest]
+        The sub-requests to execute.
+
+    Returns
+    -------
+    bytes
+        The JSON encoded batch response body.
+    """
+
+    base_path = request.path_info[:request.path_info.rindex('/') + 1]
+    batch_responses = []
+    response_memo = {}
+    has_written = False
+
+    for sub_request_group in group_sub_requests(sub_requests):
+        batch_sub_requests = [BatchSubRequest(request, sub_request, base_path) for sub_request in sub_request_group]
+
+        if sub_request_group[0].method.upper() != 'GET':
+            response_memo.clear()
+            sub_response = run_sub_request(batch_sub_requests[0])
+            has_written = has_written or sub_response.status_code < 400
+            batch_responses.append(encode_sub_response(sub_response))
+            continue
+
+        memo_keys = [
+            (batch_sub_request.path, batch_sub_request.META['QUERY_STRING'], tuple(sorted(sub_request.headers.items())))
+            for batch_sub_request, sub_request in zip(batch_sub_requests, sub_request_group)
+        ]
+        pending_sub_requests = {
+            memo_key: batch_sub_request for memo_key, batch_sub_request in zip(memo_keys, batch_sub_requests)
+            if memo_key not in response_memo
+        }
+
+        if settings.ST_BATCH_CONCURRENCY > 1 and len(pending_sub_requests) > 1 and not has_written and \
+                not threading.current_thread().name.startswith(batch_thread_name_prefix) and not in_atomic_block():
+            sub_responses = get_batch_executor().map(
+                functools.partial(run_in_pool_thread, run_sub_request), pending_sub_requests.values()
+            )
+        else:
+            sub_responses = map(run_sub_request, pending_sub_requests.values())
+
+        response_memo.update(zip(pending_sub_requests.keys(), map(encode_sub_response, sub_responses)))
+        batch_responses.extend(response_memo[memo_key] for memo_key in memo_keys)
+
+    return b'{"responses":[' + b','.join(
+        orjson.dumps({'id': sub_request.id, 'status': status, 'headers': headers})[:-1] + b',"body":' + body + b'}'
+        for sub_request, (status, headers, body) in zip(sub_requests, batch_responses)
+    ) + b']}'
+
+
+def group_sub_requests(sub_requests: Iterable['BatchRequest']) -> List[List['BatchRequest']]:
+    """
+    Groups the sub-requests of a batch request into runs of GET sub-requests and single write sub-requests.
+
+    Parameters
+    ----------
+    sub_requests : Iterable[BatchRequest]
+        The sub-requests of a batch request.
+
+    Returns
+    -------
+    List[List[BatchRequest]]
+        The groups of sub-requests, in order.
+    """
+
+    groups = []
+
+    for sub_request in sub_requests:
+        if sub_request.method.upper() == 'GET' and groups and groups[-1][0].method.upper() == 'GET':
+            groups[-1].append(sub_request)
+        else:
+            groups.append([sub_request])
+
+    return groups
+
+
+def run_sub_request(sub_request: BatchSubRequest) -> HttpResponse:
+    """
+    Resolves and runs the view of a batch sub-request.
+
+    Parameters
+    ----------
+    sub_request : BatchSubRequest
+        The sub-request to run.
+
+    Returns
+    -------
+    HttpResponse
+        The response of the sub-request.
+    """
+
+    try:
+        sub_request.resolver_match = resolve(sub_request.path_info)
+
+        if sub_request.resolver_match.url_name == 'batch':
+            return HttpResponse(status=400)
+
+        view_func = batch_middleware.prepare_view(request=sub_request, view_func=sub_request.resolver_match.func)
+
+        if view_func is None:
+            raise Http404
+    except Http404:
+        return HttpResponse(status=404)
+
+    sub_request.stream_response = False
+
+    if iscoroutinefunction(view_func):
+        return async_to_sync(view_func)(sub_request, **sub_request.resolver_match.kwargs)
+
+    return view_func(sub_request, **sub_request.resolver_match.kwargs)
+
+
+def encode_sub_response(response: HttpResponse) -> Tuple[int, Dict[str, str], bytes]:
+    """
+    Encodes the response of a batch sub-request.
+
+    Parameters
+    ----------
+    response : HttpResponse
+        The response of the sub-request.
+
+    Returns
+    -------
+    Tuple[int, Dict[str, str], bytes]
+        The status code, headers, and JSON encoded body of the response.
+    """
+
+    content = b''.join(response.streaming_content) if response.streaming else response.content
+
+    if not content:
+        body = b'null'
+    elif response.get('Content-Type', '').startswith('application/json'):
+        body = content
+    else:
+        body = orjson.dumps(content.decode(response.charset, errors='replace'))
+
+    return response.status_code, dict(response.items()), body
+
+
+def get_batch_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared thread pool used to execute GET sub-requests of batch requests concurrently.
+
+    The pool is created on first use with ST_BATCH_CONCURRENCY workers. Engines used with a concurrency above one must
+    be safe to call from multiple threads.
+
+    Returns
+    -------
+    ThreadPoolExecutor
+        The shared batch thread pool.
+    """
+
+    global batch_executor
+
+    with batch_executor_lock:
+        if batch_executor is None:
+            batch_executor = ThreadPoolExecutor(
+                max_workers=settings.ST_BATCH_CONCURRENCY,
+                thread_name_prefix=batch_thread_name_prefix
+            )
+
+    return batch_executor
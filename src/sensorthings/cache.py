@@ -0,0 +1,412 @@
+import hashlib
+import orjson
+from uuid import uuid4
+from typing import Dict, Iterable, List, Optional, Tuple
+from functools import cached_property
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from sensorthings import settings
+
+
+class SensorThingsResponseCache:
+    """
+    A cache of rendered GET responses backed by Django's cache framework.
+
+    Cached responses are keyed by the request URL, the normalized query options, and the generation tokens of every
+    component the response depends on. Writes replace the generation tokens of the affected components and entities,
+    so stale responses are never read again and simply expire. Generation tokens are stored in the same cache, so a
+    cache backend shared between processes (e.g. Redis or Memcached) must be used when running multiple workers.
+
+    Attributes
+    ----------
+    alias : Optional[str]
+        The name of the Django cache to use, or None to disable response caching.
+    timeout : int
+        The number of seconds cached responses are kept.
+    """
+
+    key_prefix = 'sensorthings'
+
+    def __init__(self, alias: Optional[str] = None, timeout: int = 300):
+        self.alias = alias
+        self.timeout = timeout
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether response caching is enabled.
+        """
+
+        return self.alias is not None
+
+    @property
+    def cache(self):
+        """
+        The configured Django cache.
+        """
+
+        return caches[self.alias]
+
+    def build_key(self, url: str, query_options: List[tuple], scope: str, generation_keys: Iterable[str]) -> str:
+        """
+        Build the cache key of a response.
+
+        Parameters
+        ----------
+        url : str
+            The absolute URL of the request, without its query string.
+        query_options : List[tuple]
+            The normalized query options of the request.
+        scope : str
+            An identifier of the audience the response was built for (e.g. the authenticated user).
+        generation_keys : Iterable[str]
+            The generation keys of the components and entities the response depends on.
+
+        Returns
+        -------
+        str
+            The cache key.
+        """
+
+        generation_keys = sorted(generation_keys)
+        generations = self.get_generations(generation_keys)
+        digest = hashlib.sha256(orjson.dumps([
+            url, query_options, scope, [generations[generation_key] for generation_key in generation_keys]
+        ])).hexdigest()
+
+        return f'{self.key_prefix}:response:{digest}'
+
+    def get_generations(self, generation_keys: List[str]) -> dict:
+        """
+        Get the current generation tokens of a list of generation keys, creating any that are missing.
+
+        Parameters
+        ----------
+        generation_keys : List[str]
+            The generation keys.
+
+        Returns
+        -------
+        dict
+            The generation token of each generation key.
+        """
+
+        generations = self.cache.get_many(generation_keys)
+
+        for generation_key in generation_keys:
+            if generation_key not in generations:
+                self.cache.add(generation_key, uuid4().hex, timeout=None)
+                generations[generation_key] = self.cache.get(generation_key)
+
+        return generations
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a cached response.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the response.
+
+        Returns
+        -------
+        Optional[bytes]
+            The rendered response, or None if it is not cached.
+        """
+
+        return self.cache.get(key)
+
+    def set(self, key: str, content: bytes):
+        """
+        Store a rendered response.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the response.
+        content : bytes
+            The rendered response.
+        """
+
+        self.cache.set(key, content, timeout=self.timeout)
+
+    def invalidate(self, component_name: str, entity_ids: Optional[Iterable] = None):
+        """
+        Invalidate the cached responses affected by a write to a component.
+
+        Parameters
+        ----------
+        component_name : str
+            The name of the written component (e.g. 'Observation').
+        entity_ids : Optional[Iterable], optional
+            The IDs of the existing entities that were modified or deleted. An empty list means no existing entity was
+            affected (e.g. a create), and None means any entity may have been affected.
+        """
+
+        generation_keys = [self.get_component_key(component_name)]
+
+        if entity_ids is None:
+            generation_keys.append(self.get_entity_key(component_name, '*'))
+        else:
+            generation_keys.extend(self.get_entity_key(component_name, entity_id) for entity_id in entity_ids)
+
+        self.cache.set_many({generation_key: uuid4().hex for generation_key in generation_keys}, timeout=None)
+
+    def get_component_key(self, component_name: str) -> str:
+        """
+        Get the generation key of every response that includes entities of a component.
+
+        Parameters
+        ----------
+        component_name : str
+            The name of the component.
+
+        Returns
+        -------
+        str
+            The generation key.
+        """
+
+        return f'{self.key_prefix}:generation:{component_name}'
+
+    def get_entity_key(self, component_name: str, entity_id) -> str:
+        """
+        Get the generation key of responses for a single entity.
+
+        Parameters
+        ----------
+        component_name : str
+            The name of the component.
+        entity_id : Any
+            The ID of the entity, or '*' for all entities of the component.
+
+        Returns
+        -------
+        str
+            The generation key.
+        """
+
+        return f'{self.key_prefix}:generation:{component_name}:{entity_id}'
+
+
+response_cache = SensorThingsResponseCache(
+    alias=settings.ST_RESPONSE_CACHE,
+    timeout=settings.ST_RESPONSE_CACHE_TIMEOUT
+)
+
+
+class LatestObservationStore:
+    """
+    A store of the latest Observation of each Datastream, used to answer Observations($top=1;$orderby=phenomenonTime
+    desc) expansions of Datastreams without querying the engine.
+
+    Entries are kept in a private in-process cache, or in a Django cache if an alias is given. A cache backend shared
+    between processes must be used when running multiple workers, since writes only invalidate the entries of the
+    cache they are made through. Each Datastream has a version token that is replaced whenever its Observations are
+    written, and entries are only read back if they were fetched under the current version, so an entry fetched while
+    a write is in progress is never served. Entries are kept per scope (the engine class they were fetched with), so
+    APIs backed by different engines never read each other's entries, while version tokens are shared so that a write
+    through any engine invalidates every scope. Entries are shared by every request of a scope, so the store should
+    not be enabled for engines that restrict access to Observations beyond access to their Datastream.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether the store is used.
+    alias : Optional[str]
+        The name of the Django cache to use, or None to keep entries in process memory.
+    timeout : Optional[int]
+        The number of seconds entries are kept, or None to keep them until they are invalidated or culled.
+    max_entries : int
+        The maximum number of Datastreams kept in process memory.
+    """
+
+    key_prefix = 'sensorthings:latest'
+
+    def __init__(
+            self,
+            enabled: bool = False,
+            alias: Optional[str] = None,
+            timeout: Optional[int] = None,
+            max_entries: int = 10000
+    ):
+        self.enabled = enabled
+        self.alias = alias
+        self.timeout = timeout
+        self.max_entries = max_entries
+
+    @cached_property
+    def cache(self):
+        """
+        The configured Django cache, or the in-process cache of the store.
+        """
+
+        if self.alias is not None:
+            return caches[self.alias]
+
+        return LocMemCache(self.key_prefix, {'TIMEOUT': None, 'OPTIONS': {'MAX_ENTRIES': self.max_entries * 2}})
+
+    def get_many(self, datastream_ids: Iterable, scope: str = '') -> Tuple[Dict[str, dict], Dict[str, str]]:
+        """
+        Get the stored latest Observations of a list of Datastreams.
+
+        Parameters
+        ----------
+        datastream_ids : Iterable
+            The IDs of the Datastreams.
+        scope : str, optional
+            The scope of the entries, such as the engine class they were fetched with.
+
+        Returns
+        -------
+        Tuple[Dict[str, dict], Dict[str, str]]
+            The latest Observations of each stored Datastream, keyed by Observation ID (empty if the Datastream has no
+            Observations), and the current version token of each Datastream, to pass to set_many.
+        """
+
+        generation = self.get_generation()
+        version_keys = {
+            datastream_id: self.get_version_key(generation, datastream_id) for datastream_id in datastream_ids
+        }
+        versions = self.cache.get_many(list(version_keys.values()))
+
+        for version_key in version_keys.values():
+            if version_key not in versions:
+                self.cache.add(version_key, uuid4().hex, timeout=self.timeout)
+                versions[version_key] = self.cache.get(version_key)
+
+        entries = self.cache.get_many([self.get_entry_key(datastream_id, scope) for datastream_id in version_keys])
+        versions = {datastream_id: versions[version_key] for datastream_id, version_key in version_keys.items()}
+
+        latest_observations = {}
+
+        for datastream_id, version in versions.items():
+            entry_version, observations = entries.get(self.get_entry_key(datastream_id, scope), (None, None))
+            if version is not None and entry_version == version:
+                latest_observations[datastream_id] = observations
+
+        return latest_observations, versions
+
+    def set_many(self, latest_observations: Dict[str, dict], versions: Dict[str, str], scope: str = ''):
+        """
+        Store the latest Observations of a list of Datastreams.
+
+        Parameters
+        ----------
+        latest_observations : Dict[str, dict]
+            The latest Observations of each Datastream, keyed by Observation ID.
+        versions : Dict[str, str]
+            The version tokens of the Datastreams read by get_many before the Observations were fetched.
+        scope : str, optional
+            The scope of the entries, such as the engine class they were fetched with.
+        """
+
+        self.cache.set_many({
+            self.get_entry_key(datastream_id, scope): (versions[datastream_id], observations)
+            for datastream_id, observations in latest_observations.items()
+            if versions.get(datastream_id) is not None
+        }, timeout=self.timeout)
+
+    def invalidate(self, datastream_ids: Optional[Iterable] = None, scope: str = ''):
+        """
+        Invalidate the stored latest Observations of Datastreams whose Observations were written.
+
+        Entries of every scope are invalidated. The invalidated entries of the given scope are removed as well, while
+        those of other scopes are left to expire.
+
+        Parameters
+        ----------
+        datastream_ids : Optional[Iterable], optional
+            The IDs of the written Datastreams, or None if the Observations of any Datastream may have been written.
+        scope : str, optional
+            The scope of the writing engine.
+        """
+
+        if datastream_ids is None:
+            self.cache.set(self.get_generation_key(), uuid4().hex, timeout=None)
+            return
+
+        datastream_ids = list(datastream_ids)
+        generation = self.get_generation()
+
+        self.cache.set_many({
+            self.get_version_key(generation, datastream_id): uuid4().hex for datastream_id in datastream_ids
+        }, timeout=self.timeout)
+        self.cache.delete_many([self.get_entry_key(datastream_id, scope) for datastream_id in datastream_ids])
+
+    def get_generation(self) -> str:
+        """
+        Get the generation token of the store, creating it if it is missing.
+
+        Returns
+        -------
+        str
+            The generation token, which is replaced when every entry is invalidated.
+        """
+
+        generation = self.cache.get(self.get_generation_key())
+
+        if generation is None:
+            self.cache.add(self.get_generation_key(), uuid4().hex, timeout=None)
+            generation = self.cache.get(self.get_generation_key())
+
+        return generation
+
+    def get_generation_key(self) -> str:
+        """
+        Get the key of the generation token of the store.
+
+        Returns
+        -------
+        str
+            The generation key.
+        """
+
+        return f'{self.key_prefix}:generation'
+
+    def get_version_key(self, generation: str, datastream_id) -> str:
+        """
+        Get the key of the version token of a Datastream.
+
+        Parameters
+        ----------
+        generation : str
+            The generation token of the store.
+        datastream_id : Any
+            The ID of the Datastream.
+
+        Returns
+        -------
+        str
+            The version key.
+        """
+
+        return f'{self.key_prefix}:version:{generation}:{datastream_id}'
+
+    def get_entry_key(self, datastream_id, scope: str = '') -> str:
+        """
+        Get the key of the stored latest Observations of a Datastream.
+
+        Parameters
+        ----------
+        datastream_id : Any
+            The ID of the Datastream.
+        scope : str, optional
+            The scope of the entry.
+
+        Returns
+        -------
+        str
+            The entry key.
+        """
+
+        return f'{self.key_prefix}:entry:{scope}:{datastream_id}'
+
+
+latest_observation_store = LatestObservationStore(
+    enabled=settings.ST_LATEST_OBSERVATIONS,
+    alias=settings.ST_LATEST_OBSERVATIONS_CACHE,
+    timeout=settings.ST_LATEST_OBSERVATIONS_TIMEOUT,
+    max_entries=settings.ST_LATEST_OBSERVATIONS_SIZE
+)
@@ -17,3 +17,13 @@ ObservationRelations.model_rebuild()
 ObservedPropertyRelations.model_rebuild()
 SensorRelations.model_rebuild()
 ThingRelations.model_rebuild()
+
+DatastreamPostBody.model_rebuild()
+DatastreamNestedPostBody.model_rebuild()
+HistoricalLocationPostBody.model_rebuild()
+HistoricalLocationNestedPostBody.model_rebuild()
+LocationPostBody.model_rebuild()
+ObservationPostBody.model_rebuild()
+ObservedPropertyPostBody.model_rebuild()
+SensorPostBody.model_rebuild()
+ThingPostBody.model_rebuild()
@@ -10,6 +10,9 @@ if TYPE_CHECKING:
     from sensorthings.components.sensors.schemas import Sensor
     from sensorthings.components.observedproperties.schemas import ObservedProperty
     from sensorthings.components.observations.schemas import Observation
+    from sensorthings.components.things.schemas import ThingPostBody
+    from sensorthings.components.sensors.schemas import SensorPostBody
+    from sensorthings.components.observedproperties.schemas import ObservedPropertyPostBody
 
 observationTypes = Literal[
     'http://www.opengis.net/def/observationType/OGC-OM/2.0/OM_CategoryObservation',
@@ -120,25 +123,53 @@ class DatastreamPostBody(BasePostBody, DatastreamFields):
 
     Attributes
     ----------
-    thing : Union[EntityId]
-        The thing associated with the datastream.
-    sensor : Union[EntityId]
-        The sensor associated with the datastream.
-    observed_property : Union[EntityId]
-        The observed property associated with the datastream.
+    thing : Union[EntityId, ThingPostBody]
+        The existing thing, or new thing, associated with the datastream.
+    sensor : Union[EntityId, SensorPostBody]
+        The existing sensor, or new sensor, associated with the datastream.
+    observed_property : Union[EntityId, ObservedPropertyPostBody]
+        The existing observed property, or new observed property, associated with the datastream.
     """
 
-    thing: Union[EntityId] = Field(
+    thing: Union[EntityId, 'ThingPostBody'] = Field(
         ..., alias='Thing', json_schema_extra={'nested_class': 'ThingPostBody'}
     )
-    sensor: Union[EntityId] = Field(
+    sensor: Union[EntityId, 'SensorPostBody'] = Field(
         ..., alias='Sensor', json_schema_extra={'nested_class': 'SensorPostBody'}
     )
-    observed_property: Union[EntityId] = Field(
+    observed_property: Union[EntityId, 'ObservedPropertyPostBody'] = Field(
         ..., alias='ObservedProperty', json_schema_extra={'nested_class': 'ObservedPropertyPostBody'}
     )
 
 
+class DatastreamNestedPostBody(DatastreamPostBody):
+    """
+    A schema for a new datastream nested in the POST request body of its thing, sensor, or observed property.
+
+    The entity the datastream is nested in is linked to the datastream when it is created, and is omitted from the
+    nested body. The other relations of the datastream are still required.
+
+    Attributes
+    ----------
+    thing : Union[EntityId, ThingPostBody, None], optional
+        The existing thing, or new thing, associated with the datastream.
+    sensor : Union[EntityId, SensorPostBody, None], optional
+        The existing sensor, or new sensor, associated with the datastream.
+    observed_property : Union[EntityId, ObservedPropertyPostBody, None], optional
+        The existing observed property, or new observed property, associated with the datastream.
+    """
+
+    thing: Union[EntityId, 'ThingPostBody', None] = Field(
+        None, alias='Thing', json_schema_extra={'nested_class': 'ThingPostBody'}
+    )
+    sensor: Union[EntityId, 'SensorPostBody', None] = Field(
+        None, alias='Sensor', json_schema_extra={'nested_class': 'SensorPostBody'}
+    )
+    observed_property: Union[EntityId, 'ObservedPropertyPostBody', None] = Field(
+        None, alias='ObservedProperty', json_schema_extra={'nested_class': 'ObservedPropertyPostBody'}
+    )
+
+
 class DatastreamPatchBody(BasePatchBody, DatastreamFields):
     """
     A schema for the body of a PATCH request to update an existing datastream.
@@ -4,7 +4,8 @@ from sensorthings import settings
 from sensorthings.router import SensorThingsRouter
 from sensorthings.http import SensorThingsHttpRequest
 from sensorthings.schemas import ListQueryParams, GetQueryParams
-from sensorthings.factories import SensorThingsRouterFactory, SensorThingsEndpointFactory
+from sensorthings.factories import (SensorThingsRouterFactory, SensorThingsEndpointFactory,
+                                    build_create_entities_endpoint)
 from .schemas import Datastream, DatastreamPostBody, DatastreamPatchBody, DatastreamListResponse, DatastreamGetResponse
 
 
@@ -87,7 +88,7 @@ def create_datastream(
       Create Entity</a>
     """
 
-    request.engine.create_entity(
+    yield request.engine.create_entity(
         component=Datastream,
         entity_body=datastream,
         response=response
@@ -104,6 +105,13 @@ create_datastream_endpoint = SensorThingsEndpointFactory(
 )
 
 
+create_datastreams_endpoint = build_create_entities_endpoint(
+    router_name='datastream',
+    component=Datastream,
+    post_body_schema=DatastreamPostBody
+)
+
+
 def update_datastream(
         request: SensorThingsHttpRequest,
         datastream_id: id_type,
@@ -121,7 +129,7 @@ def update_datastream(
       Update Entity</a>
     """
 
-    request.engine.update_entity(
+    yield request.engine.update_entity(
         component=Datastream,
         entity_id=datastream_id,
         entity_body=datastream
@@ -150,7 +158,7 @@ def delete_datastream(
       Delete Entity</a>
     """
 
-    request.engine.delete_entity(
+    yield request.engine.delete_entity(
         component=Datastream,
         entity_id=datastream_id
     )
@@ -173,6 +181,7 @@ datastream_router_factory = SensorThingsRouterFactory(
         list_datastreams_endpoint,
         get_datastream_endpoint,
         create_datastream_endpoint,
+        create_datastreams_endpoint,
         update_datastream_endpoint,
         delete_datastream_endpoint
     ]
@@ -23,7 +23,10 @@ class FeatureOfInterestBaseEngine(metaclass=ABCMeta):
             pagination: dict = None,
             ordering: dict = None,
             filters: dict = None,
-            expanded: bool = False
+            expanded: bool = False,
+            fields: List[str] = None,
+            seek: dict = None,
+            expand: dict = None
     ) -> (Dict[id_type, dict], int):
         """
         Retrieve features of interest based on the given criteria.
@@ -42,11 +45,22 @@ class FeatureOfInterestBaseEngine(metaclass=ABCMeta):
             Additional filtering options.
         expanded : bool, optional
             Whether to include expanded related entities.
+        fields : List[str], optional
+            The entity fields to return. If None, all fields are returned. Engines may return additional fields.
+        seek : dict, optional
+            A cursor pagination predicate, given only if ST_CURSOR_PAGINATION is enabled. Entities must be ordered by
+            the fields and directions in seek['fields'], and if seek['after'] is not None, only entities whose key
+            values come after seek['after'] in that order are returned.
+        expand : dict, optional
+            The expand tree of the query, given only if the method accepts this argument and relations are expanded
+            (see SensorThingsBaseEngine.build_expand_hint). Related entities may be returned under the relation name
+            in each entity instead of being fetched separately.
 
         Returns
         -------
         tuple
-            A tuple containing a dictionary of features of interest and the total count.
+            A tuple containing a dictionary of features of interest keyed by their IDs (or an iterable of entity
+            dictionaries) and the total count.
         """
 
         pass
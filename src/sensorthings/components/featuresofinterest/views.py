@@ -4,7 +4,8 @@ from sensorthings import settings
 from sensorthings.router import SensorThingsRouter
 from sensorthings.http import SensorThingsHttpRequest
 from sensorthings.schemas import ListQueryParams, GetQueryParams
-from sensorthings.factories import SensorThingsRouterFactory, SensorThingsEndpointFactory
+from sensorthings.factories import (SensorThingsRouterFactory, SensorThingsEndpointFactory,
+                                    build_create_entities_endpoint)
 from .schemas import (FeatureOfInterest, FeatureOfInterestPostBody, FeatureOfInterestPatchBody,
                       FeatureOfInterestListResponse, FeatureOfInterestGetResponse)
 
@@ -88,7 +89,7 @@ def create_feature_of_interest(
       Create Entity</a>
     """
 
-    request.engine.create_entity(
+    yield request.engine.create_entity(
         component=FeatureOfInterest,
         entity_body=feature_of_interest,
         response=response
@@ -105,6 +106,13 @@ create_feature_of_interest_endpoint = SensorThingsEndpointFactory(
 )
 
 
+create_features_of_interest_endpoint = build_create_entities_endpoint(
+    router_name='feature_of_interest',
+    component=FeatureOfInterest,
+    post_body_schema=FeatureOfInterestPostBody
+)
+
+
 def update_feature_of_interest(
         request: SensorThingsHttpRequest,
         feature_of_interest_id: id_type,
@@ -122,7 +130,7 @@ def update_feature_of_interest(
       Update Entity</a>
     """
 
-    request.engine.update_entity(
+    yield request.engine.update_entity(
         component=FeatureOfInterest,
         entity_id=feature_of_interest_id,
         entity_body=feature_of_interest
@@ -151,7 +159,7 @@ def delete_feature_of_interest(
       Delete Entity</a>
     """
 
-    request.engine.delete_entity(
+    yield request.engine.delete_entity(
         component=FeatureOfInterest,
         entity_id=feature_of_interest_id
     )
@@ -174,6 +182,7 @@ feature_of_interest_router_factory = SensorThingsRouterFactory(
         list_features_of_interest_endpoint,
         get_feature_of_interest_endpoint,
         create_feature_of_interest_endpoint,
+        create_features_of_interest_endpoint,
         update_feature_of_interest_endpoint,
         delete_feature_of_interest_endpoint
     ]
@@ -9,6 +9,8 @@ from sensorthings.types import AnyHttpUrlString
 if TYPE_CHECKING:
     from sensorthings.components.things.schemas import Thing
     from sensorthings.components.locations.schemas import Location
+    from sensorthings.components.things.schemas import ThingPostBody
+    from sensorthings.components.locations.schemas import LocationPostBody
 
 
 class HistoricalLocationFields(Schema):
@@ -63,20 +65,37 @@ class HistoricalLocationPostBody(BasePostBody, HistoricalLocationFields):
 
     Attributes
     ----------
-    thing : Union[EntityId]
-        The thing associated with the historical location.
-    locations : List[Union[EntityId]]
-        The list of location IDs associated with the historical location.
+    thing : Union[EntityId, ThingPostBody]
+        The existing thing, or new thing, associated with the historical location.
+    locations : List[Union[EntityId, LocationPostBody]]
+        The IDs of existing locations, or new locations, associated with the historical location.
     """
 
-    thing: Union[EntityId] = Field(
+    thing: Union[EntityId, 'ThingPostBody'] = Field(
         ..., alias='Thing', json_schema_extra={'nested_class': 'ThingPostBody'}
     )
-    locations: List[Union[EntityId]] = Field(
+    locations: List[Union[EntityId, 'LocationPostBody']] = Field(
         ..., alias='Locations', json_schema_extra={'nested_class': 'LocationPostBody'}
     )
 
 
+class HistoricalLocationNestedPostBody(HistoricalLocationPostBody):
+    """
+    A schema for a new historical location nested in the POST request body of its thing.
+
+    The thing is linked to the historical location when it is created, and is omitted from the nested body.
+
+    Attributes
+    ----------
+    thing : Union[EntityId, ThingPostBody, None], optional
+        The existing thing, or new thing, associated with the historical location.
+    """
+
+    thing: Union[EntityId, 'ThingPostBody', None] = Field(
+        None, alias='Thing', json_schema_extra={'nested_class': 'ThingPostBody'}
+    )
+
+
 class HistoricalLocationPatchBody(HistoricalLocationFields, BasePatchBody):
     """
     A schema for the body of a PATCH request to update an existing historical location.
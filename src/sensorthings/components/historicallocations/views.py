@@ -4,7 +4,8 @@ from sensorthings import settings
 from sensorthings.router import SensorThingsRouter
 from sensorthings.http import SensorThingsHttpRequest
 from sensorthings.schemas import ListQueryParams, GetQueryParams
-from sensorthings.factories import SensorThingsRouterFactory, SensorThingsEndpointFactory
+from sensorthings.factories import (SensorThingsRouterFactory, SensorThingsEndpointFactory,
+                                    build_create_entities_endpoint)
 from .schemas import (HistoricalLocation, HistoricalLocationPostBody, HistoricalLocationPatchBody,
                       HistoricalLocationListResponse, HistoricalLocationGetResponse)
 
@@ -88,7 +89,7 @@ def create_historical_location(
       Create Entity</a>
     """
 
-    request.engine.create_entity(
+    yield request.engine.create_entity(
         component=HistoricalLocation,
         entity_body=historical_location,
         response=response
@@ -105,6 +106,13 @@ create_historical_location_endpoint = SensorThingsEndpointFactory(
 )
 
 
+create_historical_locations_endpoint = build_create_entities_endpoint(
+    router_name='historical_location',
+    component=HistoricalLocation,
+    post_body_schema=HistoricalLocationPostBody
+)
+
+
 def update_historical_location(
         request: SensorThingsHttpRequest,
         historical_location_id: id_type,
@@ -122,7 +130,7 @@ def update_historical_location(
       Update Entity</a>
     """
 
-    request.engine.update_entity(
+    yield request.engine.update_entity(
         component=HistoricalLocation,
         entity_id=historical_location_id,
         entity_body=historical_location
@@ -148,7 +156,7 @@ def delete_historical_location(request: SensorThingsHttpRequest, historical_loca
       Delete Entity</a>
     """
 
-    request.engine.delete_entity(
+    yield request.engine.delete_entity(
         component=HistoricalLocation,
         entity_id=historical_location_id
     )
@@ -171,6 +179,7 @@ historical_location_router_factory = SensorThingsRouterFactory(
         list_historical_locations_endpoint,
         get_historical_location_endpoint,
         create_historical_location_endpoint,
+        create_historical_locations_endpoint,
         update_historical_location_endpoint,
         delete_historical_location_endpoint
     ]
@@ -9,6 +9,7 @@ from sensorthings.types import AnyHttpUrlString
 if TYPE_CHECKING:
     from sensorthings.components.things.schemas import Thing
     from sensorthings.components.historicallocations.schemas import HistoricalLocation
+    from sensorthings.components.things.schemas import ThingPostBody
 
 
 locationEncodingTypes = Literal['application/geo+json']
@@ -77,13 +78,13 @@ class LocationPostBody(BasePostBody, LocationFields):
 
     Attributes
     ----------
-    things : List[Union[EntityId]]
-        The list of thing IDs associated with the location.
+    things : List[Union[EntityId, ThingPostBody]]
+        The IDs of existing things, or new things, associated with the location.
     historical_locations : List[Union[EntityId]]
         The list of historical location IDs associated with the location.
     """
 
-    things: List[Union[EntityId]] = Field(
+    things: List[Union[EntityId, 'ThingPostBody']] = Field(
         [], alias='Things', json_schema_extra={'nested_class': 'ThingPostBody'}
     )
     historical_locations: List[Union[EntityId]] = Field(
@@ -4,7 +4,8 @@ from sensorthings import settings
 from sensorthings.router import SensorThingsRouter
 from sensorthings.http import SensorThingsHttpRequest
 from sensorthings.schemas import ListQueryParams, GetQueryParams
-from sensorthings.factories import SensorThingsRouterFactory, SensorThingsEndpointFactory
+from sensorthings.factories import (SensorThingsRouterFactory, SensorThingsEndpointFactory,
+                                    build_create_entities_endpoint)
 from .schemas import Location, LocationPostBody, LocationPatchBody, LocationListResponse, LocationGetResponse
 
 
@@ -87,7 +88,7 @@ def create_location(
       Create Entity</a>
     """
 
-    request.engine.create_entity(
+    yield request.engine.create_entity(
         component=Location,
         entity_body=location,
         response=response
@@ -104,6 +105,13 @@ create_location_endpoint = SensorThingsEndpointFactory(
 )
 
 
+create_locations_endpoint = build_create_entities_endpoint(
+    router_name='location',
+    component=Location,
+    post_body_schema=LocationPostBody
+)
+
+
 def update_location(
         request: SensorThingsHttpRequest,
         location_id: id_type,
@@ -121,7 +129,7 @@ def update_location(
       Update Entity</a>
     """
 
-    request.engine.update_entity(
+    yield request.engine.update_entity(
         component=Location,
         entity_id=location_id,
         entity_body=location
@@ -150,7 +158,7 @@ def delete_location(
       Delete Entity</a>
     """
 
-    request.engine.delete_entity(
+    yield request.engine.delete_entity(
         component=Location,
         entity_id=location_id
     )
@@ -173,6 +181,7 @@ location_router_factory = SensorThingsRouterFactory(
         list_locations_endpoint,
         get_location_endpoint,
         create_location_endpoint,
+        create_locations_endpoint,
         update_location_endpoint,
         delete_location_endpoint
     ]
@@ -24,7 +24,11 @@ class ObservationBaseEngine(metaclass=ABCMeta):
             pagination: dict = None,
             ordering: dict = None,
             filters: dict = None,
-            expanded: bool = False
+            expanded: bool = False,
+            fields: List[str] = None,
+            seek: dict = None,
+            limit_per_parent: dict = None,
+            expand: dict = None
     ) -> (Dict[id_type, dict], int):
         """
         Retrieve observations based on provided parameters.
@@ -45,11 +49,27 @@ class ObservationBaseEngine(metaclass=ABCMeta):
             Additional filters to apply to the query.
         expanded : bool, optional
             Whether to include expanded information in the results.
+        fields : List[str], optional
+            The entity fields to return. If None, all fields are returned. Engines may return additional fields.
+        seek : dict, optional
+            A cursor pagination predicate, given only if ST_CURSOR_PAGINATION is enabled. Entities must be ordered by
+            the fields and directions in seek['fields'], and if seek['after'] is not None, only entities whose key
+            values come after seek['after'] in that order are returned.
+        limit_per_parent : dict, optional
+            A per-parent limit, given instead of pagination when the entities are expanded from their parents and the
+            method accepts this argument. Entities must be partitioned by the parent ID in limit_per_parent['field']
+            (e.g. 'datastream_id') and ordered within each partition, and only entities ranked after the first
+            limit_per_parent['skip'] of their partition, up to limit_per_parent['top'] entities per partition, are
+            returned. This maps to ROW_NUMBER() OVER (PARTITION BY field ORDER BY ...) in SQL backends.
+        expand : dict, optional
+            The expand tree of the query, given only if the method accepts this argument and relations are expanded
+            (see SensorThingsBaseEngine.build_expand_hint). Related entities may be returned under the relation name
+            in each entity instead of being fetched separately.
 
         Returns
         -------
         Dict[id_type, dict]
-            A dictionary of observations, keyed by their IDs.
+            A dictionary of observations, keyed by their IDs, or an iterable of entity dictionaries.
         int
             The total number of observations matching the query.
         """
@@ -7,7 +7,7 @@ from sensorthings.types import ISOTimeString, ISOIntervalString, AnyHttpUrlStrin
 
 if TYPE_CHECKING:
     from sensorthings.components.datastreams.schemas import Datastream
-    from sensorthings.components.featuresofinterest.schemas import FeatureOfInterest
+    from sensorthings.components.featuresofinterest.schemas import FeatureOfInterest, FeatureOfInterestPostBody
 
 
 observationTypes = Literal[
@@ -96,8 +96,8 @@ class ObservationPostBody(BasePostBody, ObservationFields):
     ----------
     datastream : Union[EntityId]
         The ID of the datastream associated with the observation.
-    feature_of_interest : Union[EntityId, None], optional
-        The ID of the feature of interest associated with the observation.
+    feature_of_interest : Union[EntityId, FeatureOfInterestPostBody, None], optional
+        The existing feature of interest, or new feature of interest, associated with the observation.
     """
 
     model_config = ConfigDict(populate_by_name=True)
@@ -105,7 +105,7 @@ class ObservationPostBody(BasePostBody, ObservationFields):
     datastream: Union[EntityId] = Field(
         ..., alias='Datastream', json_schema_extra={'nested_class': 'DatastreamPostBody'}
     )
-    feature_of_interest: Union[EntityId, None] = Field(
+    feature_of_interest: Union[EntityId, 'FeatureOfInterestPostBody', None] = Field(
         None, alias='FeatureOfInterest', json_schema_extra={'nested_class': 'FeatureOfInterestPostBody'}
     )
 
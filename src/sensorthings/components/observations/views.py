@@ -3,7 +3,7 @@ from django.http import HttpResponse
 from sensorthings import settings
 from sensorthings.router import SensorThingsRouter
 from sensorthings.http import SensorThingsHttpRequest
-from sensorthings.schemas import GetQueryParams, ListQueryParams
+from sensorthings.schemas import GetQueryParams, ListQueryParams, PermissionDenied, EntityNotFound
 from sensorthings.components.datastreams.schemas import Datastream
 from sensorthings.factories import SensorThingsRouterFactory, SensorThingsEndpointFactory
 from .schemas import (Observation, ObservationPostBody, ObservationPatchBody, ObservationListResponse,
@@ -89,13 +89,16 @@ def create_observation(
       Create Entity</a>
     """
 
-    request.engine.create_entity(
+    if (yield request.engine.buffer_observation(observation=observation, response=response)):
+        return 202, None
+
+    yield request.engine.create_entity(
         component=Observation,
         response=response,
         entity_body=observation
     )
 
-    request.engine.update_related_components(
+    yield request.engine.update_related_components(
         component=Datastream, related_entity_id=observation.datastream.id
     )
 
@@ -107,6 +110,40 @@ create_observation_endpoint = SensorThingsEndpointFactory(
     endpoint_route='/Observations',
     view_function=create_observation,
     view_method=SensorThingsRouter.st_post,
+    view_response_override={
+        201: None,
+        202: None,
+        403: PermissionDenied
+    }
+)
+
+
+def get_buffered_observation(
+        request: SensorThingsHttpRequest,
+        response: HttpResponse,
+        ticket: str
+):
+    """
+    Get the status of an Observation accepted by the Observation buffer.
+
+    Returns 202 while the Observation is buffered, and 201 with the location of the created Observation once it has
+    been created.
+    """
+
+    return request.engine.get_buffered_observation(ticket=ticket, response=response), None
+
+
+get_buffered_observation_endpoint = SensorThingsEndpointFactory(
+    router_name='observation',
+    endpoint_route="/BufferedObservations('{ticket}')",
+    view_function=get_buffered_observation,
+    view_method=SensorThingsRouter.st_get,
+    view_response_override={
+        201: None,
+        202: None,
+        403: PermissionDenied,
+        404: EntityNotFound
+    }
 )
 
 
@@ -127,12 +164,14 @@ def update_observation(
       Update Entity</a>
     """
 
-    request.engine.update_entity(
+    yield request.engine.update_entity(
         component=Observation,
         entity_id=observation_id,
         entity_body=observation
     )
 
+    yield request.engine.invalidate_latest_observations()
+
     return 204, None
 
 
@@ -156,11 +195,13 @@ def delete_observation(
       Delete Entity</a>
     """
 
-    request.engine.delete_entity(
+    yield request.engine.delete_entity(
         component=Observation,
         entity_id=observation_id
     )
 
+    yield request.engine.invalidate_latest_observations()
+
     return 204, None
 
 
@@ -179,6 +220,7 @@ observation_router_factory = SensorThingsRouterFactory(
         list_observations_endpoint,
         get_observation_endpoint,
         create_observation_endpoint,
+        get_buffered_observation_endpoint,
         update_observation_endpoint,
         delete_observation_endpoint
     ]
@@ -22,7 +22,10 @@ class ObservedPropertyBaseEngine(metaclass=ABCMeta):
             pagination: dict = None,
             ordering: dict = None,
             filters: dict = None,
-            expanded: bool = False
+            expanded: bool = False,
+            fields: List[str] = None,
+            seek: dict = None,
+            expand: dict = None
     ) -> (Dict[id_type, dict], int):
         """
         Retrieve observed properties based on provided parameters.
@@ -39,11 +42,21 @@ class ObservedPropertyBaseEngine(metaclass=ABCMeta):
             Additional filters to apply to the query.
         expanded : bool, optional
             Whether to include expanded information in the results.
+        fields : List[str], optional
+            The entity fields to return. If None, all fields are returned. Engines may return additional fields.
+        seek : dict, optional
+            A cursor pagination predicate, given only if ST_CURSOR_PAGINATION is enabled. Entities must be ordered by
+            the fields and directions in seek['fields'], and if seek['after'] is not None, only entities whose key
+            values come after seek['after'] in that order are returned.
+        expand : dict, optional
+            The expand tree of the query, given only if the method accepts this argument and relations are expanded
+            (see SensorThingsBaseEngine.build_expand_hint). Related entities may be returned under the relation name
+            in each entity instead of being fetched separately.
 
         Returns
         -------
         Dict[id_type, dict]
-            A dictionary of observed properties, keyed by their IDs.
+            A dictionary of observed properties, keyed by their IDs, or an iterable of entity dictionaries.
         int
             The total number of observed properties matching the query.
         """
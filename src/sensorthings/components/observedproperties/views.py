@@ -4,7 +4,8 @@ from sensorthings import settings
 from sensorthings.router import SensorThingsRouter
 from sensorthings.http import SensorThingsHttpRequest
 from sensorthings.schemas import ListQueryParams, GetQueryParams
-from sensorthings.factories import SensorThingsRouterFactory, SensorThingsEndpointFactory
+from sensorthings.factories import (SensorThingsRouterFactory, SensorThingsEndpointFactory,
+                                    build_create_entities_endpoint)
 from .schemas import (ObservedProperty, ObservedPropertyPostBody, ObservedPropertyPatchBody,
                       ObservedPropertyListResponse, ObservedPropertyGetResponse)
 
@@ -88,7 +89,7 @@ def create_observed_property(
       Create Entity</a>
     """
 
-    request.engine.create_entity(
+    yield request.engine.create_entity(
         component=ObservedProperty,
         entity_body=observed_property,
         response=response
@@ -105,6 +106,13 @@ create_observed_property_endpoint = SensorThingsEndpointFactory(
 )
 
 
+create_observed_properties_endpoint = build_create_entities_endpoint(
+    router_name='observed_property',
+    component=ObservedProperty,
+    post_body_schema=ObservedPropertyPostBody
+)
+
+
 def update_observed_property(
         request: SensorThingsHttpRequest,
         observed_property_id: id_type,
@@ -122,7 +130,7 @@ def update_observed_property(
       Update Entity</a>
     """
 
-    request.engine.update_entity(
+    yield request.engine.update_entity(
         component=ObservedProperty,
         entity_id=observed_property_id,
         entity_body=observed_property
@@ -148,7 +156,7 @@ def delete_observed_property(request: SensorThingsHttpRequest, observed_property
       Delete Entity</a>
     """
 
-    request.engine.delete_entity(
+    yield request.engine.delete_entity(
         component=ObservedProperty,
         entity_id=observed_property_id
     )
@@ -171,6 +179,7 @@ observed_property_router_factory = SensorThingsRouterFactory(
         list_observed_properties_endpoint,
         get_observed_property_endpoint,
         create_observed_property_endpoint,
+        create_observed_properties_endpoint,
         update_observed_property_endpoint,
         delete_observed_property_endpoint
     ]
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Dict, Optional, Any
 from pydantic import Field, ConfigDict
 from ninja import Schema
 
@@ -48,3 +48,76 @@ class ServerRootResponse(Schema):
 
     server_settings: ServerSettings = Field(None, alias='serverSettings')
     server_capabilities: List[ServerCapabilities] = Field(None, alias='value')
+
+
+class BatchRequest(Schema):
+    """
+    A schema representing a sub-request of a JSON batch request.
+
+    Attributes
+    ----------
+    id : str, optional
+        The ID of the sub-request, repeated in its response.
+    method : str
+        The HTTP method of the sub-request.
+    url : str
+        The URL of the sub-request, either absolute or relative to the SensorThings API root.
+    headers : Dict[str, str], optional
+        The HTTP headers of the sub-request.
+    body : Any, optional
+        The JSON body of the sub-request.
+    """
+
+    id: Optional[str] = None
+    method: str
+    url: str
+    headers: Dict[str, str] = {}
+    body: Any = None
+
+
+class BatchRequestBody(Schema):
+    """
+    A schema for the body of a JSON batch request.
+
+    Attributes
+    ----------
+    requests : List[BatchRequest]
+        The sub-requests to execute, in order.
+    """
+
+    requests: List[BatchRequest]
+
+
+class BatchResponse(Schema):
+    """
+    A schema representing the response to a sub-request of a JSON batch request.
+
+    Attributes
+    ----------
+    id : str, optional
+        The ID of the sub-request.
+    status : int
+        The HTTP status code of the response.
+    headers : Dict[str, str]
+        The HTTP headers of the response.
+    body : Any, optional
+        The JSON body of the response.
+    """
+
+    id: Optional[str] = None
+    status: int
+    headers: Dict[str, str] = {}
+    body: Any = None
+
+
+class BatchResponseBody(Schema):
+    """
+    A schema for the body of the response to a JSON batch request.
+
+    Attributes
+    ----------
+    responses : List[BatchResponse]
+        The responses to the sub-requests, in the order of the sub-requests.
+    """
+
+    responses: List[BatchResponse]
@@ -1,7 +1,9 @@
 from ninja import Router
+from ninja.errors import HttpError
 from django.http import HttpResponse
 from django.urls import reverse
-from .schemas import ServerRootResponse
+from .schemas import ServerRootResponse, BatchRequestBody, BatchResponseBody
+from sensorthings.batch import execute_batch
 from sensorthings import settings
 
 
@@ -35,5 +37,25 @@ def get_root(request):
     return response
 
 
+@router.post(
+    '$batch',
+    url_name='batch',
+    by_alias=True,
+    response=BatchResponseBody
+)
+def batch(request, batch_request: BatchRequestBody):
+    """
+    Execute a batch of SensorThings requests in a single round trip.
+
+    Each sub-request is resolved and handled like a regular request to the API, and its response is returned in the
+    order of the sub-requests. Sub-request URLs may be absolute or relative to the API root (e.g. Things(1)).
+    """
+
+    if len(batch_request.requests) > settings.ST_BATCH_MAX_REQUESTS:
+        raise HttpError(400, f'Batch requests are limited to {settings.ST_BATCH_MAX_REQUESTS} sub-requests.')
+
+    return HttpResponse(execute_batch(request, batch_request.requests), content_type='application/json')
+
+
 def handle_advanced_path(request):  # noqa
     return HttpResponse(status=404)
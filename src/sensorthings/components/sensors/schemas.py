@@ -1,11 +1,11 @@
-from typing import TYPE_CHECKING, Literal, List, Optional
+from typing import TYPE_CHECKING, Literal, List, Union, Optional
 from pydantic import Field, ConfigDict
 from ninja import Schema
 from sensorthings.schemas import EntityId, BaseComponent, BaseListResponse, BaseGetResponse, BasePostBody, BasePatchBody
 from sensorthings.types import AnyHttpUrlString
 
 if TYPE_CHECKING:
-    from sensorthings.components.datastreams.schemas import Datastream
+    from sensorthings.components.datastreams.schemas import Datastream, DatastreamNestedPostBody
 
 
 sensorEncodingTypes = Literal[
@@ -71,11 +71,11 @@ class SensorPostBody(BasePostBody, SensorFields):
 
     Attributes
     ----------
-    datastreams : List[EntityId]
-        The IDs of the datastreams associated with the sensor.
+    datastreams : List[Union[EntityId, DatastreamNestedPostBody]]
+        The IDs of existing datastreams, or new datastreams, associated with the sensor.
     """
 
-    datastreams: List[EntityId] = Field(
+    datastreams: List[Union[EntityId, 'DatastreamNestedPostBody']] = Field(
         [], alias='Datastreams', json_schema_extra={'nested_class': 'DatastreamPostBody'}
     )
 
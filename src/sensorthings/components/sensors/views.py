@@ -4,7 +4,8 @@ from sensorthings import settings
 from sensorthings.router import SensorThingsRouter
 from sensorthings.http import SensorThingsHttpRequest
 from sensorthings.schemas import ListQueryParams, GetQueryParams
-from sensorthings.factories import SensorThingsRouterFactory, SensorThingsEndpointFactory
+from sensorthings.factories import (SensorThingsRouterFactory, SensorThingsEndpointFactory,
+                                    build_create_entities_endpoint)
 from .schemas import Sensor, SensorPostBody, SensorPatchBody, SensorListResponse, SensorGetResponse
 
 
@@ -87,7 +88,7 @@ def create_sensor(
       Create Entity</a>
     """
 
-    request.engine.create_entity(
+    yield request.engine.create_entity(
         component=Sensor,
         entity_body=sensor,
         response=response
@@ -104,6 +105,13 @@ create_sensor_endpoint = SensorThingsEndpointFactory(
 )
 
 
+create_sensors_endpoint = build_create_entities_endpoint(
+    router_name='sensor',
+    component=Sensor,
+    post_body_schema=SensorPostBody
+)
+
+
 def update_sensor(
         request: SensorThingsHttpRequest,
         sensor_id: id_type,
@@ -121,7 +129,7 @@ def update_sensor(
       Update Entity</a>
     """
 
-    request.engine.update_entity(
+    yield request.engine.update_entity(
         component=Sensor,
         entity_id=sensor_id,
         entity_body=sensor
@@ -150,7 +158,7 @@ def delete_sensor(
       Delete Entity</a>
     """
 
-    request.engine.delete_entity(
+    yield request.engine.delete_entity(
         component=Sensor,
         entity_id=sensor_id
     )
@@ -173,6 +181,7 @@ sensor_router_factory = SensorThingsRouterFactory(
         list_sensors_endpoint,
         get_sensor_endpoint,
         create_sensor_endpoint,
+        create_sensors_endpoint,
         update_sensor_endpoint,
         delete_sensor_endpoint
     ]
@@ -9,6 +9,9 @@ if TYPE_CHECKING:
     from sensorthings.components.locations.schemas import Location
     from sensorthings.components.historicallocations.schemas import HistoricalLocation
     from sensorthings.components.datastreams.schemas import Datastream
+    from sensorthings.components.locations.schemas import LocationPostBody
+    from sensorthings.components.historicallocations.schemas import HistoricalLocationNestedPostBody
+    from sensorthings.components.datastreams.schemas import DatastreamNestedPostBody
 
 
 class ThingFields(Schema):
@@ -73,21 +76,21 @@ class ThingPostBody(BasePostBody, ThingFields):
 
     Attributes
     ----------
-    locations : List[Union[EntityId]]
-        The IDs of the locations associated with the thing.
-    historical_locations : List[EntityId]
-        The IDs of the historical locations associated with the thing.
-    datastreams : List[EntityId]
-        The IDs of the datastreams associated with the thing.
+    locations : List[Union[EntityId, LocationPostBody]]
+        The IDs of existing locations, or new locations, associated with the thing.
+    historical_locations : List[Union[EntityId, HistoricalLocationNestedPostBody]]
+        The IDs of existing historical locations, or new historical locations, associated with the thing.
+    datastreams : List[Union[EntityId, DatastreamNestedPostBody]]
+        The IDs of existing datastreams, or new datastreams, associated with the thing.
     """
 
-    locations: List[Union[EntityId]] = Field(
+    locations: List[Union[EntityId, 'LocationPostBody']] = Field(
         [], alias='Locations', json_schema_extra={'nested_class': 'LocationPostBody'}
     )
-    historical_locations: List[EntityId] = Field(
+    historical_locations: List[Union[EntityId, 'HistoricalLocationNestedPostBody']] = Field(
         [], alias='HistoricalLocations', json_schema_extra={'nested_class': 'HistoricalLocationPostBody'}
     )
-    datastreams: List[EntityId] = Field(
+    datastreams: List[Union[EntityId, 'DatastreamNestedPostBody']] = Field(
         [], alias='Datastreams', json_schema_extra={'nested_class': 'DatastreamPostBody'}
     )
 
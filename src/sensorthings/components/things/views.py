@@ -4,7 +4,8 @@ from sensorthings import settings
 from sensorthings.router import SensorThingsRouter
 from sensorthings.http import SensorThingsHttpRequest
 from sensorthings.schemas import ListQueryParams, GetQueryParams
-from sensorthings.factories import SensorThingsRouterFactory, SensorThingsEndpointFactory
+from sensorthings.factories import (SensorThingsRouterFactory, SensorThingsEndpointFactory,
+                                    build_create_entities_endpoint)
 from .schemas import Thing, ThingPostBody, ThingPatchBody, ThingListResponse, ThingGetResponse
 
 
@@ -89,7 +90,7 @@ def create_thing(
       Create Entity</a>
     """
 
-    request.engine.create_entity(
+    yield request.engine.create_entity(
         component=Thing,
         entity_body=thing,
         response=response
@@ -106,6 +107,13 @@ create_thing_endpoint = SensorThingsEndpointFactory(
 )
 
 
+create_things_endpoint = build_create_entities_endpoint(
+    router_name='thing',
+    component=Thing,
+    post_body_schema=ThingPostBody
+)
+
+
 def update_thing(
         request: SensorThingsHttpRequest,
         thing_id: id_type,
@@ -123,7 +131,7 @@ def update_thing(
       Update Entity</a>
     """
 
-    request.engine.update_entity(
+    yield request.engine.update_entity(
         component=Thing,
         entity_id=thing_id,
         entity_body=thing
@@ -152,7 +160,7 @@ def delete_thing(
       Delete Entity</a>
     """
 
-    request.engine.delete_entity(
+    yield request.engine.delete_entity(
         component=Thing,
         entity_id=thing_id
     )
@@ -175,6 +183,7 @@ thing_router_factory = SensorThingsRouterFactory(
         list_things_endpoint,
         get_thing_endpoint,
         create_thing_endpoint,
+        create_things_endpoint,
         update_thing_endpoint,
         delete_thing_endpoint
     ]
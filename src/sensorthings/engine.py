@@ -1,11 +1,28 @@
 import re
 import pytz
+import base64
+import hashlib
+import binascii
+import orjson
+import asyncio
+import inspect
+import functools
+import logging
+import threading
 from abc import ABCMeta
-from typing import TYPE_CHECKING, List, Optional, Type, Dict, Callable, Tuple, ForwardRef
+from contextlib import contextmanager, asynccontextmanager
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Mapping
+from typing import (TYPE_CHECKING, Any, List, Optional, Type, Dict, Callable, Tuple, ForwardRef, Iterable, Iterator,
+                    Generator, AsyncIterator)
 from uuid import UUID
+from asgiref.sync import sync_to_async
 from datetime import datetime
 from dateutil.parser import isoparse
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
 from ninja.errors import HttpError
 from odata_query.grammar import ODataParser, ODataLexer
 from odata_query.exceptions import ParsingException, TokenizingException
@@ -17,20 +34,62 @@ from sensorthings.components.sensors.engine import SensorBaseEngine
 from sensorthings.components.observedproperties.engine import ObservedPropertyBaseEngine
 from sensorthings.components.featuresofinterest.engine import FeatureOfInterestBaseEngine
 from sensorthings.components.observations.engine import ObservationBaseEngine
-from sensorthings.schemas import ListQueryParams
+from sensorthings.schemas import ListQueryParams, BasePostBody
+from sensorthings.query import QueryPlan, query_plan_cache
+from sensorthings.cache import response_cache, latest_observation_store
+from sensorthings.workers import time_bounds_worker, observation_buffer, run_in_pool_thread, in_atomic_block
 from sensorthings.components import field_schemas
+from sensorthings import components as component_schemas
+from sensorthings.insert import InsertNode, has_nested_entities
 from sensorthings.components.datastreams.schemas import DatastreamPatchBody
 from sensorthings import settings
 
 
 if TYPE_CHECKING:
-    from sensorthings.schemas import BaseComponent, BaseGetResponse, BasePostBody, BasePatchBody
+    from sensorthings.schemas import BaseComponent, BaseGetResponse, BasePatchBody
     from sensorthings.http import SensorThingsHttpRequest
+    from sensorthings.components.observations.schemas import ObservationPostBody
 
 
+logger = logging.getLogger(__name__)
+
 id_qualifier = settings.ST_API_ID_QUALIFIER
 id_type = settings.ST_API_ID_TYPE
 
+engine_method_parameters = {}
+
+expand_executor = None
+expand_executor_lock = threading.Lock()
+expand_thread_name_prefix = 'sensorthings-expand'
+
+
+def engine_pipeline(method: Callable) -> Callable:
+    """
+    Declare a generator method of an engine as a pipeline method, shared by sync and async engines.
+
+    Pipeline methods yield the result of every call to a method that may be a coroutine function in an async engine
+    (component methods such as get_things, other pipeline methods, and the blocking, concurrent, or transactional
+    operations of the engine), and are sent the resolved value back. The engine's run_pipeline method drives the
+    generator, so a pipeline method returns its result when called on a sync engine and a coroutine when called on an
+    async engine.
+
+    Parameters
+    ----------
+    method : Callable
+        The generator method.
+
+    Returns
+    -------
+    Callable
+        The engine method running the generator with the engine's run_pipeline method.
+    """
+
+    @functools.wraps(method)
+    def pipeline_method(self, *args, **kwargs):
+        return self.run_pipeline(method(self, *args, **kwargs))
+
+    return pipeline_method
+
 
 class SensorThingsBaseEngine(
     ThingBaseEngine,
@@ -62,6 +121,89 @@ class SensorThingsBaseEngine(
         self.request = request
         self.get_response_schemas = get_response_schemas
 
+    @staticmethod
+    def run_pipeline(steps: Generator) -> Any:
+        """
+        Runs a pipeline method (see engine_pipeline), sending the result of each engine call back to it.
+
+        Parameters
+        ----------
+        steps : Generator
+            The generator of the pipeline method.
+
+        Returns
+        -------
+        Any
+            The result of the pipeline method.
+        """
+
+        result = None
+
+        while True:
+            try:
+                result = steps.send(result)
+            except StopIteration as stop:
+                return stop.value
+
+    @staticmethod
+    def run_blocking(function: Callable, *args, **kwargs) -> Any:
+        """
+        Calls a blocking function, such as a cache lookup, from a pipeline method.
+
+        Parameters
+        ----------
+        function : Callable
+            The blocking function.
+        *args, **kwargs
+            The arguments to call the function with.
+
+        Returns
+        -------
+        Any
+            The result of the function.
+        """
+
+        return function(*args, **kwargs)
+
+    def run_in_transaction(self, method: Callable, **kwargs) -> Any:
+        """
+        Calls an engine method within a transaction boundary (see transaction).
+
+        Parameters
+        ----------
+        method : Callable
+            The engine method grouping the writes.
+        **kwargs
+            The keyword arguments to call the method with.
+
+        Returns
+        -------
+        Any
+            The result of the method.
+        """
+
+        with self.transaction():
+            return method(**kwargs)
+
+    @staticmethod
+    def collect_entities(entities) -> Dict[str, dict]:
+        """
+        Collects the entities returned by an engine's get method into a dictionary keyed by entity ID.
+
+        Parameters
+        ----------
+        entities : Iterable[dict]
+            Either a dictionary of entities keyed by ID or an iterable of entity dictionaries.
+
+        Returns
+        -------
+        Dict[str, dict]
+            The entities keyed by ID.
+        """
+
+        return entities if isinstance(entities, Mapping) else {entity['id']: entity for entity in entities}
+
+    @engine_pipeline
     def list_entities(
             self,
             component: Type['BaseComponent'],
@@ -83,14 +225,71 @@ class SensorThingsBaseEngine(
             A dictionary containing the retrieved entities and optional metadata.
         """
 
-        nested_entity_id = self.check_nested_path()
+        not_modified_response = yield self.check_conditional_request(component=component, query_params=query_params)
+        if not_modified_response is not None:
+            return not_modified_response
+
+        if (yield self.load_cached_response(component=component, query_params=query_params)):
+            return {'value': []}
+
+        key_constraints = self.build_nested_key_constraints(nested_entity_id=(yield self.check_nested_path()))
+
+        if getattr(self.request, 'stream_response', False) is True:
+            return (yield self.stream_entities(
+                component=component,
+                query_params=query_params,
+                key_constraints=key_constraints
+            ))
+
+        entities, count = yield self.fetch_entities(
+            component=component,
+            query_params=query_params,
+            key_constraints=key_constraints,
+            paginate_by_cursor=True
+        )
+
+        return self.build_list_response(entities=entities, count=count, query_params=query_params)
+
+    def build_nested_key_constraints(self, nested_entity_id) -> Optional[dict]:
+        """
+        Build the parent key constraint for a collection addressed through a nested resource path.
+
+        Parameters
+        ----------
+        nested_entity_id : Optional[id_type]
+            The ID of the entity at the end of the nested path, if any.
+
+        Returns
+        -------
+        Optional[dict]
+            The parent key constraint (e.g. {'datastream_ids': [1]}), or None if the path is not nested.
+        """
+
+        if not nested_entity_id:
+            return None
+
+        nested_component = self.request.nested_path[-1][0]
+
+        return {f"{nested_component.model_config['json_schema_extra']['name_ref'][1]}_ids": [nested_entity_id]}
+
+    def build_list_response(self, entities: Dict[str, dict], count: Optional[int], query_params: dict) -> Dict:
+        """
+        Build a collection response from assembled entities.
 
-        if nested_entity_id:
-            nested_entity_filter = f"{self.request.nested_path[-1][0].__name__}/id eq '{nested_entity_id}'"
-            query_params['filters'] = f'{query_params["filters"]} and {nested_entity_filter}' \
-                if query_params['filters'] else nested_entity_filter
+        Parameters
+        ----------
+        entities : dict
+            A dictionary of assembled response entities.
+        count : Optional[int]
+            The total count of entities available.
+        query_params : dict
+            The query parameters of the request.
 
-        entities, count = self.fetch_entities(component=component, query_params=query_params)
+        Returns
+        -------
+        Dict
+            A dictionary containing the entities and optional count and next link.
+        """
 
         next_link = self.build_next_link(
             query_params=query_params,
@@ -110,6 +309,7 @@ class SensorThingsBaseEngine(
 
         return response
 
+    @engine_pipeline
     def get_entity(self, component: Type['BaseComponent'], entity_id: id_type, query_params) -> Dict:
         """
         Retrieve a single entity of a specific component type by its ID.
@@ -129,18 +329,51 @@ class SensorThingsBaseEngine(
             The retrieved entity.
         """
 
-        nested_entity_id = self.check_nested_path()
+        not_modified_response = yield self.check_conditional_request(
+            component=component, query_params=query_params, entity_id=entity_id
+        )
+        if not_modified_response is not None:
+            return not_modified_response
+
+        if (yield self.load_cached_response(component=component, query_params=query_params, entity_id=entity_id)):
+            return ''
+
+        nested_entity_id = yield self.check_nested_path()
         if nested_entity_id and entity_id in [UUID('00000000-0000-0000-0000-000000000000'), '0', 0]:
             entity_id = nested_entity_id
 
-        filter_wrap = "'" if id_type == int else ''
-        query_params['filters'] = f"id eq {filter_wrap}{str(entity_id)}{filter_wrap}"
-
-        entities, count = self.fetch_entities(
+        entities, count = yield self.fetch_entities(
             component=component,
-            query_params=query_params
+            query_params=query_params,
+            key_constraints={f"{component.model_config['json_schema_extra']['name_ref'][1]}_ids": [entity_id]}
         )
 
+        return self.build_entity_response(component=component, entities=entities, query_params=query_params)
+
+    def build_entity_response(self, component: Type['BaseComponent'], entities: Dict[str, dict], query_params: dict):
+        """
+        Build a single entity response from assembled entities.
+
+        Parameters
+        ----------
+        component : Type[BaseComponent]
+            The type of component requested.
+        entities : dict
+            A dictionary of assembled response entities.
+        query_params : dict
+            The query parameters of the request.
+
+        Returns
+        -------
+        Union[Dict, str]
+            The entity, or the selected value as a string for $value requests.
+
+        Raises
+        ------
+        HttpError
+            If no entity was found.
+        """
+
         entity = next(iter(entities.values()), None)
 
         if not entity:
@@ -151,6 +384,7 @@ class SensorThingsBaseEngine(
 
         return entity
 
+    @engine_pipeline
     def create_entity(
             self,
             component: Type['BaseComponent'],
@@ -160,6 +394,8 @@ class SensorThingsBaseEngine(
         """
         Create a new entity of a specific component type.
 
+        Entity bodies containing new related entities are created with a deep insert (see deep_insert).
+
         Parameters
         ----------
         component : Type[BaseComponent]
@@ -170,32 +406,320 @@ class SensorThingsBaseEngine(
             The HTTP response object to populate with the location of the created entity.
         """
 
-        entity_id = getattr(self, f"create_{component.model_config['json_schema_extra']['name_ref'][1]}")(entity_body)
+        if has_nested_entities(entity_body):
+            entity_id, = yield self.deep_insert(component=component, entity_body=[entity_body])
+        else:
+            entity_id = yield getattr(
+                self, f"create_{component.model_config['json_schema_extra']['name_ref'][1]}"
+            )(entity_body)
+            yield self.invalidate_cached_responses(component=component, entity_ids=[], entity_body=entity_body)
+
         response['Location'] = self.build_ref_link(component, entity_id)
 
+    @engine_pipeline
     def create_entities(
             self,
             component: Type['BaseComponent'],
-            entity_body: 'BasePostBody',
-    ) -> List[str]:
+            entity_body: List['BasePostBody'],
+    ) -> List[id_type]:
         """
         Create multiple entities of a specific component type.
 
+        If the engine implements the plural create method of the component (e.g. create_things), it receives all
+        entity bodies in a single call. Otherwise, each entity is created with the singular create method. Either way,
+        the entities are created within a single engine transaction.
+
         Parameters
         ----------
         component : Type[BaseComponent]
             The type of component to create.
-        entity_body : BasePostBody
-            The body containing the data for creating the entities.
+        entity_body : List[BasePostBody]
+            The bodies containing the data for creating the entities.
 
         Returns
         -------
-        List[str]
-            A list of IDs of the created entities.
+        List[id_type]
+            A list of IDs of the created entities, in the order of the entity bodies.
+        """
+
+        if any(has_nested_entities(body) for body in entity_body):
+            return (yield self.deep_insert(component=component, entity_body=entity_body))
+
+        entity_ids = yield self.run_in_transaction(
+            self.insert_entities, component=component, entity_body=entity_body
+        )
+
+        yield self.invalidate_cached_responses(
+            component=component, entity_ids=[], entity_body=self.get_linking_entity_body(component, entity_body)
+        )
+
+        return entity_ids
+
+    @engine_pipeline
+    def insert_entities(
+            self,
+            component: Type['BaseComponent'],
+            entity_body: List['BasePostBody'],
+    ) -> List[id_type]:
+        """
+        Passes multiple entity bodies of a specific component type to the engine's create methods.
+
+        Calls the plural create method of the component (e.g. create_things) if the engine implements it, and the
+        singular create method for each entity body otherwise. The caller is responsible for the transaction boundary
+        and for invalidating cached responses.
+
+        Parameters
+        ----------
+        component : Type[BaseComponent]
+            The type of component to create.
+        entity_body : List[BasePostBody]
+            The bodies containing the data for creating the entities.
+
+        Returns
+        -------
+        List[id_type]
+            A list of IDs of the created entities, in the order of the entity bodies.
+
+        Raises
+        ------
+        ValueError
+            If the plural create method does not return one ID per entity body.
+        """
+
+        name_ref = component.model_config['json_schema_extra']['name_ref']
+        create_entities = getattr(self, f'create_{name_ref[2]}', None)
+
+        if callable(create_entities):
+            entity_ids = list((yield create_entities(entity_body)))
+            if len(entity_ids) != len(entity_body):
+                raise ValueError(
+                    f'create_{name_ref[2]} returned {len(entity_ids)} IDs for {len(entity_body)} entity bodies.'
+                )
+            return entity_ids
+
+        entity_ids = []
+
+        for entity in entity_body:
+            entity_ids.append((yield getattr(self, f'create_{name_ref[1]}')(entity)))
+
+        return entity_ids
+
+    @engine_pipeline
+    def deep_insert(
+            self,
+            component: Type['BaseComponent'],
+            entity_body: List['BasePostBody'],
+    ) -> List[id_type]:
+        """
+        Create entities of a specific component type together with the new related entities nested in their bodies.
+
+        The insert plan (see plan_deep_insert) is applied within a single engine transaction, creating the entities of
+        each step with one call to insert_entities. Each nested entity is passed to the engine with its relations set
+        to the IDs of the entities created before it, so engine create methods only ever receive entity IDs.
+
+        Parameters
+        ----------
+        component : Type[BaseComponent]
+            The type of component to create.
+        entity_body : List[BasePostBody]
+            The bodies containing the data for creating the entities.
+
+        Returns
+        -------
+        List[id_type]
+            A list of IDs of the created entities, in the order of the entity bodies.
+        """
+
+        root_nodes, insert_steps = self.plan_deep_insert(component=component, entity_body=entity_body)
+        created_entities = yield self.run_in_transaction(self.insert_planned_entities, insert_steps=insert_steps)
+
+        for step_component, step_body in created_entities:
+            yield self.invalidate_cached_responses(
+                component=step_component, entity_ids=[],
+                entity_body=self.get_linking_entity_body(step_component, step_body)
+            )
+
+        return [node.entity_id for node in root_nodes]
+
+    @engine_pipeline
+    def insert_planned_entities(
+            self,
+            insert_steps: List[Tuple[Type['BaseComponent'], List[InsertNode]]]
+    ) -> List[Tuple[Type['BaseComponent'], List['BasePostBody']]]:
+        """
+        Creates the steps of an insert plan in order, setting the ID of each insert node once it has been created.
+
+        Parameters
+        ----------
+        insert_steps : List[Tuple[Type[BaseComponent], List[InsertNode]]]
+            The ordered steps of component types and insert nodes to create, as returned by plan_deep_insert.
+
+        Returns
+        -------
+        List[Tuple[Type[BaseComponent], List[BasePostBody]]]
+            The component type and the entity bodies created by each step.
+        """
+
+        created_entities = []
+
+        for step_component, step_nodes in insert_steps:
+            step_body = [node.build_body() for node in step_nodes]
+            entity_ids = yield self.insert_entities(component=step_component, entity_body=step_body)
+            for node, entity_id in zip(step_nodes, entity_ids):
+                node.entity_id = entity_id
+            created_entities.append((step_component, step_body))
+
+        return created_entities
+
+    def plan_deep_insert(
+            self,
+            component: Type['BaseComponent'],
+            entity_body: List['BasePostBody'],
+    ) -> Tuple[List[InsertNode], List[Tuple[Type['BaseComponent'], List[InsertNode]]]]:
+        """
+        Orders the creation of entities and the new related entities nested in their bodies.
+
+        New related entities on the many side of a relation (e.g. the Datastreams of a Thing) are created after the
+        entity they are nested in, and are linked to it through their own relation field. All other new related
+        entities (e.g. the Locations of a Thing, or the Sensor of a Datastream) are created before the entity they
+        are nested in. Entities are then grouped into steps by the number of new entities that must be created
+        before them, and by component type, so that each step can be created with a single plural create call.
+
+        Parameters
+        ----------
+        component : Type[BaseComponent]
+            The type of component of the entity bodies.
+        entity_body : List[BasePostBody]
+            The bodies containing the data for creating the entities.
+
+        Returns
+        -------
+        Tuple[List[InsertNode], List[Tuple[Type[BaseComponent], List[InsertNode]]]]
+            The insert nodes of the entity bodies, and the ordered steps of component types and insert nodes to create.
+
+        Raises
+        ------
+        HttpError
+            If a nested entity is missing a required relation.
+        """
+
+        nodes = []
+
+        def add_node(node_component, body, body_class, parent=None, parent_field=None):
+            node = InsertNode(
+                component=node_component,
+                body_class=body_class,
+                values={field_name: getattr(body, field_name) for field_name in body_class.model_fields},
+                fields_set=set(body.model_fields_set)
+            )
+
+            if parent is not None:
+                node.values[parent_field] = parent
+                node.fields_set.add(parent_field)
+                node.dependencies.append(parent)
+
+            nodes.append(node)
+            nested_entities = []
+
+            for field_name, field_info in body_class.model_fields.items():
+                nested_class = (field_info.json_schema_extra or {}).get('nested_class')
+
+                if nested_class is None or field_name == parent_field:
+                    continue
+
+                value = node.values[field_name]
+                related_component_field = node_component.model_fields[field_name]
+                related_component = self.resolve_related_component(related_component_field)
+                related_body_class = getattr(component_schemas, nested_class)
+
+                if related_component_field.json_schema_extra['relationship'] == 'one_to_many':
+                    back_ref_field = next(
+                        related_field_name for related_field_name, related_field_info
+                        in related_body_class.model_fields.items()
+                        if (related_field_info.json_schema_extra or {}).get('nested_class') == body_class.__name__
+                    )
+                    node.values[field_name] = [item for item in value if not isinstance(item, BasePostBody)]
+                    nested_entities.extend(
+                        (related_component, item, related_body_class, back_ref_field)
+                        for item in value if isinstance(item, BasePostBody)
+                    )
+                elif isinstance(value, list):
+                    node.values[field_name] = [
+                        add_node(related_component, item, related_body_class)
+                        if isinstance(item, BasePostBody) else item for item in value
+                    ]
+                    node.dependencies.extend(
+                        item for item in node.values[field_name] if isinstance(item, InsertNode)
+                    )
+                elif isinstance(value, BasePostBody):
+                    node.values[field_name] = add_node(related_component, value, related_body_class)
+                    node.dependencies.append(node.values[field_name])
+
+            for field_name, field_info in body_class.model_fields.items():
+                if field_info.is_required() and node.values[field_name] is None:
+                    raise HttpError(422, f'Nested {node_component.__name__} is missing {field_info.alias}.')
+
+            for related_component, item, related_body_class, back_ref_field in nested_entities:
+                add_node(related_component, item, related_body_class, node, back_ref_field)
+
+            return node
+
+        root_nodes = [add_node(component, body, type(body)) for body in entity_body]
+        insert_steps = {}
+
+        for node in nodes:
+            insert_steps.setdefault(
+                (node.depth, node.component.__name__), (node.component, [])
+            )[1].append(node)
+
+        return root_nodes, [insert_steps[step] for step in sorted(insert_steps, key=lambda step: step[0])]
+
+    @staticmethod
+    def get_linking_entity_body(
+            component: Type['BaseComponent'],
+            entity_body: List['BasePostBody']
+    ) -> Optional['BasePostBody']:
+        """
+        Get the first of multiple entity bodies that links related entities, if any.
+
+        Parameters
+        ----------
+        component : Type[BaseComponent]
+            The type of component of the entity bodies.
+        entity_body : List[BasePostBody]
+            The entity bodies.
+
+        Returns
+        -------
+        Optional[BasePostBody]
+            An entity body setting a relation of the component, or the first entity body if none does.
+        """
+
+        related_component_names = set(component.get_related_components())
+
+        return next(
+            (body for body in entity_body if related_component_names & body.model_fields_set),
+            next(iter(entity_body), None)
+        )
+
+    @contextmanager
+    def transaction(self):
         """
+        Opens a transaction boundary around a group of engine writes.
 
-        return getattr(self, f"create_{component.model_config['json_schema_extra']['name_ref'][2]}")(entity_body)
+        The default transaction does nothing. Engines backed by a transactional store should override this method so
+        that grouped writes (bulk and deep inserts) are applied atomically, and rolled back if an exception is raised
+        inside the block.
 
+        Returns
+        -------
+        ContextManager
+            A context manager wrapping the grouped writes.
+        """
+
+        yield
+
+    @engine_pipeline
     def update_entity(
             self,
             component: Type['BaseComponent'],
@@ -215,8 +739,12 @@ class SensorThingsBaseEngine(
             The body containing the data for updating the entity.
         """
 
-        getattr(self, f"update_{component.model_config['json_schema_extra']['name_ref'][1]}")(entity_id, entity_body)
+        yield getattr(
+            self, f"update_{component.model_config['json_schema_extra']['name_ref'][1]}"
+        )(entity_id, entity_body)
+        yield self.invalidate_cached_responses(component=component, entity_ids=[entity_id], entity_body=entity_body)
 
+    @engine_pipeline
     def delete_entity(
             self,
             component: Type['BaseComponent'],
@@ -233,13 +761,19 @@ class SensorThingsBaseEngine(
             The ID of the entity to delete.
         """
 
-        getattr(self, f"delete_{component.model_config['json_schema_extra']['name_ref'][1]}")(entity_id)
+        yield getattr(self, f"delete_{component.model_config['json_schema_extra']['name_ref'][1]}")(entity_id)
+        yield self.invalidate_cached_responses(component=component, entity_ids=[entity_id], cascade=True)
 
+    @engine_pipeline
     def fetch_entities(
             self,
             component: Type['BaseComponent'],
             query_params=None,
-            back_ref_ids=None
+            back_ref_ids=None,
+            key_constraints=None,
+            required_fields=None,
+            paginate_by_cursor=False,
+            limit_per_parent=None
     ) -> Tuple[Dict[str, dict], int]:
         """
         Fetch entities of a specific component type with optional query parameters.
@@ -252,6 +786,17 @@ class SensorThingsBaseEngine(
             Optional query parameters for filtering, pagination, etc.
         back_ref_ids : Optional[dict], optional
             Optional back reference IDs for fetching related entities.
+        key_constraints : Optional[dict], optional
+            Optional primary key or parent key constraints (e.g. {'datastream_ids': [1]}) passed directly to the
+            engine's get method instead of being expressed as filters.
+        required_fields : Optional[List[str]], optional
+            Optional engine fields that must be fetched regardless of the select parameter, such as the keys used to
+            join expanded entities to their parents.
+        paginate_by_cursor : bool, optional
+            Whether the entities are a page of a collection that may be paginated with $skiptoken cursors.
+        limit_per_parent : Optional[str], optional
+            The field referencing the parent entities of expanded entities, if $top and $skip should be applied to the
+            entities of each parent by the engine's get method (see plan_expansion_fetches).
 
         Returns
         -------
@@ -260,565 +805,2690 @@ class SensorThingsBaseEngine(
         """
 
         query_params = query_params or {}
-
-        entities, count = getattr(self, f"get_{component.model_config['json_schema_extra']['name_ref'][2]}")(
-            filters=self.parse_filters(query_params),
-            pagination=self.parse_pagination(query_params),
-            ordering=self.parse_ordering(query_params),
-            get_count=True if query_params.get('count') is True else False,
-            **back_ref_ids or {}
+        query_plan, get_method, get_method_kwargs = self.prepare_get_method(
+            component=component,
+            query_params=query_params,
+            back_ref_ids=back_ref_ids,
+            key_constraints=key_constraints,
+            required_fields=required_fields,
+            paginate_by_cursor=paginate_by_cursor,
+            limit_per_parent=limit_per_parent
         )
 
-        entities = self.insert_self_links(entities=entities, component=component)
-        entities = self.insert_related_entities(
+        entities, count = yield get_method(**get_method_kwargs)
+        entities = yield self.collect_entities(entities)
+
+        if 'seek' in get_method_kwargs:
+            self.request.next_skip_token = self.build_skip_token(
+                seek=get_method_kwargs['seek'],
+                entity=next(reversed(entities.values()), None)
+            )
+
+        entities = yield self.assemble_expanded_entities(
             entities=entities,
             component=component,
-            query_params=query_params or {},
+            query_plan=query_plan,
             include_links=True if back_ref_ids is None else False
         )
-        entities = self.remove_unselected_fields(
-            entities=entities,
-            component=component,
-            query_params=query_params or {}
-        )
 
         return entities, count
 
-    def check_nested_path(self):
+    def prepare_get_method(
+            self,
+            component: Type['BaseComponent'],
+            query_params: dict,
+            back_ref_ids=None,
+            key_constraints=None,
+            required_fields=None,
+            paginate_by_cursor=False,
+            limit_per_parent=None
+    ) -> Tuple[QueryPlan, Callable, dict]:
         """
-        Check if there is a nested path in the request and return the ID of the nested entity.
+        Compile the query parameters for a component into a call to the engine's get method.
+
+        Parameters
+        ----------
+        component : Type[BaseComponent]
+            The type of component to query.
+        query_params : dict
+            Query parameters for filtering, pagination, etc.
+        back_ref_ids : Optional[dict], optional
+            Optional back reference IDs for fetching related entities.
+        key_constraints : Optional[dict], optional
+            Optional primary key or parent key constraints passed directly to the engine's get method.
+        required_fields : Optional[List[str]], optional
+            Optional engine fields that must be fetched regardless of the select parameter.
+        paginate_by_cursor : bool, optional
+            Whether to pass a seek predicate to the get method if cursor pagination is enabled and supported.
+        limit_per_parent : Optional[str], optional
+            The field referencing the parent entities, if $top and $skip should be passed to the get method as a
+            per-parent limit instead of as pagination of the whole result.
 
         Returns
         -------
-        Optional[str]
-            The ID of the nested entity or None if no nested path exists.
+        Tuple[QueryPlan, Callable, dict]
+            The compiled query plan, the engine's get method, and the keyword arguments to call it with. The get
+            method returns either a dictionary of entities keyed by ID or an iterable of entity dictionaries, and the
+            total count of entities. Get methods accepting an expand argument are passed the expand tree of the query
+            (see build_expand_hint).
         """
 
-        previous_entity = None
+        query_plan = self.compile_query(component=component, query_params=query_params)
+        get_method_name = f"get_{component.model_config['json_schema_extra']['name_ref'][2]}"
+        get_method_kwargs = {
+            'filters': query_plan.filters,
+            'pagination': self.parse_pagination(query_params),
+            'ordering': list(query_plan.ordering),
+            'get_count': True if query_params.get('count') is True else False
+        }
 
-        for component, entity_filter_field, entity_id in self.request.nested_path:
-            try:
+        if paginate_by_cursor is True:
+            seek = self.parse_seek(
+                component=component,
+                query_plan=query_plan,
+                query_params=query_params,
+                get_method_name=get_method_name
+            )
+            if seek is not None:
+                get_method_kwargs['seek'] = seek
+                if seek['after'] is not None:
+                    get_method_kwargs['pagination']['skip'] = 0
+                required_fields = [*(required_fields or []), *(seek_field['field'] for seek_field in seek['fields'])]
+
+        if limit_per_parent is not None:
+            get_method_kwargs['limit_per_parent'] = {
+                'field': limit_per_parent,
+                'skip': get_method_kwargs['pagination']['skip'],
+                'top': get_method_kwargs['pagination']['top']
+            }
+            get_method_kwargs['pagination'] = None
+
+        if query_plan.projection is not None and self.engine_method_accepts(get_method_name, 'fields'):
+            get_method_kwargs['fields'] = sorted(query_plan.projection.union(required_fields or []))
+
+        if query_plan.expand and self.engine_method_accepts(get_method_name, 'expand'):
+            get_method_kwargs['expand'] = self.build_expand_hint(component=component, query_plan=query_plan)
+
+        get_method_kwargs.update(key_constraints or {})
+        get_method_kwargs.update(back_ref_ids or {})
+
+        return query_plan, getattr(self, get_method_name), get_method_kwargs
+
+    @engine_pipeline
+    def stream_entities(
+            self,
+            component: Type['BaseComponent'],
+            query_params: dict,
+            key_constraints=None
+    ) -> StreamingHttpResponse:
+        """
+        Stream a list of entities of a specific component type as a JSON response.
+
+        Engine entities are assembled, validated against the component's response schema, and encoded in batches of
+        ST_STREAMING_BATCH_SIZE, so memory use is bounded by the batch size rather than the page size when the
+        engine's get method yields its entities.
+
+        Parameters
+        ----------
+        component : Type[BaseComponent]
+            The type of component to stream.
+        query_params : dict
+            Query parameters for filtering, pagination, etc.
+        key_constraints : Optional[dict], optional
+            Optional primary key or parent key constraints passed directly to the engine's get method.
+
+        Returns
+        -------
+        StreamingHttpResponse
+            A response streaming the JSON encoded collection.
+        """
+
+        query_plan, get_method, get_method_kwargs = self.prepare_get_method(
+            component=component,
+            query_params=query_params,
+            key_constraints=key_constraints,
+            paginate_by_cursor=True
+        )
+        entities, count = yield get_method(**get_method_kwargs)
+
+        return StreamingHttpResponse(self.encode_entity_stream(
+            entities=entities,
+            count=count,
+            component=component,
+            query_plan=query_plan,
+            query_params=query_params,
+            seek=get_method_kwargs.get('seek')
+        ), content_type='application/json')
+
+    def encode_entity_stream(
+            self,
+            entities: Iterable[dict],
+            count: Optional[int],
+            component: Type['BaseComponent'],
+            query_plan: QueryPlan,
+            query_params: dict,
+            seek: Optional[dict] = None
+    ) -> Iterator[bytes]:
+        """
+        Encode the entities returned by an engine's get method as a streamed collection response.
+
+        Parameters
+        ----------
+        entities : Iterable[dict]
+            Either a dictionary of entities keyed by ID or an iterable of entity dictionaries.
+        count : Optional[int]
+            The total count of entities available.
+        component : Type[BaseComponent]
+            The component type of the entities.
+        query_plan : QueryPlan
+            The compiled query plan of the request.
+        query_params : dict
+            The query parameters of the request.
+        seek : Optional[dict], optional
+            The seek predicate the entities were fetched with, if the collection is paginated by cursor.
+
+        Returns
+        -------
+        Iterator[bytes]
+            The encoded chunks of the response.
+        """
+
+        length = 0
+        last_entity = None
+
+        yield self.encode_list_response_start(count=count, query_params=query_params)
+
+        for entity_batch in self.batch_entities(entities, settings.ST_STREAMING_BATCH_SIZE):
+            last_entity = next(reversed(entity_batch.values()))
+            yield self.encode_entity_batch(
+                entities=self.assemble_expanded_entities(
+                    entities=entity_batch, component=component, query_plan=query_plan
+                ),
+                component=component,
+                separator=length > 0
+            )
+            length += len(entity_batch)
+
+        if seek is not None:
+            self.request.next_skip_token = self.build_skip_token(seek=seek, entity=last_entity)
+
+        yield self.encode_list_response_end(count=count, length=length, query_params=query_params)
+
+    @staticmethod
+    def encode_list_response_start(count: Optional[int], query_params: dict) -> bytes:
+        """
+        Encode the opening of a streamed collection response.
+
+        Parameters
+        ----------
+        count : Optional[int]
+            The total count of entities available.
+        query_params : dict
+            The query parameters of the request.
+
+        Returns
+        -------
+        bytes
+            The encoded count, if requested, and the opening of the value array.
+        """
+
+        if query_params.get('count') is True:
+            return b'{"@iot.count":' + orjson.dumps(count) + b',"value":['
+        else:
+            return b'{"value":['
+
+    def encode_entity_batch(
+            self,
+            entities: Dict[str, dict],
+            component: Type['BaseComponent'],
+            separator: bool
+    ) -> bytes:
+        """
+        Validate a batch of assembled entities against the component's response schema and encode them.
+
+        Parameters
+        ----------
+        entities : dict
+            A dictionary of assembled response entities.
+        component : Type[BaseComponent]
+            The component type of the entities.
+        separator : bool
+            Whether the batch follows previously encoded entities.
+
+        Returns
+        -------
+        bytes
+            The comma separated encoded entities.
+        """
+
+        response_schema = self.get_response_schemas[f'{component.__name__}GetResponse']
+
+        return (b',' if separator else b'') + b','.join(
+            orjson.dumps(response_schema(**entity).dict(by_alias=True, exclude_unset=True))
+            for entity in entities.values()
+        )
+
+    def encode_list_response_end(self, count: Optional[int], length: int, query_params: dict) -> bytes:
+        """
+        Encode the closing of a streamed collection response.
+
+        Parameters
+        ----------
+        count : Optional[int]
+            The total count of entities available.
+        length : int
+            The number of entities streamed.
+        query_params : dict
+            The query parameters of the request.
+
+        Returns
+        -------
+        bytes
+            The closing of the value array and the encoded next link, if any.
+        """
+
+        next_link = self.build_next_link(
+            query_params=query_params,
+            length=length,
+            count=count
+        )
+
+        if next_link:
+            return b'],"@iot.nextLink":' + orjson.dumps(next_link) + b'}'
+        else:
+            return b']}'
+
+    @staticmethod
+    def batch_entities(entities: Iterable[dict], batch_size: int) -> Iterator[Dict[str, dict]]:
+        """
+        Split engine entities into batches keyed by entity ID.
+
+        Parameters
+        ----------
+        entities : Iterable[dict]
+            Either a dictionary of entities keyed by ID or an iterable of entity dictionaries.
+        batch_size : int
+            The maximum number of entities in each batch.
+
+        Returns
+        -------
+        Iterator[Dict[str, dict]]
+            Dictionaries of at most batch_size entities keyed by their IDs.
+        """
+
+        entities = iter(entities.values() if isinstance(entities, Mapping) else entities)
+
+        while True:
+            entity_batch = {entity['id']: entity for entity in islice(entities, batch_size)}
+            if not entity_batch:
+                return
+            yield entity_batch
+
+    def engine_method_accepts(self, method_name: str, argument: str) -> bool:
+        """
+        Check whether an engine method accepts a given keyword argument.
+
+        Optional engine arguments are only passed to engines whose methods declare them (or accept arbitrary keyword
+        arguments), so engines written against older versions of the engine interface keep working.
+
+        Parameters
+        ----------
+        method_name : str
+            The name of the engine method.
+        argument : str
+            The name of the keyword argument.
+
+        Returns
+        -------
+        bool
+            Whether the method accepts the argument.
+        """
+
+        cache_key = (type(self), method_name, getattr(type(self), method_name, None))
+
+        if cache_key not in engine_method_parameters:
+            parameters = inspect.signature(getattr(self, method_name)).parameters.values()
+            engine_method_parameters[cache_key] = (
+                frozenset(parameter.name for parameter in parameters),
+                any(parameter.kind == inspect.Parameter.VAR_KEYWORD for parameter in parameters)
+            )
+
+        parameter_names, accepts_kwargs = engine_method_parameters[cache_key]
+
+        return accepts_kwargs or argument in parameter_names
+
+    @engine_pipeline
+    def check_nested_path(self):
+        """
+        Check if there is a nested path in the request and return the ID of the nested entity.
+
+        Returns
+        -------
+        Optional[str]
+            The ID of the nested entity or None if no nested path exists.
+        """
+
+        previous_entity = None
+
+        for component, entity_filter_field, entity_id in self.request.nested_path:
+            try:
                 if not previous_entity and not entity_id:
                     raise HttpError(404, f'{component.__name__} not found.')
                 if not entity_id:
                     entity_id = previous_entity.get(entity_filter_field)
-                previous_entity = list(getattr(
+                entities, _ = yield getattr(
                     self, f"get_{component.model_config['json_schema_extra']['name_ref'][2]}"
                 )(
                     **{f'{entity_filter_field}s': [entity_id]}
-                )[0].values())[0]
+                )
+                previous_entity = list((yield self.collect_entities(entities)).values())[0]
             except IndexError:
                 raise HttpError(404, f'{component.__name__} not found.')
 
         return previous_entity['id'] if previous_entity else None
 
-    def remove_unselected_fields(
+    def assemble_entities(
             self,
             entities: Dict[str, dict],
             component: Type['BaseComponent'],
-            query_params: dict
+            query_plan: QueryPlan,
+            related_entity_fields: Optional[Dict[str, dict]] = None,
+            include_links: bool = True
     ) -> Dict[str, dict]:
         """
-        Removes fields from entities that are not selected in query parameters.
+        Builds response entities from engine entities in a single pass.
+
+        The projection is resolved before any row is built, so links are only generated for fields that survive the
+        select parameter. Each output entity is built exactly once.
 
         Parameters
         ----------
         entities : dict
-            A dictionary of entities with their fields.
+            A dictionary of entities returned by the engine.
         component : Type['BaseComponent']
-            The component type to process.
-        query_params : dict
-            The query parameters specifying the selected fields.
+            The component type of the entities.
+        query_plan : QueryPlan
+            The compiled query plan containing the projection and expand tree.
+        related_entity_fields : dict, optional
+            Expanded related entities keyed by relation field name and parent entity ID, as returned by
+            fetch_related_entities.
+        include_links : bool, optional
+            Whether to include navigation links to related entities (default is True).
 
         Returns
         -------
         dict
-            A dictionary of entities with only the selected fields.
+            A dictionary of response entities.
         """
 
-        unselected_fields = self.parse_select(component=component, query_params=query_params)
-        entities = {
-            entity_id: {
+        related_entity_fields = related_entity_fields or {}
+        first_entity = next(iter(entities.values()), {})
+        # Related entities joined by the engine are replaced with their assembled relation fields.
+        unselected_fields = query_plan.unselected_fields.union(
+            related_field_name[:-len('_rel')] for related_field_name in related_entity_fields
+            if related_field_name[:-len('_rel')] in first_entity
+        )
+        navigation_link_fields = [
+            (f'{related_component_name}_link', f'/{related_component_field.alias}')
+            for related_component_name, related_component_field in component.get_related_components().items()
+            if f'{related_component_name}_rel' not in related_entity_fields
+            and f'{related_component_name}_link' not in unselected_fields
+        ] if include_links is True else []
+        include_self_link = 'self_link' not in unselected_fields
+        build_self_link = include_self_link or bool(navigation_link_fields)
+
+        assembled_entities = {}
+
+        for entity_id, entity in entities.items():
+            self_link = self.build_ref_link(component, entity_id) if build_self_link else None
+            assembled_entity = {
                 field_name: field_value for field_name, field_value in entity.items()
                 if field_name not in unselected_fields
-            } for entity_id, entity in entities.items()
-        }
-
-        return entities
-
-    def insert_related_entities(
+            } if unselected_fields else dict(entity)
+            if include_self_link:
+                assembled_entity['self_link'] = self_link
+            for link_field_name, link_path in navigation_link_fields:
+                assembled_entity[link_field_name] = self_link + link_path
+            for related_field_name, related_field_values in related_entity_fields.items():
+                assembled_entity[related_field_name] = related_field_values[entity_id]
+            assembled_entities[entity_id] = assembled_entity
+
+        return assembled_entities
+
+    @engine_pipeline
+    def assemble_expanded_entities(
             self,
             entities: Dict[str, dict],
             component: Type['BaseComponent'],
-            query_params: dict,
+            query_plan: QueryPlan,
             include_links: bool = True
     ) -> Dict[str, dict]:
         """
-        Inserts related entities into the entities based on the expand query parameter.
+        Fetches the related entities requested by the expand tree and builds response entities with them.
 
         Parameters
         ----------
         entities : dict
-            A dictionary of entities.
+            A dictionary of entities returned by the engine.
         component : Type['BaseComponent']
             The component type of the entities.
-        query_params : dict
-            The query parameters containing expand information.
+        query_plan : QueryPlan
+            The compiled query plan containing the projection and expand tree.
         include_links : bool, optional
-            Whether to include links to related entities (default is True).
+            Whether to include navigation links to related entities (default is True).
 
         Returns
         -------
         dict
-            A dictionary of entities with related entities inserted.
+            A dictionary of response entities.
         """
 
-        expand_properties = self.parse_expand(
+        related_entity_fields = yield self.fetch_related_entities(
+            entities=entities,
+            component=component,
+            query_plan=query_plan
+        )
+
+        return self.assemble_entities(
+            entities=entities,
             component=component,
-            query_params=query_params
+            query_plan=query_plan,
+            related_entity_fields=related_entity_fields,
+            include_links=include_links
         )
 
+    @engine_pipeline
+    def fetch_related_entities(
+            self,
+            entities: Dict[str, dict],
+            component: Type['BaseComponent'],
+            query_plan: QueryPlan
+    ) -> Dict[str, dict]:
+        """
+        Fetches the related entities requested by the expand tree and joins them to their parent entities.
+
+        Sibling relations are fetched concurrently when ST_EXPAND_CONCURRENCY is greater than one, and are always
+        joined in relation order. $top and $skip of expanded collections apply to each parent entity (see
+        plan_expansion_fetches). Relations already joined to the parent entities by the engine are not fetched again
+        (see build_expand_hint), and the latest Observations of Datastreams are read from the latest Observation
+        store if it is enabled (see fetch_latest_observations).
+
+        Parameters
+        ----------
+        entities : dict
+            A dictionary of parent entities returned by the engine.
+        component : Type['BaseComponent']
+            The component type of the parent entities.
+        query_plan : QueryPlan
+            The compiled query plan containing the projection and expand tree.
+
+        Returns
+        -------
+        dict
+            A dictionary mapping relation field names (e.g. 'datastreams_rel') to dictionaries of related response
+            entities keyed by parent entity ID.
+        """
+
+        expansions = self.plan_related_entities(entities=entities, component=component, query_plan=query_plan)
+        related_entities = yield self.fetch_expansions(entities=entities, expansions=expansions)
+
+        return {
+            f"{expansion['name']}_rel": self.join_related_entities(
+                entities=entities,
+                expansion=expansion,
+                related_entities=expansion_entities,
+                related_entity_index=expansion_entity_index
+            ) for expansion, (expansion_entities, expansion_entity_index) in zip(expansions, related_entities)
+        }
+
+    def fetch_expansions(self, entities: Dict[str, dict], expansions: List[dict]) -> List[tuple]:
+        """
+        Fetches the related entities of sibling expanded relations.
+
+        Sibling relations are fetched concurrently in the shared expand thread pool when ST_EXPAND_CONCURRENCY is
+        greater than one, unless a database transaction is open, because pool threads use their own database
+        connections and cannot see its uncommitted changes. Pool threads close their database connections after each
+        relation.
+
+        Parameters
+        ----------
+        entities : dict
+            A dictionary of parent entities returned by the engine.
+        expansions : List[dict]
+            The expanded relations, as returned by plan_related_entities.
+
+        Returns
+        -------
+        List[tuple]
+            The related entities of each relation and their index by parent entity, as returned by fetch_expansion.
+        """
+
+        # Sibling branches are fetched concurrently, except within an expand worker thread, where waiting on the
+        # shared pool could deadlock, and within a transaction, whose uncommitted changes pool threads cannot see.
+        if settings.ST_EXPAND_CONCURRENCY > 1 and len(expansions) > 1 and \
+                not threading.current_thread().name.startswith(expand_thread_name_prefix) and not in_atomic_block():
+            return list(self.get_expand_executor().map(
+                functools.partial(run_in_pool_thread, self.fetch_expansion, entities), expansions
+            ))
+
+        return [self.fetch_expansion(entities, expansion) for expansion in expansions]
+
+    @engine_pipeline
+    def fetch_expansion(
+            self,
+            entities: Dict[str, dict],
+            expansion: dict
+    ) -> Tuple[Dict[str, dict], Optional[Dict[str, List[str]]]]:
+        """
+        Fetches the related entities of an expanded relation.
+
+        Parameters
+        ----------
+        entities : dict
+            A dictionary of parent entities returned by the engine.
+        expansion : dict
+            The expanded relation, as returned by plan_related_entities.
+
+        Returns
+        -------
+        Tuple[Dict[str, dict], Optional[Dict[str, List[str]]]]
+            The assembled related entities keyed by ID, and the related entity IDs of each parent entity if they are
+            not indexed by their back references (see join_related_entities).
+        """
+
+        if self.is_joined_expansion(entities, expansion):
+            return (yield self.assemble_joined_entities(expansion, *self.index_joined_entities(entities, expansion)))
+
+        if self.is_latest_observation_expansion(expansion):
+            return (yield self.fetch_latest_observations(expansion))
+
+        related_entities, related_entity_index = {}, None
+
+        for parent_id, fetch_kwargs in self.plan_expansion_fetches(expansion):
+            parent_related_entities, _ = yield self.fetch_entities(**fetch_kwargs)
+            related_entities.update(parent_related_entities)
+            if parent_id is not None:
+                related_entity_index = related_entity_index if related_entity_index is not None else {}
+                related_entity_index[parent_id] = list(parent_related_entities)
+
+        return related_entities, related_entity_index
+
+    @staticmethod
+    def get_expand_executor() -> ThreadPoolExecutor:
+        """
+        Get the shared thread pool used to fetch sibling expand branches concurrently.
+
+        The pool is created on first use with ST_EXPAND_CONCURRENCY workers. Engines used with a concurrency above one
+        must be safe to call from multiple threads.
+
+        Returns
+        -------
+        ThreadPoolExecutor
+            The shared expand thread pool.
+        """
+
+        global expand_executor
+
+        with expand_executor_lock:
+            if expand_executor is None:
+                expand_executor = ThreadPoolExecutor(
+                    max_workers=settings.ST_EXPAND_CONCURRENCY,
+                    thread_name_prefix=expand_thread_name_prefix
+                )
+
+        return expand_executor
+
+    @staticmethod
+    def plan_related_entities(
+            entities: Dict[str, dict],
+            component: Type['BaseComponent'],
+            query_plan: QueryPlan
+    ) -> List[dict]:
+        """
+        Resolves the relations requested by the expand tree into fetches of related entities.
+
+        Relations whose fields are excluded by the select parameter are not fetched.
+
+        Parameters
+        ----------
+        entities : dict
+            A dictionary of parent entities returned by the engine.
+        component : Type['BaseComponent']
+            The component type of the parent entities.
+        query_plan : QueryPlan
+            The compiled query plan containing the projection and expand tree.
+
+        Returns
+        -------
+        List[dict]
+            For each expanded relation, the relation name, related component, relationship, back reference, back
+            reference IDs to fetch, join field, and nested query parameters.
+        """
+
+        expansions = []
+
         for related_component_name, related_component_field in component.get_related_components().items():
-            if related_component_name not in expand_properties:
-                if include_links is True:
-                    entities = {
-                        entity_id: {
-                            f'{related_component_name}_link': f'{entity["self_link"]}/{related_component_field.alias}',
-                            **entity
-                        } for entity_id, entity in entities.items()
-                    }
+            if related_component_name not in query_plan.expand or \
+                    f'{related_component_name}_rel' in query_plan.unselected_fields:
+                continue
+
+            related_component = SensorThingsBaseEngine.resolve_related_component(related_component_field)
+            back_ref = related_component_field.json_schema_extra['back_ref']
+            component_relationship = related_component_field.json_schema_extra['relationship']
+
+            if component_relationship == 'one_to_many':
+                back_ref_ids = {f'{back_ref}s': entities.keys()}
+                join_field = back_ref
+            elif component_relationship == 'many_to_many':
+                back_ref_ids = {f'{back_ref}s': entities.keys()}
+                join_field = f'{back_ref}s'
             else:
-                related_component = related_component_field.annotation
-                back_ref = related_component_field.json_schema_extra['back_ref']
-                component_relationship = related_component_field.json_schema_extra['relationship']
-
-                if component_relationship in ['one_to_many', 'many_to_many']:
-                    related_component = related_component.__args__[0]
-                    back_ref_ids = {f'{back_ref}s': entities.keys()}
-                else:
-                    back_ref_ids = {f'{back_ref}s': [entity[back_ref] for entity in entities.values()]}
-
-                if isinstance(related_component, ForwardRef):
-                    related_component = getattr(field_schemas, related_component.__forward_arg__)
-
-                related_entities, _ = self.fetch_entities(
-                    component=related_component,
-                    query_params=expand_properties[related_component_name]['query_params'],
-                    back_ref_ids=back_ref_ids
-                )
+                back_ref_ids = {f'{back_ref}s': [entity[back_ref] for entity in entities.values()]}
+                join_field = 'id'
+
+            expansions.append({
+                'name': related_component_name,
+                'component': related_component,
+                'relationship': component_relationship,
+                'back_ref': back_ref,
+                'back_ref_ids': back_ref_ids,
+                'join_field': join_field,
+                'query_params': query_plan.expand[related_component_name]['query_params']
+            })
+
+        return expansions
+
+    def build_expand_hint(self, component: Type['BaseComponent'], query_plan: QueryPlan) -> Dict[str, dict]:
+        """
+        Builds the expand tree of a query, passed to engine get methods accepting an expand argument.
+
+        Engines can use the tree to fetch related entities together with the requested entities (e.g. with joins or
+        prefetch queries). Related entities of a relation are joined by returning them under the relation name in
+        each entity (e.g. entity['datastreams']), as a list of engine entities for collections or as an engine entity
+        or None for single entities, filtered, ordered, limited, and joined further as described by the tree. Every
+        returned entity must include a relation for it to be treated as joined; relations that are not joined are
+        fetched separately.
+
+        Parameters
+        ----------
+        component : Type['BaseComponent']
+            The component type of the queried entities.
+        query_plan : QueryPlan
+            The compiled query plan of the query.
+
+        Returns
+        -------
+        Dict[str, dict]
+            For each expanded relation name, the related component name, relationship, join field, parsed filters,
+            ordering, fields (None if all fields are needed), per-parent limit ('skip' and 'top', or None for single
+            entities), and the expand tree of the related entities.
+        """
+
+        expand_hint = {}
+
+        for expansion in self.plan_related_entities(entities={}, component=component, query_plan=query_plan):
+            related_query_plan = self.compile_query(
+                component=expansion['component'],
+                query_params=expansion['query_params']
+            )
+            pagination = self.parse_pagination(expansion['query_params'])
+            expand_hint[expansion['name']] = {
+                'component': expansion['component'].__name__,
+                'relationship': expansion['relationship'],
+                'join_field': expansion['join_field'],
+                'filters': related_query_plan.filters,
+                'ordering': list(related_query_plan.ordering),
+                'fields': sorted(related_query_plan.projection.union([expansion['join_field']]))
+                if related_query_plan.projection is not None else None,
+                'limit_per_parent': {'skip': pagination['skip'], 'top': pagination['top']}
+                if expansion['relationship'] != 'many_to_one' else None,
+                'expand': self.build_expand_hint(component=expansion['component'], query_plan=related_query_plan)
+            }
+
+        return expand_hint
+
+    @staticmethod
+    def is_joined_expansion(entities: Dict[str, dict], expansion: dict) -> bool:
+        """
+        Checks whether the engine joined the related entities of an expanded relation to their parent entities.
+
+        Parameters
+        ----------
+        entities : dict
+            A dictionary of parent entities returned by the engine.
+        expansion : dict
+            The expanded relation, as returned by plan_related_entities.
+
+        Returns
+        -------
+        bool
+            Whether every parent entity includes the related entities of the relation.
+        """
+
+        return bool(entities) and all(expansion['name'] in entity for entity in entities.values())
+
+    @staticmethod
+    def index_joined_entities(
+            entities: Dict[str, dict],
+            expansion: dict
+    ) -> Tuple[Dict[str, dict], Optional[Dict[str, List[str]]]]:
+        """
+        Collects the related entities the engine joined to their parent entities.
+
+        Parameters
+        ----------
+        entities : dict
+            A dictionary of parent entities returned by the engine.
+        expansion : dict
+            The expanded relation, as returned by plan_related_entities.
+
+        Returns
+        -------
+        Tuple[Dict[str, dict], Optional[Dict[str, List[str]]]]
+            The related engine entities keyed by ID, and the related entity IDs of each parent entity, or None for
+            single related entities.
+        """
+
+        related_entities = {}
+
+        if expansion['relationship'] == 'many_to_one':
+            for entity in entities.values():
+                related_entity = entity[expansion['name']]
+                if related_entity is not None:
+                    related_entities[related_entity['id']] = related_entity
+            return related_entities, None
+
+        related_entity_index = {}
+
+        for entity_id, entity in entities.items():
+            related_entity_index[entity_id] = []
+            for related_entity in entity[expansion['name']]:
+                related_entities[related_entity['id']] = related_entity
+                related_entity_index[entity_id].append(related_entity['id'])
+
+        return related_entities, related_entity_index
+
+    @engine_pipeline
+    def assemble_joined_entities(
+            self,
+            expansion: dict,
+            related_entities: Dict[str, dict],
+            related_entity_index: Optional[Dict[str, List[str]]]
+    ) -> Tuple[Dict[str, dict], Optional[Dict[str, List[str]]]]:
+        """
+        Assembles the related entities the engine joined to their parent entities, fetching their own expansions.
+
+        Parameters
+        ----------
+        expansion : dict
+            The expanded relation, as returned by plan_related_entities.
+        related_entities : dict
+            The related engine entities keyed by ID.
+        related_entity_index : Optional[dict]
+            The related entity IDs of each parent entity, or None for single related entities.
+
+        Returns
+        -------
+        Tuple[Dict[str, dict], Optional[Dict[str, List[str]]]]
+            The assembled related entities, and the related entity IDs of each parent entity.
+        """
+
+        related_entities = yield self.assemble_expanded_entities(
+            entities=related_entities,
+            component=expansion['component'],
+            query_plan=self.compile_query(component=expansion['component'], query_params=expansion['query_params']),
+            include_links=False
+        )
+
+        return related_entities, related_entity_index
+
+    def plan_expansion_fetches(self, expansion: dict) -> List[Tuple[Optional[id_type], dict]]:
+        """
+        Plans the engine queries fetching an expanded relation, applying its $top and $skip to each parent entity.
+
+        Expanded one-to-many collections are fetched with a single query if the engine's get method accepts a
+        limit_per_parent argument, which it applies to each parent (e.g. with a window function). Otherwise,
+        collections of several parent entities are fetched with one paginated query per parent entity, so that each
+        parent receives at most one page of related entities (the default page size if $top is not given) and no
+        query reads more than one page. The extra queries are logged at debug level; engines can avoid them by
+        implementing limit_per_parent.
+
+        Parameters
+        ----------
+        expansion : dict
+            The expanded relation, as returned by plan_related_entities.
+
+        Returns
+        -------
+        List[Tuple[Optional[id_type], dict]]
+            For each query, the parent entity ID if the query fetches the related entities of a single parent, and
+            the keyword arguments to pass to fetch_entities.
+        """
+
+        fetch_kwargs = {
+            'component': expansion['component'],
+            'query_params': expansion['query_params'],
+            'back_ref_ids': expansion['back_ref_ids'],
+            'required_fields': [expansion['join_field']]
+        }
+
+        if expansion['relationship'] == 'many_to_one':
+            return [(None, fetch_kwargs)]
+
+        get_method_name = f"get_{expansion['component'].model_config['json_schema_extra']['name_ref'][2]}"
+
+        if expansion['relationship'] == 'one_to_many' and \
+                self.engine_method_accepts(get_method_name, 'limit_per_parent'):
+            return [(None, {**fetch_kwargs, 'limit_per_parent': expansion['join_field']})]
+
+        (back_ref_ids_name, parent_ids), = expansion['back_ref_ids'].items()
+
+        if len(parent_ids) <= 1:
+            return [(None, fetch_kwargs)]
+
+        logger.debug(
+            f'{type(self).__name__}.{get_method_name} does not accept limit_per_parent; fetching the expanded '
+            f'{expansion["name"]} of {len(parent_ids)} parent entities with one query each.'
+        )
+
+        return [
+            (parent_id, {**fetch_kwargs, 'back_ref_ids': {back_ref_ids_name: [parent_id]}})
+            for parent_id in parent_ids
+        ]
+
+    def is_latest_observation_expansion(self, expansion: dict) -> bool:
+        """
+        Checks whether an expanded relation requests the latest Observation of each Datastream.
+
+        Parameters
+        ----------
+        expansion : dict
+            The expanded relation, as returned by plan_related_entities.
+
+        Returns
+        -------
+        bool
+            Whether the latest Observation store is enabled and the relation is an unfiltered
+            Observations($top=1;$orderby=phenomenonTime desc) expansion of Datastreams.
+        """
+
+        query_params = expansion['query_params']
+
+        return latest_observation_store.enabled is True and \
+            expansion['component'].__name__ == 'Observation' and \
+            'datastream_ids' in expansion['back_ref_ids'] and \
+            query_params.get('top') == 1 and not query_params.get('skip') and \
+            not query_params.get('filters') and not query_params.get('expand') and \
+            self.parse_ordering(query_params) == [{'field': 'phenomenonTime', 'direction': 'desc'}]
+
+    @engine_pipeline
+    def fetch_latest_observations(self, expansion: dict) -> Tuple[Dict[str, dict], Dict[str, List[str]]]:
+        """
+        Fetches the latest Observation of each Datastream of an expanded relation from the latest Observation store.
+
+        Datastreams missing from the store are fetched from the engine with all of their fields (see
+        plan_expansion_fetches) and added to the store, and the select parameter of the relation is applied to the
+        stored Observations afterward.
+
+        Parameters
+        ----------
+        expansion : dict
+            The expanded relation, as returned by plan_related_entities.
+
+        Returns
+        -------
+        Tuple[Dict[str, dict], Dict[str, List[str]]]
+            The assembled latest Observations, and the Observation IDs of each Datastream.
+        """
+
+        latest_observations, versions = yield self.run_blocking(
+            latest_observation_store.get_many, expansion['back_ref_ids']['datastream_ids'],
+            scope=self.get_latest_observation_scope()
+        )
+        missing_expansion = self.plan_latest_observation_fetch(expansion, latest_observations)
+
+        if missing_expansion is not None:
+            related_entities = {}
+            for _, fetch_kwargs in self.plan_expansion_fetches(missing_expansion):
+                related_entities.update((yield self.fetch_entities(**fetch_kwargs))[0])
+            missing_observations = self.index_latest_observations(missing_expansion, related_entities)
+            yield self.run_blocking(
+                latest_observation_store.set_many, missing_observations, versions,
+                scope=self.get_latest_observation_scope()
+            )
+            latest_observations.update(missing_observations)
+
+        return self.select_latest_observations(expansion, latest_observations)
+
+    def get_latest_observation_scope(self) -> str:
+        """
+        Gets the scope of the latest Observations stored by the engine (see LatestObservationStore).
+
+        Returns
+        -------
+        str
+            The import path of the engine class.
+        """
+
+        return f'{type(self).__module__}.{type(self).__qualname__}'
+
+    @staticmethod
+    def plan_latest_observation_fetch(expansion: dict, latest_observations: Dict[str, dict]) -> Optional[dict]:
+        """
+        Plans the expanded relation fetching the latest Observations of the Datastreams missing from the store.
+
+        Parameters
+        ----------
+        expansion : dict
+            The expanded relation, as returned by plan_related_entities.
+        latest_observations : dict
+            The stored latest Observations of each Datastream.
+
+        Returns
+        -------
+        Optional[dict]
+            The expanded relation restricted to the missing Datastreams and selecting every field, or None if every
+            Datastream is stored.
+        """
+
+        missing_datastream_ids = [
+            datastream_id for datastream_id in expansion['back_ref_ids']['datastream_ids']
+            if datastream_id not in latest_observations
+        ]
+
+        if not missing_datastream_ids:
+            return None
+
+        return {
+            **expansion,
+            'back_ref_ids': {'datastream_ids': missing_datastream_ids},
+            'query_params': {**expansion['query_params'], 'select': None}
+        }
+
+    def index_latest_observations(
+            self,
+            expansion: dict,
+            related_entities: Dict[str, dict]
+    ) -> Dict[str, Dict[str, dict]]:
+        """
+        Groups fetched latest Observations by Datastream.
+
+        Parameters
+        ----------
+        expansion : dict
+            The expanded relation the Observations were fetched for.
+        related_entities : dict
+            The assembled Observations, keyed by ID.
+
+        Returns
+        -------
+        dict
+            The latest Observation of each Datastream of the relation keyed by Observation ID, or an empty dictionary
+            if the Datastream has no Observations.
+        """
+
+        related_entity_index = self.build_back_ref_index(
+            related_entities=related_entities,
+            back_ref=expansion['back_ref'],
+            relationship=expansion['relationship']
+        )
+
+        return {
+            datastream_id: {
+                related_entity_id: related_entities[related_entity_id]
+                for related_entity_id in related_entity_index.get(datastream_id, [])[:1]
+            } for datastream_id in expansion['back_ref_ids']['datastream_ids']
+        }
+
+    def select_latest_observations(
+            self,
+            expansion: dict,
+            latest_observations: Dict[str, Dict[str, dict]]
+    ) -> Tuple[Dict[str, dict], Dict[str, List[str]]]:
+        """
+        Applies the select parameter of an expanded relation to the latest Observations of its Datastreams.
+
+        Parameters
+        ----------
+        expansion : dict
+            The expanded relation, as returned by plan_related_entities.
+        latest_observations : dict
+            The latest Observation of each Datastream, keyed by Observation ID.
+
+        Returns
+        -------
+        Tuple[Dict[str, dict], Dict[str, List[str]]]
+            The selected latest Observations, and the Observation IDs of each Datastream.
+        """
+
+        unselected_fields = self.compile_query(
+            component=expansion['component'],
+            query_params=expansion['query_params']
+        ).unselected_fields
+
+        related_entities = {
+            related_entity_id: {
+                field_name: field_value for field_name, field_value in related_entity.items()
+                if field_name not in unselected_fields
+            }
+            for observations in latest_observations.values()
+            for related_entity_id, related_entity in observations.items()
+        }
+
+        return related_entities, {
+            datastream_id: list(observations) for datastream_id, observations in latest_observations.items()
+        }
+
+    @staticmethod
+    def resolve_related_component(related_component_field) -> Type['BaseComponent']:
+        """
+        Resolves the component type of a relation field.
+
+        Parameters
+        ----------
+        related_component_field : FieldInfo
+            The relation field of a component.
+
+        Returns
+        -------
+        Type['BaseComponent']
+            The related component type.
+        """
+
+        related_component = related_component_field.annotation
+
+        if related_component_field.json_schema_extra['relationship'] in ['one_to_many', 'many_to_many']:
+            related_component = related_component.__args__[0]
+
+        if isinstance(related_component, ForwardRef):
+            related_component = getattr(field_schemas, related_component.__forward_arg__)
+
+        return related_component
+
+    def join_related_entities(
+            self,
+            entities: Dict[str, dict],
+            expansion: dict,
+            related_entities: Dict[str, dict],
+            related_entity_index: Optional[Dict[str, List[str]]] = None
+    ) -> Dict[str, dict]:
+        """
+        Serializes fetched related entities and joins them to their parent entities.
+
+        Parameters
+        ----------
+        entities : dict
+            A dictionary of parent entities returned by the engine.
+        expansion : dict
+            The expanded relation, as returned by plan_related_entities.
+        related_entities : dict
+            A dictionary of assembled related entities.
+        related_entity_index : Optional[dict], optional
+            The related entity IDs of each parent entity, if they were fetched for each parent separately. Built from
+            the back references of the related entities otherwise.
+
+        Returns
+        -------
+        dict
+            The related response entity (or list of entities) for each parent entity ID.
+        """
+
+        related_response_schema = self.get_response_schemas[f"{expansion['component'].__name__}GetResponse"]
+        related_entity_responses = {
+            related_entity_id: related_response_schema(**related_entity).dict(by_alias=True, exclude_unset=True)
+            for related_entity_id, related_entity in related_entities.items()
+        }
+
+        if expansion['relationship'] in ['one_to_many', 'many_to_many']:
+            if related_entity_index is None:
+                related_entity_index = self.build_back_ref_index(
+                    related_entities=related_entities,
+                    back_ref=expansion['back_ref'],
+                    relationship=expansion['relationship']
+                )
+            return {
+                entity_id: [
+                    related_entity_responses[related_entity_id]
+                    for related_entity_id in related_entity_index.get(entity_id, [])
+                ] for entity_id in entities
+            }
+        else:
+            return {
+                entity_id: related_entity_responses.get(entity[expansion['back_ref']])
+                for entity_id, entity in entities.items()
+            }
+
+    @staticmethod
+    def build_back_ref_index(
+            related_entities: Dict[str, dict],
+            back_ref: str,
+            relationship: str
+    ) -> Dict[str, List[str]]:
+        """
+        Builds an index of related entity IDs keyed by the IDs of the entities they reference.
+
+        The index is built in a single pass over the related entities so that attaching expanded entities to their
+        parents is linear in the total number of rows rather than proportional to parents times children.
+
+        Parameters
+        ----------
+        related_entities : dict
+            A dictionary of related entities keyed by their IDs.
+        back_ref : str
+            The name of the field on the related entities referencing the parent entities.
+        relationship : str
+            The relationship type between the parent and related components ('one_to_many' or 'many_to_many').
+
+        Returns
+        -------
+        dict
+            A dictionary mapping parent entity IDs to lists of related entity IDs, in related entity order.
+        """
+
+        related_entity_index = {}
+
+        for related_entity_id, related_entity in related_entities.items():
+            if relationship == 'many_to_many':
+                parent_ids = related_entity.get(f'{back_ref}s') or []
+            else:
+                parent_ids = [related_entity.get(back_ref)]
+            for parent_id in parent_ids:
+                related_entity_index.setdefault(parent_id, []).append(related_entity_id)
+
+        return related_entity_index
+
+    def compile_query(self, component: Type['BaseComponent'], query_params: dict) -> QueryPlan:
+        """
+        Compiles the filter, expand, ordering, and select query parameters into a query plan.
+
+        Plans are cached by component, response schema, and normalized query options, so repeated query strings are
+        only parsed once. The returned plan is shared and must not be modified.
+
+        Parameters
+        ----------
+        component : Type['BaseComponent']
+            The component type the query applies to.
+        query_params : dict
+            The query parameters to compile.
+
+        Returns
+        -------
+        QueryPlan
+            The compiled query plan.
+        """
+
+        query_params = query_params or {}
+        cache_key = (
+            component,
+            self.get_response_schemas.get(f'{component.__name__}GetResponse'),
+            getattr(self.request, 'ref_response', False),
+            *(
+                (query_params.get(query_param) or '').strip()
+                for query_param in ('filters', 'expand', 'order_by', 'select')
+            )
+        )
+
+        return query_plan_cache.get_or_compile(
+            cache_key,
+            lambda: QueryPlan(
+                filters=self.parse_filters(query_params),
+                expand=self.parse_expand(component=component, query_params=query_params),
+                ordering=tuple(self.parse_ordering(query_params)),
+                unselected_fields=frozenset(self.parse_select(component=component, query_params=query_params)),
+                projection=self.parse_projection(component=component, query_params=query_params)
+            )
+        )
+
+    def parse_select(self, component: Type['BaseComponent'], query_params: dict):
+        """
+        Parses the select query parameter to determine unselected fields.
+
+        Parameters
+        ----------
+        component : Type['BaseComponent']
+            The component type for which to parse the select parameter.
+        query_params : dict
+            The query parameters containing the select parameter.
+
+        Returns
+        -------
+        list
+            A list of unselected field names.
+        """
+
+        select_parameter = query_params.get('select')
+
+        if self.request.ref_response is True:
+            select_parameter = ['@iot.selfLink']
+        elif not select_parameter:
+            return []
+        else:
+            select_parameter = select_parameter.split(',')
+            if 'id' in select_parameter:
+                select_parameter.append('@iot.id')
+
+        unselect_components = [
+            field[0] for field in self.get_response_schemas[f'{component.__name__}GetResponse'].model_fields.items()
+            if field[1].alias not in select_parameter
+        ]
+
+        return unselect_components
+
+    def parse_projection(self, component: Type['BaseComponent'], query_params: dict) -> Optional[frozenset]:
+        """
+        Parses the select query parameter into the set of engine fields needed to build the response.
+
+        The projection always includes the entity ID and the keys of many-to-one relationships, so that selected
+        responses can still be linked and expanded.
+
+        Parameters
+        ----------
+        component : Type['BaseComponent']
+            The component type for which to parse the projection.
+        query_params : dict
+            The query parameters containing the select parameter.
+
+        Returns
+        -------
+        Optional[frozenset]
+            The engine fields to fetch, or None if all fields are needed.
+        """
+
+        unselected_fields = self.parse_select(component=component, query_params=query_params)
+
+        if not unselected_fields:
+            return None
+
+        related_components = component.get_related_components()
+
+        return frozenset({
+            'id',
+            *(
+                field_name for field_name in component.model_fields
+                if field_name not in related_components and field_name not in unselected_fields
+            ),
+            *(
+                related_component_field.json_schema_extra['back_ref']
+                for related_component_field in related_components.values()
+                if related_component_field.json_schema_extra['relationship'] == 'many_to_one'
+            )
+        })
+
+    @staticmethod
+    def parse_filters(query_params: dict):
+        """
+        Parses the filters query parameter into a filter object.
+
+        Parameters
+        ----------
+        query_params : dict
+            The query parameters containing the filters.
+
+        Returns
+        -------
+        object
+            The parsed filter object, or None if no filters are specified.
+        """
+
+        filter_string = query_params.get('filters')
+
+        if not filter_string:
+            return None
+
+        lexer = ODataLexer()
+        parser = ODataParser()
+
+        try:
+            return parser.parse(lexer.tokenize(filter_string))
+        except (ParsingException, TokenizingException):
+            raise HttpError(422, 'Failed to parse filter parameter.')
+
+    @staticmethod
+    def parse_pagination(query_params: dict) -> dict:
+        """
+        Parses pagination parameters from query parameters.
+
+        Parameters
+        ----------
+        query_params : dict
+            The query parameters containing pagination information.
+
+        Returns
+        -------
+        dict
+            A dictionary containing pagination parameters.
+        """
+
+        return {
+            'skip': query_params.get('skip') or 0,
+            'top': query_params.get('top') or 100,
+            'count': query_params.get('count') or False
+        }
+
+    def parse_seek(
+            self,
+            component: Type['BaseComponent'],
+            query_plan: QueryPlan,
+            query_params: dict,
+            get_method_name: str
+    ) -> Optional[dict]:
+        """
+        Parses the seek predicate passed to an engine's get method for cursor pagination.
+
+        Cursor pagination is used if ST_CURSOR_PAGINATION is enabled, the get method accepts a seek argument, and
+        every ordering field is a property of the component. The seek fields are the ordering fields followed by the
+        entity ID, so the order is total. Engines must order by the seek fields and return only entities ordered after
+        the seek values, if any.
+
+        Parameters
+        ----------
+        component : Type['BaseComponent']
+            The component type the query applies to.
+        query_plan : QueryPlan
+            The compiled query plan containing the ordering.
+        query_params : dict
+            The query parameters containing the skip token, if any.
+        get_method_name : str
+            The name of the engine's get method.
+
+        Returns
+        -------
+        Optional[dict]
+            The seek fields and directions, and the key values of the last entity of the previous page under 'after'
+            (or None on the first page), or None if cursor pagination is not used. Key values have the types the
+            engine returned them with: datetime and UUID values are restored from the skip token as datetime and
+            UUID objects, and other values are given as the JSON types they were encoded with (str, int, float, bool,
+            or None).
+
+        Raises
+        ------
+        HttpError
+            If a skip token was given but cannot be used.
+        """
+
+        skip_token = query_params.get('skip_token')
+        seek_fields = self.parse_seek_fields(
+            component=component, ordering=query_plan.ordering
+        ) if settings.ST_CURSOR_PAGINATION is True and self.engine_method_accepts(get_method_name, 'seek') else None
+
+        if seek_fields is None:
+            if skip_token:
+                raise HttpError(400, 'Cursor pagination is not supported for this request.')
+            return None
+
+        return {
+            'fields': seek_fields,
+            'after': self.parse_skip_token(skip_token=skip_token, seek_fields=seek_fields) if skip_token else None
+        }
+
+    @staticmethod
+    def parse_seek_fields(component: Type['BaseComponent'], ordering: Iterable[dict]) -> Optional[List[dict]]:
+        """
+        Resolves ordering fields into the engine fields used as the keys of a seek predicate.
+
+        Parameters
+        ----------
+        component : Type['BaseComponent']
+            The component type the query applies to.
+        ordering : Iterable[dict]
+            The parsed ordering fields and directions.
+
+        Returns
+        -------
+        Optional[List[dict]]
+            The engine field names and directions of the seek keys, or None if an ordering field is not a property
+            of the component.
+        """
+
+        related_components = component.get_related_components()
+        field_names = {
+            **{field_name: field_name for field_name in component.model_fields},
+            **{field.alias: field_name for field_name, field in component.model_fields.items() if field.alias}
+        }
+        seek_fields = []
+
+        for order_field in ordering:
+            field_name = field_names.get(order_field['field'])
+            if field_name is None or field_name in related_components:
+                return None
+            seek_fields.append({'field': field_name, 'direction': order_field['direction']})
+
+        if 'id' not in [seek_field['field'] for seek_field in seek_fields]:
+            seek_fields.append({'field': 'id', 'direction': 'asc'})
+
+        return seek_fields
+
+    @staticmethod
+    def parse_skip_token(skip_token: str, seek_fields: List[dict]) -> list:
+        """
+        Decodes the seek values of a $skiptoken cursor.
+
+        Parameters
+        ----------
+        skip_token : str
+            The skip token of the request.
+        seek_fields : List[dict]
+            The seek fields of the request.
+
+        Returns
+        -------
+        list
+            The key values of the last entity of the previous page, in the order of the seek fields.
+
+        Raises
+        ------
+        HttpError
+            If the skip token is malformed or was built for a different ordering.
+        """
+
+        try:
+            token_fields, token_values = orjson.loads(
+                base64.urlsafe_b64decode(skip_token + '=' * (-len(skip_token) % 4))
+            )
+        except (ValueError, TypeError, binascii.Error):
+            raise HttpError(400, 'Invalid $skiptoken.')
+
+        if token_fields != [[seek_field['field'], seek_field['direction']] for seek_field in seek_fields] or \
+                not isinstance(token_values, list) or len(token_values) != len(seek_fields):
+            raise HttpError(400, 'The $skiptoken does not match the $orderby of the request.')
+
+        try:
+            return [SensorThingsBaseEngine.decode_skip_token_value(token_value) for token_value in token_values]
+        except (ValueError, TypeError, OverflowError):
+            raise HttpError(400, 'Invalid $skiptoken.')
+
+    @staticmethod
+    def build_skip_token(seek: dict, entity: Optional[dict]) -> Optional[str]:
+        """
+        Encodes the seek values of the last entity of a page as an opaque $skiptoken cursor.
+
+        Parameters
+        ----------
+        seek : dict
+            The seek predicate the page was fetched with.
+        entity : Optional[dict]
+            The last engine entity of the page, if any.
+
+        Returns
+        -------
+        Optional[str]
+            The skip token of the next page, or None if the page is empty.
+        """
+
+        if entity is None:
+            return None
+
+        return base64.urlsafe_b64encode(orjson.dumps([
+            [[seek_field['field'], seek_field['direction']] for seek_field in seek['fields']],
+            [
+                SensorThingsBaseEngine.encode_skip_token_value(entity.get(seek_field['field']))
+                for seek_field in seek['fields']
+            ]
+        ], default=str)).decode().rstrip('=')
+
+    @staticmethod
+    def encode_skip_token_value(value: Any) -> list:
+        """
+        Encodes a seek value of a $skiptoken cursor together with its type.
+
+        Parameters
+        ----------
+        value : Any
+            The value of a seek field of an engine entity.
+
+        Returns
+        -------
+        list
+            The type of the value ('datetime', 'uuid', or None for JSON values) and its JSON encoded value.
+        """
+
+        if isinstance(value, datetime):
+            return ['datetime', value.isoformat()]
+        if isinstance(value, UUID):
+            return ['uuid', str(value)]
+
+        return [None, value]
+
+    @staticmethod
+    def decode_skip_token_value(token_value: list) -> Any:
+        """
+        Decodes a seek value of a $skiptoken cursor encoded by encode_skip_token_value.
+
+        Parameters
+        ----------
+        token_value : list
+            The type and JSON encoded value.
+
+        Returns
+        -------
+        Any
+            The seek value, as a datetime, UUID, or JSON value.
+
+        Raises
+        ------
+        ValueError
+            If the value is malformed.
+        """
+
+        value_type, value = token_value
+
+        if value_type == 'datetime':
+            return isoparse(value)
+        if value_type == 'uuid':
+            return UUID(value)
+        if value_type is not None:
+            raise ValueError(f'Unknown skip token value type: {value_type}')
+
+        return value
+
+    @staticmethod
+    def parse_ordering(query_params: dict) -> List[dict]:
+        """
+        Parses ordering parameters from query parameters.
+
+        Parameters
+        ----------
+        query_params : dict
+            The query parameters containing ordering information.
+
+        Returns
+        -------
+        list of dict
+            A list of dictionaries specifying field names and directions for ordering.
+        """
+
+        order_by_string = query_params.get('order_by') or ''
+        ordering = [
+            {
+                'field': order_field.strip().split(' ')[0],
+                'direction': 'desc' if order_field.strip().endswith('desc') else 'asc'
+            } for order_field in order_by_string.split(',')
+        ] if order_by_string != '' else []
+
+        return ordering
+
+    @staticmethod
+    def parse_expand(component: Type['BaseComponent'], query_params: dict):
+        """
+        Parses the expand query parameter for related entities and their nested properties.
+
+        Parameters
+        ----------
+        component : Type['BaseComponent']
+            The component type for which to parse expand parameters.
+        query_params : dict
+            The query parameters containing the expand parameter.
+
+        Returns
+        -------
+        dict
+            A dictionary mapping related component names to their respective query parameters.
+        """
+
+        expand = query_params.get('expand') or ''
+        expand_properties = {}
+        expand_components = re.split(r',(?![^(]*\))', expand)
+        related_components = component.get_related_components()
+
+        for expand_component in expand_components:
+            component_name = re.sub(r'(?<!^)(?=[A-Z])', '_', expand_component.split('/')[0].split('(')[0]).lower()
+            if component_name not in related_components:
+                continue
+
+            nested_query_params = re.search(r'\(.*?\)', expand_component.split('/')[0])
+            nested_query_params = nested_query_params.group(0)[1:-1] if nested_query_params else ''
+            nested_query_params = {
+                nested_query_param.split('=')[0]: nested_query_param.split('=')[1]
+                for nested_query_param in re.split(r'[;&]', nested_query_params) if nested_query_param
+            }
+
+            if component_name not in expand_properties:
+                expand_properties[component_name] = {
+                    'component': related_components[component_name],
+                    'query_params': nested_query_params,
+                    'join_ids': []
+                }
+
+            if len(expand_component.split('/')) > 1:
+                expand_properties[component_name]['query_params']['$expand'] = ','.join(
+                    (
+                        *expand_properties[component_name]['query_params']['$expand'].split(','),
+                        '/'.join(expand_component.split('/')[1:]),
+                    )
+                ) if '$expand' in expand_properties[component_name]['query_params'] else (
+                    '/'.join(expand_component.split('/')[1:])
+                )
+
+        for expand_property in expand_properties.values():
+            expand_property['query_params'] = ListQueryParams(**expand_property['query_params']).dict()
+
+        return expand_properties
+
+    @staticmethod
+    def iso_time_interval(start_time: Optional[datetime], end_time: Optional[datetime]):
+        """
+        Formats a time interval in ISO 8601 format.
+
+        Parameters
+        ----------
+        start_time : datetime, optional
+            The start time of the interval.
+        end_time : datetime, optional
+            The end time of the interval.
+
+        Returns
+        -------
+        Optional[str]
+            The formatted ISO 8601 time interval string, or None if both times are None.
+        """
+
+        if start_time and end_time and start_time != end_time:
+            return start_time.isoformat(timespec='seconds') + '/' + end_time.isoformat(timespec='seconds')
+        elif start_time and not end_time:
+            return start_time.isoformat(timespec='seconds')
+        elif end_time and not start_time:
+            return end_time.isoformat(timespec='seconds')
+        else:
+            return None
+
+    def build_ref_link(self, component: Type['BaseComponent'], entity_id: id_type):
+        """
+        Builds a reference link for an entity.
+
+        Parameters
+        ----------
+        component : Type['BaseComponent']
+            The component type of the entity for which to build the reference link.
+        entity_id : id_type
+            The ID of the entity.
+
+        Returns
+        -------
+        str
+            The constructed reference link.
+        """
+
+        return (
+            f'{self.request.sensorthings_url}/'
+            f'{component.model_config["json_schema_extra"]["name_ref"][0]}('
+            f'{id_qualifier}{str(entity_id)}{id_qualifier})'
+        )
+
+    def build_next_link(
+            self,
+            query_params: dict,
+            length: int,
+            count: Optional[int] = None
+    ):
+        """
+        Builds the next link for pagination.
+
+        If the page was fetched with a seek predicate, the next link carries a $skiptoken cursor built from the last
+        entity of the page instead of a $skip offset.
+
+        Parameters
+        ----------
+        query_params : dict
+            The current query parameters for pagination.
+        length : int
+            The length of the current result set.
+        count : int, optional
+            The total count of entities available.
+
+        Returns
+        -------
+        Optional[str]
+            The constructed next link for pagination, or None if there are no more pages.
+        """
+
+        top = query_params.pop('top', None)
+        skip = query_params.pop('skip', None)
+        query_params.pop('skip_token', None)
+
+        if top is None:
+            top = 100
+
+        if skip is None:
+            skip = 0
+
+        if hasattr(self.request, 'next_skip_token'):
+            if self.request.next_skip_token is None or length < top:
+                return None
+
+            query_string = ListQueryParams(
+                top=top,
+                skip=None,
+                skip_token=self.request.next_skip_token,
+                **query_params
+            ).get_query_string()
+
+            return f'{self.request.sensorthings_url}/{self.request.sensorthings_path}{query_string}'
+
+        if count is not None and top + skip < count or count is None and top == length:
+            query_string = ListQueryParams(
+                top=top,
+                skip=top + skip,
+                **query_params
+            ).get_query_string()
+
+            return f'{self.request.sensorthings_url}/{self.request.sensorthings_path}{query_string}'
+        else:
+            return None
+
+    @engine_pipeline
+    def buffer_observation(self, observation: 'ObservationPostBody', response: HttpResponse) -> bool:
+        """
+        Buffers a single Observation to be created in bulk, if the Observation buffer is enabled.
+
+        Buffered Observations are created through the engine's create_observations method by the background
+        Observation buffer (see ST_OBSERVATION_BUFFER), which also updates the Datastream time bounds and cached
+        responses. Engines without a create_observations method always create Observations individually. The
+        Datastream of the Observation is looked up before the Observation is buffered, so Observations of missing
+        Datastreams are rejected instead of being accepted and failing in the background. The location of the
+        buffered Observation's status (see get_buffered_observation) is set on the response.
+
+        Parameters
+        ----------
+        observation : ObservationPostBody
+            The validated Observation to create.
+        response : HttpResponse
+            The HTTP response object to populate with the location of the buffered Observation's status.
+
+        Returns
+        -------
+        bool
+            Whether the Observation was buffered.
+
+        Raises
+        ------
+        HttpError
+            If the Datastream of the Observation does not exist.
+        """
+
+        if settings.ST_OBSERVATION_BUFFER is not True or not callable(getattr(self, 'create_observations', None)):
+            return False
+
+        if has_nested_entities(observation):
+            return False
+
+        datastreams, _ = yield self.get_datastreams(datastream_ids=[observation.datastream.id])
+        if not (yield self.collect_entities(datastreams)):
+            raise HttpError(404, 'Datastream not found.')
+
+        ticket = yield self.run_blocking(observation_buffer.submit, engine=self, observation=observation)
+        response['Location'] = f"{self.request.sensorthings_url}/BufferedObservations('{ticket}')"
+
+        return True
+
+    def get_buffered_observation(self, ticket: str, response: HttpResponse) -> int:
+        """
+        Gets the status of a buffered Observation.
+
+        Buffered Observations that have not been created yet are answered with 202 Accepted. Created Observations
+        are answered with 201 Created and the location of the created Observation, if the engine's
+        create_observations method returned its ID.
+
+        Parameters
+        ----------
+        ticket : str
+            The ticket of the buffered Observation.
+        response : HttpResponse
+            The HTTP response object to populate with the location of the created Observation.
+
+        Returns
+        -------
+        int
+            The status code of the response.
+
+        Raises
+        ------
+        HttpError
+            If the ticket is unknown, or the Observation could not be created.
+        """
+
+        status = observation_buffer.status(ticket)
+
+        if status is None:
+            raise HttpError(404, 'Buffered Observation not found.')
+
+        state, observation_id = status
+
+        if state == 'pending':
+            return 202
+
+        if state == 'failed':
+            raise HttpError(422, 'The buffered Observation could not be created.')
+
+        if observation_id is not None:
+            response['Location'] = self.build_ref_link(field_schemas.Observation, observation_id)
+
+        return 201
+
+    @engine_pipeline
+    def update_related_components(self, component: Type['BaseComponent'], related_entity_id: id_type):
+        """
+        Updates the related components of an entity.
+
+        Parameters
+        ----------
+        component : Type['BaseComponent']
+            The component type of the related entity.
+        related_entity_id : id_type
+            The ID of the related entity.
+
+        Returns
+        -------
+        None
+        """
+
+        if component.__name__ == 'Datastream':
+            yield self.update_datastream_time_bounds(datastream_ids=[related_entity_id])
+
+    @engine_pipeline
+    def update_datastream_time_bounds(self, datastream_ids: Iterable[id_type], strict: Optional[bool] = None):
+        """
+        Updates the phenomenon and result times of Datastreams from their Observations.
+
+        Engines can implement an optional get_datastream_time_bounds(datastream_ids) method returning, for each
+        Datastream ID, a dictionary with 'phenomenon_time' and 'result_time' tuples of the earliest and latest times
+        of its Observations as datetimes (Datastreams without Observations may be omitted). If it is present, the
+        bounds of all Datastreams are read with a single call. Otherwise, the first and last Observations of each
+        Datastream are fetched with the engine's get_observations method (see build_time_bounds_queries). If
+        ST_TIME_BOUNDS_MODE is 'deferred', the Datastreams are queued and updated in the background instead (see
+        defer_datastream_time_bounds). Since this is called whenever Observations of the Datastreams are created or
+        deleted, their stored latest Observations are invalidated first.
+
+        Parameters
+        ----------
+        datastream_ids : Iterable[id_type]
+            The IDs of the Datastreams to update.
+        strict : Optional[bool], optional
+            Whether to update the Datastreams before returning. Defaults to ST_TIME_BOUNDS_MODE != 'deferred'.
+
+        Returns
+        -------
+        None
+        """
+
+        datastream_ids = list(dict.fromkeys(datastream_ids))
+        yield self.invalidate_latest_observations(datastream_ids=datastream_ids)
+
+        if (strict if strict is not None else settings.ST_TIME_BOUNDS_MODE != 'deferred') is False:
+            return self.defer_datastream_time_bounds(datastream_ids=datastream_ids)
+
+        if callable(getattr(self, 'get_datastream_time_bounds', None)):
+            time_bounds = yield self.get_datastream_time_bounds(datastream_ids=datastream_ids)  # noqa
+            entity_bodies = {
+                datastream_id: self.build_datastream_time_bounds_body(**time_bounds.get(datastream_id, {}))
+                for datastream_id in datastream_ids
+            }
+        else:
+            entity_bodies = {}
+            for datastream_id in datastream_ids:
+                observations = []
+                for query_params in self.build_time_bounds_queries():
+                    response, _ = yield self.fetch_entities(
+                        component=field_schemas.Observation,
+                        query_params=query_params,
+                        key_constraints={'datastream_ids': [datastream_id]}
+                    )
+                    observations.append(next(iter(response.values()), {}))
+                entity_bodies[datastream_id] = self.build_datastream_time_bounds(*observations)
+
+        for datastream_id, entity_body in entity_bodies.items():
+            yield self.update_entity(
+                component=field_schemas.Datastream,
+                entity_id=datastream_id,
+                entity_body=entity_body
+            )
+
+    def defer_datastream_time_bounds(self, datastream_ids: Iterable[id_type]):
+        """
+        Queues Datastreams to have their time bounds updated by the background time bounds worker.
+
+        Queued Datastreams are coalesced and updated in batches every ST_TIME_BOUNDS_INTERVAL seconds, or once
+        ST_TIME_BOUNDS_BATCH_SIZE Datastreams are queued, by an engine of the same class built outside of the request.
+        The background engine reads time bounds with its get methods only (see build_time_bounds_queries), so the
+        response cache and conditional request handling are never applied to its request. Engines used in deferred
+        mode must not depend on the request (e.g. its user) to update time bounds.
+
+        Parameters
+        ----------
+        datastream_ids : Iterable[id_type]
+            The IDs of the Datastreams to update.
+
+        Returns
+        -------
+        None
+        """
+
+        for datastream_id in datastream_ids:
+            time_bounds_worker.submit(
+                item=(type(self), self.get_response_schemas, self.request.sensorthings_url, datastream_id),
+                key=(type(self), self.request.sensorthings_url, datastream_id)
+            )
+
+    @staticmethod
+    def build_time_bounds_queries() -> List[dict]:
+        """
+        Builds the queries for the first and last Observations of a Datastream.
+
+        The queries are passed to fetch_entities with the Datastream ID as a key constraint, so they are not run
+        through the list pipeline of the request (e.g. its response cache, conditional request handling, or next
+        links).
+
+        Returns
+        -------
+        List[dict]
+            The query parameters for the first and the last Observation by phenomenon time.
+        """
+
+        return [
+            ListQueryParams(
+                select='phenomenonTime,resultTime',
+                order_by=f'phenomenonTime {direction}',
+                top=1,
+                count=False
+            ).dict() for direction in ['asc', 'desc']
+        ]
+
+    def build_datastream_time_bounds(self, first_observation: dict, last_observation: dict) -> DatastreamPatchBody:
+        """
+        Builds a Datastream update setting its phenomenon and result times from its first and last Observations.
+
+        Parameters
+        ----------
+        first_observation : dict
+            The first Observation of the Datastream, or an empty dictionary if it has none.
+        last_observation : dict
+            The last Observation of the Datastream, or an empty dictionary if it has none.
+
+        Returns
+        -------
+        DatastreamPatchBody
+            The Datastream update.
+        """
+
+        phenomenon_time_range = []
+        result_time_range = []
+
+        for observation in [first_observation, last_observation]:
+            if observation.get('phenomenon_time') is not None:
+                phenomenon_time_range.append(isoparse(observation['phenomenon_time']).replace(tzinfo=pytz.UTC))
+            else:
+                phenomenon_time_range.append(None)
+            if observation.get('result_time') is not None:
+                result_time_range.append(isoparse(observation['result_time']).replace(tzinfo=pytz.UTC))
+            else:
+                result_time_range.append(None)
+
+        return self.build_datastream_time_bounds_body(
+            phenomenon_time=tuple(phenomenon_time_range),
+            result_time=tuple(result_time_range)
+        )
+
+    def build_datastream_time_bounds_body(
+            self,
+            phenomenon_time: Tuple[Optional[datetime], Optional[datetime]] = (None, None),
+            result_time: Tuple[Optional[datetime], Optional[datetime]] = (None, None)
+    ) -> DatastreamPatchBody:
+        """
+        Builds a Datastream update setting its phenomenon and result times from their bounds.
+
+        Parameters
+        ----------
+        phenomenon_time : Tuple[Optional[datetime], Optional[datetime]], optional
+            The earliest and latest phenomenon times of the Datastream's Observations.
+        result_time : Tuple[Optional[datetime], Optional[datetime]], optional
+            The earliest and latest result times of the Datastream's Observations.
+
+        Returns
+        -------
+        DatastreamPatchBody
+            The Datastream update.
+        """
+
+        phenomenon_time, result_time = (
+            self.iso_time_interval(*(
+                (time.astimezone(pytz.UTC) if time.tzinfo else time.replace(tzinfo=pytz.UTC))
+                if time is not None else None for time in time_range
+            )) for time_range in [phenomenon_time, result_time]
+        )
+        phenomenon_time = phenomenon_time.replace('+00:00', 'Z') if phenomenon_time else None  # noqa
+        result_time = result_time.replace('+00:00', 'Z') if result_time else None  # noqa
+
+        return DatastreamPatchBody(  # noqa
+            phenomenon_time=phenomenon_time,
+            result_time=result_time
+        )
+
+    def get_version_token(
+            self,
+            component: Type['BaseComponent'],
+            query_params: dict,
+            entity_id: Optional[id_type] = None
+    ) -> Optional[str]:
+        """
+        Gets a token identifying the current version of the entities a GET request would return.
+
+        Engines that can tell cheaply whether data has changed (e.g. from a revision counter or a last-updated
+        column) can override this method so conditional requests are answered before any entities are fetched. The
+        token must change whenever the response would change. By default, no token is supplied and ETags are hashed
+        from the rendered response instead.
+
+        Parameters
+        ----------
+        component : Type['BaseComponent']
+            The component type of the response.
+        query_params : dict
+            The query parameters of the request.
+        entity_id : Optional[id_type], optional
+            The ID of the requested entity, if the request is for a single entity.
+
+        Returns
+        -------
+        Optional[str]
+            The version token, or None if the engine cannot supply one.
+        """
+
+        return None
+
+    def get_last_modified(
+            self,
+            component: Type['BaseComponent'],
+            query_params: dict,
+            entity_id: Optional[id_type] = None
+    ) -> Optional[datetime]:
+        """
+        Gets the time the entities a GET request would return were last modified.
+
+        Engines can override this method to emit Last-Modified headers and answer If-Modified-Since requests before
+        any entities are fetched. By default, no modification time is supplied.
+
+        Parameters
+        ----------
+        component : Type['BaseComponent']
+            The component type of the response.
+        query_params : dict
+            The query parameters of the request.
+        entity_id : Optional[id_type], optional
+            The ID of the requested entity, if the request is for a single entity.
+
+        Returns
+        -------
+        Optional[datetime]
+            The last modification time, or None if the engine cannot supply one.
+        """
+
+        return None
+
+    @engine_pipeline
+    def check_conditional_request(
+            self,
+            component: Type['BaseComponent'],
+            query_params: dict,
+            entity_id: Optional[id_type] = None
+    ) -> Optional[HttpResponse]:
+        """
+        Answers a conditional GET request from the engine's version token and modification time.
+
+        Parameters
+        ----------
+        component : Type['BaseComponent']
+            The component type of the response.
+        query_params : dict
+            The query parameters of the request.
+        entity_id : Optional[id_type], optional
+            The ID of the requested entity, if the request is for a single entity.
+
+        Returns
+        -------
+        Optional[HttpResponse]
+            A 304 Not Modified (or 412 Precondition Failed) response, or None if the request must be answered in full.
+        """
+
+        if getattr(self.request, 'conditional_response', False) is not True:
+            return None
+
+        version_token = yield self.get_version_token(
+            component=component, query_params=query_params, entity_id=entity_id
+        )
+        last_modified = yield self.get_last_modified(
+            component=component, query_params=query_params, entity_id=entity_id
+        )
+
+        return self.build_conditional_response(version_token=version_token, last_modified=last_modified)
+
+    def build_conditional_response(
+            self,
+            version_token: Optional[str],
+            last_modified: Optional[datetime]
+    ) -> Optional[HttpResponse]:
+        """
+        Builds the validators of the current request and evaluates its conditional headers against them.
+
+        The validators are attached to the request as 'response_etag' and 'response_last_modified' so they are also
+        emitted with full responses.
+
+        Parameters
+        ----------
+        version_token : Optional[str]
+            The engine's version token of the response.
+        last_modified : Optional[datetime]
+            The engine's last modification time of the response.
+
+        Returns
+        -------
+        Optional[HttpResponse]
+            A 304 Not Modified (or 412 Precondition Failed) response, or None if the request must be answered in full.
+        """
+
+        if version_token is None and last_modified is None:
+            return None
+
+        etag = quote_etag(hashlib.md5(orjson.dumps([
+            version_token,
+            self.request.build_absolute_uri(self.request.path),
+            sorted(self.request.GET.lists()),
+            self.get_response_cache_scope()
+        ]), usedforsecurity=False).hexdigest()) if version_token is not None else None
+        last_modified = int(last_modified.timestamp()) if last_modified is not None else None
+
+        self.request.response_etag = etag
+        self.request.response_last_modified = last_modified
+
+        response = get_conditional_response(self.request, etag=etag, last_modified=last_modified)
+
+        if response is not None:
+            if etag is not None:
+                response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+
+        return response
+
+    @engine_pipeline
+    def load_cached_response(
+            self,
+            component: Type['BaseComponent'],
+            query_params: dict,
+            entity_id: Optional[id_type] = None
+    ) -> bool:
+        """
+        Looks up a cached rendering of the current GET request.
+
+        On a hit, the cached response is attached to the request as 'response_string', which the renderer returns in
+        place of the view's result. On a miss, the cache key is attached to the request as 'response_cache_key' so the
+        renderer can store the response once it has been rendered.
+
+        Parameters
+        ----------
+        component : Type['BaseComponent']
+            The component type of the response.
+        query_params : dict
+            The query parameters of the request.
+        entity_id : Optional[id_type], optional
+            The ID of the requested entity, if the request is for a single entity.
+
+        Returns
+        -------
+        bool
+            Whether the response was found in the cache.
+        """
+
+        if not response_cache.enabled or getattr(self.request, 'method', None) != 'GET' or \
+                hasattr(self.request, 'response_string') or hasattr(self.request, 'response_cache_key'):
+            return False
+
+        cache_key = response_cache.build_key(
+            url=self.request.build_absolute_uri(self.request.path),
+            query_options=sorted(self.request.GET.lists()),
+            scope=self.get_response_cache_scope(),
+            generation_keys=self.get_response_generation_keys(
+                component=component, query_params=query_params, entity_id=entity_id
+            )
+        )
+        cached_response = yield self.run_blocking(response_cache.get, cache_key)
+
+        if cached_response is None:
+            self.request.response_cache_key = cache_key
+            return False
+
+        self.request.response_string = cached_response
+
+        return True
+
+    def get_response_generation_keys(
+            self,
+            component: Type['BaseComponent'],
+            query_params: dict,
+            entity_id: Optional[id_type] = None
+    ) -> List[str]:
+        """
+        Gets the cache generation keys of the components and entities a response depends on.
+
+        Responses for a single entity without nested paths or expanded entities only depend on that entity. All other
+        responses depend on every component they include.
+
+        Parameters
+        ----------
+        component : Type['BaseComponent']
+            The component type of the response.
+        query_params : dict
+            The query parameters of the request.
+        entity_id : Optional[id_type], optional
+            The ID of the requested entity, if the request is for a single entity.
+
+        Returns
+        -------
+        List[str]
+            The generation keys of the response.
+        """
 
-                related_response_schema = self.get_response_schemas[f'{related_component.__name__}GetResponse']
-
-                if component_relationship == 'many_to_many':
-                    entities = self.insert_entity_field(
-                        entities=entities,
-                        entity_field_name=f'{related_component_name}_rel',
-                        entity_function=lambda entity_id, entity: [
-                            related_response_schema(**related_entity).dict(by_alias=True, exclude_unset=True)
-                            for related_entity_id, related_entity in related_entities.items()
-                            if entity_id in related_entity[f'{back_ref}s']
-                        ]
-                    )
-                elif component_relationship == 'one_to_many':
-                    entities = self.insert_entity_field(
-                        entities=entities,
-                        entity_field_name=f'{related_component_name}_rel',
-                        entity_function=lambda entity_id, entity: [
-                            related_response_schema(**related_entity).dict(by_alias=True, exclude_unset=True)
-                            for related_entity_id, related_entity in related_entities.items()
-                            if related_entity[back_ref] == entity_id
-                        ]
-                    )
-                else:
-                    entities = self.insert_entity_field(
-                        entities=entities,
-                        entity_field_name=f'{related_component_name}_rel',
-                        entity_function=lambda entity_id, entity: related_response_schema(
-                            **related_entities.get(entity[back_ref])
-                        ).dict(by_alias=True, exclude_unset=True)
-                    )
+        if entity_id is not None and not self.request.nested_path and not query_params.get('expand'):
+            return [
+                response_cache.get_entity_key(component.__name__, '*'),
+                response_cache.get_entity_key(component.__name__, entity_id)
+            ]
+
+        component_names = self.collect_expanded_components(
+            component=component,
+            query_params=query_params,
+            component_names={
+                component.__name__, *(nested_component.__name__ for nested_component, *_ in self.request.nested_path)
+            }
+        )
 
-        return entities
+        return [response_cache.get_component_key(component_name) for component_name in component_names]
 
-    def insert_self_links(self, entities: Dict[str, dict], component: Type['BaseComponent']) -> Dict[str, dict]:
+    def collect_expanded_components(
+            self,
+            component: Type['BaseComponent'],
+            query_params: dict,
+            component_names: set
+    ) -> set:
         """
-        Inserts self-links into the entities.
+        Collects the names of all components included in a response through the expand tree.
 
         Parameters
         ----------
-        entities : dict
-            A dictionary of entities.
         component : Type['BaseComponent']
-            The component type of the entities.
+            The component type the query applies to.
+        query_params : dict
+            The query parameters containing the expand parameter.
+        component_names : set
+            The component names collected so far.
 
         Returns
         -------
-        dict
-            A dictionary of entities with self-links inserted.
+        set
+            The collected component names.
         """
 
-        return self.insert_entity_field(
-            entities=entities,
-            entity_field_name='self_link',
-            entity_function=lambda entity_id, entity: self.build_ref_link(component, entity_id),
-        )
+        for expand_property in self.compile_query(component=component, query_params=query_params).expand.values():
+            related_component = self.resolve_related_component(expand_property['component'])
+            component_names.add(related_component.__name__)
+            self.collect_expanded_components(
+                component=related_component,
+                query_params=expand_property['query_params'],
+                component_names=component_names
+            )
 
-    @staticmethod
-    def insert_entity_field(
-            entities: Dict[str, dict], entity_field_name: str, entity_function: Callable
-    ) -> Dict[str, dict]:
+        return component_names
+
+    def get_response_cache_scope(self) -> str:
         """
-        Inserts a field into each entity based on a provided function.
+        Gets the audience cached responses of the current request are shared with.
 
-        Parameters
-        ----------
-        entities : dict
-            A dictionary of entities.
-        entity_field_name : str
-            The name of the field to insert.
-        entity_function : Callable
-            A function to generate the field value.
+        Responses are shared between anonymous requests and kept separate for each authenticated user. Engines that
+        filter entities by something other than the Django user should override this method.
 
         Returns
         -------
-        dict
-            A dictionary of entities with the new field inserted.
+        str
+            The response cache scope of the request.
         """
 
-        return {
-            entity_id: {
-                entity_field_name: entity_function(entity_id, entity),
-                **entity
-            } for entity_id, entity in entities.items()
-        }
+        user = getattr(self.request, 'user', None)
 
-    def parse_select(self, component: Type['BaseComponent'], query_params: dict):
+        return str(user.pk) if getattr(user, 'is_authenticated', False) is True else ''
+
+    @engine_pipeline
+    def invalidate_cached_responses(
+            self,
+            component: Type['BaseComponent'],
+            entity_ids: Optional[Iterable] = None,
+            entity_body: Optional['BasePostBody'] = None,
+            cascade: bool = False
+    ):
         """
-        Parses the select query parameter to determine unselected fields.
+        Invalidates cached responses affected by a write to a component.
 
         Parameters
         ----------
         component : Type['BaseComponent']
-            The component type for which to parse the select parameter.
-        query_params : dict
-            The query parameters containing the select parameter.
-
-        Returns
-        -------
-        list
-            A list of unselected field names.
+            The written component type.
+        entity_ids : Optional[Iterable], optional
+            The IDs of the existing entities that were modified or deleted. An empty list means no existing entity was
+            affected (e.g. a create), and None means any entity may have been affected.
+        entity_body : Optional[BasePostBody], optional
+            The written entity body. Components linked by the body are invalidated as well.
+        cascade : bool, optional
+            Whether entities related to the written entities may have been removed with them (e.g. a delete).
         """
 
-        select_parameter = query_params.get('select')
+        if not response_cache.enabled:
+            return
 
-        if self.request.ref_response is True:
-            select_parameter = ['@iot.selfLink']
-        elif not select_parameter:
-            return []
-        else:
-            select_parameter = select_parameter.split(',')
-            if 'id' in select_parameter:
-                select_parameter.append('@iot.id')
+        yield self.run_blocking(
+            self.invalidate_response_cache,
+            component=component,
+            entity_ids=entity_ids,
+            entity_body=entity_body,
+            cascade=cascade
+        )
 
-        unselect_components = [
-            field[0] for field in self.get_response_schemas[f'{component.__name__}GetResponse'].model_fields.items()
-            if field[1].alias not in select_parameter
-        ]
+    def invalidate_response_cache(
+            self,
+            component: Type['BaseComponent'],
+            entity_ids: Optional[Iterable] = None,
+            entity_body: Optional['BasePostBody'] = None,
+            cascade: bool = False
+    ):
+        """
+        Removes the cached responses affected by a write to a component from the response cache.
 
-        return unselect_components
+        Parameters
+        ----------
+        component : Type['BaseComponent']
+            The written component type.
+        entity_ids : Optional[Iterable], optional
+            The IDs of the existing entities that were modified or deleted. An empty list means no existing entity was
+            affected (e.g. a create), and None means any entity may have been affected.
+        entity_body : Optional[BasePostBody], optional
+            The written entity body. Components linked by the body are invalidated as well.
+        cascade : bool, optional
+            Whether entities related to the written entities may have been removed with them (e.g. a delete).
+        """
 
-    @staticmethod
-    def parse_filters(query_params: dict):
+        response_cache.invalidate(component.__name__, entity_ids)
+
+        related_components = component.get_related_components()
+
+        if cascade is True:
+            dependent_components = [component]
+            dependent_component_names = {component.__name__}
+            while dependent_components:
+                for related_component_field in dependent_components.pop().get_related_components().values():
+                    if related_component_field.json_schema_extra['relationship'] == 'many_to_one':
+                        continue
+                    related_component = self.resolve_related_component(related_component_field)
+                    if related_component.__name__ not in dependent_component_names:
+                        dependent_component_names.add(related_component.__name__)
+                        dependent_components.append(related_component)
+                        response_cache.invalidate(related_component.__name__)
+        elif set(related_components) & getattr(entity_body, 'model_fields_set', set()):
+            for related_component_field in related_components.values():
+                response_cache.invalidate(self.resolve_related_component(related_component_field).__name__, [])
+
+    @engine_pipeline
+    def invalidate_latest_observations(self, datastream_ids: Optional[Iterable[id_type]] = None):
         """
-        Parses the filters query parameter into a filter object.
+        Invalidates the stored latest Observations of Datastreams whose Observations were written.
 
         Parameters
         ----------
-        query_params : dict
-            The query parameters containing the filters.
-
-        Returns
-        -------
-        object
-            The parsed filter object, or None if no filters are specified.
+        datastream_ids : Optional[Iterable[id_type]], optional
+            The IDs of the written Datastreams, or None if the Observations of any Datastream may have been written
+            (e.g. an update of an Observation).
         """
 
-        filter_string = query_params.get('filters')
+        if not latest_observation_store.enabled:
+            return
 
-        if not filter_string:
-            return None
+        yield self.run_blocking(
+            latest_observation_store.invalidate, datastream_ids, scope=self.get_latest_observation_scope()
+        )
 
-        lexer = ODataLexer()
-        parser = ODataParser()
 
-        try:
-            return parser.parse(lexer.tokenize(filter_string))
-        except (ParsingException, TokenizingException):
-            raise HttpError(422, 'Failed to parse filter parameter.')
+class SensorThingsBaseAsyncEngine(SensorThingsBaseEngine, metaclass=ABCMeta):
+    """
+    Abstract base engine class for handling CRUD operations and querying SensorThings components with asyncio.
+
+    Async engines implement the same component methods as SensorThingsBaseEngine (get_things, create_thing, etc.) as
+    coroutine functions. Get methods may return a dictionary of entities keyed by ID, an iterable of entity
+    dictionaries, or an async iterable of entity dictionaries. The request pipeline is shared with
+    SensorThingsBaseEngine (see engine_pipeline): this class only awaits the engine calls the pipeline methods yield,
+    runs blocking operations (e.g. response cache lookups) outside the event loop, and fetches sibling expansions as
+    concurrent tasks.
+
+    Attributes
+    ----------
+    request : SensorThingsHttpRequest
+        The HTTP request object used for communication.
+    get_response_schemas : Dict[str, Type[BaseGetResponse]]
+        Mapping of component names to their corresponding response schemas.
+    """
 
     @staticmethod
-    def parse_pagination(query_params: dict) -> dict:
+    async def run_pipeline(steps: Generator) -> Any:
         """
-        Parses pagination parameters from query parameters.
+        Runs a pipeline method (see engine_pipeline), awaiting each engine call and sending its result back to it.
+
+        Exceptions raised by an awaited engine call are raised inside the pipeline method.
 
         Parameters
         ----------
-        query_params : dict
-            The query parameters containing pagination information.
+        steps : Generator
+            The generator of the pipeline method.
 
         Returns
         -------
-        dict
-            A dictionary containing pagination parameters.
+        Any
+            The result of the pipeline method.
         """
 
-        return {
-            'skip': query_params.get('skip') or 0,
-            'top': query_params.get('top') or 100,
-            'count': query_params.get('count') or False
-        }
+        result, error = None, None
+
+        while True:
+            try:
+                step = steps.throw(error) if error is not None else steps.send(result)
+            except StopIteration as stop:
+                return stop.value
+            try:
+                result, error = (await step) if inspect.isawaitable(step) else step, None
+            except Exception as e:  # noqa
+                result, error = None, e
 
     @staticmethod
-    def parse_ordering(query_params: dict) -> List[dict]:
+    async def run_blocking(function: Callable, *args, **kwargs) -> Any:
         """
-        Parses ordering parameters from query parameters.
+        Calls a blocking function, such as a cache lookup, from a pipeline method without blocking the event loop.
 
         Parameters
         ----------
-        query_params : dict
-            The query parameters containing ordering information.
+        function : Callable
+            The blocking function.
+        *args, **kwargs
+            The arguments to call the function with.
 
         Returns
         -------
-        list of dict
-            A list of dictionaries specifying field names and directions for ordering.
+        Any
+            The result of the function.
         """
 
-        order_by_string = query_params.get('order_by') or ''
-        ordering = [
-            {
-                'field': order_field.strip().split(' ')[0],
-                'direction': 'desc' if order_field.strip().endswith('desc') else 'asc'
-            } for order_field in order_by_string.split(',')
-        ] if order_by_string != '' else []
-
-        return ordering
+        return await sync_to_async(function)(*args, **kwargs)
 
-    @staticmethod
-    def parse_expand(component: Type['BaseComponent'], query_params: dict):
+    async def run_in_transaction(self, method: Callable, **kwargs) -> Any:
         """
-        Parses the expand query parameter for related entities and their nested properties.
+        Awaits an engine method within a transaction boundary (see transaction).
 
         Parameters
         ----------
-        component : Type['BaseComponent']
-            The component type for which to parse expand parameters.
-        query_params : dict
-            The query parameters containing the expand parameter.
+        method : Callable
+            The engine method grouping the writes.
+        **kwargs
+            The keyword arguments to call the method with.
 
         Returns
         -------
-        dict
-            A dictionary mapping related component names to their respective query parameters.
+        Any
+            The result of the method.
         """
 
-        expand = query_params.get('expand') or ''
-        expand_properties = {}
-        expand_components = re.split(r',(?![^(]*\))', expand)
-        related_components = component.get_related_components()
-
-        for expand_component in expand_components:
-            component_name = re.sub(r'(?<!^)(?=[A-Z])', '_', expand_component.split('/')[0].split('(')[0]).lower()
-            if component_name not in related_components:
-                continue
-
-            nested_query_params = re.search(r'\(.*?\)', expand_component.split('/')[0])
-            nested_query_params = nested_query_params.group(0)[1:-1] if nested_query_params else ''
-            nested_query_params = {
-                nested_query_param.split('=')[0]: nested_query_param.split('=')[1]
-                for nested_query_param in nested_query_params.split('&') if nested_query_param
-            }
+        async with self.transaction():
+            return await method(**kwargs)
 
-            if component_name not in expand_properties:
-                expand_properties[component_name] = {
-                    'component': related_components[component_name],
-                    'query_params': nested_query_params,
-                    'join_ids': []
-                }
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Opens a transaction boundary around a group of engine writes.
 
-            if len(expand_component.split('/')) > 1:
-                expand_properties[component_name]['query_params']['$expand'] = ','.join(
-                    (
-                        *expand_properties[component_name]['query_params']['$expand'].split(','),
-                        '/'.join(expand_component.split('/')[1:]),
-                    )
-                ) if '$expand' in expand_properties[component_name]['query_params'] else (
-                    '/'.join(expand_component.split('/')[1:])
-                )
+        The default transaction does nothing. Async engines backed by a transactional store should override this
+        method so that grouped writes (bulk and deep inserts) are applied atomically, and rolled back if an exception
+        is raised inside the block.
 
-        for expand_property in expand_properties.values():
-            expand_property['query_params'] = ListQueryParams(**expand_property['query_params']).dict()
+        Returns
+        -------
+        AsyncContextManager
+            An async context manager wrapping the grouped writes.
+        """
 
-        return expand_properties
+        yield
 
     @staticmethod
-    def iso_time_interval(start_time: Optional[datetime], end_time: Optional[datetime]):
+    async def collect_entities(entities) -> Dict[str, dict]:
         """
-        Formats a time interval in ISO 8601 format.
+        Collects the entities returned by an engine's get method into a dictionary keyed by entity ID.
 
         Parameters
         ----------
-        start_time : datetime, optional
-            The start time of the interval.
-        end_time : datetime, optional
-            The end time of the interval.
+        entities : Union[Iterable[dict], AsyncIterable[dict]]
+            A dictionary of entities keyed by ID, or an iterable or async iterable of entity dictionaries.
 
         Returns
         -------
-        Optional[str]
-            The formatted ISO 8601 time interval string, or None if both times are None.
+        Dict[str, dict]
+            The entities keyed by ID.
         """
 
-        if start_time and end_time and start_time != end_time:
-            return start_time.isoformat(timespec='seconds') + '/' + end_time.isoformat(timespec='seconds')
-        elif start_time and not end_time:
-            return start_time.isoformat(timespec='seconds')
-        elif end_time and not start_time:
-            return end_time.isoformat(timespec='seconds')
-        else:
-            return None
+        if hasattr(entities, '__aiter__'):
+            return {entity['id']: entity async for entity in entities}
 
-    def build_ref_link(self, component: Type['BaseComponent'], entity_id: id_type):
+        return SensorThingsBaseEngine.collect_entities(entities)
+
+    async def fetch_expansions(self, entities: Dict[str, dict], expansions: List[dict]) -> List[tuple]:
         """
-        Builds a reference link for an entity.
+        Fetches the related entities of sibling expanded relations.
+
+        Sibling relations are fetched as concurrent tasks, at most ST_EXPAND_CONCURRENCY at a time.
 
         Parameters
         ----------
-        component : Type['BaseComponent']
-            The component type of the entity for which to build the reference link.
-        entity_id : id_type
-            The ID of the entity.
+        entities : dict
+            A dictionary of parent entities returned by the engine.
+        expansions : List[dict]
+            The expanded relations, as returned by plan_related_entities.
 
         Returns
         -------
-        str
-            The constructed reference link.
+        List[tuple]
+            The related entities of each relation and their index by parent entity, as returned by fetch_expansion.
         """
 
-        return (
-            f'{self.request.sensorthings_url}/'
-            f'{component.model_config["json_schema_extra"]["name_ref"][0]}('
-            f'{id_qualifier}{str(entity_id)}{id_qualifier})'
-        )
+        semaphore = asyncio.Semaphore(max(settings.ST_EXPAND_CONCURRENCY, 1))
 
-    def build_next_link(
+        async def fetch_expansion(expansion):
+            async with semaphore:
+                return await self.fetch_expansion(entities, expansion)
+
+        return list(await asyncio.gather(*(fetch_expansion(expansion) for expansion in expansions)))
+
+    async def encode_entity_stream(
             self,
+            entities,
+            count: Optional[int],
+            component: Type['BaseComponent'],
+            query_plan: QueryPlan,
             query_params: dict,
-            length: int,
-            count: Optional[int] = None
-    ):
+            seek: Optional[dict] = None
+    ) -> AsyncIterator[bytes]:
         """
-        Builds the next link for pagination.
+        Encode the entities returned by an engine's get method as a streamed collection response.
 
         Parameters
         ----------
-        query_params : dict
-            The current query parameters for pagination.
-        length : int
-            The length of the current result set.
-        count : int, optional
+        entities : Union[Iterable[dict], AsyncIterable[dict]]
+            A dictionary of entities keyed by ID, or an iterable or async iterable of entity dictionaries.
+        count : Optional[int]
             The total count of entities available.
+        component : Type[BaseComponent]
+            The component type of the entities.
+        query_plan : QueryPlan
+            The compiled query plan of the request.
+        query_params : dict
+            The query parameters of the request.
+        seek : Optional[dict], optional
+            The seek predicate the entities were fetched with, if the collection is paginated by cursor.
 
         Returns
         -------
-        Optional[str]
-            The constructed next link for pagination, or None if there are no more pages.
+        AsyncIterator[bytes]
+            The encoded chunks of the response.
         """
 
-        top = query_params.pop('top', None)
-        skip = query_params.pop('skip', None)
+        length = 0
+        last_entity = None
 
-        if top is None:
-            top = 100
+        yield self.encode_list_response_start(count=count, query_params=query_params)
 
-        if skip is None:
-            skip = 0
+        async for entity_batch in self.batch_entities_async(entities, settings.ST_STREAMING_BATCH_SIZE):
+            last_entity = next(reversed(entity_batch.values()))
+            yield self.encode_entity_batch(
+                entities=await self.assemble_expanded_entities(
+                    entities=entity_batch, component=component, query_plan=query_plan
+                ),
+                component=component,
+                separator=length > 0
+            )
+            length += len(entity_batch)
 
-        if count is not None and top + skip < count or count is None and top == length:
-            query_string = ListQueryParams(
-                top=top,
-                skip=top + skip,
-                **query_params
-            ).get_query_string()
+        if seek is not None:
+            self.request.next_skip_token = self.build_skip_token(seek=seek, entity=last_entity)
 
-            return f'{self.request.sensorthings_url}/{self.request.sensorthings_path}{query_string}'
-        else:
-            return None
+        yield self.encode_list_response_end(count=count, length=length, query_params=query_params)
 
-    def update_related_components(self, component: Type['BaseComponent'], related_entity_id: id_type):
+    @classmethod
+    async def batch_entities_async(cls, entities, batch_size: int) -> AsyncIterator[Dict[str, dict]]:
         """
-        Updates the related components of an entity.
+        Split engine entities, including async iterables of entities, into batches keyed by entity ID.
 
         Parameters
         ----------
-        component : Type['BaseComponent']
-            The component type of the related entity.
-        related_entity_id : id_type
-            The ID of the related entity.
+        entities : Union[Iterable[dict], AsyncIterable[dict]]
+            A dictionary of entities keyed by ID, or an iterable or async iterable of entity dictionaries.
+        batch_size : int
+            The maximum number of entities in each batch.
 
         Returns
         -------
-        None
+        AsyncIterator[Dict[str, dict]]
+            Dictionaries of at most batch_size entities keyed by their IDs.
         """
 
-        if component.__name__ == 'Datastream':
-            first_observation = next(iter(self.list_entities(
-                component=field_schemas.Observation,
-                query_params=ListQueryParams(
-                    select='',
-                    filters=f'Datastream/id eq \'{str(related_entity_id)}\'',
-                    expand='Datastream',
-                    order_by='phenomenonTime asc',
-                    top=1,
-                    count=False
-                ).dict()
-            )['value']), {})
-
-            last_observation = next(iter(self.list_entities(
-                component=field_schemas.Observation,
-                query_params=ListQueryParams(
-                    select='',
-                    filters=f'Datastream/id eq \'{str(related_entity_id)}\'',
-                    expand='Datastream',
-                    order_by='phenomenonTime desc',
-                    top=1,
-                    count=False
-                ).dict()
-            )['value']), {})
-
-            phenomenon_time_range = []
-            result_time_range = []
-
-            for observation in [first_observation, last_observation]:
-                if observation.get('phenomenon_time') is not None:
-                    phenomenon_time_range.append(isoparse(observation['phenomenon_time']).replace(tzinfo=pytz.UTC))
-                else:
-                    phenomenon_time_range.append(None)
-                if observation.get('result_time') is not None:
-                    result_time_range.append(isoparse(observation['result_time']).replace(tzinfo=pytz.UTC))
-                else:
-                    result_time_range.append(None)
-
-            phenomenon_time = self.iso_time_interval(phenomenon_time_range[0], phenomenon_time_range[1])
-            result_time = self.iso_time_interval(result_time_range[0], result_time_range[1])
-            phenomenon_time = phenomenon_time.replace('+00:00', 'Z') if phenomenon_time else None  # noqa
-            result_time = result_time.replace('+00:00', 'Z') if result_time else None  # noqa
-
-            self.update_entity(
-                component=field_schemas.Datastream,
-                entity_id=related_entity_id,
-                entity_body=DatastreamPatchBody(  # noqa
-                    phenomenon_time=phenomenon_time,
-                    result_time=result_time
-                )  # noqa
-            )
+        if not hasattr(entities, '__aiter__'):
+            for entity_batch in cls.batch_entities(entities, batch_size):
+                yield entity_batch
+            return
+
+        entity_batch = {}
+
+        async for entity in entities:
+            entity_batch[entity['id']] = entity
+            if len(entity_batch) >= batch_size:
+                yield entity_batch
+                entity_batch = {}
+
+        if entity_batch:
+            yield entity_batch
@@ -1,8 +1,16 @@
+import pytz
+import orjson
 from abc import ABCMeta, abstractmethod
-from typing import List, Union, Dict
+from typing import List, Union, Dict, Callable, Any, Iterable, Optional
+from datetime import datetime
 from itertools import groupby
+from pydantic import TypeAdapter
+from ninja.errors import HttpError
+from sensorthings.cache import response_cache
+from sensorthings.engine import engine_pipeline
 from sensorthings.schemas import EntityId
-from sensorthings.components.observations.schemas import ObservationPostBody
+from sensorthings.types.iso_string import validate_iso_time, validate_iso_interval
+from sensorthings.components.observations.schemas import Observation, ObservationPostBody
 from sensorthings.extensions.dataarray.schemas import ObservationDataArrayFields
 from .schemas import ObservationDataArrayPostBody
 from sensorthings import settings
@@ -11,6 +19,55 @@ from sensorthings import settings
 id_type = settings.ST_API_ID_TYPE
 id_qualifier = settings.ST_API_ID_QUALIFIER
 
+# Columnar values are coerced by the same field types as ObservationPostBody rows (e.g. numeric strings to results,
+# and UUID strings to UUID IDs).
+result_adapter = TypeAdapter(ObservationPostBody.model_fields['result'].annotation)
+id_adapter = TypeAdapter(EntityId.model_fields['id'].annotation)
+
+
+def validate_time_or_interval(value: str) -> str:
+    if isinstance(value, str) and '/' in value:
+        return validate_iso_interval(value)
+    return validate_iso_time(value)
+
+
+def validate_result(value: Any) -> float:
+    return result_adapter.validate_python(value)
+
+
+def validate_dict(value: Any) -> dict:
+    if not isinstance(value, dict):
+        raise TypeError('object required')
+    return value
+
+
+def validate_id(value: Any) -> id_type:
+    return id_adapter.validate_python(value)
+
+
+def format_time_value(value: Any) -> Any:
+    # Engine values are trusted and not validated again: datetimes are formatted as UTC ISO times, and stored UTC
+    # time strings only have their Z designator written as an offset, as the Observation response schema does.
+    if isinstance(value, datetime):
+        value = value.replace(tzinfo=pytz.UTC) if value.tzinfo is None else value.astimezone(pytz.UTC)
+        return value.isoformat(sep='T', timespec='seconds')
+    if isinstance(value, str):
+        return value.replace('Z', '+00:00')
+    return value
+
+
+# Data array components accepted by the columnar ingest path, mapped to their column names, whether the column is
+# required, and the validator applied to each value of the column.
+data_array_columns = {
+    'phenomenonTime': ('phenomenon_time', True, validate_time_or_interval),
+    'result': ('result', True, validate_result),
+    'resultTime': ('result_time', False, validate_iso_time),
+    'resultQuality': ('result_quality', False, validate_dict),
+    'validTime': ('valid_time', False, validate_iso_interval),
+    'parameters': ('parameters', False, validate_dict),
+    'FeatureOfInterest/id': ('feature_of_interest_id', False, validate_id),
+}
+
 
 class DataArrayBaseEngine(metaclass=ABCMeta):
 
@@ -59,20 +116,237 @@ class DataArrayBaseEngine(metaclass=ABCMeta):
             ] for data_array in observations
         }
 
-    def convert_to_data_array(
+    @staticmethod
+    def convert_from_data_array_columnar(
+            observations: List[ObservationDataArrayPostBody],
+    ) -> Dict[id_type, Dict[str, list]]:
+        """
+        Convert Observations data array to columns of validated values grouped by Datastream.
+
+        Each component of a data array is validated as a column in a single pass, without building an
+        ObservationPostBody for every row. Data arrays of the same Datastream are concatenated; columns that are
+        missing from one of them are filled with None. Engines receive these columns through their optional
+        create_observations_columnar method.
+
+        Parameters:
+        - observations ('ObservationDataArrayPostBody'): The entity body.
+
+        Returns:
+        - dict: Columns of Observation field values keyed by field name, grouped by Datastream.
+
+        Raises:
+        - HttpError: If a component is not supported, a row length does not match the components, or a value is
+          invalid.
+        """
+
+        datastream_columns = {}
+
+        for group_index, data_array in enumerate(observations):
+            unsupported_components = [
+                component for component in data_array.components if component not in data_array_columns
+            ]
+            if unsupported_components:
+                raise HttpError(422, f'Unsupported data array components: {", ".join(unsupported_components)}.')
+
+            missing_components = [
+                component for component, (_, required, _) in data_array_columns.items()
+                if required and component not in data_array.components
+            ]
+            if missing_components:
+                raise HttpError(422, f'Missing data array components: {", ".join(missing_components)}.')
+
+            if any(len(row) != len(data_array.components) for row in data_array.data_array):
+                raise HttpError(422, f'Data array {group_index} rows must have one value per component.')
+
+            columns = datastream_columns.setdefault(data_array.datastream.id, {})
+            row_count = len(next(iter(columns.values()), []))
+            group_row_count = len(data_array.data_array)
+
+            for column_index, column_values in enumerate(zip(*data_array.data_array)):
+                component = data_array.components[column_index]
+                field_name, required, validator = data_array_columns[component]
+                columns.setdefault(field_name, [None] * row_count).extend(
+                    DataArrayBaseEngine.validate_data_array_column(
+                        values=column_values, validator=validator, required=required, component=component
+                    )
+                )
+
+            for column in columns.values():
+                column.extend([None] * (row_count + group_row_count - len(column)))
+
+        return datastream_columns
+
+    @staticmethod
+    def validate_data_array_column(
+            values: tuple,
+            validator: Callable[[Any], Any],
+            required: bool,
+            component: str
+    ) -> list:
+        """
+        Validate all values of a data array column.
+
+        Parameters:
+        - values (tuple): The values of the column.
+        - validator (Callable): The validator of a single value.
+        - required (bool): Whether null values are rejected.
+        - component (str): The data array component of the column.
+
+        Returns:
+        - list: The validated values.
+        """
+
+        if required and any(value is None for value in values):
+            raise HttpError(422, f'Data array component {component} must not be null.')
+
+        try:
+            return [None if value is None else validator(value) for value in values]
+        except (TypeError, ValueError, OverflowError) as e:
+            raise HttpError(422, f'Invalid data array value for component {component}: {e}')
+
+    @engine_pipeline
+    def list_data_array(self, query_params: dict) -> dict:
+        """
+        List Observations in data array format.
+
+        Only the selected data array components are requested from the engine. Rows are grouped by Datastream in a
+        single pass and the response is encoded directly, without building response entities or validating them
+        against the response schema. The encoded response is returned through the request's 'response_string', the
+        same way cached responses are.
+
+        Parameters:
+        - query_params (dict): The query parameters of the request.
+
+        Returns:
+        - dict: An empty list response standing in for the encoded response, or a 304 Not Modified response.
+        """
+
+        not_modified_response = yield self.check_conditional_request(  # noqa
+            component=Observation, query_params=query_params
+        )
+        if not_modified_response is not None:
+            return not_modified_response
+
+        if (yield self.load_cached_response(component=Observation, query_params=query_params)):  # noqa
+            return {'value': []}
+
+        get_method, get_method_kwargs, fields = self.prepare_data_array_query(
+            query_params=query_params,
+            nested_entity_id=(yield self.check_nested_path())  # noqa
+        )
+        entities, count = yield get_method(**get_method_kwargs)
+        entities = yield self.collect_entities(entities)  # noqa
+
+        response_string = self.encode_data_array_response(
+            entities=entities.values(),
+            count=count,
+            fields=fields,
+            query_params=query_params,
+            seek=get_method_kwargs.get('seek')
+        )
+
+        if getattr(self.request, 'response_cache_key', None):  # noqa
+            yield self.run_blocking(response_cache.set, self.request.response_cache_key, response_string)  # noqa
+
+        self.request.response_string = response_string  # noqa
+
+        return {'value': []}
+
+    def prepare_data_array_query(self, query_params: dict, nested_entity_id: Optional[id_type]) -> tuple:
+        """
+        Compile a data array request into a call to the engine's get_observations method.
+
+        Parameters:
+        - query_params (dict): The query parameters of the request.
+        - nested_entity_id (Optional[id_type]): The ID of the parent entity of a nested resource path.
+
+        Returns:
+        - tuple: The get method, its keyword arguments, and the Observation fields of the data array components.
+        """
+
+        fields = self.get_data_array_fields(query_params.get('select'))
+        _, get_method, get_method_kwargs = self.prepare_get_method(  # noqa
+            component=Observation,
+            query_params=query_params,
+            key_constraints=self.build_nested_key_constraints(nested_entity_id=nested_entity_id),  # noqa
+            paginate_by_cursor=True
+        )
+
+        if self.engine_method_accepts('get_observations', 'fields'):  # noqa
+            get_method_kwargs['fields'] = sorted({
+                'id', 'datastream_id', *fields,
+                *(seek_field['field'] for seek_field in get_method_kwargs.get('seek', {}).get('fields', []))
+            })
+
+        return get_method, get_method_kwargs, fields
+
+    def encode_data_array_response(
             self,
-            response: dict,
-            select: Union[str, None] = None
-    ) -> dict:
+            entities: Iterable[dict],
+            count: Optional[int],
+            fields: List[str],
+            query_params: dict,
+            seek: Optional[dict] = None
+    ) -> bytes:
         """
-        Convert Observations response to a data array.
+        Group Observation rows by Datastream and encode them as a data array response.
+
+        Time values returned by the engine are formatted without being validated again (see format_time_value).
+
+        Parameters:
+        - entities (Iterable[dict]): The Observations returned by the engine.
+        - count (Optional[int]): The total count of Observations available.
+        - fields (List[str]): The Observation fields of the data array components.
+        - query_params (dict): The query parameters of the request.
+        - seek (Optional[dict]): The seek predicate passed to the engine, if the response is paginated by cursor.
+
+        Returns:
+        - bytes: The encoded response.
+        """
+
+        time_fields = {'phenomenon_time', 'result_time', 'valid_time'}
+        field_encoders = [(field, field in time_fields) for field in fields]
+        data_arrays = {}
+        length = 0
+        last_entity = None
+
+        for entity in entities:
+            data_arrays.setdefault(entity['datastream_id'], []).append([
+                format_time_value(entity.get(field)) if is_time_field else entity.get(field)
+                for field, is_time_field in field_encoders
+            ])
+            length += 1
+            last_entity = entity
+
+        if seek is not None:
+            self.request.next_skip_token = self.build_skip_token(seek=seek, entity=last_entity)  # noqa
+
+        components = [
+            '@iot.id' if field == 'id' else ObservationDataArrayFields.model_fields[field].alias for field in fields
+        ]
+        return b''.join([
+            self.encode_list_response_start(count=count, query_params=query_params),  # noqa
+            b','.join(
+                orjson.dumps({
+                    'Datastream@iot.navigationLink': f'{self.request.sensorthings_url}/'  # noqa
+                                                     f'Datastreams({id_qualifier}{datastream_id}{id_qualifier})',
+                    'components': components,
+                    'dataArray': data_array
+                }) for datastream_id, data_array in data_arrays.items()
+            ),
+            self.encode_list_response_end(count=count, length=length, query_params=query_params)  # noqa
+        ])
+
+    @staticmethod
+    def get_data_array_fields(select: Union[str, None] = None) -> List[str]:
+        """
+        Get the Observation fields included in a data array response.
 
         Parameters:
-        - response (dict): The response dictionary.
         - select (Union[str, None]): Optional parameter to select specific fields.
 
         Returns:
-        - dict: The converted data array response.
+        - List[str]: The selected Observation fields, in data array component order.
         """
 
         if select:
@@ -87,6 +361,26 @@ class DataArrayBaseEngine(metaclass=ABCMeta):
                 field for field in ObservationDataArrayFields.model_fields if field in ['phenomenon_time', 'result']
             ]
 
+        return selected_fields
+
+    def convert_to_data_array(
+            self,
+            response: dict,
+            select: Union[str, None] = None
+    ) -> dict:
+        """
+        Convert Observations response to a data array.
+
+        Parameters:
+        - response (dict): The response dictionary.
+        - select (Union[str, None]): Optional parameter to select specific fields.
+
+        Returns:
+        - dict: The converted data array response.
+        """
+
+        selected_fields = self.get_data_array_fields(select)
+
         response['value'] = [
             {
                 'datastream_id': datastream_id,
@@ -3,7 +3,6 @@ from sensorthings import settings
 from sensorthings.router import SensorThingsRouter
 from sensorthings.http import SensorThingsHttpRequest
 from sensorthings.factories import SensorThingsEndpointFactory, SensorThingsEndpointHookFactory
-from sensorthings.components.datastreams.schemas import Datastream
 from sensorthings.components.observations.schemas import Observation
 from sensorthings.extensions.dataarray.schemas import (ObservationDataArrayPostBody, ObservationQueryParams,
                                                        ObservationListResponse)
@@ -29,18 +28,21 @@ def create_observations(
       Create Entities</a>
     """
 
-    observation_ids = request.engine.create_observations( # noqa
-        observations=request.engine.convert_from_data_array(observations) # noqa
-    )
+    if callable(getattr(request.engine, 'create_observations_columnar', None)):
+        observation_ids = yield request.engine.create_observations_columnar( # noqa
+            observations=request.engine.convert_from_data_array_columnar(observations) # noqa
+        )
+    else:
+        observation_ids = yield request.engine.create_observations( # noqa
+            observations=request.engine.convert_from_data_array(observations) # noqa
+        )
+    yield request.engine.invalidate_cached_responses(component=Observation, entity_ids=[])
 
     datastream_ids = list(set([
         observation_group.datastream.id for observation_group in observations
     ]))
 
-    for datastream_id in datastream_ids:
-        request.engine.update_related_components(
-            component=Datastream, related_entity_id=datastream_id
-        )
+    yield request.engine.update_datastream_time_bounds(datastream_ids=datastream_ids)
 
     observation_links = [
         request.engine.build_ref_link(Observation, observation_id)
@@ -52,13 +54,9 @@ def create_observations(
 
 def serialize_data_array(view_function):
     def wrapper(*args, **kwargs):
-        response = view_function(*args, **kwargs)
         if getattr(kwargs['params'], 'result_format', None) == 'dataArray':
-            response = args[0].engine.convert_to_data_array( # noqa
-                response=response,
-                select=getattr(kwargs['params'], 'select', None)
-            )
-        return response
+            return args[0].engine.list_data_array(query_params=kwargs['params'].dict())  # noqa
+        return view_function(*args, **kwargs)
     return wrapper
 
 
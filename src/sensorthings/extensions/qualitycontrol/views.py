@@ -3,7 +3,7 @@ from sensorthings import settings
 from sensorthings.router import SensorThingsRouter
 from sensorthings.http import SensorThingsHttpRequest
 from sensorthings.factories import SensorThingsEndpointFactory
-from sensorthings.components.datastreams.schemas import Datastream
+from sensorthings.components.observations.schemas import Observation
 from sensorthings.extensions.qualitycontrol.schemas import DeleteObservationsPostBody
 from sensorthings.types.iso_string import parse_iso_interval
 from sensorthings.schemas import PermissionDenied
@@ -26,20 +26,19 @@ def delete_observations(
             parse_iso_interval(datastream.phenomenon_time)
             if datastream.phenomenon_time else (None, None)
         )
-        request.engine.delete_observations( # noqa
+        yield request.engine.delete_observations( # noqa
             datastream_id=datastream.datastream.id,
             start_time=start_time,
             end_time=end_time
         )
 
+    yield request.engine.invalidate_cached_responses(component=Observation)
+
     datastream_ids = list(set([
         datastream.datastream.id for datastream in datastreams
     ]))
 
-    for datastream_id in datastream_ids:
-        request.engine.update_related_components(
-            component=Datastream, related_entity_id=datastream_id
-        )
+    yield request.engine.update_datastream_time_bounds(datastream_ids=datastream_ids)
 
     return 204, None
 
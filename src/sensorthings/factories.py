@@ -1,7 +1,12 @@
+import inspect
 from ninja import Schema
-from typing import Type, Optional, List, Callable, Union
+from typing import TYPE_CHECKING, Type, Optional, List, Callable, Union
 from dataclasses import dataclass
 from sensorthings.router import SensorThingsRouter
+from sensorthings.http import SensorThingsHttpRequest
+
+if TYPE_CHECKING:
+    from sensorthings.schemas import BaseComponent
 
 
 @dataclass
@@ -38,3 +43,68 @@ class SensorThingsEndpointHookFactory:
     view_body_schema: Optional[Type[Schema]] = None
     view_response_schema: Optional[Type[Schema]] = None
     view_response_override: Optional[dict] = None
+
+
+def build_create_entities_endpoint(
+        router_name: str,
+        component: Type['BaseComponent'],
+        post_body_schema: Type[Schema]
+) -> SensorThingsEndpointFactory:
+    """
+    Build the bulk create endpoint of a component (e.g. POST /CreateThings).
+
+    Parameters
+    ----------
+    router_name : str
+        The name of the component's router.
+    component : Type[BaseComponent]
+        The component type to create.
+    post_body_schema : Type[Schema]
+        The POST body schema of a single entity of the component.
+
+    Returns
+    -------
+    SensorThingsEndpointFactory
+        The endpoint creating a list of entities in one transaction, and responding with their self links.
+    """
+
+    name_ref = component.model_config['json_schema_extra']['name_ref']
+    title = ' '.join(word if word == 'of' else word.capitalize() for word in name_ref[1].split('_'))
+    model_path = name_ref[1].replace('_', '-')
+
+    def create_entities(request: SensorThingsHttpRequest, **entity_bodies):
+        entity_ids = yield request.engine.create_entities(
+            component=component,
+            entity_body=entity_bodies[name_ref[2]]
+        )
+
+        return 201, [
+            request.engine.build_ref_link(component, entity_id) for entity_id in entity_ids
+        ]
+
+    # The view is named and documented like the other views of the component, and takes the list of entity bodies
+    # as a parameter named after the component (e.g. things), so the generated OpenAPI operation is unchanged.
+    create_entities.__signature__ = inspect.Signature([
+        inspect.Parameter('request', inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=SensorThingsHttpRequest),
+        inspect.Parameter(name_ref[2], inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=List[post_body_schema])
+    ])
+    create_entities.__name__ = create_entities.__qualname__ = f'create_{name_ref[2]}'
+    create_entities.__module__ = component.__module__.replace('.schemas', '.views')
+    create_entities.__doc__ = f"""
+    Create new {title} entities.
+
+    Links:
+    <a href="http://www.opengis.net/spec/iot_sensing/1.1/req/datamodel/{model_path}/properties" target="_blank">\\
+      {title} Properties</a> -
+    <a href="http://www.opengis.net/spec/iot_sensing/1.1/req/datamodel/{model_path}/relations" target="_blank">\\
+      {title} Relations</a> -
+    <a href="http://www.opengis.net/spec/iot_sensing/1.1/req/create-update-delete/create-entity" target="_blank">\\
+      Create Entity</a>
+    """
+
+    return SensorThingsEndpointFactory(
+        router_name=router_name,
+        endpoint_route=f'/Create{name_ref[0]}',
+        view_function=create_entities,
+        view_method=SensorThingsRouter.st_post,
+    )
@@ -27,6 +27,18 @@ class SensorThingsHttpRequest(HttpRequest):
         Indicates whether the response is a reference.
     value_response : bool
         Indicates whether the response is a value.
+    stream_response : bool
+        Indicates whether list responses should be streamed.
+    response_cache_key : Optional[str]
+        The key to store the rendered response under in the response cache, if any.
+    conditional_response : bool
+        Indicates whether the request is a conditional GET request.
+    response_etag : Optional[str]
+        The ETag of the response computed from the engine's version token, if any.
+    response_last_modified : Optional[int]
+        The last modification time of the response supplied by the engine, as a POSIX timestamp, if any.
+    next_skip_token : Optional[str]
+        The $skiptoken cursor of the next page, set if the collection was fetched with cursor pagination.
     """
 
     sensorthings_url: AnyHttpUrlString
@@ -35,3 +47,9 @@ class SensorThingsHttpRequest(HttpRequest):
     nested_path: List[Tuple[BaseComponent, Optional[ST_API_ID_TYPE]]]
     ref_response: bool
     value_response: bool
+    stream_response: bool
+    response_cache_key: Optional[str]
+    conditional_response: bool
+    response_etag: Optional[str]
+    response_last_modified: Optional[int]
+    next_skip_token: Optional[str]
@@ -0,0 +1,119 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Type
+from sensorthings.schemas import BasePostBody, EntityId
+
+if TYPE_CHECKING:
+    from sensorthings.schemas import BaseComponent
+
+
+@dataclass(eq=False)
+class InsertNode:
+    """
+    A new entity of a deep insert request.
+
+    Related entities that are created in the same request are referenced by their insert nodes until they have been
+    created, and are replaced with their entity IDs when the body of the entity is built.
+
+    Attributes
+    ----------
+    component : Type[BaseComponent]
+        The component type of the entity.
+    body_class : Type[BasePostBody]
+        The POST body schema of the component.
+    values : dict
+        The field values of the entity body.
+    fields_set : Set[str]
+        The names of the fields set in the entity body.
+    dependencies : List[InsertNode]
+        The nodes of the new entities that must be created before this entity.
+    entity_id : Any
+        The ID of the entity, once it has been created.
+    """
+
+    component: Type['BaseComponent']
+    body_class: Type[BasePostBody]
+    values: Dict[str, Any]
+    fields_set: Set[str]
+    dependencies: List['InsertNode'] = field(default_factory=list)
+    entity_id: Any = None
+
+    @property
+    def depth(self) -> int:
+        """
+        The length of the longest chain of new entities that must be created before this entity.
+
+        Returns
+        -------
+        int
+            Zero if the entity depends on no other new entities.
+        """
+
+        return max((dependency.depth + 1 for dependency in self.dependencies), default=0)
+
+    def build_body(self) -> BasePostBody:
+        """
+        Builds the POST body of the entity, linking the new entities it depends on by their IDs.
+
+        Returns
+        -------
+        BasePostBody
+            The entity body passed to the engine.
+        """
+
+        return self.body_class.model_construct(
+            _fields_set=self.fields_set,
+            **{field_name: resolve_insert_value(value) for field_name, value in self.values.items()}
+        )
+
+
+def resolve_insert_value(value: Any) -> Any:
+    """
+    Replaces the insert nodes in a relation value with the IDs of the created entities.
+
+    Parameters
+    ----------
+    value : Any
+        A field value of an entity body.
+
+    Returns
+    -------
+    Any
+        The field value with insert nodes replaced with entity IDs.
+    """
+
+    if isinstance(value, InsertNode):
+        return EntityId(id=value.entity_id)
+    elif isinstance(value, list):
+        return [resolve_insert_value(item) for item in value]
+    else:
+        return value
+
+
+def has_nested_entities(entity_body: Optional[BasePostBody]) -> bool:
+    """
+    Checks whether an entity body contains new related entities to create with it.
+
+    Parameters
+    ----------
+    entity_body : Optional[BasePostBody]
+        The entity body to check.
+
+    Returns
+    -------
+    bool
+        Whether any relation of the entity body is a nested entity body rather than an entity ID.
+    """
+
+    if entity_body is None:
+        return False
+
+    for field_name, field_info in type(entity_body).model_fields.items():
+        if not field_info.json_schema_extra or 'nested_class' not in field_info.json_schema_extra:
+            continue
+
+        value = getattr(entity_body, field_name)
+
+        if any(isinstance(item, BasePostBody) for item in (value if isinstance(value, list) else [value])):
+            return True
+
+    return False
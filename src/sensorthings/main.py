@@ -1,13 +1,20 @@
 import functools
+import inspect
 import types
 from copy import deepcopy
 from dataclasses import dataclass
 from typing import Type, NewType, List, Optional, Literal
 from django.urls import re_path
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, set_response_etag
+from django.utils.http import http_date
+from asgiref.sync import iscoroutinefunction
 from ninja import NinjaAPI, Router
-from sensorthings.engine import SensorThingsBaseEngine
+from sensorthings.engine import SensorThingsBaseEngine, SensorThingsBaseAsyncEngine
 from sensorthings.renderer import SensorThingsRenderer
 from sensorthings.router import SensorThingsRouter
+from sensorthings.workers import observation_buffer
+from sensorthings import settings
 from sensorthings.factories import (SensorThingsRouterFactory, SensorThingsEndpointFactory,
                                     SensorThingsEndpointHookFactory)
 from sensorthings.components.root.views import router as root_router, handle_advanced_path
@@ -40,6 +47,7 @@ class SensorThingsAPI(NinjaAPI):
 
         self.routers = {}
         self.engine = engine
+        self.is_async_engine = engine is not None and issubclass(engine, SensorThingsBaseAsyncEngine)
         self.get_response_schemas = {}
         self.extensions = extensions or []
         self.handle_advanced_path = self._copy_view(handle_advanced_path)
@@ -48,6 +56,35 @@ class SensorThingsAPI(NinjaAPI):
         self._initialize_default_routers()
         self.handle_advanced_path.__api__ = self
 
+        # Recover Observations left in the Observation buffer journal by a previous process
+        if engine is not None and settings.ST_OBSERVATION_BUFFER is True:
+            observation_buffer.recover(engine_class=engine, get_response_schemas=self.get_response_schemas)
+
+    def create_response(self, request, data, *, status=None, temporal_response=None) -> HttpResponse:
+        """
+        Render a response, answering conditional GET requests with 304 Not Modified when their validators match.
+
+        Successful responses of conditional requests use the ETag and Last-Modified validators computed by the engine
+        from its version tokens if it supplied any, or a strong ETag hashed from the rendered body otherwise.
+        """
+
+        response = super().create_response(request, data, status=status, temporal_response=temporal_response)
+
+        if getattr(request, 'conditional_response', False) is not True or response.status_code != 200:
+            return response
+
+        if getattr(request, 'response_etag', None):
+            response['ETag'] = request.response_etag
+        else:
+            set_response_etag(response)
+
+        last_modified = getattr(request, 'response_last_modified', None)
+
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+
+        return get_conditional_response(request, etag=response['ETag'], last_modified=last_modified, response=response)
+
     def _stage_routers(self):
         """
         Stage routers for SensorThings components and extensions.
@@ -127,6 +164,9 @@ class SensorThingsAPI(NinjaAPI):
         # Store response schemas for GET requests
         self._store_get_response_schema(endpoint.view_response_schema)
 
+        # Run the engine calls of the view with the engine's pipeline driver
+        view_function = self._run_view_pipeline(endpoint.view_function)
+
         # Add endpoint to the router
         getattr(st_router, endpoint.view_method.__name__)(
             endpoint.endpoint_route,
@@ -135,7 +175,7 @@ class SensorThingsAPI(NinjaAPI):
             response_dict=endpoint.view_response_override,
             deprecated=not endpoint.enabled,
             auth=endpoint.view_authentication
-        )(self._apply_authorization(endpoint.view_function, endpoint.view_authorization or []))
+        )(self._apply_authorization(view_function, endpoint.view_authorization or []))
 
     def _apply_endpoint_hook(self, extension, name, endpoint):
         """
@@ -175,6 +215,32 @@ class SensorThingsAPI(NinjaAPI):
 
         return wrapped_view
 
+    def _run_view_pipeline(self, view_function):
+        """
+        Wrap a view function to run the engine calls it yields with the engine's pipeline driver.
+
+        View functions are shared by sync and async engines. A view either returns the result of an engine method,
+        which is a coroutine for async engines, or is a generator yielding the engine calls whose results it uses (see
+        sensorthings.engine.engine_pipeline). Views of async engines are wrapped as coroutine functions.
+        """
+
+        if self.is_async_engine:
+            @functools.wraps(view_function)
+            async def async_pipeline_view(*args, **kwargs):
+                response = view_function(*args, **kwargs)
+                if inspect.isgenerator(response):
+                    return await self.engine.run_pipeline(response)
+                return await response if inspect.isawaitable(response) else response
+
+            return async_pipeline_view
+
+        @functools.wraps(view_function)
+        def pipeline_view(*args, **kwargs):
+            response = view_function(*args, **kwargs)
+            return self.engine.run_pipeline(response) if inspect.isgenerator(response) else response
+
+        return pipeline_view
+
     def _store_get_response_schema(self, response_schema):
         """
         Store GET response schemas for later use.
@@ -198,6 +264,16 @@ class SensorThingsAPI(NinjaAPI):
         Wrap view function with authorization checks.
         """
 
+        if iscoroutinefunction(view_func):
+            @functools.wraps(view_func)
+            async def async_auth_wrapper(*args, **kwargs):
+                for auth_callback in auth_callbacks:
+                    if auth_callback(*args, **kwargs) is not True:
+                        return 403, {'detail': 'Forbidden'}
+                return await view_func(*args, **kwargs)
+
+            return async_auth_wrapper
+
         @functools.wraps(view_func)
         def auth_wrapper(*args, **kwargs):
             for auth_callback in auth_callbacks:
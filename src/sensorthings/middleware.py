@@ -1,6 +1,8 @@
 import sensorthings.components.field_schemas as component_field_schemas
+from copy import copy
 from uuid import UUID
 from typing import ForwardRef
+from asgiref.sync import async_to_sync, sync_to_async, iscoroutinefunction
 from django.utils.deprecation import MiddlewareMixin
 from django.http import HttpRequest
 from django.urls import resolve
@@ -20,6 +22,13 @@ class SensorThingsMiddleware(MiddlewareMixin):
     This middleware attaches the SensorThings engine to the request and handles advanced paths.
     """
 
+    def __init__(self, get_response):
+        super().__init__(get_response)
+
+        # Swap in the async view processor when the middleware chain is running in async mode.
+        if iscoroutinefunction(self):
+            self.process_view = self.process_view_async
+
     def process_view(self, request: HttpRequest, view_func, view_args, view_kwargs):
         """
         Process the view before it is called.
@@ -41,6 +50,66 @@ class SensorThingsMiddleware(MiddlewareMixin):
             The view function to be called, or None if no processing is needed.
         """
 
+        view_func = self.prepare_view(request=request, view_func=view_func)
+
+        if view_func is None:
+            return None
+
+        # Call the updated view function, running async views in their own event loop.
+        if iscoroutinefunction(view_func):
+            return async_to_sync(view_func)(request, *view_args, **request.resolver_match.kwargs)
+
+        return view_func(request, *view_args, **request.resolver_match.kwargs)
+
+    async def process_view_async(self, request: HttpRequest, view_func, view_args, view_kwargs):
+        """
+        Process the view before it is called, when the middleware chain is running in async mode.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The current HTTP request.
+        view_func : Callable
+            The view function that will be called.
+        view_args : tuple
+            The positional arguments for the view function.
+        view_kwargs : dict
+            The keyword arguments for the view function.
+
+        Returns
+        -------
+        Callable or None
+            The view function to be called, or None if no processing is needed.
+        """
+
+        view_func = self.prepare_view(request=request, view_func=view_func)
+
+        if view_func is None:
+            return None
+
+        # Call the updated view function, running sync views in a thread.
+        if not iscoroutinefunction(view_func):
+            view_func = sync_to_async(view_func, thread_sensitive=True)
+
+        return await view_func(request, *view_args, **request.resolver_match.kwargs)
+
+    def prepare_view(self, request: HttpRequest, view_func):
+        """
+        Attach the SensorThings engine to the request and resolve the view for advanced paths.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The current HTTP request.
+        view_func : Callable
+            The view function that will be called.
+
+        Returns
+        -------
+        Callable or None
+            The view function to be called, or None if the request is not part of the SensorThings API.
+        """
+
         # Check that the request resolved to part of the SensorThings API.
         if not hasattr(request, 'resolver_match') or (not any(
             namespace.endswith(('sensorthings-v1.0-api', 'sensorthings-v1.1-api'))
@@ -48,15 +117,21 @@ class SensorThingsMiddleware(MiddlewareMixin):
         )) or request.resolver_match.url_name in ['openapi-view', 'openapi-json']:
             return None
 
-        # Attach the SensorThings engine to the request.
+        # Attach the SensorThings engine to the request, sharing the engine of the batch request for sub-requests.
         sensorthings_api = getattr(view_func, '__api__', None) or view_func.__self__.api
-        request.engine = sensorthings_api.engine(
-            request=request,
-            get_response_schemas=sensorthings_api.get_response_schemas,
-        )
+        batch_engine = getattr(request, 'batch_engine', None)
+        if type(batch_engine) is sensorthings_api.engine:
+            request.engine = copy(batch_engine)
+            request.engine.request = request
+        else:
+            request.engine = sensorthings_api.engine(
+                request=request,
+                get_response_schemas=sensorthings_api.get_response_schemas,
+            )
         request.nested_path = []
         request.ref_response = False
         request.value_response = False
+        request.stream_response = settings.ST_STREAMING_RESPONSES is True and request.method == 'GET'
 
         # Attempt to resolve advanced SensorThings paths (e.g. nested resource paths, addresses to values, etc.)
         if request.resolver_match.url_name == 'advanced_path_handler':
@@ -73,8 +148,7 @@ class SensorThingsMiddleware(MiddlewareMixin):
             request.path_info.split('/')[len(request.resolver_match.route.split('/')):]
         )
 
-        # Call the updated view function.
-        return view_func(request, *view_args, **request.resolver_match.kwargs)
+        return view_func
 
     def handle_advanced_path(self, request: HttpRequest):
         """
@@ -120,7 +194,7 @@ class SensorThingsMiddleware(MiddlewareMixin):
                     request.nested_path.append((  # noqa
                         self.get_component_model_from_path(path_component),
                         next(iter(effective_resolved_path.kwargs.items()))[0],
-                        next(iter(effective_resolved_path.kwargs.items()))[1],
+                        self.get_typed_id(next(iter(effective_resolved_path.kwargs.items()))[1]),
                     ))
                 else:
                     raise Http404
@@ -203,6 +277,32 @@ class SensorThingsMiddleware(MiddlewareMixin):
                 ).get('json_schema_extra', {}).get('name_ref', (None,))[0] == path_component
             )
 
+    @staticmethod
+    def get_typed_id(entity_id: str):
+        """
+        Convert an entity ID parsed from a resource path to the configured ID type.
+
+        Parameters
+        ----------
+        entity_id : str
+            The entity ID as it appears in the path.
+
+        Returns
+        -------
+        Union[str, int, UUID]
+            The entity ID converted to the configured ID type.
+
+        Raises
+        ------
+        Http404
+            If the entity ID cannot be converted to the configured ID type.
+        """
+
+        try:
+            return id_type(entity_id)
+        except (TypeError, ValueError):
+            raise Http404
+
     @staticmethod
     def get_placeholder_id():
         """
@@ -0,0 +1,120 @@
+from threading import Lock
+from collections import OrderedDict, namedtuple
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Optional, Tuple
+from sensorthings import settings
+
+
+QueryPlanCacheInfo = namedtuple('QueryPlanCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """
+    A precompiled set of query options for a component.
+
+    Query plans are shared between requests and must be treated as read-only.
+
+    Attributes
+    ----------
+    filters : Optional[Any]
+        The parsed OData filter AST, or None if no filters were given.
+    expand : dict
+        The parsed expand tree, mapping related component names to their component and nested query parameters.
+    ordering : Tuple[dict]
+        The parsed ordering fields and directions.
+    unselected_fields : FrozenSet[str]
+        The response fields excluded by the select parameter.
+    projection : Optional[FrozenSet[str]]
+        The engine fields needed to answer the query, or None if all fields are needed.
+    """
+
+    filters: Optional[Any] = None
+    expand: Dict[str, dict] = field(default_factory=dict)
+    ordering: Tuple[dict, ...] = ()
+    unselected_fields: FrozenSet[str] = frozenset()
+    projection: Optional[FrozenSet[str]] = None
+
+
+class QueryPlanCache:
+    """
+    A bounded, thread-safe LRU cache of compiled query plans.
+
+    Attributes
+    ----------
+    maxsize : int
+        The maximum number of plans to keep. A value of zero disables caching.
+    hits : int
+        The number of lookups answered from the cache.
+    misses : int
+        The number of lookups that required compiling a new plan.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._plans = OrderedDict()
+        self._lock = Lock()
+
+    def get_or_compile(self, key: Hashable, compile_plan: Callable[[], QueryPlan]) -> QueryPlan:
+        """
+        Return the cached plan for a key, compiling and storing it on a miss.
+
+        Parameters
+        ----------
+        key : Hashable
+            The normalized query options identifying the plan.
+        compile_plan : Callable[[], QueryPlan]
+            A function that compiles the plan if it is not cached.
+
+        Returns
+        -------
+        QueryPlan
+            The compiled query plan.
+        """
+
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                self.hits += 1
+                return plan
+            self.misses += 1
+
+        plan = compile_plan()
+
+        if self.maxsize > 0:
+            with self._lock:
+                self._plans[key] = plan
+                self._plans.move_to_end(key)
+                while len(self._plans) > self.maxsize:
+                    self._plans.popitem(last=False)
+
+        return plan
+
+    def info(self) -> QueryPlanCacheInfo:
+        """
+        Report cache statistics.
+
+        Returns
+        -------
+        QueryPlanCacheInfo
+            The hit and miss counts and the maximum and current sizes of the cache.
+        """
+
+        with self._lock:
+            return QueryPlanCacheInfo(self.hits, self.misses, self.maxsize, len(self._plans))
+
+    def clear(self):
+        """
+        Remove all cached plans and reset the hit and miss counters.
+        """
+
+        with self._lock:
+            self._plans.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+query_plan_cache = QueryPlanCache(maxsize=settings.ST_QUERY_PLAN_CACHE_SIZE)
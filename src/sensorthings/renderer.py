@@ -1,5 +1,7 @@
 import orjson
+import asyncio
 from ninja.renderers import BaseRenderer
+from sensorthings.cache import response_cache
 
 
 class SensorThingsRenderer(BaseRenderer):
@@ -7,7 +9,9 @@ class SensorThingsRenderer(BaseRenderer):
     A custom JSON renderer for the SensorThings API.
 
     This renderer checks if the request object has a pre-defined 'response_string' attribute.
-    If so, it uses this string as the response. Otherwise, it defaults to the standard JSON rendering.
+    If so, it uses this string as the response. Otherwise, it defaults to the standard JSON rendering, and stores
+    successful responses in the response cache if the engine attached a 'response_cache_key' to the request. Responses
+    of async views are rendered inside the event loop, so they are stored in the loop's default executor instead.
     """
 
     media_type = "application/json"
@@ -31,8 +35,17 @@ class SensorThingsRenderer(BaseRenderer):
             The rendered response string, either from 'response_string' attribute or standard JSON rendering.
         """
 
-        return getattr(
-            request,
-            'response_string',
-            orjson.dumps(data)
-        )
+        if hasattr(request, 'response_string'):
+            return request.response_string
+
+        response_string = orjson.dumps(data)
+
+        if response_status == 200 and getattr(request, 'response_cache_key', None):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                response_cache.set(request.response_cache_key, response_string)
+            else:
+                loop.run_in_executor(None, response_cache.set, request.response_cache_key, response_string)
+
+        return response_string
@@ -1,5 +1,7 @@
+import functools
 from ninja import Router
-from typing import Union, List, Type, Optional
+from asgiref.sync import iscoroutinefunction
+from typing import Union, List, Type, Optional, Callable
 from sensorthings.schemas import PermissionDenied, EntityNotFound
 from sensorthings.types import AnyHttpUrlString
 
@@ -26,10 +28,10 @@ class SensorThingsRouter(Router):
         Returns
         -------
         callable
-            The endpoint decorated as a GET operation.
+            The endpoint decorated as a conditional GET operation.
         """
 
-        return super(SensorThingsRouter, self).get(
+        return self.conditional_get(super(SensorThingsRouter, self).get(
             route,
             *args,
             response=response_dict or {
@@ -38,7 +40,7 @@ class SensorThingsRouter(Router):
             by_alias=True,
             exclude_unset=True,
             **kwargs
-        )
+        ))
 
     def st_get(self, route, response_schema, response_dict: Optional[dict] = None, *args, **kwargs):
         """
@@ -56,10 +58,10 @@ class SensorThingsRouter(Router):
         Returns
         -------
         callable
-            The endpoint decorated as a GET operation.
+            The endpoint decorated as a conditional GET operation.
         """
 
-        return super(SensorThingsRouter, self).get(
+        return self.conditional_get(super(SensorThingsRouter, self).get(
             route,
             *args,
             response=response_dict or {
@@ -70,7 +72,45 @@ class SensorThingsRouter(Router):
             by_alias=True,
             exclude_unset=True,
             **kwargs
-        )
+        ))
+
+    @staticmethod
+    def conditional_get(operation_decorator: Callable) -> Callable:
+        """
+        Mark the requests of a GET endpoint as conditional.
+
+        Successful responses of conditional requests are given an ETag, and requests whose If-None-Match header
+        matches it are answered with 304 Not Modified. See SensorThingsAPI.create_response and
+        SensorThingsBaseEngine.check_conditional_request.
+
+        Parameters
+        ----------
+        operation_decorator : callable
+            The decorator registering the view function as a GET operation.
+
+        Returns
+        -------
+        callable
+            The decorator registering the view function as a conditional GET operation.
+        """
+
+        def decorator(view_func):
+            if iscoroutinefunction(view_func):
+                @functools.wraps(view_func)
+                async def async_conditional_view(request, *args, **kwargs):
+                    request.conditional_response = True
+                    return await view_func(request, *args, **kwargs)
+
+                return operation_decorator(async_conditional_view)
+
+            @functools.wraps(view_func)
+            def conditional_view(request, *args, **kwargs):
+                request.conditional_response = True
+                return view_func(request, *args, **kwargs)
+
+            return operation_decorator(conditional_view)
+
+        return decorator
 
     def st_post(self, route, response_dict: Optional[dict] = None, *args, **kwargs):
         """
@@ -196,6 +196,8 @@ class ListQueryParams(GetQueryParams):
         The skip parameter, aliased as '$skip'.
     top : int
         The top parameter, aliased as '$top'.
+    skip_token : str
+        The opaque pagination cursor of a next link, aliased as '$skiptoken'.
     select : str
         The select parameter, aliased as '$select'.
     """
@@ -207,6 +209,7 @@ class ListQueryParams(GetQueryParams):
     order_by: Optional[str] = Field(None, alias='$orderby')
     skip: Optional[int] = Field(0, alias='$skip')
     top: Optional[int] = Field(None, alias='$top')
+    skip_token: Optional[str] = Field(None, alias='$skiptoken')
     select: Optional[str] = Field(None, alias='$select')
 
     def get_query_string(self):
@@ -63,3 +63,31 @@ ST_CAPABILITIES = getattr(settings, 'ST_CAPABILITIES', [
 ])
 
 PROXY_BASE_URL = getattr(settings, 'PROXY_BASE_URL', None)
+
+ST_QUERY_PLAN_CACHE_SIZE = getattr(settings, 'ST_QUERY_PLAN_CACHE_SIZE', 256)
+
+ST_STREAMING_RESPONSES = getattr(settings, 'ST_STREAMING_RESPONSES', False)
+ST_STREAMING_BATCH_SIZE = getattr(settings, 'ST_STREAMING_BATCH_SIZE', 1000)
+ST_EXPAND_CONCURRENCY = getattr(settings, 'ST_EXPAND_CONCURRENCY', 1)
+
+ST_BATCH_MAX_REQUESTS = getattr(settings, 'ST_BATCH_MAX_REQUESTS', 100)
+ST_BATCH_CONCURRENCY = getattr(settings, 'ST_BATCH_CONCURRENCY', 1)
+
+ST_RESPONSE_CACHE = getattr(settings, 'ST_RESPONSE_CACHE', None)
+ST_RESPONSE_CACHE_TIMEOUT = getattr(settings, 'ST_RESPONSE_CACHE_TIMEOUT', 300)
+
+ST_LATEST_OBSERVATIONS = getattr(settings, 'ST_LATEST_OBSERVATIONS', False)
+ST_LATEST_OBSERVATIONS_CACHE = getattr(settings, 'ST_LATEST_OBSERVATIONS_CACHE', None)
+ST_LATEST_OBSERVATIONS_TIMEOUT = getattr(settings, 'ST_LATEST_OBSERVATIONS_TIMEOUT', 3600)
+ST_LATEST_OBSERVATIONS_SIZE = getattr(settings, 'ST_LATEST_OBSERVATIONS_SIZE', 10000)
+
+ST_CURSOR_PAGINATION = getattr(settings, 'ST_CURSOR_PAGINATION', False)
+
+ST_TIME_BOUNDS_MODE = getattr(settings, 'ST_TIME_BOUNDS_MODE', 'strict')
+ST_TIME_BOUNDS_INTERVAL = getattr(settings, 'ST_TIME_BOUNDS_INTERVAL', 5)
+ST_TIME_BOUNDS_BATCH_SIZE = getattr(settings, 'ST_TIME_BOUNDS_BATCH_SIZE', 1000)
+
+ST_OBSERVATION_BUFFER = getattr(settings, 'ST_OBSERVATION_BUFFER', False)
+ST_OBSERVATION_BUFFER_INTERVAL = getattr(settings, 'ST_OBSERVATION_BUFFER_INTERVAL', 1)
+ST_OBSERVATION_BUFFER_SIZE = getattr(settings, 'ST_OBSERVATION_BUFFER_SIZE', 1000)
+ST_OBSERVATION_BUFFER_JOURNAL = getattr(settings, 'ST_OBSERVATION_BUFFER_JOURNAL', None)
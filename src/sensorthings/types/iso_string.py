@@ -1,14 +1,23 @@
+import re
 import pytz
 from typing import Annotated, Tuple
-from datetime import datetime
+from datetime import datetime, timedelta
 from dateutil.parser import isoparse
 from pydantic import AfterValidator, WithJsonSchema
 
 
+iso_time_pattern = re.compile(
+    r'([0-9]{4})-([0-9]{2})-([0-9]{2})T([0-9]{2}):([0-9]{2}):([0-9]{2})(?:[.,][0-9]+)?(Z|[+-][0-9]{2}:[0-9]{2})?'
+)
+
+
 def validate_iso_time(value: str) -> str:
     """
     Validate and format a string as an ISO time.
 
+    Times in the common fixed-width form YYYY-MM-DDTHH:MM:SS[.fff][Z|±HH:MM] are parsed directly. All other inputs
+    are parsed with dateutil (see parse_iso_time), which produces the same output for the fixed-width forms.
+
     Parameters
     ----------
     value : str
@@ -29,6 +38,48 @@ def validate_iso_time(value: str) -> str:
 
     if not isinstance(value, str):
         raise TypeError('string required')
+
+    match = iso_time_pattern.fullmatch(value)
+
+    if match is None:
+        return parse_iso_time(value)
+
+    year, month, day, hour, minute, second, offset = match.groups()
+
+    if hour == '24' or (offset is not None and offset != 'Z' and (offset[1:3] > '23' or offset[4:6] > '59')):
+        return parse_iso_time(value)
+
+    parsed_value = datetime(int(year), int(month), int(day), int(hour), int(minute), int(second))
+
+    if offset is None or offset == 'Z' or offset[1:] == '00:00':
+        return value[:19] + '+00:00'
+
+    offset_delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6]))
+    parsed_value = parsed_value - offset_delta if offset[0] == '+' else parsed_value + offset_delta
+
+    return parsed_value.isoformat(sep='T', timespec='seconds') + '+00:00'
+
+
+def parse_iso_time(value: str) -> str:
+    """
+    Validate and format a string as an ISO time using dateutil.
+
+    Parameters
+    ----------
+    value : str
+        The string to validate and format.
+
+    Returns
+    -------
+    str
+        The validated and formatted ISO time string.
+
+    Raises
+    ------
+    ValueError
+        If the input string is not in a valid ISO time format.
+    """
+
     try:
         parsed_value = isoparse(value)
         if parsed_value.tzinfo is None:
@@ -77,10 +128,8 @@ def validate_iso_interval(value: str) -> str:
         validate_iso_time(dt_value) for dt_value in value.split('/')
     ]
 
-    try:
-        if len(split_value) != 2 or isoparse(split_value[0]) >= isoparse(split_value[1]):
-            raise TypeError
-    except TypeError:
+    # Validated times share the same fixed-width UTC format, so they compare chronologically as strings.
+    if len(split_value) != 2 or split_value[0] >= split_value[1]:
         raise ValueError('invalid ISO interval format')
 
     return '/'.join(split_value)
@@ -108,8 +157,8 @@ def parse_iso_interval(interval: str) -> Tuple[datetime, datetime]:
 
     validated_interval = validate_iso_interval(interval)
     start, end = validated_interval.split('/')
-    start_datetime = isoparse(start)
-    end_datetime = isoparse(end)
+    start_datetime = datetime.fromisoformat(start)
+    end_datetime = datetime.fromisoformat(end)
 
     return start_datetime, end_datetime
 
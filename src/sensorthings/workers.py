@@ -0,0 +1,656 @@
+import os
+import atexit
+import asyncio
+import logging
+import threading
+import orjson
+from uuid import uuid4
+from itertools import count
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, List, Optional, Dict, Tuple, Type
+from django.db import close_old_connections, connections
+from django.http import HttpRequest
+from sensorthings.components.observations.schemas import Observation, ObservationPostBody
+from sensorthings import settings
+
+if TYPE_CHECKING:
+    from sensorthings.engine import SensorThingsBaseEngine
+
+
+logger = logging.getLogger(__name__)
+
+
+class BatchWorker:
+    """
+    An in-process background worker that collects items and processes them in batches.
+
+    Pending items are processed by a daemon thread once per interval, or as soon as max_size items have accumulated.
+    Items submitted with a key replace any pending item with the same key, so repeated work is coalesced. Pending
+    items are flushed when the process exits normally.
+
+    Attributes
+    ----------
+    name : str
+        The name of the worker thread.
+    interval : float
+        The maximum number of seconds an item waits before it is processed.
+    max_size : int
+        The number of pending items that triggers processing before the interval has elapsed.
+    process_batch : Callable[[List[Any]], None]
+        The function processing a batch of items.
+    """
+
+    def __init__(self, name: str, interval: float, max_size: int, process_batch: Callable[[List[Any]], None]):
+        self.name = name
+        self.interval = interval
+        self.max_size = max_size
+        self.process_batch = process_batch
+        self._pending = {}
+        self._sequence = count()
+        self._condition = threading.Condition()
+        self._process_lock = threading.Lock()
+        self._thread = None
+        atexit.register(self.flush)
+
+    def submit(self, item: Any, key: Optional[Hashable] = None):
+        """
+        Add an item to the pending batch.
+
+        Parameters
+        ----------
+        item : Any
+            The item to process.
+        key : Optional[Hashable], optional
+            A key identifying the work the item represents. A pending item with the same key is replaced.
+        """
+
+        with self._condition:
+            self._pending[key if key is not None else (self, next(self._sequence))] = item
+
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+
+            if len(self._pending) >= self.max_size:
+                self._condition.notify()
+
+    def flush(self):
+        """
+        Process all pending items in the calling thread.
+        """
+
+        with self._condition:
+            batch = self._take_pending()
+
+        self._process(batch)
+
+    def pending(self) -> int:
+        """
+        Count the pending items.
+
+        Returns
+        -------
+        int
+            The number of items waiting to be processed.
+        """
+
+        with self._condition:
+            return len(self._pending)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: len(self._pending) >= self.max_size, timeout=self.interval)
+                batch = self._take_pending()
+
+            self._process(batch)
+            close_old_connections()
+
+    def _take_pending(self) -> List[Any]:
+        batch = list(self._pending.values())
+        self._pending.clear()
+
+        return batch
+
+    def _process(self, batch: List[Any]):
+        if not batch:
+            return
+
+        with self._process_lock:
+            try:
+                self.process_batch(batch)
+            except Exception:  # noqa
+                logger.exception(f'{self.name} failed to process a batch of {len(batch)} items.')
+
+
+def run_in_pool_thread(function: Callable, *args) -> Any:
+    """
+    Call a function on a thread pool thread and release the database connections it left open afterward.
+
+    Django opens a separate database connection for each thread, so connections opened by pool threads are closed the
+    same way a request/response cycle closes them.
+
+    Parameters
+    ----------
+    function : Callable
+        The function to call.
+    *args
+        The arguments to call the function with.
+
+    Returns
+    -------
+    Any
+        The return value of the function.
+    """
+
+    try:
+        return function(*args)
+    finally:
+        close_old_connections()
+
+
+def in_atomic_block() -> bool:
+    """
+    Check whether the current thread is inside a database transaction.
+
+    Work inside a transaction must not be moved to pool threads, which use their own database connections and cannot
+    see the uncommitted changes of the transaction.
+
+    Returns
+    -------
+    bool
+        Whether any database connection of the current thread is in an atomic block.
+    """
+
+    return any(connection.in_atomic_block for connection in connections.all())
+
+
+def build_background_request(sensorthings_url: str) -> HttpRequest:
+    """
+    Build a request for engines used outside of a request/response cycle.
+
+    Parameters
+    ----------
+    sensorthings_url : str
+        The base SensorThings URL of the API the engine belongs to.
+
+    Returns
+    -------
+    HttpRequest
+        A request with the SensorThings attributes engines rely on.
+    """
+
+    request = HttpRequest()
+    request.sensorthings_url = sensorthings_url
+    request.sensorthings_path = ''
+    request.nested_path = []
+    request.ref_response = False
+    request.value_response = False
+    request.stream_response = False
+
+    return request
+
+
+def update_deferred_time_bounds(batch: List[tuple]):
+    """
+    Update the time bounds of Datastreams collected by the time bounds worker.
+
+    Parameters
+    ----------
+    batch : List[tuple]
+        Tuples of the engine class, its response schemas, the base SensorThings URL, and a Datastream ID.
+    """
+
+    datastream_ids = {}
+
+    for engine_class, get_response_schemas, sensorthings_url, datastream_id in batch:
+        datastream_ids.setdefault(
+            (engine_class, id(get_response_schemas), sensorthings_url), (get_response_schemas, [])
+        )[1].append(datastream_id)
+
+    for (engine_class, _, sensorthings_url), (get_response_schemas, engine_datastream_ids) in datastream_ids.items():
+        engine = engine_class(
+            request=build_background_request(sensorthings_url),
+            get_response_schemas=get_response_schemas
+        )
+        run_engine_method(engine.update_datastream_time_bounds(datastream_ids=engine_datastream_ids, strict=True))
+
+
+def run_engine_method(result: Any) -> Any:
+    """
+    Resolve the result of an engine method, running it to completion if it is a coroutine.
+
+    Parameters
+    ----------
+    result : Any
+        The value returned by a sync or async engine method.
+
+    Returns
+    -------
+    Any
+        The resolved result.
+    """
+
+    if asyncio.iscoroutine(result):
+        return asyncio.run(result)
+
+    return result
+
+
+class ObservationJournal:
+    """
+    An append-only journal of buffered Observations.
+
+    Each buffered Observation is written as a JSON line with a sequence number before it is acknowledged to the
+    client, and acknowledgement lines are appended once the Observations have been created. Lines are flushed to the
+    operating system as they are written, so Observations survive a restart of the process. The file is truncated
+    whenever every journaled Observation has been acknowledged. Observations that could not be created are moved to
+    a dead-letter file next to the journal.
+
+    Attributes
+    ----------
+    path : str
+        The path of the journal file.
+    dead_letter_path : str
+        The path of the file rejected records are moved to.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.dead_letter_path = f'{path}.failed'
+        self._lock = threading.Lock()
+        self._file = None
+        self._records = {}
+        self._sequence = None
+
+    def append(self, record: dict) -> int:
+        """
+        Journal a record.
+
+        Parameters
+        ----------
+        record : dict
+            A JSON serializable record.
+
+        Returns
+        -------
+        int
+            The sequence number of the record.
+        """
+
+        with self._lock:
+            self._open()
+            sequence = next(self._sequence)
+            self._write({'sequence': sequence, **record})
+            self._records[sequence] = record
+
+        return sequence
+
+    def acknowledge(self, sequences: Iterable[int]):
+        """
+        Mark records as processed, truncating the journal once no unprocessed records remain.
+
+        Parameters
+        ----------
+        sequences : Iterable[int]
+            The sequence numbers of the processed records.
+        """
+
+        sequences = [sequence for sequence in sequences if sequence is not None]
+
+        if not sequences:
+            return
+
+        with self._lock:
+            self._open()
+            self._write({'ack': sequences})
+
+            for sequence in sequences:
+                self._records.pop(sequence, None)
+
+            if not self._records:
+                self._file.truncate(0)
+                self._file.seek(0)
+
+    def reject(self, sequences: Iterable[int]):
+        """
+        Move records that could not be processed to the dead-letter file, and acknowledge them.
+
+        Parameters
+        ----------
+        sequences : Iterable[int]
+            The sequence numbers of the rejected records.
+        """
+
+        sequences = [sequence for sequence in sequences if sequence is not None]
+
+        if not sequences:
+            return
+
+        with self._lock:
+            self._open()
+            with open(self.dead_letter_path, 'ab') as dead_letter_file:
+                dead_letter_file.write(b''.join(
+                    orjson.dumps({'sequence': sequence, **self._records[sequence]}) + b'\n'
+                    for sequence in sequences if sequence in self._records
+                ))
+
+        self.acknowledge(sequences)
+
+    def pending(self) -> Dict[int, dict]:
+        """
+        Get the journaled records that have not been acknowledged.
+
+        Returns
+        -------
+        Dict[int, dict]
+            The unacknowledged records keyed by sequence number.
+        """
+
+        with self._lock:
+            self._open()
+            return dict(self._records)
+
+    def _open(self):
+        if self._file is not None:
+            return
+
+        records = {}
+
+        if os.path.exists(self.path):
+            with open(self.path, 'rb') as journal_file:
+                for line in journal_file:
+                    try:
+                        entry = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        logger.warning(f'Skipping an unreadable line in the Observation journal {self.path}.')
+                        continue
+                    if 'ack' in entry:
+                        for sequence in entry['ack']:
+                            records.pop(sequence, None)
+                    else:
+                        records[entry.pop('sequence')] = entry
+
+        self._records = records
+        self._sequence = count(max(records, default=-1) + 1)
+        self._file = open(self.path, 'ab')
+
+    def _write(self, entry: dict):
+        self._file.write(orjson.dumps(entry) + b'\n')
+        self._file.flush()
+
+
+class ObservationBuffer:
+    """
+    A write-behind buffer creating single Observations in bulk.
+
+    Buffered Observations are created in batches through the engine's create_observations method every interval
+    seconds, or as soon as max_size Observations are pending. If a batch fails, its Observations are created one at a
+    time, and Observations that still fail are logged and moved to the journal's dead-letter file. If a journal path
+    is given, buffered Observations are journaled so they can be recovered after a restart.
+
+    Each buffered Observation is given a ticket, and the status of the most recent max_statuses tickets is kept in
+    memory (see status), so clients can follow a buffered Observation to the entity created for it. Statuses are
+    kept by the process that buffered the Observation.
+
+    Attributes
+    ----------
+    worker : BatchWorker
+        The worker collecting and flushing buffered Observations.
+    journal : Optional[ObservationJournal]
+        The journal of buffered Observations, if any.
+    max_statuses : int
+        The number of ticket statuses kept.
+    """
+
+    def __init__(self, interval: float, max_size: int, journal_path: Optional[str] = None, max_statuses: int = 10000):
+        self.worker = BatchWorker(
+            name='sensorthings-observation-buffer',
+            interval=interval,
+            max_size=max_size,
+            process_batch=self.create_buffered_observations
+        )
+        self.journal = ObservationJournal(journal_path) if journal_path else None
+        self.max_statuses = max_statuses
+        self._recovered_engines = set()
+        self._statuses = OrderedDict()
+        self._status_lock = threading.Lock()
+
+    def submit(self, engine: 'SensorThingsBaseEngine', observation: ObservationPostBody) -> str:
+        """
+        Buffer an Observation to be created by an engine of the same class.
+
+        Parameters
+        ----------
+        engine : SensorThingsBaseEngine
+            The engine handling the request the Observation was posted with.
+        observation : ObservationPostBody
+            The validated Observation.
+
+        Returns
+        -------
+        str
+            The ticket of the buffered Observation.
+        """
+
+        ticket = uuid4().hex
+
+        self._submit(
+            engine_class=type(engine),
+            get_response_schemas=engine.get_response_schemas,
+            sensorthings_url=engine.request.sensorthings_url,
+            observation=observation,
+            ticket=ticket
+        )
+
+        return ticket
+
+    def status(self, ticket: str) -> Optional[Tuple[str, Any]]:
+        """
+        Get the status of a buffered Observation.
+
+        Parameters
+        ----------
+        ticket : str
+            The ticket of the buffered Observation.
+
+        Returns
+        -------
+        Optional[Tuple[str, Any]]
+            The state of the Observation ('pending', 'created', or 'failed') and the ID of the created Observation if
+            the engine returned it, or None if the ticket is unknown or its status is no longer kept.
+        """
+
+        with self._status_lock:
+            return self._statuses.get(ticket)
+
+    def recover(self, engine_class: Type['SensorThingsBaseEngine'], get_response_schemas: dict):
+        """
+        Buffer the journaled Observations of an engine class that were not created before the last restart.
+
+        Observations are recovered once per engine class; later calls for the same class are ignored.
+
+        Parameters
+        ----------
+        engine_class : Type[SensorThingsBaseEngine]
+            The engine class to recover Observations for.
+        get_response_schemas : dict
+            The response schemas of the API using the engine class.
+        """
+
+        if self.journal is None:
+            return
+
+        engine_path = f'{engine_class.__module__}.{engine_class.__qualname__}'
+        recovered_sequences = []
+
+        if engine_path in self._recovered_engines:
+            return
+
+        self._recovered_engines.add(engine_path)
+
+        for sequence, record in self.journal.pending().items():
+            if record['engine'] != engine_path:
+                continue
+            self._submit(
+                engine_class=engine_class,
+                get_response_schemas=get_response_schemas,
+                sensorthings_url=record['sensorthings_url'],
+                observation=ObservationPostBody(**record['observation']),
+                ticket=record.get('ticket') or uuid4().hex
+            )
+            recovered_sequences.append(sequence)
+
+        self.journal.acknowledge(recovered_sequences)
+
+    def flush(self):
+        """
+        Create all buffered Observations in the calling thread.
+        """
+
+        self.worker.flush()
+
+    def pending(self) -> int:
+        """
+        Count the buffered Observations.
+
+        Returns
+        -------
+        int
+            The number of Observations waiting to be created.
+        """
+
+        return self.worker.pending()
+
+    def create_buffered_observations(self, batch: List[tuple]):
+        """
+        Create a batch of buffered Observations, grouped by engine.
+
+        Parameters
+        ----------
+        batch : List[tuple]
+            Tuples of the engine class, its response schemas, the base SensorThings URL, an Observation, its journal
+            sequence number, and its ticket.
+        """
+
+        engine_batches = {}
+
+        for engine_class, get_response_schemas, sensorthings_url, observation, sequence, ticket in batch:
+            engine_batches.setdefault(
+                (engine_class, id(get_response_schemas), sensorthings_url), (get_response_schemas, [])
+            )[1].append((observation, sequence, ticket))
+
+        for (engine_class, _, sensorthings_url), (get_response_schemas, observations) in engine_batches.items():
+            engine = engine_class(
+                request=build_background_request(sensorthings_url),
+                get_response_schemas=get_response_schemas
+            )
+
+            try:
+                observation_ids = self._create_observations(
+                    engine=engine, observations=[observation for observation, _, _ in observations]
+                )
+            except Exception:  # noqa
+                logger.exception(
+                    f'Failed to create {len(observations)} buffered Observations, creating them one at a time.'
+                )
+                created_observations, failed_observations = [], []
+                for observation, sequence, ticket in observations:
+                    try:
+                        observation_id, = self._create_observations(engine=engine, observations=[observation])
+                    except Exception:  # noqa
+                        logger.exception(
+                            f'Failed to create a buffered Observation of Datastream {observation.datastream.id}: '
+                            f'{observation.dict(exclude_unset=True)}'
+                        )
+                        failed_observations.append((observation, sequence, ticket))
+                    else:
+                        created_observations.append((observation, sequence, ticket, observation_id))
+            else:
+                created_observations = [
+                    (observation, sequence, ticket, observation_id)
+                    for (observation, sequence, ticket), observation_id in zip(observations, observation_ids)
+                ]
+                failed_observations = []
+
+            # Created Observations are acknowledged before the follow-up updates, so that a failure of these updates
+            # cannot create them again on restart.
+            if self.journal is not None:
+                self.journal.acknowledge([sequence for _, sequence, _, _ in created_observations])
+                self.journal.reject([sequence for _, sequence, _ in failed_observations])
+
+            for _, _, ticket, observation_id in created_observations:
+                self._set_status(ticket, 'created', observation_id)
+            for _, _, ticket in failed_observations:
+                self._set_status(ticket, 'failed')
+
+            if not created_observations:
+                continue
+
+            try:
+                run_engine_method(engine.invalidate_cached_responses(component=Observation, entity_ids=[]))
+                run_engine_method(engine.update_datastream_time_bounds(
+                    datastream_ids=list(dict.fromkeys(
+                        observation.datastream.id for observation, _, _, _ in created_observations
+                    ))
+                ))
+            except Exception:  # noqa
+                logger.exception(f'Failed to update Datastreams after creating {len(created_observations)} buffered '
+                                 f'Observations.')
+
+    def _submit(self, engine_class, get_response_schemas, sensorthings_url, observation, ticket):
+        sequence = self.journal.append({
+            'engine': f'{engine_class.__module__}.{engine_class.__qualname__}',
+            'sensorthings_url': sensorthings_url,
+            'observation': observation.dict(exclude_unset=True),
+            'ticket': ticket
+        }) if self.journal is not None else None
+
+        self._set_status(ticket, 'pending')
+        self.worker.submit((engine_class, get_response_schemas, sensorthings_url, observation, sequence, ticket))
+
+    def _set_status(self, ticket: str, state: str, observation_id: Any = None):
+        with self._status_lock:
+            self._statuses[ticket] = (state, observation_id)
+            self._statuses.move_to_end(ticket)
+
+            while len(self._statuses) > self.max_statuses:
+                self._statuses.popitem(last=False)
+
+    @staticmethod
+    def _create_observations(engine: 'SensorThingsBaseEngine', observations: List[ObservationPostBody]) -> List[Any]:
+        # Observations are passed to create_observations grouped by Datastream, and the returned IDs are mapped back
+        # to the order of the buffered Observations. Engines that do not return one ID per Observation leave them
+        # unknown.
+        observations_by_datastream = {}
+        positions_by_datastream = {}
+
+        for position, observation in enumerate(observations):
+            observations_by_datastream.setdefault(observation.datastream.id, []).append(observation)
+            positions_by_datastream.setdefault(observation.datastream.id, []).append(position)
+
+        created_ids = run_engine_method(engine.create_observations(observations=observations_by_datastream))  # noqa
+        created_ids = list(created_ids) if created_ids is not None else []
+        observation_ids = [None] * len(observations)
+
+        if len(created_ids) == len(observations):
+            positions = [position for datastream_positions in positions_by_datastream.values()
+                         for position in datastream_positions]
+            for position, observation_id in zip(positions, created_ids):
+                observation_ids[position] = observation_id
+
+        return observation_ids
+
+
+time_bounds_worker = BatchWorker(
+    name='sensorthings-time-bounds',
+    interval=settings.ST_TIME_BOUNDS_INTERVAL,
+    max_size=settings.ST_TIME_BOUNDS_BATCH_SIZE,
+    process_batch=update_deferred_time_bounds
+)
+
+observation_buffer = ObservationBuffer(
+    interval=settings.ST_OBSERVATION_BUFFER_INTERVAL,
+    max_size=settings.ST_OBSERVATION_BUFFER_SIZE,
+    journal_path=settings.ST_OBSERVATION_BUFFER_JOURNAL
+)
@@ -0,0 +1,56 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import Client, AsyncClient
+
+
+@pytest.mark.parametrize('endpoint, query_params', [
+    ('Things', {}),
+    ('Things', {'$count': True, '$skip': 1, '$top': 1}),
+    ('Things', {'$select': 'name,description'}),
+    ('Things', {'$expand': 'Locations/HistoricalLocations,Datastreams/Sensor,Datastreams/ObservedProperty'}),
+    ('Things/$ref', {}),
+    ('Things(1)', {}),
+    ('Things(1)/Locations', {}),
+    ('Datastreams(1)/Observations', {'$top': 1}),
+    ('HistoricalLocations(1)/Thing', {}),
+    ('Observations(1)/Datastream/Thing/name/$value', {}),
+    ('Observations', {'$resultFormat': 'dataArray'}),
+])
+@pytest.mark.django_db()
+def test_sensorthings_async_get_endpoints(endpoint, query_params):
+    client = Client()
+    async_client = AsyncClient()
+
+    response = client.get(f'http://127.0.0.1:8000/sensorthings/data-array/v1.1/{endpoint}', query_params)
+    async_response = async_to_sync(async_client.get)(
+        f'http://127.0.0.1:8000/sensorthings/async/v1.1/{endpoint}', query_params
+    )
+
+    assert async_response.status_code == response.status_code == 200
+    assert async_response.content == response.content
+
+
+@pytest.mark.parametrize('method, endpoint, body, expected_status', [
+    ('post', 'Things', {'name': 'TEST', 'description': 'TEST'}, 201),
+    ('patch', 'Things(1)', {'name': 'TEST'}, 204),
+    ('delete', 'Things(1)', None, 204),
+    ('post', 'Observations', {
+        'phenomenonTime': '2024-01-01T00:00:00Z', 'result': 10.0, 'Datastream': {'@iot.id': 1}
+    }, 201),
+    ('post', 'CreateObservations', [{
+        'Datastream': {'@iot.id': 1}, 'components': ['phenomenonTime', 'result'],
+        'dataArray': [['2024-01-01T00:00:00Z', 10.0]]
+    }], 201),
+    ('post', 'DeleteObservations', [{'Datastream': {'@iot.id': 1}}], 204),
+    ('get', 'Things(3)', None, 404),
+])
+@pytest.mark.django_db()
+def test_sensorthings_async_endpoints(method, endpoint, body, expected_status):
+    async_client = AsyncClient()
+
+    response = async_to_sync(getattr(async_client, method))(
+        f'http://127.0.0.1:8000/sensorthings/async/v1.1/{endpoint}',
+        **({'data': body, 'content_type': 'application/json'} if body is not None else {})
+    )
+
+    assert response.status_code == expected_status
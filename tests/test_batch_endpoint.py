@@ -0,0 +1,133 @@
+import pytest
+import threading
+from django.test import Client
+
+
+@pytest.mark.parametrize('api', ['core', 'async'])
+@pytest.mark.django_db()
+def test_batch_endpoint(api):
+    client = Client()
+
+    response = client.post(
+        f'http://127.0.0.1:8000/sensorthings/{api}/v1.1/$batch',
+        {'requests': [
+            {'id': '1', 'method': 'get', 'url': 'Things(1)?$select=name'},
+            {'id': '2', 'method': 'get', 'url': f'/sensorthings/{api}/v1.1/Things(1)/Locations/$ref?$top=1'},
+            {'id': '3', 'method': 'post', 'url': 'Sensors', 'body': {
+                'name': 'TEST', 'description': 'TEST', 'metadata': 'https://www.example.com/test.html',
+                'encodingType': 'text/html'
+            }},
+            {'id': '4', 'method': 'post', 'url': 'Sensors', 'body': {'name': 'TEST'}},
+            {'id': '5', 'method': 'get', 'url': 'Things(1)/Unknown'},
+        ]},
+        content_type='application/json'
+    )
+
+    assert response.status_code == 200
+
+    responses = response.json()['responses']
+    assert [(sub_response['id'], sub_response['status']) for sub_response in responses] == [
+        ('1', 200), ('2', 200), ('3', 201), ('4', 422), ('5', 404)
+    ]
+    assert responses[0]['body'] == {'name': 'THING_1'}
+    assert responses[1]['body']['value'] == [{'@iot.selfLink': 'http://testserver/sensorthings/v1.1/Locations(1)'}]
+    assert responses[2]['headers']['Location'] == 'http://testserver/sensorthings/v1.1/Sensors(1)'
+    assert responses[2]['body'] is None
+
+
+@pytest.mark.django_db()
+def test_batch_endpoint_shares_engine_and_repeated_responses(monkeypatch):
+    from sta.engine import TestSensorThingsEngine
+    from sta.engine.thing import ThingEngine
+
+    client = Client()
+    engines = []
+    calls = []
+    engine_init = TestSensorThingsEngine.__init__
+    get_things = ThingEngine.get_things
+
+    def count_engines(self, *args, **kwargs):
+        engines.append(self)
+        engine_init(self, *args, **kwargs)
+
+    def count_get_things(self, *args, **kwargs):
+        calls.append(kwargs.get('thing_ids'))
+        return get_things(self, *args, **kwargs)
+
+    monkeypatch.setattr(TestSensorThingsEngine, '__init__', count_engines)
+    monkeypatch.setattr(ThingEngine, 'get_things', count_get_things)
+
+    response = client.post(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/$batch',
+        {'requests': [
+            {'id': '1', 'method': 'get', 'url': 'Things(1)'},
+            {'id': '2', 'method': 'get', 'url': 'Things(1)'},
+            {'id': '3', 'method': 'get', 'url': 'Things(2)'},
+        ]},
+        content_type='application/json'
+    )
+
+    assert response.status_code == 200
+    assert [sub_response['status'] for sub_response in response.json()['responses']] == [200, 200, 200]
+    assert response.json()['responses'][0]['body'] == response.json()['responses'][1]['body']
+    assert len(engines) == 1
+    assert len(calls) == 2
+
+
+@pytest.mark.django_db()
+def test_batch_endpoint_limits_sub_requests(monkeypatch):
+    from sensorthings import settings
+
+    client = Client()
+    monkeypatch.setattr(settings, 'ST_BATCH_MAX_REQUESTS', 1)
+
+    response = client.post(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/$batch',
+        {'requests': [{'method': 'get', 'url': 'Things(1)'}, {'method': 'get', 'url': 'Things(2)'}]},
+        content_type='application/json'
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db()
+def test_batch_endpoint_runs_gets_after_writes_on_request_thread(monkeypatch):
+    from sensorthings import settings, workers
+    from sta.engine.thing import ThingEngine
+
+    client = Client()
+    thread_names = []
+    closed_thread_names = []
+    get_things = ThingEngine.get_things
+
+    def record_get_things(self, *args, **kwargs):
+        thread_names.append(threading.current_thread().name)
+        return get_things(self, *args, **kwargs)
+
+    monkeypatch.setattr(settings, 'ST_BATCH_CONCURRENCY', 4)
+    monkeypatch.setattr(ThingEngine, 'get_things', record_get_things)
+    monkeypatch.setattr(
+        workers, 'close_old_connections', lambda: closed_thread_names.append(threading.current_thread().name)
+    )
+
+    response = client.post(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/$batch',
+        {'requests': [
+            {'id': '1', 'method': 'get', 'url': 'Things(1)'},
+            {'id': '2', 'method': 'get', 'url': 'Things(2)'},
+            {'id': '3', 'method': 'post', 'url': 'Sensors', 'body': {
+                'name': 'TEST', 'description': 'TEST', 'metadata': 'https://www.example.com/test.html',
+                'encodingType': 'text/html'
+            }},
+            {'id': '4', 'method': 'get', 'url': 'Things(1)'},
+            {'id': '5', 'method': 'get', 'url': 'Things(2)'},
+        ]},
+        content_type='application/json'
+    )
+
+    assert response.status_code == 200
+    assert [sub_response['status'] for sub_response in response.json()['responses']] == [200, 200, 201, 200, 200]
+    assert all(name.startswith('sensorthings-batch') for name in thread_names[:2])
+    assert thread_names[2:] == [threading.current_thread().name] * 2
+    assert len(closed_thread_names) == 2
+    assert all(name.startswith('sensorthings-batch') for name in closed_thread_names)
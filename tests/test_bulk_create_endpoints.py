@@ -0,0 +1,115 @@
+import pytest
+from django.test import Client
+
+
+@pytest.mark.parametrize('endpoint, post_body, expected_link', [
+    ('Things', {'name': 'TEST', 'description': 'TEST', 'Locations': [{'@iot.id': 1}]}, 'Things(3)'),
+    ('Sensors', {
+        'name': 'TEST', 'description': 'TEST', 'metadata': 'https://www.example.com/test.html',
+        'encodingType': 'text/html'
+    }, 'Sensors(1)'),
+    ('ObservedProperties', {
+        'name': 'TEST', 'description': 'TEST', 'definition': 'https://www.example.com'
+    }, 'ObservedProperties(1)'),
+    ('HistoricalLocations', {
+        'time': '2024-01-01T00:00:00Z', 'Thing': {'@iot.id': 1}, 'Locations': [{'@iot.id': 1}]
+    }, 'HistoricalLocations(1)'),
+])
+@pytest.mark.parametrize('api', ['core', 'async'])
+@pytest.mark.django_db()
+def test_bulk_create_endpoints(api, endpoint, post_body, expected_link):
+    client = Client()
+
+    response = client.post(
+        f'http://127.0.0.1:8000/sensorthings/{api}/v1.1/Create{endpoint}',
+        [post_body, post_body],
+        content_type='application/json'
+    )
+
+    assert response.status_code == 201
+    assert response.json() == [f'http://testserver/sensorthings/v1.1/{expected_link}'] * 2
+
+
+@pytest.mark.django_db()
+def test_bulk_create_uses_plural_engine_method_in_one_transaction(monkeypatch):
+    from contextlib import contextmanager
+    from sta.engine import TestSensorThingsEngine
+    from sta.engine.thing import ThingEngine
+
+    client = Client()
+    calls = []
+
+    def create_thing(self, thing):
+        raise AssertionError('Thing created individually by an engine implementing create_things.')
+
+    def create_things(self, things):
+        calls.append(('create_things', [thing.name for thing in things]))
+        return [10, 11]
+
+    @contextmanager
+    def transaction(self):
+        calls.append('begin')
+        yield
+        calls.append('commit')
+
+    monkeypatch.setattr(ThingEngine, 'create_thing', create_thing)
+    monkeypatch.setattr(ThingEngine, 'create_things', create_things, raising=False)
+    monkeypatch.setattr(TestSensorThingsEngine, 'transaction', transaction)
+
+    response = client.post(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/CreateThings',
+        [{'name': 'THING A', 'description': 'TEST'}, {'name': 'THING B', 'description': 'TEST'}],
+        content_type='application/json'
+    )
+
+    assert response.status_code == 201
+    assert response.json() == [
+        'http://testserver/sensorthings/v1.1/Things(10)', 'http://testserver/sensorthings/v1.1/Things(11)'
+    ]
+    assert calls == ['begin', ('create_things', ['THING A', 'THING B']), 'commit']
+
+
+@pytest.mark.django_db()
+def test_bulk_create_checks_plural_engine_method_ids(monkeypatch):
+    from contextlib import contextmanager
+    from sta.engine import TestSensorThingsEngine
+    from sta.engine.thing import ThingEngine
+
+    client = Client()
+    calls = []
+
+    def create_things(self, things):
+        return [10]
+
+    @contextmanager
+    def transaction(self):
+        try:
+            yield
+        except Exception:
+            calls.append('rollback')
+            raise
+
+    monkeypatch.setattr(ThingEngine, 'create_things', create_things, raising=False)
+    monkeypatch.setattr(TestSensorThingsEngine, 'transaction', transaction)
+
+    response = client.post(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/CreateThings',
+        [{'name': 'THING A', 'description': 'TEST'}, {'name': 'THING B', 'description': 'TEST'}],
+        content_type='application/json'
+    )
+
+    assert response.status_code == 500
+    assert calls == ['rollback']
+
+
+@pytest.mark.django_db()
+def test_bulk_create_rejects_invalid_entities():
+    client = Client()
+
+    response = client.post(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/CreateThings',
+        [{'name': 'TEST', 'description': 'TEST'}, {'name': 'TEST'}],
+        content_type='application/json'
+    )
+
+    assert response.status_code == 422
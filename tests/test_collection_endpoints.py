@@ -57,7 +57,7 @@ from django.test import Client
     (  # Test Thing's HistoricalLocations endpoint.
         'Things(1)/HistoricalLocations',
         {},
-        '{"value": [{"@iot.id": 1, "@iot.selfLink": "http://testserver/sensorthings/v1.1/HistoricalLocations(1)", "time": "2024-01-01T00:00:00+00:00", "Thing@iot.navigationLink": "http://testserver/sensorthings/v1.1/HistoricalLocations(1)/Thing"}]}'
+        '{"value": []}'
     ),
     (  # Test Locations endpoint with no query parameters.
         'Locations',
@@ -107,7 +107,7 @@ from django.test import Client
     (  # Test Location's HistoricalLocations endpoint.
         'Locations(1)/HistoricalLocations',
         {},
-        '{"value": [{"@iot.id": 1, "@iot.selfLink": "http://testserver/sensorthings/v1.1/HistoricalLocations(1)", "time": "2024-01-01T00:00:00+00:00", "Thing@iot.navigationLink": "http://testserver/sensorthings/v1.1/HistoricalLocations(1)/Thing"}]}'
+        '{"value": []}'
     ),
     (  # Test HistoricalLocations endpoint with no query parameters.
         'HistoricalLocations',
@@ -152,7 +152,7 @@ from django.test import Client
     (  # Test HistoricalLocations's Locations endpoint.
         'HistoricalLocations(1)/Locations',
         {},
-        '{"value": [{"@iot.id": 1, "@iot.selfLink": "http://testserver/sensorthings/v1.1/Locations(1)", "name": "LOCATION_1", "description": "Location 1", "encodingType": "application/geo+json", "location": {"type": "Feature", "geometry": {"type": "Point", "coordinates": [41.740004, -111.793743]}, "properties": {}}, "properties": {}, "Things@iot.navigationLink": "http://testserver/sensorthings/v1.1/Locations(1)/Things", "HistoricalLocations@iot.navigationLink": "http://testserver/sensorthings/v1.1/Locations(1)/HistoricalLocations"}]}'
+        '{"value": [{"@iot.id": 2, "@iot.selfLink": "http://testserver/sensorthings/v1.1/Locations(2)", "name": "LOCATION_2", "description": "Location 2", "encodingType": "application/geo+json", "location": {"type": "Feature", "geometry": {"type": "Point", "coordinates": [41.745527, -111.813398]}, "properties": {}}, "properties": {"code": "LOCATION"}, "Things@iot.navigationLink": "http://testserver/sensorthings/v1.1/Locations(2)/Things", "HistoricalLocations@iot.navigationLink": "http://testserver/sensorthings/v1.1/Locations(2)/HistoricalLocations"}]}'
     ),
     (  # Test Sensors endpoint with no query parameters.
         'Sensors',
@@ -267,7 +267,12 @@ from django.test import Client
     (  # Test Datastream's Observations endpoint.
         'Datastreams(1)/Observations',
         {},
-        '{"value": [{"@iot.id": 1, "@iot.selfLink": "http://testserver/sensorthings/v1.1/Observations(1)", "phenomenonTime": "2024-01-01T00:00:00+00:00", "result": 10.0, "resultTime": "2024-01-01T00:00:00+00:00", "Datastream@iot.navigationLink": "http://testserver/sensorthings/v1.1/Observations(1)/Datastream", "FeatureOfInterest@iot.navigationLink": "http://testserver/sensorthings/v1.1/Observations(1)/FeatureOfInterest"}]}'
+        '{"value": [{"@iot.id": 1, "@iot.selfLink": "http://testserver/sensorthings/v1.1/Observations(1)", "phenomenonTime": "2024-01-01T00:00:00+00:00", "result": 10.0, "resultTime": "2024-01-01T00:00:00+00:00", "Datastream@iot.navigationLink": "http://testserver/sensorthings/v1.1/Observations(1)/Datastream", "FeatureOfInterest@iot.navigationLink": "http://testserver/sensorthings/v1.1/Observations(1)/FeatureOfInterest"}, {"@iot.id": 2, "@iot.selfLink": "http://testserver/sensorthings/v1.1/Observations(2)", "phenomenonTime": "2024-01-02T00:00:00+00:00", "result": 15.0, "resultTime": "2024-01-02T00:00:00+00:00", "Datastream@iot.navigationLink": "http://testserver/sensorthings/v1.1/Observations(2)/Datastream", "FeatureOfInterest@iot.navigationLink": "http://testserver/sensorthings/v1.1/Observations(2)/FeatureOfInterest"}]}'
+    ),
+    (  # Test Datastream's Observations endpoint with pagination.
+        'Datastreams(1)/Observations',
+        {'$top': 1},
+        '{"value": [{"@iot.id": 1, "@iot.selfLink": "http://testserver/sensorthings/v1.1/Observations(1)", "phenomenonTime": "2024-01-01T00:00:00+00:00", "result": 10.0, "resultTime": "2024-01-01T00:00:00+00:00", "Datastream@iot.navigationLink": "http://testserver/sensorthings/v1.1/Observations(1)/Datastream", "FeatureOfInterest@iot.navigationLink": "http://testserver/sensorthings/v1.1/Observations(1)/FeatureOfInterest"}], "@iot.nextLink": "http://testserver/sensorthings/v1.1/Datastreams(1)/Observations?$skip=1&$top=1"}'
     ),
     (  # Test Observations endpoint with no query parameters.
         'Observations',
@@ -337,7 +342,7 @@ from django.test import Client
     (  # Test FeatureOfInterest's Observations endpoint.
         'FeaturesOfInterest(1)/Observations',
         {},
-        '{"value": [{"@iot.id": 1, "@iot.selfLink": "http://testserver/sensorthings/v1.1/Observations(1)", "phenomenonTime": "2024-01-01T00:00:00+00:00", "result": 10.0, "resultTime": "2024-01-01T00:00:00+00:00", "Datastream@iot.navigationLink": "http://testserver/sensorthings/v1.1/Observations(1)/Datastream", "FeatureOfInterest@iot.navigationLink": "http://testserver/sensorthings/v1.1/Observations(1)/FeatureOfInterest"}]}'
+        '{"value": [{"@iot.id": 1, "@iot.selfLink": "http://testserver/sensorthings/v1.1/Observations(1)", "phenomenonTime": "2024-01-01T00:00:00+00:00", "result": 10.0, "resultTime": "2024-01-01T00:00:00+00:00", "Datastream@iot.navigationLink": "http://testserver/sensorthings/v1.1/Observations(1)/Datastream", "FeatureOfInterest@iot.navigationLink": "http://testserver/sensorthings/v1.1/Observations(1)/FeatureOfInterest"}, {"@iot.id": 2, "@iot.selfLink": "http://testserver/sensorthings/v1.1/Observations(2)", "phenomenonTime": "2024-01-02T00:00:00+00:00", "result": 15.0, "resultTime": "2024-01-02T00:00:00+00:00", "Datastream@iot.navigationLink": "http://testserver/sensorthings/v1.1/Observations(2)/Datastream", "FeatureOfInterest@iot.navigationLink": "http://testserver/sensorthings/v1.1/Observations(2)/FeatureOfInterest"}]}'
     ),
 ])
 @pytest.mark.django_db()
@@ -0,0 +1,123 @@
+import pytest
+from django.test import Client
+
+
+pytest.importorskip('numpy')
+
+
+@pytest.fixture()
+def observation_store():
+    from sta.engine.columnar_observation import get_observation_store
+
+    get_observation_store.cache_clear()
+
+    yield get_observation_store()
+
+    get_observation_store.cache_clear()
+
+
+@pytest.mark.parametrize('query_params, expected_ids', [
+    ({}, [1, 2, 3, 4]),
+    ({'$filter': 'phenomenonTime ge 2024-01-02T00:00:00Z'}, [2, 4]),
+    ({'$filter': 'phenomenonTime lt 2024-01-02T00:00:00Z and Datastream/id eq 2'}, [3]),
+    ({'$filter': 'result gt 12 and not (result eq 20)'}, [2, 4]),
+    ({'$filter': 'result eq 10 or FeatureOfInterest/id eq 2'}, [1, 3, 4]),
+    ({'$orderby': 'phenomenonTime desc'}, [2, 4, 1, 3]),
+    ({'$orderby': 'result desc', '$top': 2, '$skip': 1}, [3, 2]),
+])
+def test_columnar_observation_queries(observation_store, query_params, expected_ids):
+    client = Client()
+
+    response = client.get(
+        'http://127.0.0.1:8000/sensorthings/columnar/v1.1/Observations', {**query_params, '$select': 'id'}
+    )
+
+    assert response.status_code == 200
+    assert [observation['@iot.id'] for observation in response.json()['value']] == expected_ids
+
+
+def test_columnar_observations_of_a_datastream_are_not_sorted(observation_store, monkeypatch):
+    from sta.engine import columnar_observation
+
+    client = Client()
+
+    def lexsort(*args, **kwargs):
+        raise AssertionError('Observations of a Datastream sorted by phenomenon time were sorted again.')
+
+    monkeypatch.setattr(columnar_observation.np, 'lexsort', lexsort)
+
+    response = client.get(
+        'http://127.0.0.1:8000/sensorthings/columnar/v1.1/Datastreams(1)/Observations',
+        {'$orderby': 'phenomenonTime desc', '$top': 1, '$count': True, '$select': 'id,result'}
+    )
+
+    assert response.status_code == 200
+    assert response.json()['@iot.count'] == 2
+    assert response.json()['value'] == [{'@iot.id': 2, 'result': 15.0}]
+
+    response = client.get(
+        'http://127.0.0.1:8000/sensorthings/columnar/v1.1/Datastreams',
+        {
+            '$expand': 'Observations($top=1;$skip=1;$orderby=phenomenonTime;$select=result)',
+            '$select': 'id,Observations'
+        }
+    )
+
+    assert response.status_code == 200
+    assert response.json()['value'] == [
+        {'@iot.id': 1, 'Observations': [{'result': 15.0}]},
+        {'@iot.id': 2, 'Observations': [{'result': 25.0}]}
+    ]
+
+
+def test_columnar_observations_are_inserted_in_order(observation_store):
+    client = Client()
+
+    response = client.post(
+        'http://127.0.0.1:8000/sensorthings/columnar/v1.1/CreateObservations',
+        [
+            {
+                'Datastream': {'@iot.id': 1}, 'components': ['phenomenonTime', 'result', 'resultTime'],
+                'dataArray': [
+                    ['2024-01-04T00:00:00Z', 40, '2024-01-04T00:00:00Z'],
+                    ['2024-01-03T00:00:00Z', 30, '2024-01-03T00:00:00Z']
+                ]
+            },
+            {
+                'Datastream': {'@iot.id': 1}, 'components': ['phenomenonTime', 'result'],
+                'dataArray': [['2023-12-31T00:00:00Z', 5]]
+            }
+        ],
+        content_type='application/json'
+    )
+
+    assert response.status_code == 201
+    assert len(response.json()) == 3
+
+    response = client.get(
+        'http://127.0.0.1:8000/sensorthings/columnar/v1.1/Observations',
+        {'$filter': 'Datastream/id eq 1', '$orderby': 'phenomenonTime', '$select': 'result,resultTime'}
+    )
+
+    assert response.status_code == 200
+    assert response.json()['value'] == [
+        {'result': 5.0, 'resultTime': None},
+        {'result': 10.0, 'resultTime': '2024-01-01T00:00:00+00:00'},
+        {'result': 15.0, 'resultTime': '2024-01-02T00:00:00+00:00'},
+        {'result': 30.0, 'resultTime': '2024-01-03T00:00:00+00:00'},
+        {'result': 40.0, 'resultTime': '2024-01-04T00:00:00+00:00'}
+    ]
+
+    response = client.delete('http://127.0.0.1:8000/sensorthings/columnar/v1.1/Observations(1)')
+
+    assert response.status_code == 204
+    assert 1 not in observation_store.datastreams[1]['id'].tolist()
+
+
+@pytest.mark.parametrize('filters', ['contains(name, \'TEST\')', 'Datastream/name eq \'TEST\'', 'result eq \'TEST\''])
+def test_columnar_observations_reject_unsupported_filters(observation_store, filters):
+    client = Client()
+
+    response = client.get('http://127.0.0.1:8000/sensorthings/columnar/v1.1/Observations', {'$filter': filters})
+
+    assert response.status_code == 422
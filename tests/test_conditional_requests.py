@@ -0,0 +1,62 @@
+import pytest
+from django.test import Client
+
+
+@pytest.mark.parametrize('endpoint', [
+    'Things',
+    'Things(1)',
+    'Datastreams(1)/Observations?$filter=result gt 0',
+])
+@pytest.mark.django_db()
+def test_conditional_get_with_hashed_etag(endpoint):
+    client = Client()
+
+    response = client.get(f'http://127.0.0.1:8000/sensorthings/core/v1.1/{endpoint}')
+    etag = response['ETag']
+
+    not_modified_response = client.get(
+        f'http://127.0.0.1:8000/sensorthings/core/v1.1/{endpoint}', HTTP_IF_NONE_MATCH=etag
+    )
+    modified_response = client.get(
+        f'http://127.0.0.1:8000/sensorthings/core/v1.1/{endpoint}', HTTP_IF_NONE_MATCH='"outdated"'
+    )
+
+    assert response.status_code == 200
+    assert etag.startswith('"') and not etag.startswith('W/')
+    assert not_modified_response.status_code == 304
+    assert not_modified_response.content == b''
+    assert not_modified_response['ETag'] == etag
+    assert modified_response.status_code == 200
+    assert modified_response.content == response.content
+
+
+@pytest.mark.django_db()
+def test_conditional_get_with_engine_version_token(monkeypatch):
+    from datetime import datetime, timezone
+    from sta.engine import TestSensorThingsEngine
+
+    client = Client()
+    monkeypatch.setattr(TestSensorThingsEngine, 'get_version_token', lambda self, **kwargs: 'revision-1')
+    monkeypatch.setattr(
+        TestSensorThingsEngine, 'get_last_modified', lambda self, **kwargs: datetime(2024, 1, 1, tzinfo=timezone.utc)
+    )
+
+    response = client.get('http://127.0.0.1:8000/sensorthings/core/v1.1/Things(1)')
+
+    def get_things(self, *args, **kwargs):
+        raise AssertionError('Entities fetched for a request answered by the version token.')
+
+    monkeypatch.setattr(TestSensorThingsEngine, 'get_things', get_things)
+
+    not_modified_response = client.get(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/Things(1)', HTTP_IF_NONE_MATCH=response['ETag']
+    )
+    not_modified_since_response = client.get(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/Things(1)', HTTP_IF_MODIFIED_SINCE=response['Last-Modified']
+    )
+
+    assert response.status_code == 200
+    assert response['Last-Modified'] == 'Mon, 01 Jan 2024 00:00:00 GMT'
+    assert not_modified_response.status_code == 304
+    assert not_modified_response['ETag'] == response['ETag']
+    assert not_modified_since_response.status_code == 304
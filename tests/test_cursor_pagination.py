@@ -0,0 +1,75 @@
+import pytest
+from django.test import Client
+
+
+@pytest.fixture
+def cursor_pagination(monkeypatch):
+    from sensorthings import settings
+
+    monkeypatch.setattr(settings, 'ST_CURSOR_PAGINATION', True)
+
+
+@pytest.mark.parametrize('api, query_params, expected_ids', [
+    ('core', {'$top': 1}, [1, 2, 3, 4]),
+    ('core', {'$top': 3, '$orderby': 'phenomenonTime desc'}, [2, 4, 1, 3]),
+    ('core', {'$top': 2, '$orderby': 'phenomenonTime desc', '$select': 'result', '$count': True}, [2, 4, 1, 3]),
+    ('async', {'$top': 1, '$orderby': 'phenomenonTime'}, [1, 3, 2, 4]),
+])
+@pytest.mark.django_db()
+def test_cursor_pagination_next_links(cursor_pagination, api, query_params, expected_ids):
+    from sta.data import observations
+
+    client = Client()
+    result_ids = {observation['result']: observation_id for observation_id, observation in observations.items()}
+
+    response = client.get(f'http://127.0.0.1:8000/sensorthings/{api}/v1.1/Observations', query_params)
+    pages = [response.json()]
+
+    while '@iot.nextLink' in pages[-1]:
+        assert '$skiptoken=' in pages[-1]['@iot.nextLink']
+        assert '$skip=' not in pages[-1]['@iot.nextLink']
+        response = client.get(pages[-1]['@iot.nextLink'].replace('/sensorthings/', f'/sensorthings/{api}/'))
+        assert response.status_code == 200
+        pages.append(response.json())
+
+    assert [result_ids[entity['result']] for page in pages for entity in page['value']] == expected_ids
+
+
+@pytest.mark.parametrize('orderby, expected_ids', [
+    ('phenomenonTime', [1, 3, 2, 4]),
+    ('phenomenonTime desc', [2, 4, 1, 3]),
+])
+@pytest.mark.django_db()
+def test_cursor_pagination_by_datetime_values(cursor_pagination, monkeypatch, orderby, expected_ids):
+    from dateutil.parser import isoparse
+    from sta.data import observations
+
+    # Engines such as ORM engines return datetime values, which are compared with the seek values of skip tokens.
+    for observation in observations.values():
+        monkeypatch.setitem(observation, 'phenomenon_time', isoparse(observation['phenomenon_time']))
+
+    client = Client()
+
+    pages = [client.get(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/Observations', {'$top': 1, '$orderby': orderby, '$select': 'id'}
+    ).json()]
+
+    while '@iot.nextLink' in pages[-1]:
+        response = client.get(pages[-1]['@iot.nextLink'].replace('/sensorthings/', '/sensorthings/core/'))
+        assert response.status_code == 200
+        pages.append(response.json())
+
+    assert [entity['@iot.id'] for page in pages for entity in page['value']] == expected_ids
+
+
+@pytest.mark.parametrize('query_params', [
+    {'$skiptoken': 'not-a-token'},
+    {'$skiptoken': 'W1tbImlkIiwiYXNjIl1dLFsxXV0', '$orderby': 'result'},
+])
+@pytest.mark.django_db()
+def test_cursor_pagination_rejects_invalid_skip_tokens(cursor_pagination, query_params):
+    client = Client()
+
+    response = client.get('http://127.0.0.1:8000/sensorthings/core/v1.1/Observations', query_params)
+
+    assert response.status_code == 400
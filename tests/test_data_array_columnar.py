@@ -0,0 +1,137 @@
+import pytest
+from django.test import Client
+
+
+@pytest.fixture
+def columnar_observations(monkeypatch):
+    from sta.engine.data_array import DataArrayEngine
+
+    calls = []
+
+    def create_observations(self, observations):
+        raise AssertionError('Per-row Observations created by a columnar engine.')
+
+    def create_observations_columnar(self, observations):
+        calls.append(observations)
+        return []
+
+    monkeypatch.setattr(DataArrayEngine, 'create_observations', create_observations)
+    monkeypatch.setattr(DataArrayEngine, 'create_observations_columnar', create_observations_columnar, raising=False)
+
+    return calls
+
+
+@pytest.mark.django_db()
+def test_data_array_columnar_ingest(columnar_observations):
+    client = Client()
+
+    response = client.post(
+        'http://127.0.0.1:8000/sensorthings/data-array/v1.1/CreateObservations',
+        [
+            {
+                'Datastream': {'@iot.id': 1},
+                'components': ['phenomenonTime', 'result'],
+                'dataArray': [['2024-01-01T00:00:00Z', 10], ['2024-01-02T00:00:00+01:00', 15.5]]
+            },
+            {
+                'Datastream': {'@iot.id': 2},
+                'components': ['result', 'phenomenonTime', 'FeatureOfInterest/id'],
+                'dataArray': [[20.0, '2024-01-01T00:00:00Z/2024-01-02T00:00:00Z', 1]]
+            },
+            {
+                'Datastream': {'@iot.id': 1},
+                'components': ['phenomenonTime', 'result', 'resultQuality'],
+                'dataArray': [['2024-01-03T00:00:00Z', 25.0, {'qualityCode': 'ok'}]]
+            },
+        ],
+        content_type='application/json'
+    )
+
+    assert response.status_code == 201
+    assert columnar_observations == [{
+        1: {
+            'phenomenon_time': [
+                '2024-01-01T00:00:00+00:00', '2024-01-01T23:00:00+00:00', '2024-01-03T00:00:00+00:00'
+            ],
+            'result': [10.0, 15.5, 25.0],
+            'result_quality': [None, None, {'qualityCode': 'ok'}]
+        },
+        2: {
+            'result': [20.0],
+            'phenomenon_time': ['2024-01-01T00:00:00+00:00/2024-01-02T00:00:00+00:00'],
+            'feature_of_interest_id': [1]
+        }
+    }]
+
+
+@pytest.mark.parametrize('components, data_array', [
+    (['phenomenonTime'], [['2024-01-01T00:00:00Z']]),
+    (['phenomenonTime', 'result', '@iot.id'], [['2024-01-01T00:00:00Z', 10.0, 1]]),
+    (['phenomenonTime', 'result'], [['2024-01-01T00:00:00Z', 10.0, 1]]),
+    (['phenomenonTime', 'result'], [['2024-01-01T00:00:00Z', {'value': 10.0}]]),
+    (['phenomenonTime', 'result'], [['2024-01-02T00:00:00Z/2024-01-01T00:00:00Z', 10.0]]),
+    (['phenomenonTime', 'result', 'resultQuality'], [['2024-01-01T00:00:00Z', 10.0, 1]]),
+])
+@pytest.mark.django_db()
+def test_data_array_columnar_ingest_rejects_invalid_columns(columnar_observations, components, data_array):
+    client = Client()
+
+    response = client.post(
+        'http://127.0.0.1:8000/sensorthings/data-array/v1.1/CreateObservations',
+        [{'Datastream': {'@iot.id': 1}, 'components': components, 'dataArray': data_array}],
+        content_type='application/json'
+    )
+
+    assert response.status_code == 422
+    assert columnar_observations == []
+
+
+@pytest.mark.django_db()
+def test_data_array_columnar_ingest_coerces_values(columnar_observations):
+    client = Client()
+
+    response = client.post(
+        'http://127.0.0.1:8000/sensorthings/data-array/v1.1/CreateObservations',
+        [{
+            'Datastream': {'@iot.id': 1},
+            'components': ['phenomenonTime', 'result', 'FeatureOfInterest/id'],
+            'dataArray': [['2024-01-01T00:00:00Z', '10.5', '1'], ['2024-01-02T00:00:00Z', 11, 2]]
+        }],
+        content_type='application/json'
+    )
+
+    assert response.status_code == 201
+    assert columnar_observations[0][1]['result'] == [10.5, 11.0]
+    assert columnar_observations[0][1]['feature_of_interest_id'] == [1, 2]
+
+
+@pytest.mark.parametrize('id_type, value, expected', [
+    ('uuid', '2c5e0a9e-6e1f-4a4b-9d4b-7b1c7d1f1c2a', 'uuid'),
+    ('str', 'foi-1', 'foi-1'),
+    ('uuid', 'foi-1', None),
+])
+def test_data_array_columnar_ids(monkeypatch, id_type, value, expected):
+    from uuid import UUID
+    from pydantic import TypeAdapter
+    from ninja.errors import HttpError
+    from sensorthings.schemas import EntityId
+    from sensorthings.extensions.dataarray import engine
+    from sensorthings.extensions.dataarray.schemas import ObservationDataArrayPostBody
+
+    monkeypatch.setattr(engine, 'id_adapter', TypeAdapter({'uuid': UUID, 'str': str}[id_type]))
+
+    # The request body schema validates IDs with the configured ID type, so it is built without validation here.
+    observations = [ObservationDataArrayPostBody.model_construct(
+        datastream=EntityId.model_construct(id=1),
+        components=['phenomenonTime', 'result', 'FeatureOfInterest/id'],
+        data_array=[['2024-01-01T00:00:00Z', 10.0, value]]
+    )]
+
+    if expected is None:
+        with pytest.raises(HttpError):
+            engine.DataArrayBaseEngine.convert_from_data_array_columnar(observations)
+        return
+
+    columns = engine.DataArrayBaseEngine.convert_from_data_array_columnar(observations)
+
+    assert columns[1]['feature_of_interest_id'] == [UUID(value) if expected == 'uuid' else expected]
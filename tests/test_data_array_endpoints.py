@@ -27,7 +27,7 @@ from django.test import Client
     (  # Test Datastream's Observations data array collection endpoint.
         'Datastreams(1)/Observations',
         {'$resultFormat': 'dataArray'},
-        '{"value": [{"Datastream@iot.navigationLink": "http://testserver/sensorthings/v1.1/Datastreams(1)", "components": ["phenomenonTime", "result"], "dataArray": [["2024-01-01T00:00:00+00:00", 10]]}]}'
+        '{"value": [{"Datastream@iot.navigationLink": "http://testserver/sensorthings/v1.1/Datastreams(1)", "components": ["phenomenonTime", "result"], "dataArray": [["2024-01-01T00:00:00+00:00", 10], ["2024-01-02T00:00:00+00:00", 15]]}]}'
     ),
 ])
 @pytest.mark.django_db()
@@ -81,3 +81,81 @@ def test_sensorthings_create_endpoints(endpoint, post_body):
     )
 
     assert response.status_code == 201
+
+
+@pytest.mark.parametrize('api', ['data-array', 'async'])
+@pytest.mark.django_db()
+def test_sensorthings_data_array_groups_unsorted_observations(monkeypatch, api):
+    from sta.engine.observation import ObservationEngine
+    from sta.engine.async_engine import TestAsyncSensorThingsEngine, run_async
+
+    client = Client()
+    requested_fields = []
+    get_observations = ObservationEngine.get_observations
+
+    def recorded_get_observations(self, *args, **kwargs):
+        requested_fields.append(kwargs.get('fields'))
+        return get_observations(self, *args, **kwargs)
+
+    monkeypatch.setattr(ObservationEngine, 'get_observations', recorded_get_observations)
+    monkeypatch.setattr(TestAsyncSensorThingsEngine, 'get_observations', run_async(recorded_get_observations))
+
+    response = client.get(
+        f'http://127.0.0.1:8000/sensorthings/{api}/v1.1/Observations',
+        {'$resultFormat': 'dataArray', '$orderby': 'phenomenonTime', '$select': 'result', '$count': True}
+    )
+
+    assert response.status_code == 200
+    assert requested_fields == [['datastream_id', 'id', 'result']]
+    assert response.json() == {
+        '@iot.count': 4,
+        'value': [
+            {
+                'Datastream@iot.navigationLink': 'http://testserver/sensorthings/v1.1/Datastreams(1)',
+                'components': ['result'],
+                'dataArray': [[10], [15]]
+            },
+            {
+                'Datastream@iot.navigationLink': 'http://testserver/sensorthings/v1.1/Datastreams(2)',
+                'components': ['result'],
+                'dataArray': [[20], [25]]
+            }
+        ]
+    }
+
+
+@pytest.mark.django_db()
+def test_sensorthings_data_array_formats_engine_times_without_validation(monkeypatch):
+    from datetime import datetime, timezone, timedelta
+    from sensorthings.extensions.dataarray import engine as data_array_engine
+    from sta.engine.observation import ObservationEngine
+
+    client = Client()
+    get_observations = ObservationEngine.get_observations
+    stored_times = [
+        datetime(2024, 1, 1, 5, tzinfo=timezone(timedelta(hours=5))), '2024-01-02T00:00:00Z', 'not a time'
+    ]
+
+    def typed_get_observations(self, *args, **kwargs):
+        response, count = get_observations(self, *args, **kwargs)
+        return [
+            {**observation, 'phenomenon_time': phenomenon_time}
+            for observation, phenomenon_time in zip(response.values(), stored_times)
+        ], count
+
+    def validate_time(value):
+        raise AssertionError('Engine times must not be validated again.')
+
+    monkeypatch.setattr(ObservationEngine, 'get_observations', typed_get_observations)
+    monkeypatch.setattr(data_array_engine, 'validate_iso_time', validate_time)
+    monkeypatch.setattr(data_array_engine, 'validate_iso_interval', validate_time)
+
+    response = client.get(
+        'http://127.0.0.1:8000/sensorthings/data-array/v1.1/Observations',
+        {'$resultFormat': 'dataArray', '$select': 'phenomenonTime', '$top': 3}
+    )
+
+    assert response.status_code == 200
+    assert [
+        phenomenon_time for data_array in response.json()['value'] for phenomenon_time, in data_array['dataArray']
+    ] == ['2024-01-01T00:00:00+00:00', '2024-01-02T00:00:00+00:00', 'not a time']
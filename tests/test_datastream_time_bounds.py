@@ -0,0 +1,85 @@
+import orjson
+import pytest
+from django.test import Client
+
+
+@pytest.fixture
+def datastream_updates(monkeypatch):
+    from sta.engine.datastream import DatastreamEngine
+
+    updates = {}
+
+    def update_datastream(self, datastream_id, datastream):
+        updates[datastream_id] = datastream.dict(exclude_unset=True)
+
+    monkeypatch.setattr(DatastreamEngine, 'update_datastream', update_datastream)
+
+    return updates
+
+
+def create_observations(client):
+    return client.post(
+        'http://127.0.0.1:8000/sensorthings/data-array/v1.1/CreateObservations',
+        orjson.dumps([
+            {
+                'Datastream': {'@iot.id': datastream_id},
+                'components': ['phenomenonTime', 'result'],
+                'dataArray': [['2024-01-01T00:00:00+00:00', 10.0], ['2024-01-02T00:00:00+00:00', 15.0]]
+            } for datastream_id in [1, 2, 1]
+        ]),
+        content_type='application/json'
+    )
+
+
+@pytest.mark.django_db()
+def test_datastream_time_bounds_hook_is_batched(monkeypatch, datastream_updates):
+    from sta.engine.observation import ObservationEngine
+
+    client = Client()
+    hook_calls = []
+    get_datastream_time_bounds = ObservationEngine.get_datastream_time_bounds
+
+    def counted_get_datastream_time_bounds(self, datastream_ids):
+        hook_calls.append(sorted(datastream_ids))
+        return get_datastream_time_bounds(self, datastream_ids)
+
+    monkeypatch.setattr(ObservationEngine, 'get_datastream_time_bounds', counted_get_datastream_time_bounds)
+
+    response = create_observations(client)
+
+    assert response.status_code == 201
+    assert hook_calls == [[1, 2]]
+    assert datastream_updates[1] == datastream_updates[2] == {
+        'phenomenon_time': '2024-01-01T00:00:00+00:00/2024-01-02T00:00:00+00:00',
+        'result_time': '2024-01-01T00:00:00+00:00/2024-01-02T00:00:00+00:00'
+    }
+
+
+@pytest.mark.django_db()
+def test_datastream_time_bounds_without_hook(monkeypatch, datastream_updates):
+    from sensorthings.engine import SensorThingsBaseEngine
+    from sta.engine.observation import ObservationEngine
+
+    client = Client()
+    calls = []
+    get_observations = ObservationEngine.get_observations
+
+    def record_get_observations(self, *args, **kwargs):
+        calls.append((kwargs.get('datastream_ids'), kwargs.get('pagination'), kwargs.get('ordering')))
+        return get_observations(self, *args, **kwargs)
+
+    def list_entities(*args, **kwargs):
+        raise AssertionError('Time bounds must not be read through the list pipeline.')
+
+    monkeypatch.setattr(ObservationEngine, 'get_datastream_time_bounds', None)
+    monkeypatch.setattr(ObservationEngine, 'get_observations', record_get_observations)
+    monkeypatch.setattr(SensorThingsBaseEngine, 'list_entities', list_entities)
+
+    response = create_observations(client)
+
+    assert response.status_code == 201
+    assert sorted(datastream_updates) == [1, 2]
+    assert calls == [
+        ([datastream_id], {'skip': 0, 'top': 1, 'count': False}, [{'field': 'phenomenonTime', 'direction': direction}])
+        for datastream_id in [1, 2] for direction in ['asc', 'desc']
+    ]
@@ -0,0 +1,126 @@
+import pytest
+from django.test import Client
+
+
+unit_of_measurement = {'name': 'TEST', 'symbol': 'TEST', 'definition': 'https://www.example.com'}
+observation_type = 'http://www.opengis.net/def/observationType/OGC-OM/2.0/OM_Measurement'
+
+
+def build_datastream(name, sensor):
+    return {
+        'name': name, 'description': 'TEST', 'unitOfMeasurement': unit_of_measurement,
+        'observationType': observation_type, 'Sensor': sensor,
+        'ObservedProperty': {'name': name, 'description': 'TEST', 'definition': 'https://www.example.com'}
+    }
+
+
+@pytest.mark.django_db()
+def test_deep_insert_batches_nested_entities_in_one_transaction(monkeypatch):
+    from contextlib import contextmanager
+    from sta.engine import TestSensorThingsEngine
+    from sta.engine.thing import ThingEngine
+    from sta.engine.location import LocationEngine
+    from sta.engine.datastream import DatastreamEngine
+    from sta.engine.sensor import SensorEngine
+    from sta.engine.observed_property import ObservedPropertyEngine
+
+    client = Client()
+    calls = []
+
+    def create_entities(method_name, first_id):
+        def create(self, entity_body):
+            calls.append((method_name, entity_body))
+            return list(range(first_id, first_id + len(entity_body)))
+        return create
+
+    @contextmanager
+    def transaction(self):
+        calls.append('begin')
+        yield
+        calls.append('commit')
+
+    for engine, method_name, first_id in [
+        (ThingEngine, 'create_things', 10), (LocationEngine, 'create_locations', 20),
+        (DatastreamEngine, 'create_datastreams', 30), (SensorEngine, 'create_sensors', 40),
+        (ObservedPropertyEngine, 'create_observed_properties', 50)
+    ]:
+        monkeypatch.setattr(engine, method_name, create_entities(method_name, first_id), raising=False)
+
+    monkeypatch.setattr(TestSensorThingsEngine, 'transaction', transaction)
+
+    response = client.post(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/Things',
+        {
+            'name': 'TEST', 'description': 'TEST',
+            'Locations': [
+                {'@iot.id': 1},
+                {
+                    'name': 'TEST', 'description': 'TEST', 'encodingType': 'application/geo+json',
+                    'location': {
+                        'type': 'Feature', 'properties': {}, 'geometry': {'type': 'Point', 'coordinates': [0, 0]}
+                    }
+                }
+            ],
+            'Datastreams': [
+                build_datastream('DATASTREAM A', {
+                    'name': 'TEST', 'description': 'TEST', 'metadata': 'https://www.example.com/test.html',
+                    'encodingType': 'text/html'
+                }),
+                build_datastream('DATASTREAM B', {'@iot.id': 1})
+            ]
+        },
+        content_type='application/json'
+    )
+
+    assert response.status_code == 201
+    assert response['Location'] == 'http://testserver/sensorthings/v1.1/Things(10)'
+    assert calls[0] == 'begin' and calls[-1] == 'commit'
+    assert [(method_name, len(entity_body)) for method_name, entity_body in calls[1:-1]] == [
+        ('create_locations', 1), ('create_sensors', 1), ('create_observed_properties', 2), ('create_things', 1),
+        ('create_datastreams', 2)
+    ]
+
+    thing = calls[4][1][0]
+    assert [location.id for location in thing.locations] == [1, 20]
+    assert thing.datastreams == []
+
+    datastreams = calls[5][1]
+    assert [datastream.name for datastream in datastreams] == ['DATASTREAM A', 'DATASTREAM B']
+    assert [datastream.thing.id for datastream in datastreams] == [10, 10]
+    assert [datastream.sensor.id for datastream in datastreams] == [40, 1]
+    assert [datastream.observed_property.id for datastream in datastreams] == [50, 51]
+
+
+@pytest.mark.parametrize('api', ['core', 'async'])
+@pytest.mark.django_db()
+def test_deep_insert_endpoints(api):
+    client = Client()
+
+    response = client.post(
+        f'http://127.0.0.1:8000/sensorthings/{api}/v1.1/Sensors',
+        {
+            'name': 'TEST', 'description': 'TEST', 'metadata': 'https://www.example.com/test.html',
+            'encodingType': 'text/html',
+            'Datastreams': [{**build_datastream('TEST', None), 'Thing': {'@iot.id': 1}}]
+        },
+        content_type='application/json'
+    )
+
+    assert response.status_code == 201
+    assert response['Location'] == 'http://testserver/sensorthings/v1.1/Sensors(1)'
+
+
+@pytest.mark.django_db()
+def test_deep_insert_rejects_nested_entities_missing_relations():
+    client = Client()
+
+    response = client.post(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/Things',
+        {
+            'name': 'TEST', 'description': 'TEST',
+            'Datastreams': [{**build_datastream('TEST', None), 'Sensor': None}]
+        },
+        content_type='application/json'
+    )
+
+    assert response.status_code == 422
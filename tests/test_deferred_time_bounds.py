@@ -0,0 +1,119 @@
+import orjson
+import pytest
+from django.test import Client
+
+
+@pytest.fixture
+def deferred_time_bounds(monkeypatch):
+    from sensorthings import settings
+    from sensorthings.workers import time_bounds_worker
+
+    monkeypatch.setattr(settings, 'ST_TIME_BOUNDS_MODE', 'deferred')
+    monkeypatch.setattr(time_bounds_worker, 'interval', 3600)
+
+    yield time_bounds_worker
+
+    time_bounds_worker.flush()
+
+
+@pytest.fixture
+def datastream_updates(monkeypatch):
+    from sta.engine.datastream import DatastreamEngine
+
+    updates = []
+
+    def update_datastream(self, datastream_id, datastream):
+        updates.append(datastream_id)
+
+    monkeypatch.setattr(DatastreamEngine, 'update_datastream', update_datastream)
+
+    return updates
+
+
+@pytest.mark.django_db()
+def test_deferred_time_bounds_are_coalesced(deferred_time_bounds, datastream_updates):
+    client = Client()
+
+    for datastream_ids in [[1, 2, 1], [2]]:
+        response = client.post(
+            'http://127.0.0.1:8000/sensorthings/data-array/v1.1/CreateObservations',
+            orjson.dumps([
+                {
+                    'Datastream': {'@iot.id': datastream_id},
+                    'components': ['phenomenonTime', 'result'],
+                    'dataArray': [['2024-01-01T00:00:00+00:00', 10.0]]
+                } for datastream_id in datastream_ids
+            ]),
+            content_type='application/json'
+        )
+        assert response.status_code == 201
+
+    assert datastream_updates == []
+    assert deferred_time_bounds.pending() == 2
+
+    deferred_time_bounds.flush()
+
+    assert sorted(datastream_updates) == [1, 2]
+    assert deferred_time_bounds.pending() == 0
+
+
+@pytest.mark.django_db()
+def test_deferred_time_bounds_are_processed_at_batch_size(monkeypatch, deferred_time_bounds, datastream_updates):
+    import time
+
+    client = Client()
+    monkeypatch.setattr(deferred_time_bounds, 'max_size', 1)
+
+    response = client.post(
+        'http://127.0.0.1:8000/sensorthings/data-array/v1.1/CreateObservations',
+        orjson.dumps([{
+            'Datastream': {'@iot.id': 1},
+            'components': ['phenomenonTime', 'result'],
+            'dataArray': [['2024-01-01T00:00:00+00:00', 10.0]]
+        }]),
+        content_type='application/json'
+    )
+
+    for _ in range(100):
+        if datastream_updates:
+            break
+        time.sleep(0.05)
+
+    assert response.status_code == 201
+    assert datastream_updates == [1]
+
+
+@pytest.mark.django_db()
+def test_deferred_time_bounds_without_hook_bypass_list_pipeline(monkeypatch, deferred_time_bounds, datastream_updates):
+    from sensorthings.engine import SensorThingsBaseEngine
+    from sta.engine.observation import ObservationEngine
+
+    client = Client()
+    observation_queries = []
+    list_calls = []
+    get_observations = ObservationEngine.get_observations
+
+    def record_get_observations(self, *args, **kwargs):
+        observation_queries.append(kwargs.get('datastream_ids'))
+        return get_observations(self, *args, **kwargs)
+
+    response = client.post(
+        'http://127.0.0.1:8000/sensorthings/data-array/v1.1/CreateObservations',
+        orjson.dumps([{
+            'Datastream': {'@iot.id': 1},
+            'components': ['phenomenonTime', 'result'],
+            'dataArray': [['2024-01-01T00:00:00+00:00', 10.0]]
+        }]),
+        content_type='application/json'
+    )
+    assert response.status_code == 201
+
+    monkeypatch.setattr(ObservationEngine, 'get_datastream_time_bounds', None)
+    monkeypatch.setattr(ObservationEngine, 'get_observations', record_get_observations)
+    monkeypatch.setattr(SensorThingsBaseEngine, 'list_entities', lambda *args, **kwargs: list_calls.append(kwargs))
+
+    deferred_time_bounds.flush()
+
+    assert datastream_updates == [1]
+    assert observation_queries == [[1], [1]]
+    assert list_calls == []
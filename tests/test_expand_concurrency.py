@@ -0,0 +1,85 @@
+import pytest
+import threading
+from functools import wraps
+from asgiref.sync import async_to_sync
+from django.test import Client, AsyncClient
+
+
+@pytest.mark.parametrize('endpoint, query_params', [
+    ('Datastreams', {'$expand': 'Thing,Sensor,ObservedProperty,Observations($top=1)'}),
+    ('Things', {'$expand': 'Locations/HistoricalLocations,Datastreams/Sensor,Datastreams/ObservedProperty'}),
+    ('Observations', {'$expand': 'Datastream/Thing,FeatureOfInterest'}),
+])
+@pytest.mark.parametrize('api', ['core', 'async'])
+@pytest.mark.django_db()
+def test_sensorthings_concurrent_expand(monkeypatch, api, endpoint, query_params):
+    from sensorthings import settings
+
+    client = Client()
+    async_client = AsyncClient()
+
+    response = client.get(f'http://127.0.0.1:8000/sensorthings/core/v1.1/{endpoint}', query_params)
+
+    monkeypatch.setattr(settings, 'ST_EXPAND_CONCURRENCY', 4)
+
+    if api == 'async':
+        concurrent_response = async_to_sync(async_client.get)(
+            f'http://127.0.0.1:8000/sensorthings/async/v1.1/{endpoint}', query_params
+        )
+    else:
+        concurrent_response = client.get(f'http://127.0.0.1:8000/sensorthings/core/v1.1/{endpoint}', query_params)
+
+    assert concurrent_response.status_code == 200
+    assert concurrent_response.content == response.content
+
+
+def record_expand_threads(monkeypatch):
+    from sensorthings import settings, workers
+    from sta.engine.sensor import SensorEngine
+
+    thread_names = []
+    closed_thread_names = []
+    get_sensors = SensorEngine.get_sensors
+
+    @wraps(get_sensors)
+    def record_get_sensors(self, *args, **kwargs):
+        thread_names.append(threading.current_thread().name)
+        return get_sensors(self, *args, **kwargs)
+
+    monkeypatch.setattr(settings, 'ST_EXPAND_CONCURRENCY', 4)
+    monkeypatch.setattr(SensorEngine, 'get_sensors', record_get_sensors)
+    monkeypatch.setattr(
+        workers, 'close_old_connections', lambda: closed_thread_names.append(threading.current_thread().name)
+    )
+
+    return thread_names, closed_thread_names
+
+
+@pytest.mark.django_db()
+def test_concurrent_expand_closes_pool_thread_connections(monkeypatch):
+    thread_names, closed_thread_names = record_expand_threads(monkeypatch)
+
+    response = Client().get(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/Datastreams', {'$expand': 'Thing,Sensor,ObservedProperty'}
+    )
+
+    assert response.status_code == 200
+    assert thread_names and all(name.startswith('sensorthings-expand') for name in thread_names)
+    assert len(closed_thread_names) == 3
+    assert all(name.startswith('sensorthings-expand') for name in closed_thread_names)
+
+
+@pytest.mark.django_db()
+def test_expand_within_transaction_runs_on_request_thread(monkeypatch):
+    from django.db import connection
+
+    thread_names, closed_thread_names = record_expand_threads(monkeypatch)
+    monkeypatch.setattr(connection, 'in_atomic_block', True)
+
+    response = Client().get(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/Datastreams', {'$expand': 'Thing,Sensor,ObservedProperty'}
+    )
+
+    assert response.status_code == 200
+    assert thread_names == [threading.current_thread().name]
+    assert closed_thread_names == []
@@ -0,0 +1,84 @@
+import pytest
+from django.test import Client
+
+
+@pytest.mark.django_db()
+def test_engine_joined_expansions_are_not_fetched_again(monkeypatch):
+    from sta.engine.thing import ThingEngine
+    from sta.engine.datastream import DatastreamEngine
+
+    client = Client()
+    expand_hints = []
+    datastream_calls = []
+    get_things = ThingEngine.get_things
+    get_datastreams = DatastreamEngine.get_datastreams
+
+    def get_things_with_datastreams(self, *args, expand=None, **kwargs):
+        expand_hints.append(expand)
+        things, count = get_things(self, *args, **kwargs)
+        return [
+            {**thing, 'datastreams': [{'id': thing['id'] * 10, 'name': 'JOINED', 'thing_id': thing['id']}]}
+            for thing in (things.values() if isinstance(things, dict) else things)
+        ], count
+
+    def record_get_datastreams(self, *args, **kwargs):
+        datastream_calls.append(kwargs)
+        return get_datastreams(self, *args, **kwargs)
+
+    monkeypatch.setattr(ThingEngine, 'get_things', get_things_with_datastreams)
+    monkeypatch.setattr(DatastreamEngine, 'get_datastreams', record_get_datastreams)
+
+    response = client.get(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/Things',
+        {
+            '$expand': 'Datastreams($top=1;$select=id,name),Locations($select=id)',
+            '$select': 'id,Datastreams,Locations'
+        }
+    )
+
+    assert response.status_code == 200
+    assert response.json()['value'] == [
+        {'@iot.id': 1, 'Datastreams': [{'@iot.id': 10, 'name': 'JOINED'}], 'Locations': [{'@iot.id': 1}]},
+        {
+            '@iot.id': 2, 'Datastreams': [{'@iot.id': 20, 'name': 'JOINED'}],
+            'Locations': [{'@iot.id': 2}, {'@iot.id': 3}]
+        }
+    ]
+    assert datastream_calls == []
+
+    datastreams_hint = expand_hints[0]['datastreams']
+    assert set(expand_hints[0]) == {'datastreams', 'locations'}
+    assert datastreams_hint['component'] == 'Datastream'
+    assert datastreams_hint['relationship'] == 'one_to_many'
+    assert datastreams_hint['join_field'] == 'thing_id'
+    assert datastreams_hint['limit_per_parent'] == {'skip': 0, 'top': 1}
+    assert {'id', 'name', 'thing_id'} <= set(datastreams_hint['fields'])
+    assert datastreams_hint['expand'] == {}
+
+
+@pytest.mark.django_db()
+def test_expand_hint_is_only_passed_to_engines_accepting_it(monkeypatch):
+    from sta.engine.thing import ThingEngine
+
+    client = Client()
+    calls = []
+    get_things = ThingEngine.get_things
+
+    def record_get_things(self, thing_ids=None, location_ids=None, pagination=None, ordering=None, filters=None,
+                          expanded=False, fields=None, get_count=False):
+        calls.append(thing_ids)
+        return get_things(self, thing_ids, location_ids, pagination, ordering, filters, expanded, fields, get_count)
+
+    monkeypatch.setattr(ThingEngine, 'get_things', record_get_things)
+
+    response = client.get(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/Things',
+        {'$expand': 'Datastreams($select=id)', '$select': 'id,Datastreams'}
+    )
+
+    assert response.status_code == 200
+    assert len(calls) == 1
+    assert response.json()['value'] == [
+        {'@iot.id': 1, 'Datastreams': [{'@iot.id': 1}]},
+        {'@iot.id': 2, 'Datastreams': [{'@iot.id': 2}]}
+    ]
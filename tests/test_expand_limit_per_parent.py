@@ -0,0 +1,81 @@
+import pytest
+from functools import wraps
+from django.test import Client
+
+
+@pytest.mark.parametrize('api', ['core', 'async'])
+@pytest.mark.django_db()
+def test_expand_top_applies_to_each_parent(api):
+    client = Client()
+
+    response = client.get(
+        f'http://127.0.0.1:8000/sensorthings/{api}/v1.1/Datastreams',
+        {'$expand': 'Observations($top=1;$skip=1;$select=result)', '$select': 'id,Observations'}
+    )
+
+    assert response.status_code == 200
+    assert response.json()['value'] == [
+        {'@iot.id': 1, 'Observations': [{'result': 15.0}]},
+        {'@iot.id': 2, 'Observations': [{'result': 25.0}]}
+    ]
+
+
+@pytest.mark.django_db()
+def test_expand_passes_limit_per_parent_to_engine(monkeypatch):
+    from sta.engine.observation import ObservationEngine
+
+    client = Client()
+    calls = []
+    get_observations = ObservationEngine.get_observations
+
+    @wraps(get_observations)
+    def record_get_observations(self, *args, **kwargs):
+        calls.append(kwargs)
+        return get_observations(self, *args, **kwargs)
+
+    monkeypatch.setattr(ObservationEngine, 'get_observations', record_get_observations)
+
+    response = client.get(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/Datastreams',
+        {'$expand': 'Observations($top=1)'}
+    )
+
+    assert response.status_code == 200
+    assert len(calls) == 1
+    assert calls[0]['pagination'] is None
+    assert calls[0]['limit_per_parent'] == {'field': 'datastream_id', 'skip': 0, 'top': 1}
+
+
+@pytest.mark.parametrize('query_params, pagination', [
+    ({'$expand': 'Datastreams($top=1;$select=id)'}, {'skip': 0, 'top': 1, 'count': False}),
+    ({'$expand': 'Datastreams($select=id)'}, {'skip': 0, 'top': 100, 'count': False}),
+])
+@pytest.mark.django_db()
+def test_expand_without_engine_support_pages_each_parent(monkeypatch, query_params, pagination):
+    from sta.engine.datastream import DatastreamEngine
+
+    client = Client()
+    calls = []
+    get_datastreams = DatastreamEngine.get_datastreams
+
+    @wraps(get_datastreams)
+    def record_get_datastreams(self, *args, **kwargs):
+        response, count = get_datastreams(self, *args, **kwargs)
+        calls.append((list(kwargs.get('thing_ids')), kwargs.get('pagination'), len(response)))
+        return response, count
+
+    monkeypatch.setattr(DatastreamEngine, 'get_datastreams', record_get_datastreams)
+
+    response = client.get(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/Things',
+        {**query_params, '$select': 'id,Datastreams'}
+    )
+
+    assert response.status_code == 200
+    assert [thing_ids for thing_ids, _, _ in calls] == [[1], [2]]
+    assert all(call_pagination == pagination for _, call_pagination, _ in calls)
+    assert all(row_count <= pagination['top'] for _, _, row_count in calls)
+    assert response.json()['value'] == [
+        {'@iot.id': 1, 'Datastreams': [{'@iot.id': 1}]},
+        {'@iot.id': 2, 'Datastreams': [{'@iot.id': 2}]}
+    ]
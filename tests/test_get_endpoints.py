@@ -132,7 +132,7 @@ from django.test import Client
     (  # Test HistoricalLocation's Thing endpoint.
         'HistoricalLocations(1)/Thing',
         {},
-        '{"@iot.id": 1, "@iot.selfLink": "http://testserver/sensorthings/v1.1/Things(1)", "name": "THING_1", "description": "Thing 1", "properties": {}, "Locations@iot.navigationLink": "http://testserver/sensorthings/v1.1/Things(1)/Locations", "HistoricalLocations@iot.navigationLink": "http://testserver/sensorthings/v1.1/Things(1)/HistoricalLocations", "Datastreams@iot.navigationLink": "http://testserver/sensorthings/v1.1/Things(1)/Datastreams"}'
+        '{"@iot.id": 2, "@iot.selfLink": "http://testserver/sensorthings/v1.1/Things(2)", "name": "THING_2", "description": "Thing 2", "properties": {"code": "THING"}, "Locations@iot.navigationLink": "http://testserver/sensorthings/v1.1/Things(2)/Locations", "HistoricalLocations@iot.navigationLink": "http://testserver/sensorthings/v1.1/Things(2)/HistoricalLocations", "Datastreams@iot.navigationLink": "http://testserver/sensorthings/v1.1/Things(2)/Datastreams"}'
     ),
     (  # Test Sensors endpoint with no query parameters.
         'Sensors(1)',
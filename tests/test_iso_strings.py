@@ -0,0 +1,65 @@
+import random
+import pytest
+from dateutil.parser import isoparse
+
+
+def build_iso_time_corpus():
+    corpus = [
+        '2024-01-01T00:00:00Z', '2024-01-01T00:00:00', '2024-01-01T00:00:00+00:00', '2024-01-01T00:00:00-00:00',
+        '2024-06-30T23:59:59.999999Z', '2024-06-30T23:59:59,5+05:30', '2024-02-29T12:00:00-08:00',
+        '2023-02-29T12:00:00Z', '2024-13-01T00:00:00Z', '2024-00-10T00:00:00Z', '2024-01-32T00:00:00Z',
+        '2024-01-01T25:00:00Z', '2024-01-01T24:00:00Z', '2024-01-01T23:60:00Z', '2024-01-01T23:59:60Z',
+        '2024-01-01T00:00:00+24:00', '2024-01-01T00:00:00+23:60', '2024-01-01T00:00:00+14:00',
+        '0001-01-01T00:00:00Z', '0001-01-01T00:30:00+01:00', '9999-12-31T23:59:59Z', '9999-12-31T23:30:00-01:00',
+        '2024-01-01T00:00:00z', '2024-01-01T00:00:00+0100', '2024-01-01T00:00:00+01', '2024-01-01 00:00:00Z',
+        '2024-01-01T00:00Z', '2024-01-01T00Z', '2024-01-01', '20240101T000000Z', '2024-W01-1T00:00:00Z',
+        '2024-01-01T00:00:00.Z', '2024-01-01T00:00:00.1234567890Z', '2024-01-01T00:00:00Z ', ' 2024-01-01T00:00:00Z',
+        '2024-01-01T00:00:00ZZ', '2024-01-01T00:00:00+01:00:00', '２０２４-01-01T00:00:00Z', 'not a time', '',
+    ]
+
+    generator = random.Random(20240101)
+
+    for _ in range(500):
+        offset = generator.choice([
+            '', 'Z', f'{generator.choice("+-")}{generator.randint(0, 25):02d}:{generator.randint(0, 61):02d}'
+        ])
+        fraction = generator.choice(['', f'.{generator.randint(0, 999)}', f'.{generator.randint(0, 999999):06d}'])
+        corpus.append(
+            f'{generator.randint(1, 9999):04d}-{generator.randint(0, 13):02d}-{generator.randint(0, 32):02d}T'
+            f'{generator.randint(0, 24):02d}:{generator.randint(0, 60):02d}:{generator.randint(0, 60):02d}'
+            f'{fraction}{offset}'
+        )
+
+    return corpus
+
+
+def outcome(function, value):
+    try:
+        return function(value)
+    except (TypeError, ValueError, OverflowError) as e:
+        return type(e)
+
+
+@pytest.mark.parametrize('value', build_iso_time_corpus())
+def test_validate_iso_time_matches_dateutil(value):
+    from sensorthings.types.iso_string import validate_iso_time, parse_iso_time
+
+    assert outcome(validate_iso_time, value) == outcome(parse_iso_time, value)
+
+
+@pytest.mark.parametrize('value', [
+    '2024-01-01T00:00:00Z/2024-01-02T00:00:00Z', '2024-01-01T01:00:00+02:00/2024-01-01T00:00:00Z',
+    '2024-01-01T00:00:00Z/2024-01-01T00:00:00Z', '2024-01-02T00:00:00Z/2024-01-01T00:00:00Z',
+    '2024-01-01/2024-01-02T00:00:00-05:00', '0001-01-01T00:00:00Z/9999-12-31T23:59:59Z',
+    '2024-01-01T00:00:00Z', '2024-01-01T00:00:00Z/2024-01-02T00:00:00Z/2024-01-03T00:00:00Z',
+])
+def test_validate_iso_interval_matches_dateutil(value):
+    from sensorthings.types.iso_string import validate_iso_interval, parse_iso_time
+
+    def dateutil_validate_iso_interval(interval):
+        split_value = [parse_iso_time(dt_value) for dt_value in interval.split('/')]
+        if len(split_value) != 2 or isoparse(split_value[0]) >= isoparse(split_value[1]):
+            raise ValueError('invalid ISO interval format')
+        return '/'.join(split_value)
+
+    assert outcome(validate_iso_interval, value) == outcome(dateutil_validate_iso_interval, value)
@@ -0,0 +1,122 @@
+import pytest
+from django.test import Client
+
+
+latest_observations_query = {
+    '$expand': 'Observations($top=1;$orderby=phenomenonTime desc;$select=result)',
+    '$select': 'id,Observations'
+}
+
+
+@pytest.fixture()
+def latest_observation_store(monkeypatch):
+    from sensorthings.cache import latest_observation_store
+
+    monkeypatch.setattr(latest_observation_store, 'enabled', True)
+    latest_observation_store.invalidate()
+
+    yield latest_observation_store
+
+    latest_observation_store.invalidate()
+
+
+@pytest.fixture()
+def observation_queries(monkeypatch):
+    from sta.engine.observation import ObservationEngine
+
+    calls = []
+    get_observations = ObservationEngine.get_observations
+
+    def record_get_observations(self, *args, **kwargs):
+        calls.append(list(kwargs.get('datastream_ids') or []))
+        return get_observations(self, *args, **kwargs)
+
+    monkeypatch.setattr(ObservationEngine, 'get_observations', record_get_observations)
+
+    return calls
+
+
+@pytest.mark.parametrize('api', ['core', 'async'])
+@pytest.mark.django_db()
+def test_latest_observations_expansion(api, latest_observation_store):
+    client = Client()
+
+    for _ in range(2):
+        response = client.get(f'http://127.0.0.1:8000/sensorthings/{api}/v1.1/Datastreams', latest_observations_query)
+
+        assert response.status_code == 200
+        assert response.json()['value'] == [
+            {'@iot.id': 1, 'Observations': [{'result': 10.0}]},
+            {'@iot.id': 2, 'Observations': [{'result': 20.0}]}
+        ]
+
+
+@pytest.mark.django_db()
+def test_latest_observations_are_stored(latest_observation_store, observation_queries):
+    client = Client()
+
+    for _ in range(2):
+        response = client.get('http://127.0.0.1:8000/sensorthings/core/v1.1/Datastreams', latest_observations_query)
+        assert response.status_code == 200
+
+    assert observation_queries == [[1, 2]]
+
+    response = client.get(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/Datastreams',
+        {'$expand': 'Observations($top=1;$orderby=phenomenonTime desc)'}
+    )
+
+    assert response.status_code == 200
+    assert observation_queries == [[1, 2]]
+    assert set(response.json()['value'][0]['Observations'][0]) >= {'@iot.id', 'phenomenonTime', 'result'}
+
+
+@pytest.mark.django_db()
+def test_latest_observations_are_invalidated_by_writes(latest_observation_store, observation_queries):
+    client = Client()
+
+    client.get('http://127.0.0.1:8000/sensorthings/core/v1.1/Datastreams', latest_observations_query)
+
+    response = client.post(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/Observations',
+        {'phenomenonTime': '2024-01-01T00:00:00Z', 'result': 30, 'Datastream': {'@iot.id': 2}},
+        content_type='application/json'
+    )
+    assert response.status_code == 201
+
+    observation_queries.clear()
+    client.get('http://127.0.0.1:8000/sensorthings/core/v1.1/Datastreams', latest_observations_query)
+    assert observation_queries == [[2]]
+
+    response = client.post(
+        'http://127.0.0.1:8000/sensorthings/quality-control/v1.1/DeleteObservations',
+        [{'Datastream': {'@iot.id': 1}}],
+        content_type='application/json'
+    )
+    assert response.status_code == 204
+
+    observation_queries.clear()
+    client.get('http://127.0.0.1:8000/sensorthings/core/v1.1/Datastreams', latest_observations_query)
+    assert observation_queries == [[1]]
+
+
+@pytest.mark.django_db()
+def test_latest_observations_are_scoped_by_engine(latest_observation_store, observation_queries):
+    client = Client()
+
+    for api in ['core', 'data-array', 'core', 'data-array']:
+        response = client.get(f'http://127.0.0.1:8000/sensorthings/{api}/v1.1/Datastreams', latest_observations_query)
+        assert response.status_code == 200
+
+    assert observation_queries == [[1, 2], [1, 2]]
+
+    response = client.post(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/Observations',
+        {'phenomenonTime': '2024-01-01T00:00:00Z', 'result': 30, 'Datastream': {'@iot.id': 2}},
+        content_type='application/json'
+    )
+    assert response.status_code == 201
+
+    observation_queries.clear()
+    client.get('http://127.0.0.1:8000/sensorthings/data-array/v1.1/Datastreams', latest_observations_query)
+    assert observation_queries == [[2]]
@@ -0,0 +1,261 @@
+import pytest
+from django.test import Client
+
+
+@pytest.fixture
+def buffered_observations(monkeypatch):
+    from sensorthings import settings
+    from sta.engine.observation import ObservationEngine
+    from sta.engine.data_array import DataArrayEngine
+    from sta.engine.datastream import DatastreamEngine
+
+    calls = {'create_observation': [], 'create_observations': [], 'update_datastream': []}
+
+    def create_observation(self, observation):
+        calls['create_observation'].append(observation)
+        return 1
+
+    def create_observations(self, observations):
+        calls['create_observations'].append(observations)
+        return []
+
+    def update_datastream(self, datastream_id, datastream):
+        calls['update_datastream'].append(datastream_id)
+
+    monkeypatch.setattr(settings, 'ST_OBSERVATION_BUFFER', True)
+    monkeypatch.setattr(ObservationEngine, 'create_observation', create_observation)
+    monkeypatch.setattr(DataArrayEngine, 'create_observations', create_observations)
+    monkeypatch.setattr(DatastreamEngine, 'update_datastream', update_datastream)
+
+    return calls
+
+
+@pytest.fixture
+def observation_buffer(monkeypatch):
+    from sensorthings.workers import observation_buffer
+
+    monkeypatch.setattr(observation_buffer.worker, 'interval', 3600)
+
+    yield observation_buffer
+
+    observation_buffer.flush()
+
+
+def post_observations(client, api, datastream_ids):
+    return [
+        client.post(
+            f'http://127.0.0.1:8000/sensorthings/{api}/v1.1/Observations',
+            {
+                'phenomenonTime': f'2024-01-0{i + 1}T00:00:00Z', 'result': 10.0 + i,
+                'Datastream': {'@iot.id': datastream_id}
+            },
+            content_type='application/json'
+        ) for i, datastream_id in enumerate(datastream_ids)
+    ]
+
+
+@pytest.mark.django_db()
+def test_observation_buffer_creates_observations_in_bulk(buffered_observations, observation_buffer):
+    client = Client()
+
+    responses = post_observations(client, 'data-array', [1, 2, 1])
+
+    assert [response.status_code for response in responses] == [202, 202, 202]
+    assert buffered_observations['create_observations'] == []
+    assert observation_buffer.pending() == 3
+
+    observation_buffer.flush()
+
+    assert buffered_observations['create_observation'] == []
+    assert len(buffered_observations['create_observations']) == 1
+    assert {
+        datastream_id: [observation.result for observation in observations]
+        for datastream_id, observations in buffered_observations['create_observations'][0].items()
+    } == {1: [10.0, 12.0], 2: [11.0]}
+    assert sorted(buffered_observations['update_datastream']) == [1, 2]
+
+
+@pytest.mark.django_db()
+def test_observation_buffer_locates_buffered_observations(monkeypatch, buffered_observations, observation_buffer):
+    from sta.engine.data_array import DataArrayEngine
+
+    client = Client()
+
+    def create_observations(self, observations):
+        return [
+            int(observation.result) * 10 for datastream_observations in observations.values()
+            for observation in datastream_observations
+        ]
+
+    monkeypatch.setattr(DataArrayEngine, 'create_observations', create_observations)
+
+    responses = post_observations(client, 'data-array', [1, 2, 1])
+    locations = [response['Location'] for response in responses]
+
+    assert all(
+        location.startswith("http://testserver/sensorthings/v1.1/BufferedObservations('") for location in locations
+    )
+    assert len(set(locations)) == 3
+
+    # The example project serves several APIs, so the status locations are requested from the data array API.
+    status_urls = [location.replace('/sensorthings/', '/sensorthings/data-array/') for location in locations]
+
+    assert [client.get(status_url).status_code for status_url in status_urls] == [202, 202, 202]
+
+    observation_buffer.flush()
+
+    status_responses = [client.get(status_url) for status_url in status_urls]
+
+    assert [response.status_code for response in status_responses] == [201, 201, 201]
+    assert [response['Location'] for response in status_responses] == [
+        f'http://testserver/sensorthings/v1.1/Observations({observation_id})' for observation_id in [100, 110, 120]
+    ]
+
+
+@pytest.mark.django_db()
+def test_observation_buffer_reports_failed_observations(monkeypatch, buffered_observations, observation_buffer):
+    from sta.engine.data_array import DataArrayEngine
+
+    client = Client()
+
+    def create_observations(self, observations):
+        raise ValueError('Invalid result.')
+
+    monkeypatch.setattr(DataArrayEngine, 'create_observations', create_observations)
+
+    location = post_observations(client, 'data-array', [1])[0]['Location']
+    observation_buffer.flush()
+
+    assert client.get(location.replace('/sensorthings/', '/sensorthings/data-array/')).status_code == 422
+    assert client.get(
+        "http://testserver/sensorthings/data-array/v1.1/BufferedObservations('unknown')"
+    ).status_code == 404
+
+
+@pytest.mark.django_db()
+def test_observation_buffer_requires_bulk_create(buffered_observations, observation_buffer):
+    client = Client()
+
+    responses = post_observations(client, 'core', [1])
+
+    assert responses[0].status_code == 201
+    assert len(buffered_observations['create_observation']) == 1
+    assert observation_buffer.pending() == 0
+
+
+@pytest.mark.django_db()
+def test_observation_buffer_journal_recovery(tmp_path, buffered_observations):
+    from sensorthings.schemas import EntityId
+    from sensorthings.workers import ObservationBuffer
+    from sensorthings.components.observations.schemas import ObservationPostBody
+    from sta.engine import TestDataArraySensorThingsEngine
+
+    class Request:
+        sensorthings_url = 'http://testserver/sensorthings/v1.1'
+
+    journal_path = str(tmp_path / 'observations.journal')
+    stopped_buffer = ObservationBuffer(interval=3600, max_size=1000, journal_path=journal_path)
+
+    for result in [10.0, 11.0]:
+        observation = ObservationPostBody(
+            phenomenon_time='2024-01-01T00:00:00Z', result=result, datastream=EntityId(id=1)
+        )
+        stopped_buffer.submit(
+            engine=TestDataArraySensorThingsEngine(request=Request(), get_response_schemas={}),
+            observation=observation
+        )
+
+    stopped_buffer.worker.process_batch = lambda batch: None
+
+    restarted_buffer = ObservationBuffer(interval=3600, max_size=1000, journal_path=journal_path)
+    restarted_buffer.recover(engine_class=TestDataArraySensorThingsEngine, get_response_schemas={})
+
+    assert restarted_buffer.pending() == 2
+
+    restarted_buffer.flush()
+
+    assert [
+        observation.result for observations in buffered_observations['create_observations']
+        for observation in observations[1]
+    ] == [10.0, 11.0]
+    assert restarted_buffer.journal.pending() == {}
+    assert (tmp_path / 'observations.journal').read_bytes() == b''
+
+
+@pytest.mark.django_db()
+def test_observation_buffer_rejects_missing_datastream(buffered_observations, observation_buffer):
+    client = Client()
+
+    responses = post_observations(client, 'data-array', [999])
+
+    assert responses[0].status_code == 404
+    assert observation_buffer.pending() == 0
+
+
+def build_journaled_buffer(tmp_path, results):
+    from sensorthings.schemas import EntityId
+    from sensorthings.workers import ObservationBuffer
+    from sensorthings.components.observations.schemas import ObservationPostBody
+    from sta.engine import TestDataArraySensorThingsEngine
+
+    class Request:
+        sensorthings_url = 'http://testserver/sensorthings/v1.1'
+
+    buffer = ObservationBuffer(interval=3600, max_size=1000, journal_path=str(tmp_path / 'observations.journal'))
+    engine = TestDataArraySensorThingsEngine(request=Request(), get_response_schemas={})
+
+    for datastream_id, result in results:
+        buffer.submit(
+            engine=engine,
+            observation=ObservationPostBody(
+                phenomenon_time='2024-01-01T00:00:00Z', result=result, datastream=EntityId(id=datastream_id)
+            )
+        )
+
+    return buffer
+
+
+@pytest.mark.django_db()
+def test_observation_buffer_retries_failed_batches(tmp_path, monkeypatch, buffered_observations):
+    import orjson
+    from sta.engine.data_array import DataArrayEngine
+
+    def create_observations(self, observations):
+        if any(observation.result == 11.0 for datastream_observations in observations.values()
+               for observation in datastream_observations):
+            raise ValueError('Invalid result.')
+        buffered_observations['create_observations'].append(observations)
+        return []
+
+    monkeypatch.setattr(DataArrayEngine, 'create_observations', create_observations)
+
+    buffer = build_journaled_buffer(tmp_path, [(1, 10.0), (2, 11.0), (1, 12.0)])
+    buffer.flush()
+
+    assert [
+        observation.result for observations in buffered_observations['create_observations']
+        for observation in observations[1]
+    ] == [10.0, 12.0]
+    assert sorted(buffered_observations['update_datastream']) == [1]
+    assert buffer.journal.pending() == {}
+    assert [
+        orjson.loads(line)['observation']['result']
+        for line in (tmp_path / 'observations.journal.failed').read_bytes().splitlines()
+    ] == [11.0]
+
+
+@pytest.mark.django_db()
+def test_observation_buffer_acknowledges_before_updates(tmp_path, monkeypatch, buffered_observations):
+    from sta.engine.datastream import DatastreamEngine
+
+    def update_datastream(self, datastream_id, datastream):
+        raise ValueError('Datastream update failed.')
+
+    monkeypatch.setattr(DatastreamEngine, 'update_datastream', update_datastream)
+
+    buffer = build_journaled_buffer(tmp_path, [(1, 10.0)])
+    buffer.flush()
+
+    assert len(buffered_observations['create_observations']) == 1
+    assert buffer.journal.pending() == {}
+    assert (tmp_path / 'observations.journal').read_bytes() == b''
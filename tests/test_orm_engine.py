@@ -0,0 +1,253 @@
+import pytest
+from django.test import Client
+
+
+@pytest.fixture(scope='module')
+def orm_database(django_setup):
+    from django.db import connection
+    from sta import data, models
+
+    database_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+
+    for thing in data.things.values():
+        models.Thing.objects.create(
+            **{field: value for field, value in thing.items() if not field.endswith('_ids')}
+        )
+    for location in data.locations.values():
+        models.Location.objects.create(
+            **{field: value for field, value in location.items() if not field.endswith('_ids')}
+        ).things.set(location['thing_ids'])
+    for historical_location in data.historical_locations.values():
+        models.HistoricalLocation.objects.create(
+            id=historical_location['id'], time=historical_location['time'], thing_id=historical_location['thing_id']
+        ).locations.set(historical_location['location_ids'])
+    for sensor in data.sensors.values():
+        models.Sensor.objects.create(**sensor)
+    for observed_property in data.observed_properties.values():
+        models.ObservedProperty.objects.create(**observed_property)
+    for feature_of_interest in data.features_of_interest.values():
+        models.FeatureOfInterest.objects.create(**feature_of_interest)
+    for datastream in data.datastreams.values():
+        phenomenon_time_start, phenomenon_time_end = datastream['phenomenon_time'].split('/')
+        result_time_start, result_time_end = datastream['result_time'].split('/')
+        models.Datastream.objects.create(
+            **{field: value for field, value in datastream.items() if not field.endswith('_time')},
+            phenomenon_time_start=phenomenon_time_start, phenomenon_time_end=phenomenon_time_end,
+            result_time_start=result_time_start, result_time_end=result_time_end
+        )
+    for observation in data.observations.values():
+        models.Observation.objects.create(
+            **{field: value for field, value in observation.items() if field != 'properties'}
+        )
+
+    yield
+
+    connection.creation.destroy_test_db(database_name, verbosity=0)
+
+
+@pytest.fixture()
+def rollback(orm_database):
+    from django.db import transaction
+
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
+
+
+@pytest.mark.parametrize('filters, expected_ids', [
+    ('Datastream/id eq 1', [1, 2]),
+    ('result gt 12 and result lt 25', [2, 3]),
+    ('result eq 10 or result eq 25', [1, 4]),
+    ('not (result eq 10) and Datastream/Thing/id eq 1', [2]),
+    ('year(phenomenonTime) eq 2024 and day(phenomenonTime) eq 2', [2, 4]),
+    ('phenomenonTime lt 2024-01-02T00:00:00+00:00', [1, 3]),
+    ('Datastream/Thing/Locations/name eq \'LOCATION_3\'', [3, 4]),
+    ('FeatureOfInterest/name eq \'FEATURE_OF_INTEREST_2\'', [3, 4]),
+])
+def test_orm_engine_filters(orm_database, filters, expected_ids):
+    client = Client()
+
+    response = client.get(
+        'http://127.0.0.1:8000/sensorthings/orm/v1.1/Observations', {'$filter': filters, '$select': 'id'}
+    )
+
+    assert response.status_code == 200
+    assert [observation['@iot.id'] for observation in response.json()['value']] == expected_ids
+
+
+@pytest.mark.parametrize('filters', ['unknownProperty eq 1', 'Datastream/unknownProperty eq 1'])
+def test_orm_engine_rejects_unknown_filter_properties(orm_database, filters):
+    client = Client()
+
+    response = client.get('http://127.0.0.1:8000/sensorthings/orm/v1.1/Observations', {'$filter': filters})
+
+    assert response.status_code == 422
+
+
+def test_orm_engine_orders_and_paginates(orm_database):
+    client = Client()
+
+    response = client.get(
+        'http://127.0.0.1:8000/sensorthings/orm/v1.1/Observations',
+        {'$orderby': 'result desc', '$top': 2, '$count': True}
+    )
+
+    assert response.status_code == 200
+    assert response.json()['@iot.count'] == 4
+    assert [
+        (observation['@iot.id'], observation['result'], observation['phenomenonTime'])
+        for observation in response.json()['value']
+    ] == [(4, 25.0, '2024-01-02T00:00:00+00:00'), (3, 20.0, '2024-01-01T00:00:00+00:00')]
+
+
+@pytest.mark.parametrize('query_params, expected_ids', [
+    ({'$top': 3, '$orderby': 'phenomenonTime desc'}, [2, 4, 1, 3]),
+    ({'$top': 1, '$orderby': 'result'}, [1, 2, 3, 4]),
+])
+def test_orm_engine_cursor_pagination(orm_database, monkeypatch, query_params, expected_ids):
+    from sensorthings import settings
+
+    client = Client()
+    monkeypatch.setattr(settings, 'ST_CURSOR_PAGINATION', True)
+
+    pages = [client.get(
+        'http://127.0.0.1:8000/sensorthings/orm/v1.1/Observations', {**query_params, '$select': 'id'}
+    ).json()]
+
+    while '@iot.nextLink' in pages[-1]:
+        pages.append(client.get(pages[-1]['@iot.nextLink'].replace('/sensorthings/', '/sensorthings/orm/')).json())
+
+    assert [observation['@iot.id'] for page in pages for observation in page['value']] == expected_ids
+
+
+def test_orm_engine_expands_collections_per_parent(orm_database):
+    client = Client()
+
+    response = client.get(
+        'http://127.0.0.1:8000/sensorthings/orm/v1.1/Datastreams',
+        {
+            '$expand': 'Observations($top=1;$orderby=phenomenonTime desc;$select=result)',
+            '$select': 'id,phenomenonTime,Observations'
+        }
+    )
+
+    assert response.status_code == 200
+    assert response.json()['value'] == [
+        {
+            '@iot.id': 1, 'phenomenonTime': '2024-01-01T00:00:00+00:00/2024-01-02T00:00:00+00:00',
+            'Observations': [{'result': 15.0}]
+        },
+        {
+            '@iot.id': 2, 'phenomenonTime': '2024-01-01T00:00:00+00:00/2024-01-02T00:00:00+00:00',
+            'Observations': [{'result': 25.0}]
+        }
+    ]
+
+    response = client.get(
+        'http://127.0.0.1:8000/sensorthings/orm/v1.1/Things',
+        {
+            '$expand': 'Locations($select=id),HistoricalLocations($select=time)',
+            '$select': 'id,Locations,HistoricalLocations'
+        }
+    )
+
+    assert response.status_code == 200
+    assert response.json()['value'] == [
+        {'@iot.id': 1, 'Locations': [{'@iot.id': 1}], 'HistoricalLocations': []},
+        {
+            '@iot.id': 2, 'Locations': [{'@iot.id': 2}, {'@iot.id': 3}],
+            'HistoricalLocations': [{'time': '2024-01-01T00:00:00+00:00'}, {'time': '2024-01-02T00:00:00+00:00'}]
+        }
+    ]
+
+
+def test_orm_engine_bulk_creates_observations(rollback):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from sta.models import Observation
+
+    client = Client()
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.post(
+            'http://127.0.0.1:8000/sensorthings/orm/v1.1/CreateObservations',
+            [{
+                'Datastream': {'@iot.id': 1}, 'components': ['phenomenonTime', 'result'],
+                'dataArray': [[f'2024-01-0{day}T00:00:00Z', day] for day in range(3, 6)]
+            }],
+            content_type='application/json'
+        )
+
+    assert response.status_code == 201
+    assert len(response.json()) == 3
+    assert len([query for query in queries if query['sql'].startswith('INSERT')]) == 1
+    assert list(Observation.objects.filter(datastream_id=1).order_by('id').values_list('result', flat=True)) == [
+        10.0, 15.0, 3.0, 4.0, 5.0
+    ]
+
+    response = client.get('http://127.0.0.1:8000/sensorthings/orm/v1.1/Datastreams(1)', {'$select': 'phenomenonTime'})
+
+    assert response.json() == {'phenomenonTime': '2024-01-01T00:00:00+00:00/2024-01-05T00:00:00+00:00'}
+
+
+def test_orm_engine_bulk_creates_things(rollback, monkeypatch):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from sta.orm.thing import ThingEngine
+    from sta.models import Thing
+
+    client = Client()
+
+    def create_thing(self, thing):
+        raise AssertionError('Thing created individually by an engine implementing create_things.')
+
+    monkeypatch.setattr(ThingEngine, 'create_thing', create_thing)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.post(
+            'http://127.0.0.1:8000/sensorthings/orm/v1.1/CreateThings',
+            [
+                {'name': f'TEST_{index}', 'description': 'TEST', 'Locations': [{'@iot.id': 1}, {'@iot.id': 2}]}
+                for index in range(3)
+            ],
+            content_type='application/json'
+        )
+
+    assert response.status_code == 201
+    assert len(response.json()) == 3
+    assert len([query for query in queries if query['sql'].startswith('INSERT')]) == 2
+    assert list(
+        Thing.objects.filter(name__startswith='TEST_').values_list('locations', flat=True).order_by('id', 'locations')
+    ) == [1, 2] * 3
+
+
+def test_orm_engine_creates_updates_and_deletes_entities(rollback):
+    from sta.models import Thing
+
+    client = Client()
+
+    response = client.post(
+        'http://127.0.0.1:8000/sensorthings/orm/v1.1/Things',
+        {'name': 'TEST', 'description': 'TEST', 'Locations': [{'@iot.id': 1}, {'@iot.id': 2}]},
+        content_type='application/json'
+    )
+
+    assert response.status_code == 201
+    thing_id = int(response['Location'].split('(')[-1].rstrip(')'))
+    assert list(Thing.objects.get(id=thing_id).locations.order_by('id').values_list('id', flat=True)) == [1, 2]
+
+    response = client.patch(
+        f'http://127.0.0.1:8000/sensorthings/orm/v1.1/Things({thing_id})',
+        {'description': 'UPDATED', 'Locations': [{'@iot.id': 3}]},
+        content_type='application/json'
+    )
+
+    assert response.status_code == 204
+    assert Thing.objects.get(id=thing_id).description == 'UPDATED'
+    assert list(Thing.objects.get(id=thing_id).locations.values_list('id', flat=True)) == [3]
+
+    response = client.delete(f'http://127.0.0.1:8000/sensorthings/orm/v1.1/Things({thing_id})')
+
+    assert response.status_code == 204
+    assert not Thing.objects.filter(id=thing_id).exists()
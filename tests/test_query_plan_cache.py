@@ -0,0 +1,49 @@
+import pytest
+from django.test import Client
+
+
+def test_query_plan_cache_evicts_least_recently_used():
+    from sensorthings.query import QueryPlan, QueryPlanCache
+
+    cache = QueryPlanCache(maxsize=2)
+
+    cache.get_or_compile('a', QueryPlan)
+    cache.get_or_compile('b', QueryPlan)
+    cache.get_or_compile('a', QueryPlan)
+    cache.get_or_compile('c', QueryPlan)
+    cache.get_or_compile('b', QueryPlan)
+
+    assert cache.info() == (1, 4, 2, 2)
+
+
+@pytest.mark.django_db()
+def test_query_plan_cache_reuses_compiled_plans():
+    from sensorthings.query import query_plan_cache
+
+    client = Client()
+    query_params = {'$filter': 'id eq 1', '$expand': 'Datastreams/Sensor', '$orderby': 'name desc'}
+
+    client.get('http://127.0.0.1:8000/sensorthings/core/v1.1/Things', query_params)
+    cache_info = query_plan_cache.info()
+
+    response = client.get('http://127.0.0.1:8000/sensorthings/core/v1.1/Things', query_params)
+
+    assert response.status_code == 200
+    assert query_plan_cache.info().misses == cache_info.misses
+    assert query_plan_cache.info().hits > cache_info.hits
+
+
+@pytest.mark.django_db()
+def test_query_plan_projects_selected_fields():
+    from sensorthings.query import query_plan_cache
+
+    client = Client()
+    query_plan_cache.clear()
+
+    response = client.get(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/Observations', {'$select': 'result,phenomenonTime'}
+    )
+    query_plan = next(iter(query_plan_cache._plans.values()))
+
+    assert response.status_code == 200
+    assert query_plan.projection == {'id', 'result', 'phenomenon_time', 'datastream_id', 'feature_of_interest_id'}
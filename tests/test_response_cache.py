@@ -0,0 +1,100 @@
+import pytest
+from functools import wraps
+from django.test import Client
+from django.core.cache import cache
+
+
+@pytest.fixture
+def response_cache(monkeypatch):
+    from sensorthings.cache import response_cache
+
+    cache.clear()
+    monkeypatch.setattr(response_cache, 'alias', 'default')
+
+    yield response_cache
+
+    cache.clear()
+
+
+@pytest.fixture
+def engine_calls(monkeypatch):
+    from sta.engine.thing import ThingEngine
+
+    calls = []
+    get_things = ThingEngine.get_things
+
+    @wraps(get_things)
+    def counted_get_things(self, *args, **kwargs):
+        calls.append(kwargs)
+        return get_things(self, *args, **kwargs)
+
+    monkeypatch.setattr(ThingEngine, 'get_things', counted_get_things)
+
+    return calls
+
+
+@pytest.mark.parametrize('endpoint', [
+    'Things?$expand=Datastreams&$top=2',
+    'Things(1)',
+    'Things(1)/name/$value',
+])
+@pytest.mark.django_db()
+def test_response_cache_serves_repeated_requests(response_cache, engine_calls, endpoint):
+    client = Client()
+
+    first_response = client.get(f'http://127.0.0.1:8000/sensorthings/core/v1.1/{endpoint}')
+    call_count = len(engine_calls)
+    second_response = client.get(f'http://127.0.0.1:8000/sensorthings/core/v1.1/{endpoint}')
+
+    assert first_response.status_code == second_response.status_code == 200
+    assert first_response.content == second_response.content
+    assert call_count > 0
+    assert len(engine_calls) == call_count
+
+
+@pytest.mark.django_db()
+def test_response_cache_is_invalidated_by_writes(response_cache, engine_calls):
+    client = Client()
+
+    client.get('http://127.0.0.1:8000/sensorthings/core/v1.1/Things')
+    client.get('http://127.0.0.1:8000/sensorthings/core/v1.1/Things(2)')
+    client.get('http://127.0.0.1:8000/sensorthings/core/v1.1/Things(1)')
+    call_count = len(engine_calls)
+
+    response = client.patch(
+        'http://127.0.0.1:8000/sensorthings/core/v1.1/Things(1)',
+        {'name': 'THING 1'},
+        content_type='application/json'
+    )
+
+    assert response.status_code == 204
+
+    client.get('http://127.0.0.1:8000/sensorthings/core/v1.1/Things(2)')
+    assert len(engine_calls) == call_count
+
+    client.get('http://127.0.0.1:8000/sensorthings/core/v1.1/Things')
+    client.get('http://127.0.0.1:8000/sensorthings/core/v1.1/Things(1)')
+    assert len(engine_calls) == call_count + 2
+
+
+@pytest.mark.django_db()
+def test_response_cache_is_invalidated_by_related_writes(response_cache, engine_calls):
+    client = Client()
+
+    client.get('http://127.0.0.1:8000/sensorthings/core/v1.1/Things', {'$expand': 'Datastreams/Observations'})
+    client.get('http://127.0.0.1:8000/sensorthings/core/v1.1/Things')
+    call_count = len(engine_calls)
+
+    response = client.post(
+        'http://127.0.0.1:8000/sensorthings/quality-control/v1.1/DeleteObservations',
+        [{'Datastream': {'@iot.id': 1}}],
+        content_type='application/json'
+    )
+
+    assert response.status_code == 204
+
+    client.get('http://127.0.0.1:8000/sensorthings/core/v1.1/Things')
+    assert len(engine_calls) == call_count
+
+    client.get('http://127.0.0.1:8000/sensorthings/core/v1.1/Things', {'$expand': 'Datastreams/Observations'})
+    assert len(engine_calls) == call_count + 1
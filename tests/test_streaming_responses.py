@@ -0,0 +1,56 @@
+import pytest
+from django.test import Client
+
+
+@pytest.mark.parametrize('endpoint, query_params', [
+    ('Things', {}),
+    ('Things', {'$count': True, '$skip': 1, '$top': 1}),
+    ('Things', {'$select': 'name,description'}),
+    ('Things', {'$expand': 'Locations/HistoricalLocations,Datastreams/Sensor'}),
+    ('Things/$ref', {}),
+    ('Datastreams(1)/Observations', {'$top': 1}),
+    ('Observations', {'$expand': 'Datastream,FeatureOfInterest'}),
+])
+@pytest.mark.django_db()
+def test_sensorthings_streaming_list_endpoints(monkeypatch, endpoint, query_params):
+    from sensorthings import settings
+
+    client = Client()
+
+    response = client.get(f'http://127.0.0.1:8000/sensorthings/core/v1.1/{endpoint}', query_params)
+
+    monkeypatch.setattr(settings, 'ST_STREAMING_RESPONSES', True)
+    monkeypatch.setattr(settings, 'ST_STREAMING_BATCH_SIZE', 1)
+
+    streaming_response = client.get(f'http://127.0.0.1:8000/sensorthings/core/v1.1/{endpoint}', query_params)
+
+    assert streaming_response.status_code == 200
+    assert streaming_response.streaming is True
+    assert b''.join(streaming_response.streaming_content) == response.content
+
+
+@pytest.mark.django_db()
+def test_sensorthings_async_streaming_list_endpoint(monkeypatch):
+    from asgiref.sync import async_to_sync
+    from django.test import AsyncClient
+    from sensorthings import settings
+
+    client = Client()
+    async_client = AsyncClient()
+    query_params = {'$count': True, '$expand': 'Datastreams'}
+
+    response = client.get('http://127.0.0.1:8000/sensorthings/core/v1.1/Things', query_params)
+
+    monkeypatch.setattr(settings, 'ST_STREAMING_RESPONSES', True)
+    monkeypatch.setattr(settings, 'ST_STREAMING_BATCH_SIZE', 1)
+
+    async def get_streaming_response():
+        streaming_response = await async_client.get(
+            'http://127.0.0.1:8000/sensorthings/async/v1.1/Things', query_params
+        )
+        return streaming_response, b''.join([chunk async for chunk in streaming_response.streaming_content])
+
+    streaming_response, streaming_content = async_to_sync(get_streaming_response)()
+
+    assert streaming_response.status_code == 200
+    assert streaming_content == response.content